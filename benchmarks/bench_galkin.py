@@ -0,0 +1,65 @@
+"""Benchmarks of the Galkin velocity dispersion computation for each aperture type."""
+
+import numpy as np
+
+from lenstronomy.GalKin.galkin import Galkin
+
+from .scenarios import SEED
+
+_X_GRID, _Y_GRID = np.meshgrid(np.arange(-0.9, 1, 0.2), np.arange(-0.9, 1, 0.2))
+
+KWARGS_APERTURE = {
+    "slit": {"length": 1.0, "width": 0.3, "center_ra": 0, "center_dec": 0, "angle": 0},
+    "shell": {"r_in": 0.2, "r_out": 1.0, "center_ra": 0, "center_dec": 0},
+    "frame": {
+        "width_outer": 1.5,
+        "width_inner": 0.5,
+        "center_ra": 0,
+        "center_dec": 0,
+        "angle": 0,
+    },
+    "IFU_shells": {"r_bins": np.linspace(0, 2, 6), "center_ra": 0, "center_dec": 0},
+    "IFU_grid": {"x_grid": _X_GRID, "y_grid": _Y_GRID},
+}
+
+
+class TimeGalkinDispersion(object):
+    """Galkin.dispersion() (and Galkin.dispersion_map() for IFU apertures) of a
+    power-law mass profile with Hernquist light and Osipkov-Merritt anisotropy."""
+
+    params = list(KWARGS_APERTURE.keys())
+    param_names = ["aperture_type"]
+
+    def setup(self, aperture_type):
+        kwargs_aperture = dict(KWARGS_APERTURE[aperture_type])
+        kwargs_aperture["aperture_type"] = aperture_type
+        self.galkin = Galkin(
+            kwargs_model={
+                "mass_profile_list": ["SPP"],
+                "light_profile_list": ["HERNQUIST"],
+                "anisotropy_model": "OM",
+            },
+            kwargs_aperture=kwargs_aperture,
+            kwargs_psf={"psf_type": "GAUSSIAN", "fwhm": 0.7},
+            kwargs_cosmo={"d_d": 1000, "d_s": 1500, "d_ds": 800},
+            kwargs_numerics={
+                "interpol_grid_num": 1000,
+                "max_integrate": 100,
+                "min_integrate": 0.001,
+            },
+        )
+        self.kwargs = {
+            "kwargs_mass": [{"theta_E": 1.2, "gamma": 2.0}],
+            "kwargs_light": [{"Rs": 0.8, "amp": 1.0}],
+            "kwargs_anisotropy": {"r_ani": 2.0},
+        }
+        self._ifu = aperture_type.startswith("IFU")
+        np.random.seed(SEED)
+
+    def time_dispersion(self, aperture_type):
+        if self._ifu:
+            self.galkin.dispersion_map(
+                num_kin_sampling=200, num_psf_sampling=20, **self.kwargs
+            )
+        else:
+            self.galkin.dispersion(sampling_number=200, **self.kwargs)
@@ -0,0 +1,43 @@
+"""Benchmarks of the imaging likelihood hot path."""
+
+from lenstronomy.Workflow.psf_fitting import PsfFitting
+
+from .scenarios import imaging_scenario
+
+
+class TimeImageLikelihood(object):
+    """ImageLinearFit.likelihood_data_given_model() on HST-like and Euclid-like data."""
+
+    params = ["HST", "Euclid"]
+    param_names = ["observation"]
+
+    def setup(self, observation):
+        self.image_fit, self.kwargs_params, _ = imaging_scenario(observation)
+        # solves for the point source positions once, as in the sampling
+        self.image_fit.likelihood_data_given_model(**self.kwargs_params)
+
+    def time_likelihood_data_given_model(self, observation):
+        self.image_fit.likelihood_data_given_model(**self.kwargs_params)
+
+    def time_image_linear_solve(self, observation):
+        self.image_fit.image_linear_solve(**self.kwargs_params)
+
+
+class TimePsfFitting(object):
+    """Two iterations of PsfFitting.update_iterative() on HST-like data."""
+
+    timeout = 300
+
+    def setup(self):
+        self.image_fit, self.kwargs_params, self.kwargs_psf = imaging_scenario("HST")
+        self.psf_fitting = PsfFitting(self.image_fit)
+
+    def time_update_iterative(self):
+        self.psf_fitting.update_iterative(
+            self.kwargs_psf,
+            self.kwargs_params,
+            num_iter=2,
+            psf_iter_factor=0.5,
+            stacking_method="mean",
+            verbose=False,
+        )
@@ -0,0 +1,59 @@
+"""Benchmarks of the lens model ray-tracing and lens equation solving."""
+
+import numpy as np
+
+import lenstronomy.Util.util as util
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
+
+from .scenarios import KWARGS_MODEL, KWARGS_PARAMS, SEED
+
+
+class TimeLensEquationSolver(object):
+    """LensEquationSolver.image_position_from_source() for a quadruply imaged source."""
+
+    params = ["lenstronomy", "analytical"]
+    param_names = ["solver"]
+
+    def setup(self, solver):
+        lens_model = LensModel(lens_model_list=KWARGS_MODEL["lens_model_list"])
+        self.solver = LensEquationSolver(lens_model)
+        self.kwargs_lens = KWARGS_PARAMS["kwargs_lens"]
+
+    def time_image_position_from_source(self, solver):
+        self.solver.image_position_from_source(
+            0.05, 0.02, self.kwargs_lens, solver=solver
+        )
+
+
+class TimeMultiPlaneRayShooting(object):
+    """MultiPlane.ray_shooting() through a main deflector and 50 subhalo planes on a
+    100 x 100 grid."""
+
+    num_subhalos = 50
+
+    def setup(self):
+        np.random.seed(SEED)
+        z_subhalos = np.linspace(0.1, 1.9, self.num_subhalos)
+        lens_model_list = ["EPL", "SHEAR"] + ["NFW"] * self.num_subhalos
+        lens_redshift_list = [0.5, 0.5] + list(z_subhalos)
+        kwargs_subhalos = [
+            {
+                "Rs": 0.1,
+                "alpha_Rs": 0.005,
+                "center_x": x,
+                "center_y": y,
+            }
+            for x, y in np.random.uniform(-2, 2, size=(self.num_subhalos, 2))
+        ]
+        self.kwargs_lens = KWARGS_PARAMS["kwargs_lens"] + kwargs_subhalos
+        self.lens_model = LensModel(
+            lens_model_list=lens_model_list,
+            z_source=2.0,
+            lens_redshift_list=lens_redshift_list,
+            multi_plane=True,
+        )
+        self.x, self.y = util.make_grid(num_pix=100, delta_pix=0.05)
+
+    def time_ray_shooting(self):
+        self.lens_model.ray_shooting(self.x, self.y, self.kwargs_lens)
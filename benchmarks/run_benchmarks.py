@@ -0,0 +1,237 @@
+"""Stand-alone runner of the benchmark suite keeping a machine-readable history.
+
+The benchmark classes follow the airspeed velocity (asv) conventions and can be run
+with ``asv run`` (see asv.conf.json). This runner times the same benchmarks without
+asv, appends one JSON record per benchmark to a history file (JSON lines) and reports
+the benchmarks that got slower than the previous record of the same machine.
+
+Usage (from the root of the repository)::
+
+    python -m benchmarks.run_benchmarks [--bench REGEX] [--history FILE] [--threshold 0.2]
+"""
+
+import argparse
+import datetime
+import importlib
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import timeit
+
+import numpy as np
+
+import lenstronomy
+
+__all__ = ["discover", "measure", "run", "compare", "main"]
+
+_BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_HISTORY = os.path.join(_BENCHMARK_DIR, "results", "history.jsonl")
+
+
+def discover(pattern=None):
+    """Finds the timing benchmarks of all bench_*.py modules of this package.
+
+    :param pattern: (optional) regular expression matched against the benchmark names
+        ('module.Class.time_method')
+    :return: list of (name, class, method name)
+    """
+    benchmarks = []
+    for module_info in pkgutil.iter_modules([_BENCHMARK_DIR]):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(__package__ + "." + module_info.name)
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if not class_name.startswith("Time") or cls.__module__ != module.__name__:
+                continue
+            for method_name in sorted(vars(cls)):
+                if not method_name.startswith("time_"):
+                    continue
+                name = "%s.%s.%s" % (module_info.name, class_name, method_name)
+                if pattern is None or re.search(pattern, name):
+                    benchmarks.append((name, cls, method_name))
+    return benchmarks
+
+
+def _param_combinations(cls):
+    """Parameter combinations of an asv benchmark class.
+
+    :param cls: benchmark class
+    :return: list of tuples of parameters
+    """
+    params = getattr(cls, "params", None)
+    if params is None:
+        return [()]
+    if len(params) > 0 and isinstance(params[0], (list, tuple)):
+        return list(itertools.product(*params))
+    return [(param,) for param in params]
+
+
+def measure(cls, method_name, params, repeat=5, min_time=0.2):
+    """Times a benchmark method, calibrating the number of calls per repetition to
+    last at least min_time seconds.
+
+    :param cls: benchmark class
+    :param method_name: name of the time_* method
+    :param params: tuple of parameters passed to setup() and the method
+    :param repeat: number of repetitions
+    :param min_time: minimal duration of a repetition in seconds
+    :return: dict with the minimum and median time per call [s] and the number of calls
+    """
+    benchmark = cls()
+    if hasattr(benchmark, "setup"):
+        benchmark.setup(*params)
+    method = getattr(benchmark, method_name)
+    timer = timeit.Timer(lambda: method(*params))
+    number, duration = timer.autorange()
+    number = max(1, int(np.ceil(number * min_time / max(duration, 1e-9))))
+    times = np.array(timer.repeat(repeat=repeat, number=number)) / number
+    if hasattr(benchmark, "teardown"):
+        benchmark.teardown(*params)
+    return {
+        "min": float(np.min(times)),
+        "median": float(np.median(times)),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def _environment():
+    """Description of the environment the benchmarks are run in.
+
+    :return: dict
+    """
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=_BENCHMARK_DIR,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "lenstronomy": lenstronomy.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.node(),
+        "cpu": platform.processor() or platform.machine(),
+    }
+
+
+def run(pattern=None, repeat=5, min_time=0.2, verbose=True):
+    """Runs the benchmarks.
+
+    :param pattern: (optional) regular expression selecting the benchmarks
+    :param repeat: number of repetitions of each benchmark
+    :param min_time: minimal duration of a repetition in seconds
+    :param verbose: bool, if True, prints the timings
+    :return: list of result records
+    """
+    environment = _environment()
+    records = []
+    for name, cls, method_name in discover(pattern):
+        for params in _param_combinations(cls):
+            timing = measure(cls, method_name, params, repeat=repeat, min_time=min_time)
+            record = dict(environment, benchmark=name, params=list(params), **timing)
+            records.append(record)
+            if verbose:
+                print("%-70s %10.3f ms" % (_label(record), timing["median"] * 1000))
+    return records
+
+
+def _label(record):
+    if len(record["params"]) == 0:
+        return record["benchmark"]
+    return "%s(%s)" % (record["benchmark"], ", ".join(map(str, record["params"])))
+
+
+def load_history(history_file):
+    """Reads the history of benchmark results.
+
+    :param history_file: path to the JSON lines history file
+    :return: list of result records
+    """
+    if not os.path.exists(history_file):
+        return []
+    with open(history_file) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_history(history_file, records):
+    """Appends benchmark results to the history.
+
+    :param history_file: path to the JSON lines history file
+    :param records: list of result records
+    :return: None
+    """
+    directory = os.path.dirname(history_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(history_file, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def compare(records, history, threshold=0.2):
+    """Compares results with the latest previous record of the same benchmark,
+    parameters and machine.
+
+    :param records: list of new result records
+    :param history: list of previous result records
+    :param threshold: relative slow-down of the median time flagged as regression
+    :return: list of (label, previous median [s], new median [s]) of the regressions
+    """
+    latest = {}
+    for record in history:
+        key = (record["benchmark"], json.dumps(record["params"]), record["machine"])
+        latest[key] = record
+    regressions = []
+    for record in records:
+        key = (record["benchmark"], json.dumps(record["params"]), record["machine"])
+        if key not in latest:
+            continue
+        previous = latest[key]["median"]
+        if record["median"] > previous * (1 + threshold):
+            regressions.append((_label(record), previous, record["median"]))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--bench", default=None, help="regex selecting benchmarks")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="history file")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slow-down flagged as regression",
+    )
+    parser.add_argument(
+        "--no-save", action="store_true", help="do not append to the history"
+    )
+    args = parser.parse_args(args)
+
+    records = run(args.bench, repeat=args.repeat, min_time=args.min_time)
+    regressions = compare(records, load_history(args.history), args.threshold)
+    if not args.no_save:
+        save_history(args.history, records)
+    for label, previous, new in regressions:
+        print(
+            "REGRESSION %s: %.3f ms -> %.3f ms (x%.2f)"
+            % (label, previous * 1000, new * 1000, new / previous)
+        )
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
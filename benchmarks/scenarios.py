@@ -0,0 +1,126 @@
+"""Reproducible synthetic data sets shared by the benchmarks.
+
+The imaging data is simulated with SimulationAPI.SimAPI for HST-like and Euclid-like
+observations of a quadruply imaged quasar with an extended host galaxy. All random
+draws are seeded, such that every run of the benchmarks times the same problem.
+"""
+
+import copy
+
+import numpy as np
+
+import lenstronomy.Util.kernel_util as kernel_util
+from lenstronomy.Data.imaging_data import ImageData
+from lenstronomy.Data.psf import PSF
+from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+from lenstronomy.SimulationAPI.ObservationConfig.Euclid import Euclid
+from lenstronomy.SimulationAPI.ObservationConfig.HST import HST
+from lenstronomy.SimulationAPI.sim_api import SimAPI
+
+__all__ = ["KWARGS_MODEL", "KWARGS_PARAMS", "OBSERVATIONS", "imaging_scenario"]
+
+SEED = 42
+
+KWARGS_MODEL = {
+    "lens_model_list": ["EPL", "SHEAR"],
+    "source_light_model_list": ["SERSIC_ELLIPSE"],
+    "lens_light_model_list": ["SERSIC_ELLIPSE"],
+    "point_source_model_list": ["SOURCE_POSITION"],
+}
+
+KWARGS_PARAMS = {
+    "kwargs_lens": [
+        {
+            "theta_E": 1.1,
+            "gamma": 2.05,
+            "e1": 0.12,
+            "e2": -0.05,
+            "center_x": 0.0,
+            "center_y": 0.0,
+        },
+        {"gamma1": 0.03, "gamma2": 0.01, "ra_0": 0, "dec_0": 0},
+    ],
+    "kwargs_source_mag": [
+        {
+            "magnitude": 22,
+            "R_sersic": 0.2,
+            "n_sersic": 1.5,
+            "e1": 0.1,
+            "e2": 0.05,
+            "center_x": 0.05,
+            "center_y": 0.02,
+        }
+    ],
+    "kwargs_lens_light_mag": [
+        {
+            "magnitude": 19,
+            "R_sersic": 0.8,
+            "n_sersic": 3.5,
+            "e1": 0.05,
+            "e2": -0.02,
+            "center_x": 0.0,
+            "center_y": 0.0,
+        }
+    ],
+    "kwargs_ps_mag": [{"magnitude": 21, "ra_source": 0.05, "dec_source": 0.02}],
+}
+
+# name: (observation configuration, PSF type, number of pixels, supersampling factor)
+OBSERVATIONS = {
+    "HST": (HST(band="WFC3_F160W"), "PIXEL", 80, 3),
+    "Euclid": (Euclid(band="VIS"), "GAUSSIAN", 64, 2),
+}
+
+
+def imaging_scenario(observation):
+    """Simulates a noisy image of the standard lens system for a given observation.
+
+    :param observation: name of the observation in OBSERVATIONS ('HST' or 'Euclid')
+    :return: ImageLinearFit instance holding the simulated data, keyword arguments of
+        the model parameters (in amplitude units), keyword arguments of the PSF
+    """
+    config, psf_type, num_pix, supersampling_factor = OBSERVATIONS[observation]
+    kwargs_band = copy.deepcopy(config.kwargs_single_band())
+    kwargs_band["psf_type"] = psf_type
+    if psf_type == "PIXEL":
+        # drizzled pixelated PSF approximated with a Gaussian of 0.15 arcsec FWHM
+        kwargs_band["kernel_point_source"] = kernel_util.kernel_gaussian(
+            num_pix=25, delta_pix=kwargs_band["pixel_scale"], fwhm=0.15
+        )
+    sim = SimAPI(
+        num_pix=num_pix, kwargs_single_band=kwargs_band, kwargs_model=KWARGS_MODEL
+    )
+    kwargs_lens_light, kwargs_source, kwargs_ps = sim.magnitude2amplitude(
+        KWARGS_PARAMS["kwargs_lens_light_mag"],
+        KWARGS_PARAMS["kwargs_source_mag"],
+        KWARGS_PARAMS["kwargs_ps_mag"],
+    )
+    kwargs_numerics = {
+        "supersampling_factor": supersampling_factor,
+        "supersampling_convolution": False,
+    }
+    image_model = sim.image_model_class(kwargs_numerics)
+    kwargs_lens = copy.deepcopy(KWARGS_PARAMS["kwargs_lens"])
+    image = image_model.image(kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps)
+    np.random.seed(SEED)
+    image += sim.noise_for_model(model=image)
+
+    kwargs_data = sim.kwargs_data
+    kwargs_data["image_data"] = image
+    kwargs_psf = sim.kwargs_psf
+    image_fit = ImageLinearFit(
+        data_class=ImageData(**kwargs_data),
+        psf_class=PSF(**kwargs_psf),
+        lens_model_class=image_model.LensModel,
+        source_model_class=image_model.SourceModel,
+        lens_light_model_class=image_model.LensLightModel,
+        point_source_class=image_model.PointSource,
+        kwargs_numerics=kwargs_numerics,
+    )
+    kwargs_params = {
+        "kwargs_lens": kwargs_lens,
+        "kwargs_source": kwargs_source,
+        "kwargs_lens_light": kwargs_lens_light,
+        "kwargs_ps": kwargs_ps,
+    }
+    return image_fit, kwargs_params, kwargs_psf
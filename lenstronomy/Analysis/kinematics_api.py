@@ -251,6 +251,177 @@ class KinematicsAPI(object):
         sigma_v = self.transform_kappa_ext(sigma_v, kappa_ext=kappa_ext)
         return sigma_v
 
+    def velocity_dispersion_batch(
+        self,
+        kwargs_lens_list,
+        kwargs_lens_light_list,
+        kwargs_anisotropy_list,
+        r_eff=None,
+        theta_E=None,
+        gamma=None,
+        kappa_ext=0,
+        inclination=90.0,
+        num_processes=1,
+        chunk_size=None,
+    ):
+        """Velocity dispersion [km/s] of many parameter samples (e.g. of a posterior
+        chain), evaluated together. The kinematics model instances (with the aperture
+        and PSF settings) are set up once for all samples. With analytic kinematics
+        and the 'galkin' backend, all samples share the same tracer particle draws and
+        are evaluated in a vectorized way (see Galkin.dispersion_batch()). Chunks of
+        samples can be distributed over a process pool.
+
+        :param kwargs_lens_list: list of lens model keyword arguments, one per sample
+        :param kwargs_lens_light_list: list of lens light model keyword arguments, one
+            per sample
+        :param kwargs_anisotropy_list: list of stellar anisotropy keyword arguments,
+            one per sample
+        :param r_eff: projected half-light radius, None, float or one value per sample
+        :param theta_E: Einstein radius, None, float or one value per sample
+        :param gamma: power-law slope, None, float or one value per sample
+        :param kappa_ext: external convergence, float or one value per sample
+        :param inclination: inclination angle of the galaxy in degrees for axisymmetric
+            deprojection, float or one value per sample
+        :param num_processes: int, number of processes the chunks of samples are
+            distributed over
+        :param chunk_size: number of samples per chunk; default is an even split
+            among the processes
+        :return: velocity dispersion [km/s], array of shape (number of samples, number
+            of apertures)
+        """
+        num_samples = len(kwargs_lens_list)
+        if len(kwargs_lens_light_list) != num_samples or (
+            len(kwargs_anisotropy_list) != num_samples
+        ):
+            raise ValueError(
+                "kwargs_lens_list, kwargs_lens_light_list and kwargs_anisotropy_list "
+                "need to have the same length."
+            )
+        r_eff, theta_E, gamma, kappa_ext, inclination = [
+            self._per_sample(value, num_samples)
+            for value in [r_eff, theta_E, gamma, kappa_ext, inclination]
+        ]
+        if chunk_size is None:
+            chunk_size = int(np.ceil(num_samples / max(num_processes, 1)))
+        chunk_size = max(chunk_size, 1)
+        chunks = []
+        for start in range(0, num_samples, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            chunks.append(
+                (
+                    kwargs_lens_list[chunk],
+                    kwargs_lens_light_list[chunk],
+                    kwargs_anisotropy_list[chunk],
+                    r_eff[chunk],
+                    theta_E[chunk],
+                    gamma[chunk],
+                    inclination[chunk],
+                )
+            )
+        if num_processes > 1 and len(chunks) > 1:
+            from lenstronomy.Sampling.Pool.pool import choose_pool
+
+            pool = choose_pool(mpi=False, processes=num_processes)
+            sigma_v_chunks = list(pool.map(self._velocity_dispersion_chunk, chunks))
+            pool.close()
+        else:
+            sigma_v_chunks = [
+                self._velocity_dispersion_chunk(chunk) for chunk in chunks
+            ]
+        sigma_v = np.concatenate(sigma_v_chunks, axis=0)
+        kappa_ext = np.array(kappa_ext, dtype=float)[:, np.newaxis]
+        return self.transform_kappa_ext(sigma_v, kappa_ext=kappa_ext)
+
+    def _velocity_dispersion_chunk(self, chunk):
+        """Velocity dispersion [km/s] of a chunk of parameter samples without external
+        convergence.
+
+        :param chunk: tuple of lists (kwargs_lens, kwargs_lens_light,
+            kwargs_anisotropy, r_eff, theta_E, gamma, inclination) with one entry per
+            sample
+        :return: velocity dispersion [km/s], array of shape (number of samples, number
+            of apertures)
+        """
+        (
+            kwargs_lens_list,
+            kwargs_lens_light_list,
+            kwargs_anisotropy_list,
+            r_eff,
+            theta_E,
+            gamma,
+            inclination,
+        ) = chunk
+        jam_models = None
+        kwargs_profile_list, kwargs_light_list, sigma_v = [], [], []
+        for k in range(len(kwargs_lens_list)):
+            (
+                mass_profile_list,
+                kwargs_profile,
+                light_profile_list,
+                kwargs_light,
+            ) = self._kinematic_profiles(
+                kwargs_lens_list[k],
+                kwargs_lens_light_list[k],
+                r_eff=r_eff[k],
+                theta_E=theta_E[k],
+                gamma=gamma[k],
+            )
+            if jam_models is None:
+                jam_models = self._jam_models(mass_profile_list, light_profile_list)
+            if self.kinematics_backend == "galkin":
+                kwargs_profile_list.append(kwargs_profile)
+                kwargs_light_list.append(kwargs_light)
+            elif self.kinematics_backend == "jampy":
+                # the black hole mass is set per sample in kinematic_lens_profiles()
+                sigma_v_k = []
+                for i in range(len(jam_models)):
+                    if self._multi_light_profile:
+                        kwargs_light_i = kwargs_light[i]
+                    else:
+                        kwargs_light_i = kwargs_light
+                    sigma_v_k.append(
+                        jam_models[i].dispersion(
+                            kwargs_profile,
+                            kwargs_light_i,
+                            kwargs_anisotropy_list[k],
+                            inclination=inclination[k],
+                            black_hole_mass=self._black_hole_mass,
+                        )
+                    )
+                sigma_v.append(np.ravel(sigma_v_k))
+        if self.kinematics_backend == "jampy":
+            return np.array(sigma_v)
+        for i in range(len(jam_models)):
+            if self._multi_light_profile:
+                kwargs_light_i = [kwargs_light[i] for kwargs_light in kwargs_light_list]
+            else:
+                kwargs_light_i = kwargs_light_list
+            sigma_v.append(
+                jam_models[i].dispersion_batch(
+                    kwargs_profile_list,
+                    kwargs_light_i,
+                    kwargs_anisotropy_list,
+                    sampling_number=self._sampling_number,
+                )
+            )
+        return np.transpose(sigma_v)
+
+    @staticmethod
+    def _per_sample(value, num_samples):
+        """List with one value per sample.
+
+        :param value: None, a single value for all samples or one value per sample
+        :param num_samples: number of samples
+        :return: list of length num_samples
+        """
+        if value is None or np.ndim(value) == 0:
+            return [value] * num_samples
+        if len(value) != num_samples:
+            raise ValueError(
+                "%s values provided for %s samples." % (len(value), num_samples)
+            )
+        return list(value)
+
     def velocity_dispersion_map(
         self,
         kwargs_lens,
@@ -263,6 +434,7 @@ class KinematicsAPI(object):
         inclination=90.0,
         supersampling_factor=None,
         voronoi_bins=None,
+        pool=None,
     ):
         """API for both, analytic and numerical JAM to compute the velocity dispersion
         map with IFU data or multiple apertures [km/s]
@@ -282,6 +454,9 @@ class KinematicsAPI(object):
         :param supersampling_factor: supersampling factor for 2D integration grid
         :param voronoi_bins: mapping of the voronoi bins, -1 values for pixels not
             binned
+        :param pool: (optional) pool with a map() method (e.g. a
+            concurrent.futures.ThreadPoolExecutor) over which the radial integrals of
+            the IFU maps of the 'galkin' backend are distributed
         :return: velocity dispersion map in specified bins or grid in `kwargs_aperture`,
             in [km/s] unit
         """
@@ -305,6 +480,7 @@ class KinematicsAPI(object):
                         kwargs_anisotropy,
                         supersampling_factor=supersampling_factor,
                         voronoi_bins=voronoi_bins,
+                        pool=pool,
                     )
                 else:
                     sigma_v_map_ = jam_model[i].dispersion_map(
@@ -381,6 +557,29 @@ class KinematicsAPI(object):
         :return: Galkin() instance and mass and light profiles configured for the Galkin
             module
         """
+        (
+            mass_profile_list,
+            kwargs_profile,
+            light_profile_list,
+            kwargs_light,
+        ) = self._kinematic_profiles(
+            kwargs_lens, kwargs_lens_light, r_eff=r_eff, theta_E=theta_E, gamma=gamma
+        )
+        jam_models = self._jam_models(mass_profile_list, light_profile_list)
+        return jam_models, kwargs_profile, kwargs_light
+
+    def _kinematic_profiles(
+        self, kwargs_lens, kwargs_lens_light, r_eff=None, theta_E=None, gamma=None
+    ):
+        """Mass and light profiles configured for the kinematics modules.
+
+        :param kwargs_lens: lens model keyword argument list
+        :param kwargs_lens_light: deflector light keyword argument list
+        :param r_eff: half-light radius (optional)
+        :param theta_E: Einstein radius (optional)
+        :param gamma: local power-law slope at the Einstein radius (optional)
+        :return: mass_profile_list, kwargs_profile, light_profile_list, kwargs_light
+        """
         if r_eff is None:
             if self._multi_light_profile is True:
                 kwargs_lens_light_ = kwargs_lens_light[0]
@@ -431,7 +630,15 @@ class KinematicsAPI(object):
             Hernquist_approx=self._Hernquist_approx,
             analytic_kinematics=self._analytic_kinematics,
         )
+        return mass_profile_list, kwargs_profile, light_profile_list, kwargs_light
+
+    def _jam_models(self, mass_profile_list, light_profile_list):
+        """Kinematics model instances (one per aperture) of the configured backend.
 
+        :param mass_profile_list: list of mass profiles
+        :param light_profile_list: list of light profiles
+        :return: list of Galkin(), GalkinShells() or JAMWrapper() instances
+        """
         jam_models = []
 
         for i in range(len(self._kwargs_aperture_kin)):
@@ -472,8 +679,7 @@ class KinematicsAPI(object):
                     kwargs_jampy=self._kwargs_numerics_jampy,
                 )
             jam_models.append(jam_model_i)
-
-        return jam_models, kwargs_profile, kwargs_light
+        return jam_models
 
     def _copy_centers(self, kwargs_1, kwargs_2):
         """Fills the centers of the kwargs_1 with the centers of kwargs_2.
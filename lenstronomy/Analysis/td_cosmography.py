@@ -186,6 +186,54 @@ class TDCosmography(KinematicsAPI):
         J = sigma_v**2 * self._lens_cosmo.dds / self._lens_cosmo.ds / const.c**2
         return J
 
+    def velocity_dispersion_dimension_less_batch(
+        self,
+        kwargs_lens_list,
+        kwargs_lens_light_list,
+        kwargs_anisotropy_list,
+        inclination=90,
+        r_eff=None,
+        theta_E=None,
+        gamma=None,
+        num_processes=1,
+        chunk_size=None,
+    ):
+        """Dimensionless velocity dispersion J (see velocity_dispersion_dimension_less())
+        of many parameter samples, evaluated together with
+        velocity_dispersion_batch().
+
+        :param kwargs_lens_list: list of lens model keyword arguments, one per sample
+        :param kwargs_lens_light_list: list of lens light model keyword arguments, one
+            per sample
+        :param kwargs_anisotropy_list: list of stellar anisotropy keyword arguments,
+            one per sample
+        :param inclination: inclination angle in degrees, float or one value per sample
+        :param r_eff: projected half-light radius, None, float or one value per sample
+        :param theta_E: pre-computed Einstein radius, None, float or one value per
+            sample
+        :param gamma: pre-computed power-law slope, None, float or one value per sample
+        :param num_processes: int, number of processes the chunks of samples are
+            distributed over
+        :param chunk_size: number of samples per chunk; default is an even split
+            among the processes
+        :return: dimensionless velocity dispersion, array of shape (number of samples,
+            number of apertures)
+        """
+        sigma_v = self.velocity_dispersion_batch(
+            kwargs_lens_list=kwargs_lens_list,
+            kwargs_lens_light_list=kwargs_lens_light_list,
+            kwargs_anisotropy_list=kwargs_anisotropy_list,
+            inclination=inclination,
+            r_eff=r_eff,
+            theta_E=theta_E,
+            gamma=gamma,
+            num_processes=num_processes,
+            chunk_size=chunk_size,
+        )
+        sigma_v *= 1000  # convert from [km/s] to  [m/s]
+        J = sigma_v**2 * self._lens_cosmo.dds / self._lens_cosmo.ds / const.c**2
+        return J
+
     def velocity_dispersion_map_dimension_less(
         self,
         kwargs_lens,
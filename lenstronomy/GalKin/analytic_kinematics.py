@@ -1,5 +1,7 @@
 __author__ = "sibirrer"
 
+import functools
+
 import numpy as np
 from scipy.interpolate import interp1d
 import lenstronomy.GalKin.velocity_util as vel_util
@@ -127,6 +129,25 @@ class AnalyticKinematics(Anisotropy):
         R, x, y = vel_util.project2d_random(r)
         return r, R, x, y
 
+    @classmethod
+    def draw_light_batch(cls, kwargs_light_list, num):
+        """Draws random light tracer particles from the Hernquist light profiles of
+        several parameter samples. The draws are made once in units of the Hernquist
+        scale radius and are shared by all samples (common random numbers).
+
+        :param kwargs_light_list: list of keyword arguments of the light model, one per
+            sample
+        :param num: number of tracer particles per sample
+        :return: 3d radius, 2d projected radius, x-projected coordinate, y-projected
+            coordinate, each of shape (number of samples, num)
+        """
+        a = np.array(
+            [cls._get_hernquist_scale_radius(kwargs) for kwargs in kwargs_light_list]
+        )[:, np.newaxis]
+        r = vel_util.draw_hernquist(1, size=num)
+        R, x, y = vel_util.project2d_random(r)
+        return a * r, a * R, a * x, a * y
+
     def _sigma_s2(self, r, R, r_ani, a, gamma, rho0_r0_gamma):
         """Projected velocity dispersion :param r: 3d radius of the light tracer
         particle :param R: 2d projected radius of the light tracer particle :param
@@ -160,6 +181,33 @@ class AnalyticKinematics(Anisotropy):
         )
         return self._sigma_s2(r, R, r_ani, a, gamma, rho0_r0_gamma), 1
 
+    def sigma_s2_batch(
+        self, r, R, kwargs_mass_list, kwargs_light_list, kwargs_anisotropy_list
+    ):
+        """Unweighted los velocity dispersion of several parameter samples, evaluated
+        in a vectorized way.
+
+        :param r: 3d radii, array of shape (number of samples, number of tracers)
+        :param R: 2d projected radii (in angular units of arcsec), same shape as r
+        :param kwargs_mass_list: list of mass model parameters, one per sample
+        :param kwargs_light_list: list of deflector light parameters, one per sample
+        :param kwargs_anisotropy_list: list of anisotropy parameters, one per sample
+        :return: line-of-sight projected velocity dispersions of shape of r, weight 1
+        """
+        params = np.array(
+            [
+                self._read_out_params(kwargs_mass, kwargs_light, kwargs_anisotropy)
+                for kwargs_mass, kwargs_light, kwargs_anisotropy in zip(
+                    kwargs_mass_list, kwargs_light_list, kwargs_anisotropy_list
+                )
+            ],
+            dtype=float,
+        )
+        a, gamma, rho0_r0_gamma, r_ani = [params[:, i, np.newaxis] for i in range(4)]
+        beta = self.beta_r(r, **{"r_ani": r_ani})
+        sigma_r2 = self._sigma_r2_interp_batch(r, a, gamma, rho0_r0_gamma, r_ani)
+        return (1 - beta * R**2 / r**2) * sigma_r2, 1
+
     def sigma_r2(self, r, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """Equation (19) in Suyu+ 2010.
 
@@ -196,14 +244,20 @@ class AnalyticKinematics(Anisotropy):
 
         return a, gamma, rho0_r0_gamma, r_ani
 
-    def _sigma_r2(self, r, a, gamma, rho0_r0_gamma, r_ani):
-        """Equation (19) in Suyu+ 2010."""
+    def _sigma_r2(self, r, a, gamma, rho0_r0_gamma, r_ani, vectorized=False):
+        """Equation (19) in Suyu+ 2010.
+
+        If vectorized=True, the arguments can be numpy arrays (broadcast against each
+        other) and the hypergeometric functions are evaluated with scipy instead of
+        mpmath.
+        """
+        hyp_2F1 = vel_util.hyp_2F1_array if vectorized else vel_util.hyp_2F1
         # first term
         prefac1 = 4 * np.pi * const.G * a ** (-gamma) * rho0_r0_gamma / (3 - gamma)
         prefac2 = r * (r + a) ** 3 / (r**2 + r_ani**2)
         # TODO check whether interpolation functions can speed this up
-        hyp1 = vel_util.hyp_2F1(a=2 + gamma, b=gamma, c=3 + gamma, z=1.0 / (1 + r / a))
-        hyp2 = vel_util.hyp_2F1(a=3, b=gamma, c=1 + gamma, z=-a / r)
+        hyp1 = hyp_2F1(a=2 + gamma, b=gamma, c=3 + gamma, z=1.0 / (1 + r / a))
+        hyp2 = hyp_2F1(a=3, b=gamma, c=1 + gamma, z=-a / r)
         fac = r_ani**2 / a**2 * hyp1 / (
             (2 + gamma) * (r / a + 1) ** (2 + gamma)
         ) + hyp2 / (gamma * (r / a) ** gamma)
@@ -235,6 +289,36 @@ class AnalyticKinematics(Anisotropy):
             )
         return self._interp_sigma_r2(np.log(r))
 
+    def _sigma_r2_interp_batch(self, r, a, gamma, rho0_r0_gamma, r_ani):
+        """Vectorized version of _sigma_r2_interp() for several parameter samples. The
+        radial velocity dispersion of all samples is tabulated on the same logarithmic
+        grid and linearly interpolated (and extrapolated) in log(r).
+
+        :param r: 3d radii, array of shape (number of samples, number of tracers)
+        :param a: scales of the Hernquist light profiles, shape (number of samples, 1)
+        :param gamma: power-law slopes, shape (number of samples, 1)
+        :param rho0_r0_gamma: density normalizations, shape (number of samples, 1)
+        :param r_ani: anisotropy radii, shape (number of samples, 1)
+        :return: radial velocity dispersions of shape of r
+        """
+        min_log = np.log10(self._min_integrate)
+        max_log = np.log10(self._max_integrate)
+        r_array = np.logspace(min_log, max_log, self._interp_grid_num)
+        sigma_r2_array = self._sigma_r2(
+            r_array, a, gamma, rho0_r0_gamma, r_ani, vectorized=True
+        )
+        log_r_array = np.log(r_array)
+        dlog_r = log_r_array[1] - log_r_array[0]
+        log_r = np.log(r)
+        index = np.floor((log_r - log_r_array[0]) / dlog_r).astype(int)
+        index = np.clip(index, 0, self._interp_grid_num - 2)
+        weight = (log_r - log_r_array[index]) / (
+            log_r_array[index + 1] - log_r_array[index]
+        )
+        lower = np.take_along_axis(sigma_r2_array, index, axis=1)
+        upper = np.take_along_axis(sigma_r2_array, index + 1, axis=1)
+        return lower + weight * (upper - lower)
+
     def _I_R_sigma2(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """Equation A15 in Mamon&Lokas 2005 as a logarithmic numerical integral (if
         option is chosen)
@@ -253,40 +337,38 @@ class AnalyticKinematics(Anisotropy):
         max_integrate = (
             self._max_integrate
         )  # make sure the integration of the Jeans equation is performed further out than the interpolation
+        a, gamma, rho0_r0_gamma, r_ani = self._read_out_params(
+            kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        kwargs_light_copy = deepcopy(kwargs_light)
+        if "r_eff" in kwargs_light_copy:
+            kwargs_light_copy["Rs"] = kwargs_light_copy["r_eff"] * 0.551
+            kwargs_light_copy["amp"] = 1
+            kwargs_light_copy.pop("r_eff")
 
+        # the substitution u = sqrt(r^2 - R^2) removes the integrable r / sqrt(r^2 - R^2)
+        # singularity at r = R of eq. 21 in Suyu+ 2010 and of the projection of the
+        # light, which the midpoint rule in r underestimates
+        u_max = np.sqrt(max(max_integrate**2 - R**2, 0))
         if self._log_int is True:
-            min_log = np.log(R)
-            max_log = np.log(max_integrate)
-            dlogr = (max_log - min_log) / (self._interp_grid_num - 1)
-            r_array = np.logspace(
-                min_log + dlogr / 2.0,
-                max_log + dlogr / 2.0,
-                self._interp_grid_num,
-                base=np.e,
-            )
-            dlog_r = np.log(r_array[2]) - np.log(r_array[1])
-            IR_sigma2_ = self._integrand_suyu10_eq21(
-                r_array, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+            min_log = np.log(R * 1e-6)
+            max_log = np.log(max(u_max, R * 1e-6))
+            dlog_u = (max_log - min_log) / self._interp_grid_num
+            u_array = np.exp(
+                min_log + (np.arange(self._interp_grid_num) + 0.5) * dlog_u
             )
-            IR_sigma2_dr = IR_sigma2_ * dlog_r * r_array
+            du = dlog_u * u_array
         else:
-            r_array = np.linspace(
-                start=R, stop=self._max_interpolate, num=self._interp_grid_num
-            )
-            dr = r_array[2] - r_array[1]
-            IR_sigma2_ = self._integrand_suyu10_eq21(
-                r_array + dr / 2.0, R, kwargs_mass, kwargs_light, kwargs_anisotropy
-            )
-            IR_sigma2_dr = IR_sigma2_ * dr
+            du = u_max / self._interp_grid_num
+            u_array = (np.arange(self._interp_grid_num) + 0.5) * du
+        r_array = np.sqrt(R**2 + u_array**2)
+        I_r_dr = self.light_profile.light_3d(r_array, [kwargs_light_copy]) * du
+        IR_sigma2_dr = (
+            self._sigma_s2(r_array, R, r_ani, a, gamma, rho0_r0_gamma) * I_r_dr
+        )
 
         IR_sigma2 = 2 * np.sum(IR_sigma2_dr)  # integral from angle to
-
-        kwargs_light_copy = deepcopy(kwargs_light)
-        if "r_eff" in kwargs_light_copy:
-            kwargs_light_copy["Rs"] = kwargs_light_copy["r_eff"] * 0.551
-            kwargs_light_copy["amp"] = 1
-            kwargs_light_copy.pop("r_eff")
-        IR = self.light_profile.light_2d_finite(R, [kwargs_light_copy])
+        IR = 2 * np.sum(I_r_dr)
 
         return IR_sigma2, IR
 
@@ -322,17 +404,33 @@ class AnalyticKinematics(Anisotropy):
             * self.light_profile.light_3d(r, [kwargs_light_copy])
         )
 
-    def I_R_sigma2_and_IR(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+    def I_R_sigma2_and_IR(
+        self, R, kwargs_mass, kwargs_light, kwargs_anisotropy, pool=None
+    ):
         """Return I(R)*sigma^2 equation 20 in Suyu 2010 as interpolation in log space,
         and I(R)
 
-        :param R: projected radius
+        :param R: projected radius (float or 1d numpy array)
         :param kwargs_mass: mass profile keyword arguments
         :param kwargs_light: light model keyword arguments
         :param kwargs_anisotropy: stellar anisotropy keyword arguments
-        :return:
+        :param pool: (optional) pool with a map() method over which the radial
+            integrals of an array of R are distributed
+        :return: a tuple containing (I(R)*sigma^2, IR)
         """
-        return self._I_R_sigma2(R, kwargs_mass, kwargs_light, kwargs_anisotropy)
+        if np.ndim(R) == 0:
+            return self._I_R_sigma2(R, kwargs_mass, kwargs_light, kwargs_anisotropy)
+        I_R_sigma2, I_R = vel_util.map_array(
+            functools.partial(
+                self._I_R_sigma2,
+                kwargs_mass=kwargs_mass,
+                kwargs_light=kwargs_light,
+                kwargs_anisotropy=kwargs_anisotropy,
+            ),
+            np.asarray(R),
+            pool=pool,
+        ).T
+        return I_R_sigma2, I_R
 
     def grav_potential(self, r, kwargs_mass):
         """Gravitational potential in SI units.
@@ -87,6 +87,26 @@ class Aperture(object):
             aperture_samples, supersampling_factor
         )
 
+    def aperture_gaussian_weight(self, ra, dec, sigma):
+        """Probability of a photon/ray to fall into the aperture after a displacement
+        by a circular Gaussian seeing (available for the 'slit', 'shell' and 'frame'
+        apertures).
+
+        :param ra: angular coordinate of photon/ray (float or numpy array)
+        :param dec: angular coordinate of photon/ray (float or numpy array)
+        :param sigma: Gaussian sigma of the seeing
+        :return: probability in [0, 1] of the shape of ra
+        """
+        return self._aperture.gaussian_weight(ra, dec, sigma)
+
+    @property
+    def aperture_max_radius(self):
+        """Upper bound of the distance of the aperture from the origin.
+
+        :return: radius in arc seconds
+        """
+        return self._aperture.max_radius
+
     @property
     def num_segments(self):
         return self._aperture.num_segments
@@ -1,6 +1,8 @@
 __author__ = "sibirrer"
 
 import numpy as np
+from scipy.special import erf
+from scipy.stats import ncx2
 from lenstronomy.Util.package_util import exporter
 
 export, __all__ = exporter()
@@ -85,6 +87,28 @@ class ApertureBase:
                 return True, bin_id
         return False, None
 
+    def gaussian_weight(self, ra, dec, sigma):
+        """Probability of a photon/ray to fall into the aperture after a displacement
+        by a circular Gaussian seeing.
+
+        :param ra: angular coordinate of photon/ray (float or numpy array)
+        :param dec: angular coordinate of photon/ray (float or numpy array)
+        :param sigma: Gaussian sigma of the seeing
+        :return: probability in [0, 1] of the shape of ra
+        """
+        raise ValueError(
+            "The seeing convolved aperture weights are not available for the %s "
+            "aperture." % self.__class__.__name__
+        )
+
+    @property
+    def max_radius(self):
+        """Upper bound of the distance of the aperture from the origin.
+
+        :return: radius in arc seconds
+        """
+        return np.max(np.sqrt(self._x_grid**2 + self._y_grid**2)) + self._delta_pix
+
     @property
     def bins(self):
         return self._bins
@@ -176,6 +200,68 @@ class Slit(ApertureBase):
             0,
         )
 
+    def gaussian_weight(self, ra, dec, sigma):
+        """Probability of a photon/ray to fall into the slit after a displacement by a
+        circular Gaussian seeing.
+
+        :param ra: angular coordinate of photon/ray (float or numpy array)
+        :param dec: angular coordinate of photon/ray (float or numpy array)
+        :param sigma: Gaussian sigma of the seeing
+        :return: probability in [0, 1] of the shape of ra
+        """
+        return slit_gaussian_weight(
+            ra,
+            dec,
+            sigma,
+            self._length,
+            self._width,
+            self._center_ra,
+            self._center_dec,
+            self._angle,
+        )
+
+
+@export
+def slit_gaussian_weight(
+    ra, dec, sigma, length, width, center_ra=0, center_dec=0, angle=0
+):
+    """Probability of a photon/ray to fall into the slit after a displacement by a
+    circular Gaussian seeing.
+
+    :param ra: angular coordinate of photon/ray (float or numpy array)
+    :param dec: angular coordinate of photon/ray (float or numpy array)
+    :param sigma: Gaussian sigma of the seeing
+    :param length: length of slit
+    :param width: width of slit
+    :param center_ra: center of slit
+    :param center_dec: center of slit
+    :param angle: orientation angle of slit in radians,
+        angle=0 corresponds length in RA direction
+    :return: probability in [0, 1]
+    """
+    ra_ = ra - center_ra
+    dec_ = dec - center_dec
+    x = np.cos(angle) * ra_ + np.sin(angle) * dec_
+    y = -np.sin(angle) * ra_ + np.cos(angle) * dec_
+    return _box_gaussian_weight(x, y, length, width, sigma)
+
+
+def _box_gaussian_weight(x, y, length, width, sigma):
+    """Probability of a point displaced by a circular Gaussian to fall into a
+    rectangular box centered at the origin and aligned with the coordinate axes.
+
+    :param x: coordinate along the length of the box
+    :param y: coordinate along the width of the box
+    :param length: extent of the box in x
+    :param width: extent of the box in y
+    :param sigma: Gaussian sigma
+    :return: probability in [0, 1]
+    """
+    norm = np.sqrt(2) * sigma
+    weight_x = (erf((length / 2.0 - x) / norm) + erf((length / 2.0 + x) / norm)) / 2
+    weight_y = (erf((width / 2.0 - y) / norm) + erf((width / 2.0 + y) / norm)) / 2
+    return weight_x * weight_y
+
 
 @export
 def slit_select(ra, dec, length, width, center_ra=0, center_dec=0, angle=0):
@@ -189,13 +275,16 @@ def slit_select(ra, dec, length, width, center_ra=0, center_dec=0, angle=0):
     :param center_dec: center of slit
     :param angle: orientation angle of slit in radians,
         angle=0 corresponds length in RA direction
-    :return: bool, True if photon/ray is within the slit, False otherwise
+    :return: bool, True if photon/ray is within the slit, False otherwise (bool array
+        for arrays of rays)
     """
     ra_ = ra - center_ra
     dec_ = dec - center_dec
     x = np.cos(angle) * ra_ + np.sin(angle) * dec_
     y = -np.sin(angle) * ra_ + np.cos(angle) * dec_
 
+    if np.ndim(x) > 0:
+        return (np.abs(x) < length / 2.0) & (np.abs(y) < width / 2.0)
     if abs(x) < length / 2.0 and abs(y) < width / 2.0:
         return True
     else:
@@ -293,6 +382,53 @@ class Frame(ApertureBase):
             0,
         )
 
+    def gaussian_weight(self, ra, dec, sigma):
+        """Probability of a photon/ray to fall into the frame after a displacement by
+        a circular Gaussian seeing.
+
+        :param ra: angular coordinate of photon/ray (float or numpy array)
+        :param dec: angular coordinate of photon/ray (float or numpy array)
+        :param sigma: Gaussian sigma of the seeing
+        :return: probability in [0, 1] of the shape of ra
+        """
+        return frame_gaussian_weight(
+            ra,
+            dec,
+            sigma,
+            self._width_outer,
+            self._width_inner,
+            self._center_ra,
+            self._center_dec,
+            self._angle,
+        )
+
+
+@export
+def frame_gaussian_weight(
+    ra, dec, sigma, width_outer, width_inner, center_ra=0, center_dec=0, angle=0
+):
+    """Probability of a photon/ray to fall into the frame after a displacement by a
+    circular Gaussian seeing.
+
+    :param ra: angular coordinate of photon/ray (float or numpy array)
+    :param dec: angular coordinate of photon/ray (float or numpy array)
+    :param sigma: Gaussian sigma of the seeing
+    :param width_outer: width of box to the outer parts
+    :param width_inner: width of inner removed box
+    :param center_ra: center of slit
+    :param center_dec: center of slit
+    :param angle: orientation angle of slit in radians,
+        angle=0 corresponds length in RA direction
+    :return: probability in [0, 1]
+    """
+    ra_ = ra - center_ra
+    dec_ = dec - center_dec
+    x = np.cos(angle) * ra_ + np.sin(angle) * dec_
+    y = -np.sin(angle) * ra_ + np.cos(angle) * dec_
+    return _box_gaussian_weight(
+        x, y, width_outer, width_outer, sigma
+    ) - _box_gaussian_weight(x, y, width_inner, width_inner, sigma)
+
 
 @export
 def frame_select(ra, dec, width_outer, width_inner, center_ra=0, center_dec=0, angle=0):
@@ -307,11 +443,16 @@ def frame_select(ra, dec, width_outer, width_inner, center_ra=0, center_dec=0, a
     :param angle: orientation angle of slit in radians,
         angle=0 corresponds length in RA direction
     :return: bool, True if photon/ray is within the box with a hole, False otherwise
+        (bool array for arrays of rays)
     """
     ra_ = ra - center_ra
     dec_ = dec - center_dec
     x = np.cos(angle) * ra_ + np.sin(angle) * dec_
     y = -np.sin(angle) * ra_ + np.cos(angle) * dec_
+    if np.ndim(x) > 0:
+        outer = (np.abs(x) < width_outer / 2.0) & (np.abs(y) < width_outer / 2.0)
+        inner = (np.abs(x) < width_inner / 2.0) & (np.abs(y) < width_inner / 2.0)
+        return outer & ~inner
     if abs(x) < width_outer / 2.0 and abs(y) < width_outer / 2.0:
         if abs(x) < width_inner / 2.0 and abs(y) < width_inner / 2.0:
             return False
@@ -366,6 +507,39 @@ class Shell(ApertureBase):
             0,
         )
 
+    def gaussian_weight(self, ra, dec, sigma):
+        """Probability of a photon/ray to fall into the shell after a displacement by
+        a circular Gaussian seeing.
+
+        :param ra: angular coordinate of photon/ray (float or numpy array)
+        :param dec: angular coordinate of photon/ray (float or numpy array)
+        :param sigma: Gaussian sigma of the seeing
+        :return: probability in [0, 1] of the shape of ra
+        """
+        return shell_gaussian_weight(
+            ra, dec, sigma, self._r_in, self._r_out, self._center_ra, self._center_dec
+        )
+
+
+@export
+def shell_gaussian_weight(ra, dec, sigma, r_in, r_out, center_ra=0, center_dec=0):
+    """Probability of a photon/ray to fall into the shell after a displacement by a
+    circular Gaussian seeing. The squared distance of the displaced ray from the center
+    (in units of sigma) follows a non-central chi-squared distribution with two degrees
+    of freedom.
+
+    :param ra: angular coordinate of photon/ray (float or numpy array)
+    :param dec: angular coordinate of photon/ray (float or numpy array)
+    :param sigma: Gaussian sigma of the seeing
+    :param r_in: innermost radius to be selected
+    :param r_out: outermost radius to be selected
+    :param center_ra: center of the sphere
+    :param center_dec: center of the sphere
+    :return: probability in [0, 1]
+    """
+    nc = ((ra - center_ra) ** 2 + (dec - center_dec) ** 2) / sigma**2
+    return ncx2.cdf(r_out**2 / sigma**2, 2, nc) - ncx2.cdf(r_in**2 / sigma**2, 2, nc)
+
 
 @export
 def shell_select(ra, dec, r_in, r_out, center_ra=0, center_dec=0):
@@ -377,11 +551,14 @@ def shell_select(ra, dec, r_in, r_out, center_ra=0, center_dec=0):
     :param r_out: outermost radius to be selected
     :param center_ra: center of the sphere
     :param center_dec: center of the sphere
-    :return: boolean, True if within the radial range, False otherwise
+    :return: boolean, True if within the radial range, False otherwise (bool array for
+        arrays of rays)
     """
     x = ra - center_ra
     y = dec - center_dec
     r = np.sqrt(x**2 + y**2)
+    if np.ndim(r) > 0:
+        return (r >= r_in) & (r < r_out)
     if (r >= r_in) and (r < r_out):
         return True
     else:
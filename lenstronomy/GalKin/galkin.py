@@ -2,8 +2,7 @@ from lenstronomy.GalKin.observation import GalkinObservation
 from lenstronomy.GalKin.galkin_model import GalkinModel
 
 import numpy as np
-from scipy.signal import convolve2d
-from scipy.interpolate import interp1d
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["Galkin"]
 
@@ -47,6 +46,15 @@ class Galkin(GalkinModel, GalkinObservation):
 
     These numerical options should be chosen to allow for a converged result (within your tolerance) but not too
     conservative to impact too much the computational cost. Reasonable values might depend on the specific problem.
+
+    The averaged dispersion in the 'slit', 'shell' and 'frame' apertures can alternatively be computed with a
+    deterministic quadrature instead of the spectral rendering (kwargs_numerics options):
+
+        quadrature: bool, if True, dispersion() integrates the projected I(R)*sigma^2(R) and I(R) on a log-polar grid,
+        weighted by the probability of the seeing convolved light to fall into the aperture (analytic for a Gaussian
+        seeing, a Moffat seeing is approximated by its multi-Gaussian expansion).
+        quadrature_num_r: number of radial (Gauss-Legendre in log(R)) quadrature points.
+        quadrature_num_phi: number of azimuthal quadrature points.
     """
 
     def __init__(
@@ -68,6 +76,15 @@ class Galkin(GalkinModel, GalkinObservation):
         :param kwargs_numerics: numerics keyword arguments
         :param analytic_kinematics: bool, if True uses the analytic kinematic model
         """
+        kwargs_quadrature = {}
+        if kwargs_numerics is not None:
+            kwargs_numerics = dict(kwargs_numerics)
+            for key in ["quadrature", "quadrature_num_r", "quadrature_num_phi"]:
+                if key in kwargs_numerics:
+                    kwargs_quadrature[key] = kwargs_numerics.pop(key)
+        self._quadrature = kwargs_quadrature.get("quadrature", False)
+        self._quadrature_num_r = kwargs_quadrature.get("quadrature_num_r", 100)
+        self._quadrature_num_phi = kwargs_quadrature.get("quadrature_num_phi", 32)
         GalkinModel.__init__(
             self,
             kwargs_model,
@@ -81,7 +98,23 @@ class Galkin(GalkinModel, GalkinObservation):
             kwargs_psf=kwargs_psf,
             backend="galkin",
         )
+        if self._quadrature is True:
+            if self.aperture_type not in ["slit", "shell", "frame"]:
+                raise ValueError(
+                    "quadrature integration is only supported for the 'slit', 'shell' "
+                    "and 'frame' apertures, not for %s." % self.aperture_type
+                )
+            if self.psf_type not in ["GAUSSIAN", "MOFFAT", "MULTI_GAUSSIAN"]:
+                raise ValueError(
+                    "quadrature integration is not supported for the %s PSF."
+                    % self.psf_type
+                )
+            if not getattr(self.numerics, "lum_weight_int_method", True):
+                raise ValueError(
+                    "quadrature integration requires 'lum_weight_int_method' to be True!"
+                )
 
+    @timed("Galkin.dispersion")
     def dispersion(
         self, kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=1000
     ):
@@ -95,9 +128,13 @@ class Galkin(GalkinModel, GalkinObservation):
             anisotropy type chosen. We refer to the Anisotropy() class for details on
             the parameters.
         :param sampling_number: int, number of spectral sampling of the light
-            distribution
+            distribution (not used with the quadrature option of kwargs_numerics)
         :return: integrated LOS velocity dispersion in units [km/s]
         """
+        if self._quadrature is True:
+            return self._dispersion_quadrature(
+                kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
         sigma2_IR_sum = 0
         IR_sum = 0
         for i in range(0, sampling_number):
@@ -111,6 +148,158 @@ class Galkin(GalkinModel, GalkinObservation):
         self.numerics.delete_cache()
         return np.sqrt(sigma_s2_average) / 1000.0  # in units of km/s
 
+    def _dispersion_quadrature(self, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Computes the averaged LOS velocity dispersion in the aperture (convolved)
+        with a deterministic quadrature. The projected I(R)*sigma^2(R) and I(R) are
+        integrated on a log-polar grid around the center, weighted by the probability
+        of the seeing convolved light to fall into the aperture. Radii that do not
+        contribute to the aperture are not evaluated.
+
+        :param kwargs_mass: mass model parameters (following lenstronomy lens model
+            conventions)
+        :param kwargs_light: deflector light parameters (following lenstronomy light
+            model conventions)
+        :param kwargs_anisotropy: anisotropy parameters, may vary according to
+            anisotropy type chosen. We refer to the Anisotropy() class for details on
+            the parameters.
+        :return: integrated LOS velocity dispersion in units [km/s]
+        """
+        sigmas = np.atleast_1d(self.psf_multi_gauss_sigmas)
+        amplitudes = np.atleast_1d(self.psf_multi_gauss_amplitudes).astype(float)
+        amplitudes /= np.sum(amplitudes)
+
+        log_r_min = np.log(self.numerics.min_integrate)
+        log_r_max = np.log(self.aperture_max_radius + 5 * np.max(sigmas))
+        x, w = np.polynomial.legendre.leggauss(self._quadrature_num_r)
+        log_R = (log_r_max - log_r_min) / 2.0 * (x + 1) + log_r_min
+        R = np.exp(log_R)
+        # integration weights of R dR dphi / (2 pi) in log(R)
+        weight_R = w * (log_r_max - log_r_min) / 2.0 * R**2
+        phi = np.linspace(0, 2 * np.pi, self._quadrature_num_phi, endpoint=False)
+        ra = np.outer(R, np.cos(phi))
+        dec = np.outer(R, np.sin(phi))
+        aperture_weight = np.zeros_like(ra)
+        for amp, sigma in zip(amplitudes, sigmas):
+            aperture_weight += amp * self.aperture_gaussian_weight(ra, dec, sigma)
+        weight_R *= np.mean(aperture_weight, axis=1)
+
+        # only evaluate the kinematics at radii contributing to the aperture
+        contributing = weight_R > 1e-10 * np.max(weight_R)
+        sigma2_IR, IR = self.numerics.I_R_sigma2_and_IR(
+            R[contributing], kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        weight_R = weight_R[contributing]
+        sigma_s2_average = np.sum(weight_R * sigma2_IR) / np.sum(weight_R * IR)
+        self.numerics.delete_cache()
+        # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
+        return np.sqrt(sigma_s2_average) / 1000.0  # in units of km/s
+
+    @timed("Galkin.dispersion_batch")
+    def dispersion_batch(
+        self,
+        kwargs_mass_list,
+        kwargs_light_list,
+        kwargs_anisotropy_list,
+        sampling_number=1000,
+    ):
+        """Computes the averaged LOS velocity dispersion in the slit (convolved) for
+        several parameter samples.
+
+        With analytic kinematics, all samples are evaluated together: the tracer
+        particles are drawn (in units of the Hernquist scale radius) and displaced by
+        the PSF once for all samples, and the velocity dispersions of all samples are
+        evaluated in a vectorized way. Otherwise, the samples are evaluated one after
+        the other with dispersion().
+
+        :param kwargs_mass_list: list of mass model parameters, one per sample
+        :param kwargs_light_list: list of deflector light parameters, one per sample
+        :param kwargs_anisotropy_list: list of anisotropy parameters, one per sample
+        :param sampling_number: int, number of spectral sampling of the light
+            distribution
+        :return: integrated LOS velocity dispersions in units [km/s], one per sample
+        """
+        num_samples = len(kwargs_mass_list)
+        if len(kwargs_light_list) != num_samples or (
+            len(kwargs_anisotropy_list) != num_samples
+        ):
+            raise ValueError(
+                "kwargs_mass_list, kwargs_light_list and kwargs_anisotropy_list need to "
+                "have the same length."
+            )
+        if not self._analytic_kinematics:
+            return np.array(
+                [
+                    self.dispersion(
+                        kwargs_mass,
+                        kwargs_light,
+                        kwargs_anisotropy,
+                        sampling_number=sampling_number,
+                    )
+                    for kwargs_mass, kwargs_light, kwargs_anisotropy in zip(
+                        kwargs_mass_list, kwargs_light_list, kwargs_anisotropy_list
+                    )
+                ]
+            )
+        sigma2_IR_sum = np.zeros(num_samples)
+        IR_sum = np.zeros(num_samples)
+        count = np.zeros(num_samples, dtype=int)
+        num_draw = sampling_number
+        while True:
+            pending = np.where(count < sampling_number)[0]
+            if len(pending) == 0:
+                break
+            kwargs_mass_pending = [kwargs_mass_list[k] for k in pending]
+            kwargs_light_pending = [kwargs_light_list[k] for k in pending]
+            kwargs_anisotropy_pending = [kwargs_anisotropy_list[k] for k in pending]
+            r, R, x, y = self.numerics.draw_light_batch(kwargs_light_pending, num_draw)
+            dx, dy = self.displace_psf(np.zeros(num_draw), np.zeros(num_draw))
+            in_aperture = self._aperture_select_array(x + dx, y + dy)
+            # keep the first draws in the aperture up to the requested sampling number
+            remaining = sampling_number - count[pending]
+            selected = in_aperture & (
+                np.cumsum(in_aperture, axis=1) <= remaining[:, np.newaxis]
+            )
+            sigma2_IR, IR = self.numerics.sigma_s2_batch(
+                r,
+                R,
+                kwargs_mass_pending,
+                kwargs_light_pending,
+                kwargs_anisotropy_pending,
+            )
+            sigma2_IR_sum[pending] += np.sum(np.where(selected, sigma2_IR, 0), axis=1)
+            IR_sum[pending] += np.sum(selected * IR, axis=1)
+            count[pending] += np.sum(selected, axis=1)
+            # size the next round of draws with the observed acceptance rate
+            acceptance = np.maximum(np.mean(in_aperture, axis=1), 1.0 / num_draw)
+            remaining = sampling_number - count[pending]
+            num_draw = int(
+                np.clip(
+                    np.ceil(1.2 * np.max(remaining / acceptance)),
+                    1,
+                    10 * sampling_number,
+                )
+            )
+        sigma_s2_average = sigma2_IR_sum / IR_sum
+        # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
+        return np.sqrt(sigma_s2_average) / 1000.0  # in units of km/s
+
+    def _aperture_select_array(self, ra, dec):
+        """Aperture selection of arrays of rays.
+
+        :param ra: angular coordinates of photons/rays (numpy array)
+        :param dec: angular coordinates of photons/rays (numpy array)
+        :return: bool array, True if the photon/ray is within the aperture
+        """
+        if self.aperture_type in ["slit", "frame", "shell"]:
+            bool_ap, _ = self.aperture_select(ra, dec)
+            return bool_ap
+        select = np.vectorize(
+            lambda ra_, dec_: self.aperture_select(ra_, dec_)[0] is True,
+            otypes=[bool],
+        )
+        return select(ra, dec)
+
+    @timed("Galkin.dispersion_map")
     def dispersion_map(
         self,
         kwargs_mass,
@@ -157,108 +346,7 @@ class Galkin(GalkinModel, GalkinObservation):
         self.numerics.delete_cache()
         return np.sqrt(sigma_s2_average) / 1000.0  # in units of km/s
 
-    @staticmethod
-    def _extract_center(kwargs):
-        if not isinstance(kwargs, dict):
-            if "center_x" in kwargs[0]:
-                return kwargs[0]["center_x"], kwargs[0]["center_y"]
-            else:
-                return 0, 0
-        else:
-            if "center_x" in kwargs:
-                return kwargs["center_x"], kwargs["center_y"]
-            else:
-                return 0, 0
-
-    def _delta_pix_xy(self):
-        """Get the pixel scale of the grid.
-
-        :return: delta_x, delta_y
-        """
-        x_grid = self._aperture.x_grid
-        y_grid = self._aperture.y_grid
-        delta_x = x_grid[0, 1] - x_grid[0, 0]
-        delta_y = y_grid[1, 0] - y_grid[0, 0]
-
-        return delta_x, delta_y
-
-    def _get_grid(self, kwargs_mass, supersampling_factor=1):
-        """Compute the grid to compute the dispersion map on.
-
-        :param kwargs_mass: keyword arguments of the mass model
-        :param supersampling_factor: sampling factor for the grid to do the 2D
-            convolution on
-        :return: x_grid, y_grid, log10_radial_distance_from_center
-        """
-        mass_center_x, mass_center_y = self._extract_center(kwargs_mass)
-
-        delta_x, delta_y = self._delta_pix_xy()
-        assert np.abs(delta_x) == np.abs(delta_y)
-
-        x_grid = self._aperture.x_grid
-        y_grid = self._aperture.y_grid
-
-        new_delta_x = delta_x / supersampling_factor
-        new_delta_y = delta_y / supersampling_factor
-        x_start = x_grid[0, 0] - delta_x / 2.0 * (1 - 1 / supersampling_factor)
-        x_end = x_grid[0, -1] + delta_x / 2.0 * (1 - 1 / supersampling_factor)
-        y_start = y_grid[0, 0] - delta_y / 2.0 * (1 - 1 / supersampling_factor)
-        y_end = y_grid[-1, 0] + delta_y / 2.0 * (1 - 1 / supersampling_factor)
-
-        xs = np.arange(x_start, x_end * (1 + 1e-6), new_delta_x)
-        ys = np.arange(y_start, y_end * (1 + 1e-6), new_delta_y)
-
-        x_grid_supersampled, y_grid_supersmapled = np.meshgrid(xs, ys)
-
-        log10_radial_distance_from_center = np.log10(
-            np.sqrt(
-                (x_grid_supersampled - mass_center_x) ** 2
-                + (y_grid_supersmapled - mass_center_y) ** 2
-            )
-        )
-
-        return (
-            x_grid_supersampled,
-            y_grid_supersmapled,
-            log10_radial_distance_from_center,
-        )
-
-    def _get_convolution_kernel(self, fwhm_factor=3, supersampling_factor=1):
-        """Normalized convolution kernel.
-
-        :param delta_x: pixel scale of kernel
-        :param delta_y: pixel scale of kernel
-        :param fwhm_factor: number of FWHM to compute the kernel on
-        :param supersampling_factor: number of sub-pixels to compute the kernel on
-        """
-        delta_x, delta_y = self._delta_pix_xy()
-
-        delta_x_sub = np.abs(delta_x) / supersampling_factor
-        num_x = int(round(2 * fwhm_factor * self._psf.fwhm / delta_x_sub + 0.5))
-        if num_x % 2 == 0:
-            num_x += 1
-
-        psf_x = np.arange(
-            -delta_x_sub * (num_x - 1) / 2,
-            delta_x_sub * (num_x + 1) / 2,
-            delta_x_sub,
-        )
-
-        delta_y_sub = np.abs(delta_y) / supersampling_factor
-        num_y = int(round(2 * fwhm_factor * self._psf.fwhm / delta_y_sub + 0.5))
-        if num_y % 2 == 0:
-            num_y += 1
-
-        psf_y = np.arange(
-            -delta_y_sub * (num_y - 1) / 2,
-            delta_y_sub * (num_y + 1) / 2,
-            delta_y_sub,
-        )
-
-        psf_x_grid, psf_y_grid = np.meshgrid(psf_x, psf_y)
-
-        return self.convolution_kernel_grid(psf_x_grid, psf_y_grid)
-
+    @timed("Galkin.dispersion_map_grid_convolved")
     def dispersion_map_grid_convolved(
         self,
         kwargs_mass,
@@ -266,6 +354,7 @@ class Galkin(GalkinModel, GalkinObservation):
         kwargs_anisotropy,
         supersampling_factor=None,
         voronoi_bins=None,
+        pool=None,
     ):
         """Computes the velocity dispersion in each Integral Field Unit.
 
@@ -276,6 +365,9 @@ class Galkin(GalkinModel, GalkinObservation):
             convolution on
         :param voronoi_bins: mapping of the voronoi bins, bin indices should start from
             0, -1 values for pixels not binned
+        :param pool: (optional) pool with a map() method (e.g. a
+            concurrent.futures.ThreadPoolExecutor) over which the radial integrals of
+            I(R)*sigma^2 are distributed
         :return: ordered array of velocity dispersions [km/s] for each unit
         """
         if hasattr(self.numerics, "lum_weight_int_method"):
@@ -295,90 +387,24 @@ class Galkin(GalkinModel, GalkinObservation):
             log10_radial_distance_from_center,
         ) = self._get_grid(kwargs_mass, supersampling_factor=supersampling_factor)
 
-        x_grid = self._aperture.x_grid
-        y_grid = self._aperture.y_grid
-
-        mass_center_x, mass_center_y = self._extract_center(kwargs_mass)
-        R_max = np.sqrt(
-            (x_grid_supersmapled - mass_center_x) ** 2
-            + (y_grid_supersmapled - mass_center_y) ** 2
-        ).max()
-        Rs = np.logspace(
-            np.log10(self.numerics.min_integrate), np.log10(R_max + 0.1), 300
-        )
-        sigma2_IRs = np.zeros_like(Rs)
-        IRs = np.zeros_like(Rs)
-
-        for i, R in enumerate(Rs):
-            sigma2_IRs[i], IRs[i] = self.numerics.I_R_sigma2_and_IR(
-                R, kwargs_mass, kwargs_light, kwargs_anisotropy
-            )
-
-        log10_Rs = np.log10(Rs)
-        log10_sigma2_IRs = np.log10(sigma2_IRs)
-        log10_IRs = np.log10(IRs)
-
-        log10_sigma2_interp = interp1d(
-            log10_Rs,
-            log10_sigma2_IRs,
-            kind="linear",
-            bounds_error=False,
-            fill_value=(log10_sigma2_IRs[0], log10_sigma2_IRs[-1]),
-            assume_sorted=True,
+        log10_sigma2_interp, log10_IR_interp = self._I_R_sigma2_log_interp(
+            np.max(log10_radial_distance_from_center),
+            kwargs_mass,
+            kwargs_light,
+            kwargs_anisotropy,
+            pool=pool,
         )
-        log10_IR_interp = interp1d(
-            log10_Rs,
-            log10_IRs,
-            kind="linear",
-            bounds_error=False,
-            fill_value=(log10_IRs[0], log10_IRs[-1]),
-            assume_sorted=True,
-        )
-
         sigma2_IR_grid = 10 ** log10_sigma2_interp(log10_radial_distance_from_center)
         IR_grid = 10 ** log10_IR_interp(log10_radial_distance_from_center)
+        self.numerics.delete_cache()
 
-        convolution_kernel = self._get_convolution_kernel(
-            fwhm_factor=3, supersampling_factor=supersampling_factor
-        )
-
-        sigma2_IR_convolved = convolve2d(
-            sigma2_IR_grid, convolution_kernel, mode="same"
+        sigma2_IR_integrated, IR_integrated = self._convolve_and_bin(
+            sigma2_IR_grid,
+            IR_grid,
+            supersampling_factor=supersampling_factor,
+            voronoi_bins=voronoi_bins,
         )
-        IR_convolved = convolve2d(IR_grid, convolution_kernel, mode="same")
-
-        if voronoi_bins is not None:
-            n_bins = int(np.max(voronoi_bins)) + 1
-
-            sigma_IR_integrated = np.zeros(n_bins)
-            IR_integrated = np.zeros(n_bins)
-
-            supersampled_voronoi_bins = voronoi_bins.repeat(
-                supersampling_factor, axis=0
-            ).repeat(supersampling_factor, axis=1)
-
-            for n in range(n_bins):
-                sigma_IR_integrated[n] = np.sum(
-                    sigma2_IR_convolved[supersampled_voronoi_bins == n]
-                )
-                IR_integrated[n] = np.sum(IR_convolved[supersampled_voronoi_bins == n])
-        else:
-            sigma_IR_integrated = (
-                sigma2_IR_convolved.reshape(
-                    len(x_grid), supersampling_factor, len(y_grid), supersampling_factor
-                )
-                .sum(3)
-                .sum(1)
-            )
-            IR_integrated = (
-                IR_convolved.reshape(
-                    len(x_grid), supersampling_factor, len(y_grid), supersampling_factor
-                )
-                .sum(3)
-                .sum(1)
-            )
-
-        sigma2_grid = sigma_IR_integrated / IR_integrated
+        sigma2_grid = sigma2_IR_integrated / IR_integrated
 
         # apply unit conversion from arc seconds and deflections to physical velocity
         # dispersion in (km/s)
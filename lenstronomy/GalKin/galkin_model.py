@@ -1,6 +1,9 @@
 from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
 from lenstronomy.GalKin.analytic_kinematics import AnalyticKinematics
 
+import numpy as np
+from scipy.interpolate import interp1d
+
 __all__ = ["GalkinModel"]
 
 
@@ -104,3 +107,57 @@ class GalkinModel(object):
         grav_pot_dr = self.numerics.grav_potential(r_dr, kwargs_mass)
         self.numerics.delete_cache()
         return r * (sigmar2_dr - sigmar2 - grav_pot + grav_pot_dr) / dr
+
+    def _I_R_sigma2_log_interp(
+        self,
+        log10_R_max,
+        kwargs_mass,
+        kwargs_light,
+        kwargs_anisotropy,
+        pool=None,
+        num_R=300,
+    ):
+        """Tabulates I(R)*sigma^2 and I(R) on logarithmically spaced projected radii and
+        interpolates them linearly in log space. The table is shared by all pixels (and
+        observations) the dispersion is evaluated at.
+
+        :param log10_R_max: log10 of the largest projected radius to be evaluated
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param pool: (optional) pool with a map() method over which the radial
+            integrals are distributed
+        :param num_R: number of radii of the table
+        :return: interpolation functions of log10(R) returning log10(I(R)*sigma^2) and
+            log10(I(R))
+        """
+        Rs = np.logspace(
+            np.log10(self.numerics.min_integrate),
+            np.log10(10**log10_R_max + 0.1),
+            num_R,
+        )
+        sigma2_IRs, IRs = self.numerics.I_R_sigma2_and_IR(
+            Rs, kwargs_mass, kwargs_light, kwargs_anisotropy, pool=pool
+        )
+
+        log10_Rs = np.log10(Rs)
+        log10_sigma2_IRs = np.log10(sigma2_IRs)
+        log10_IRs = np.log10(IRs)
+
+        log10_sigma2_interp = interp1d(
+            log10_Rs,
+            log10_sigma2_IRs,
+            kind="linear",
+            bounds_error=False,
+            fill_value=(log10_sigma2_IRs[0], log10_sigma2_IRs[-1]),
+            assume_sorted=True,
+        )
+        log10_IR_interp = interp1d(
+            log10_Rs,
+            log10_IRs,
+            kind="linear",
+            bounds_error=False,
+            fill_value=(log10_IRs[0], log10_IRs[-1]),
+            assume_sorted=True,
+        )
+        return log10_sigma2_interp, log10_IR_interp
@@ -12,7 +12,8 @@ class GalkinMultiObservation(GalkinModel):
     lens.
 
     The main difference to the Galkin main class is that it feeds in list of
-    observational settings. Does not work with IFU observations (yet)
+    observational settings. The velocity dispersion maps of several IFU observations
+    are computed with dispersion_map_grid_convolved().
     """
 
     def __init__(
@@ -98,3 +99,103 @@ class GalkinMultiObservation(GalkinModel):
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
         self.numerics.delete_cache()
         return np.sqrt(sigma_s2_average) / 1000.0  # in units of km/s
+
+    def dispersion_map_grid_convolved(
+        self,
+        kwargs_mass,
+        kwargs_light,
+        kwargs_anisotropy,
+        supersampling_factor=None,
+        voronoi_bins_list=None,
+        pool=None,
+    ):
+        """Computes the velocity dispersion in each Integral Field Unit of all (IFU)
+        observations. The projected I(R)*sigma^2 is tabulated once for all
+        observations and the convolutions of the observations can be distributed over
+        a pool.
+
+        :param kwargs_mass: keyword arguments of the mass model
+        :param kwargs_light: keyword argument of the light model
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :param supersampling_factor: sampling factor for the grid to do the 2D
+            convolution on, if None, uses the default of each observation
+        :param voronoi_bins_list: (optional) list of the mapping of the voronoi bins
+            (or None) of each observation with an IFU_grid aperture
+        :param pool: (optional) pool with a map() method (e.g. a
+            concurrent.futures.ThreadPoolExecutor) over which the radial integrals and
+            the convolutions of the observations are distributed
+        :return: list of the velocity dispersions [km/s] of each observation
+        """
+        if hasattr(self.numerics, "lum_weight_int_method"):
+            if not self.numerics.lum_weight_int_method:
+                raise ValueError("'lum_weight_int_method' must be True!")
+        if voronoi_bins_list is None:
+            voronoi_bins_list = [None] * self._num_observations
+        args_list = []
+        log10_R_max = -np.inf
+        for observation, voronoi_bins in zip(self._observation_list, voronoi_bins_list):
+            if observation.aperture_type not in ["IFU_grid", "IFU_binned"]:
+                raise ValueError(
+                    "dispersion_map_grid_convolved() requires IFU_grid or IFU_binned "
+                    "apertures, not %s." % observation.aperture_type
+                )
+            if (voronoi_bins is not None) and observation.aperture_type != "IFU_grid":
+                raise ValueError(
+                    "Voronoi bins can only be used with the IFU_grid aperture!"
+                )
+            if observation.aperture_type == "IFU_binned":
+                voronoi_bins = observation._aperture.bins
+            supersampling_factor_ = supersampling_factor
+            if supersampling_factor_ is None:
+                supersampling_factor_ = observation._default_supersampling_factor
+            _, _, log10_radial_distance_from_center = observation._get_grid(
+                kwargs_mass, supersampling_factor=supersampling_factor_
+            )
+            log10_R_max = max(log10_R_max, np.max(log10_radial_distance_from_center))
+            args_list.append(
+                [
+                    observation,
+                    log10_radial_distance_from_center,
+                    supersampling_factor_,
+                    voronoi_bins,
+                ]
+            )
+
+        log10_sigma2_interp, log10_IR_interp = self._I_R_sigma2_log_interp(
+            log10_R_max, kwargs_mass, kwargs_light, kwargs_anisotropy, pool=pool
+        )
+        self.numerics.delete_cache()
+        for args in args_list:
+            log10_R = args[1]
+            args[1] = (
+                10 ** log10_sigma2_interp(log10_R),
+                10 ** log10_IR_interp(log10_R),
+            )
+
+        if pool is None:
+            integrated_list = map(_convolve_and_bin, args_list)
+        else:
+            integrated_list = pool.map(_convolve_and_bin, args_list)
+        # apply unit conversion from arc seconds and deflections to physical velocity
+        # dispersion in (km/s)
+        return [
+            np.sqrt(sigma2_IR_integrated / IR_integrated) / 1000.0
+            for sigma2_IR_integrated, IR_integrated in integrated_list
+        ]
+
+
+def _convolve_and_bin(args):
+    """Convolution and binning of the I(R)*sigma^2 and I(R) grids of an observation
+    (module-level function to be mapped over a pool).
+
+    :param args: observation (GalkinObservation instance), tuple of the I(R)*sigma^2
+        and I(R) grids, supersampling factor, voronoi bins (or None)
+    :return: I(R)*sigma^2 and I(R) summed in each pixel or bin
+    """
+    observation, (sigma2_IR_grid, IR_grid), supersampling_factor, voronoi_bins = args
+    return observation._convolve_and_bin(
+        sigma2_IR_grid,
+        IR_grid,
+        supersampling_factor=supersampling_factor,
+        voronoi_bins=voronoi_bins,
+    )
@@ -0,0 +1,405 @@
+__author__ = "sibirrer"
+
+import json
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
+
+__all__ = ["JeansEmulator"]
+
+# power-law mass profiles (parameters theta_E and gamma) with the 3d mass of the SPP profile
+_POWER_LAW_MASS = ["SPP", "SPEP", "PEMD", "EPL", "EPL_Q_PHI"]
+# light profiles with a single scale radius and the name of that parameter
+_LIGHT_SCALE = {
+    "HERNQUIST": "Rs",
+    "HERNQUIST_ELLIPSE": "Rs",
+    "GAUSSIAN": "sigma",
+    "GAUSSIAN_ELLIPSE": "sigma",
+}
+# anisotropy models with at most one parameter: (parameter name, log10 scaling of the
+# axis in units of the light scale radius, default range)
+_ANISOTROPY_PARAM = {
+    "isotropic": None,
+    "radial": None,
+    "OM": ("r_ani", True, (0.1, 10.0)),
+    "const": ("beta", False, (-0.5, 0.8)),
+}
+# cosmology of the tabulation (the table is normalized by D_s / D_ds)
+_KWARGS_COSMO = {"d_d": 1000.0, "d_s": 2000.0, "d_ds": 1000.0}
+
+
+class JeansEmulator(object):
+    """Tabulated luminosity-weighted line-of-sight velocity dispersion sigma^2(R) =
+    I(R) sigma^2(R) / I(R) (equation A15 in Mamon & Lokas 2005) of a spherical power-law
+    mass profile, a light profile with a single scale radius r_s and an anisotropy model
+    with at most one parameter.
+
+    The dimensionless table is computed with NumericKinematics on a regular grid in
+    (power-law slope gamma, anisotropy parameter, log10 R / r_s), where the anisotropy
+    parameter is log10(r_ani / r_s) for Osipkov-Merritt and beta for constant
+    anisotropy. The dependence on the remaining parameters is analytic:
+
+    sigma^2(R) = theta_E^(gamma - 1) r_s^(2 - gamma) D_s / D_ds S(gamma, a, R / r_s)
+
+    At runtime, S is interpolated (multilinear by default) in log space. The accuracy of
+    the emulator is estimated when tabulating with direct computations at random
+    parameters inside the grid (error_bound, maximum relative error of sigma^2 over the
+    tested radii). The truncation of the numerical integrals at min_integrate and
+    max_integrate, which breaks the scale-invariance, is not part of this estimate and
+    is negligible for r_s well within these bounds.
+
+    The emulator is used by NumericKinematics (and hence Galkin, KinematicsAPI and
+    TDCosmography) when passed with the numerical settings, e.g.
+    kwargs_numerics_galkin = {..., 'emulator': JeansEmulator.load(path)}. Parameters
+    outside the tabulated range are computed numerically.
+    """
+
+    def __init__(
+        self,
+        kwargs_model,
+        gamma_array,
+        anisotropy_array,
+        log_x_array,
+        log_s2_table,
+        kwargs_numerics=None,
+        error_bound=None,
+        method="linear",
+    ):
+        """
+
+        :param kwargs_model: keyword arguments of the kinematic model with
+            'mass_profile_list', 'light_profile_list' and 'anisotropy_model' (one
+            profile each)
+        :param gamma_array: grid of power-law slopes
+        :param anisotropy_array: grid of the anisotropy parameter (empty for anisotropy
+            models without parameter)
+        :param log_x_array: grid of log10(R / r_s)
+        :param log_s2_table: natural logarithm of S on the grid
+        :param kwargs_numerics: numerical settings of NumericKinematics used to compute
+            the table
+        :param error_bound: estimated maximum relative error of sigma^2
+        :param method: interpolation method of scipy's RegularGridInterpolator
+            ('linear', 'cubic', ...)
+        """
+        self._mass_profile, self._light_profile, self._anisotropy_model = _check_model(
+            kwargs_model
+        )
+        self._kwargs_model = {
+            "mass_profile_list": [self._mass_profile],
+            "light_profile_list": [self._light_profile],
+            "anisotropy_model": self._anisotropy_model,
+        }
+        self._gamma_array = np.asarray(gamma_array, dtype=float)
+        self._anisotropy_array = np.asarray(anisotropy_array, dtype=float)
+        self._log_x_array = np.asarray(log_x_array, dtype=float)
+        self._log_s2_table = np.asarray(log_s2_table, dtype=float)
+        self._kwargs_numerics = kwargs_numerics
+        self.error_bound = error_bound
+        self._method = method
+        self._anisotropy_param = _ANISOTROPY_PARAM[self._anisotropy_model]
+        points = [self._gamma_array, self._log_x_array]
+        if self._anisotropy_param is not None:
+            points.insert(1, self._anisotropy_array)
+        self._interp = RegularGridInterpolator(
+            points,
+            self._log_s2_table,
+            method=method,
+            bounds_error=False,
+            fill_value=None,
+        )
+
+    @classmethod
+    def tabulate(
+        cls,
+        kwargs_model,
+        gamma_range=(1.5, 2.5),
+        num_gamma=21,
+        anisotropy_range=None,
+        num_anisotropy=21,
+        x_range=(1e-3, 20),
+        num_x=100,
+        kwargs_numerics=None,
+        method="linear",
+        num_validate=10,
+        seed=None,
+    ):
+        """Computes the table numerically.
+
+        :param kwargs_model: keyword arguments of the kinematic model with
+            'mass_profile_list', 'light_profile_list' and 'anisotropy_model' (one
+            profile each)
+        :param gamma_range: (min, max) of the power-law slope
+        :param num_gamma: number of grid points in gamma
+        :param anisotropy_range: (min, max) of r_ani / r_s (OM) or beta (const). Default
+            is (0.1, 10) for OM and (-0.5, 0.8) for const
+        :param num_anisotropy: number of grid points of the anisotropy parameter
+        :param x_range: (min, max) of R / r_s
+        :param num_x: number of grid points in R / r_s (logarithmically spaced)
+        :param kwargs_numerics: numerical settings of NumericKinematics (in units of the
+            light scale radius)
+        :param method: interpolation method of scipy's RegularGridInterpolator
+        :param num_validate: number of random parameter sets inside the grid at which
+            the emulator is compared with a direct computation to estimate error_bound
+        :param seed: seed of the random validation parameters
+        :return: JeansEmulator instance
+        """
+        _, light_profile, anisotropy_model = _check_model(kwargs_model)
+        if kwargs_numerics is None:
+            kwargs_numerics = {}
+        kinematics = NumericKinematics(kwargs_model, _KWARGS_COSMO, **kwargs_numerics)
+        gamma_array = np.linspace(gamma_range[0], gamma_range[1], num_gamma)
+        anisotropy_param = _ANISOTROPY_PARAM[anisotropy_model]
+        if anisotropy_param is None:
+            anisotropy_array = np.array([])
+        else:
+            _, log_scale, default_range = anisotropy_param
+            if anisotropy_range is None:
+                anisotropy_range = default_range
+            if log_scale is True:
+                anisotropy_range = np.log10(anisotropy_range)
+            anisotropy_array = np.linspace(
+                anisotropy_range[0], anisotropy_range[1], num_anisotropy
+            )
+        log_x_array = np.linspace(np.log10(x_range[0]), np.log10(x_range[1]), num_x)
+        x_array = 10**log_x_array
+
+        log_s2_table = np.zeros(
+            (num_gamma, max(len(anisotropy_array), 1), num_x), dtype=float
+        )
+        for i, gamma in enumerate(gamma_array):
+            for j, anisotropy in enumerate(
+                anisotropy_array if anisotropy_param is not None else [None]
+            ):
+                s2 = _sigma2_numeric(
+                    kinematics,
+                    x_array,
+                    gamma,
+                    anisotropy,
+                    light_profile,
+                    anisotropy_model,
+                )
+                if np.any(s2 <= 0):
+                    raise ValueError(
+                        "non-positive velocity dispersion in the table, reduce x_range "
+                        "or increase max_integrate of kwargs_numerics."
+                    )
+                log_s2_table[i, j] = np.log(s2)
+        if anisotropy_param is None:
+            log_s2_table = log_s2_table[:, 0, :]
+        emulator = cls(
+            kwargs_model,
+            gamma_array,
+            anisotropy_array,
+            log_x_array,
+            log_s2_table,
+            kwargs_numerics=kwargs_numerics,
+            method=method,
+        )
+        if num_validate > 0:
+            emulator.error_bound = emulator.validate(
+                kinematics, num_validate=num_validate, seed=seed
+            )
+        return emulator
+
+    def validate(self, kinematics, num_validate=10, seed=None):
+        """Maximum relative error of sigma^2 of the emulator compared to a direct
+        computation at random parameters inside the grid and at radii between the grid
+        points.
+
+        :param kinematics: NumericKinematics instance of the model of the emulator
+        :param num_validate: number of random parameter sets
+        :param seed: seed of the random parameters
+        :return: maximum relative error
+        """
+        random = np.random.RandomState(seed)
+        x_array = 10 ** ((self._log_x_array[1:] + self._log_x_array[:-1]) / 2)
+        error = 0
+        for _ in range(num_validate):
+            gamma = random.uniform(self._gamma_array[0], self._gamma_array[-1])
+            anisotropy = None
+            if self._anisotropy_param is not None:
+                anisotropy = random.uniform(
+                    self._anisotropy_array[0], self._anisotropy_array[-1]
+                )
+            s2 = _sigma2_numeric(
+                kinematics,
+                x_array,
+                gamma,
+                anisotropy,
+                self._light_profile,
+                self._anisotropy_model,
+            )
+            s2_emulated = np.exp(self._interpolate(x_array, gamma, anisotropy))
+            error = max(error, np.max(np.abs(s2_emulated / s2 - 1)))
+        return float(error)
+
+    @property
+    def kwargs_model(self):
+        """Kinematic model of the emulator.
+
+        :return: keyword arguments with 'mass_profile_list', 'light_profile_list' and
+            'anisotropy_model'
+        """
+        return self._kwargs_model
+
+    def supports(self, kwargs_model):
+        """Checks whether the emulator describes a kinematic model.
+
+        :param kwargs_model: keyword arguments of the kinematic model
+        :return: bool
+        """
+        return (
+            list(kwargs_model.get("mass_profile_list", []))
+            == self._kwargs_model["mass_profile_list"]
+            and list(kwargs_model.get("light_profile_list", []))
+            == self._kwargs_model["light_profile_list"]
+            and kwargs_model.get("anisotropy_model") == self._anisotropy_model
+        )
+
+    def sigma2(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Luminosity-weighted line-of-sight velocity dispersion squared for D_s / D_ds
+        = 1.
+
+        :param R: projected radius (float or array) in arc seconds
+        :param kwargs_mass: mass model keyword argument list
+        :param kwargs_light: light model keyword argument list
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :return: sigma^2(R) in (m/s)^2 or None if the parameters or any R / r_s are
+            outside the tabulated range
+        """
+        theta_E = kwargs_mass[0]["theta_E"]
+        gamma = kwargs_mass[0]["gamma"]
+        r_s = kwargs_light[0][_LIGHT_SCALE[self._light_profile]]
+        anisotropy = None
+        if self._anisotropy_param is not None:
+            param, log_scale, _ = self._anisotropy_param
+            anisotropy = kwargs_anisotropy[param]
+            if log_scale is True:
+                anisotropy = np.log10(anisotropy / r_s)
+            if (
+                not self._anisotropy_array[0]
+                <= anisotropy
+                <= self._anisotropy_array[-1]
+            ):
+                return None
+        if not self._gamma_array[0] <= gamma <= self._gamma_array[-1]:
+            return None
+        x = np.asarray(R, dtype=float) / r_s
+        x_min, x_max = 10 ** self._log_x_array[[0, -1]]
+        if np.any(x < x_min) or np.any(x > x_max):
+            return None
+        log_s2 = self._interpolate(x, gamma, anisotropy)
+        return np.exp(log_s2) * theta_E ** (gamma - 1) * r_s ** (2 - gamma)
+
+    def save(self, path):
+        """Writes the table to disk (numpy .npz format).
+
+        :param path: file path
+        :return: None
+        """
+        metadata = {
+            "kwargs_model": self._kwargs_model,
+            "kwargs_numerics": self._kwargs_numerics,
+            "error_bound": self.error_bound,
+            "method": self._method,
+        }
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                gamma_array=self._gamma_array,
+                anisotropy_array=self._anisotropy_array,
+                log_x_array=self._log_x_array,
+                log_s2_table=self._log_s2_table,
+                metadata=np.array(json.dumps(metadata)),
+            )
+
+    @classmethod
+    def load(cls, path):
+        """Reads a table written with save().
+
+        :param path: file path
+        :return: JeansEmulator instance
+        """
+        with np.load(path) as data:
+            metadata = json.loads(str(data["metadata"]))
+            return cls(
+                metadata["kwargs_model"],
+                data["gamma_array"],
+                data["anisotropy_array"],
+                data["log_x_array"],
+                data["log_s2_table"],
+                kwargs_numerics=metadata["kwargs_numerics"],
+                error_bound=metadata["error_bound"],
+                method=metadata["method"],
+            )
+
+    def _interpolate(self, x, gamma, anisotropy=None):
+        """Interpolated log S.
+
+        :param x: R / r_s (float or array) within the tabulated range
+        :param gamma: power-law slope
+        :param anisotropy: anisotropy parameter of the grid (None if not tabulated)
+        :return: log S with the shape of x
+        """
+        x = np.asarray(x, dtype=float)
+        log_x = np.log10(x)
+        points = [np.full(log_x.size, gamma), log_x.ravel()]
+        if self._anisotropy_param is not None:
+            points.insert(1, np.full(log_x.size, anisotropy))
+        return self._interp(np.stack(points, axis=-1)).reshape(x.shape)
+
+
+def _check_model(kwargs_model):
+    """Checks that the kinematic model is supported by the emulator.
+
+    :param kwargs_model: keyword arguments of the kinematic model
+    :return: mass profile, light profile, anisotropy model
+    """
+    mass_profile_list = list(kwargs_model.get("mass_profile_list", []))
+    light_profile_list = list(kwargs_model.get("light_profile_list", []))
+    anisotropy_model = kwargs_model.get("anisotropy_model")
+    if len(mass_profile_list) != 1 or mass_profile_list[0] not in _POWER_LAW_MASS:
+        raise ValueError(
+            "JeansEmulator requires a single power-law mass profile out of %s, got %s."
+            % (_POWER_LAW_MASS, mass_profile_list)
+        )
+    if len(light_profile_list) != 1 or light_profile_list[0] not in _LIGHT_SCALE:
+        raise ValueError(
+            "JeansEmulator requires a single light profile out of %s, got %s."
+            % (list(_LIGHT_SCALE.keys()), light_profile_list)
+        )
+    if anisotropy_model not in _ANISOTROPY_PARAM:
+        raise ValueError(
+            "JeansEmulator supports the anisotropy models %s, got %s."
+            % (list(_ANISOTROPY_PARAM.keys()), anisotropy_model)
+        )
+    return mass_profile_list[0], light_profile_list[0], anisotropy_model
+
+
+def _sigma2_numeric(
+    kinematics, x_array, gamma, anisotropy, light_profile, anisotropy_model
+):
+    """Numerical S(gamma, anisotropy, x) for theta_E = 1, r_s = 1 and D_s / D_ds = 1.
+
+    :param kinematics: NumericKinematics instance
+    :param x_array: R / r_s
+    :param gamma: power-law slope
+    :param anisotropy: anisotropy parameter of the grid
+    :param light_profile: light profile name
+    :param anisotropy_model: anisotropy model name
+    :return: S at x_array
+    """
+    kwargs_mass = [{"theta_E": 1.0, "gamma": gamma}]
+    kwargs_light = [{"amp": 1.0, _LIGHT_SCALE[light_profile]: 1.0}]
+    kwargs_anisotropy = {}
+    anisotropy_param = _ANISOTROPY_PARAM[anisotropy_model]
+    if anisotropy_param is not None:
+        param, log_scale, _ = anisotropy_param
+        kwargs_anisotropy[param] = 10**anisotropy if log_scale is True else anisotropy
+    I_R_sigma2, I_R = kinematics.I_R_sigma2_and_IR(
+        x_array, kwargs_mass, kwargs_light, kwargs_anisotropy
+    )
+    kinematics.delete_cache()
+    return I_R_sigma2 / I_R * kinematics.cosmo.dds / kinematics.cosmo.ds
@@ -295,6 +295,8 @@ class LightProfile(object):
             del self._light_cdf_log
         if hasattr(self, "_light_cdf"):
             del self._light_cdf
+        if hasattr(self, "_light_3d_cdf_log"):
+            del self._light_3d_cdf_log
         if hasattr(self, "_f_light_3d"):
             del self._f_light_3d
         if hasattr(self, "_kwargs_light_circularized"):
@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 from scipy.interpolate import interp1d
 
@@ -22,6 +24,7 @@ class NumericKinematics(Anisotropy):
         min_integrate=0.0001,
         max_light_draw=None,
         lum_weight_int_method=True,
+        emulator=None,
     ):
         """
         What we need:
@@ -37,6 +40,9 @@ class NumericKinematics(Anisotropy):
         :param lum_weight_int_method: bool, luminosity weighted dispersion integral to calculate LOS projected Jean's
          solution. ATTENTION: currently less accurate than 3d solution
         :param min_integrate:
+        :param emulator: (optional) JeansEmulator instance of this kinematic model. If set, the luminosity-weighted
+         LOS dispersion (lum_weight_int_method=True) is interpolated from its table instead of solving the Jeans
+         equation for each set of parameters (parameters outside the table are computed numerically)
         """
         mass_profile_list = kwargs_model.get("mass_profile_list")
         light_profile_list = kwargs_model.get("light_profile_list")
@@ -65,6 +71,12 @@ class NumericKinematics(Anisotropy):
         self.cosmo = Cosmo(**kwargs_cosmo)
         self._mass_profile = SinglePlane(mass_profile_list)
         self._lum_weight_int_method = lum_weight_int_method
+        if emulator is not None and not emulator.supports(kwargs_model):
+            raise ValueError(
+                "The JeansEmulator of model %s does not match the kinematic model %s."
+                % (emulator.kwargs_model, kwargs_model)
+            )
+        self._emulator = emulator
 
     @property
     def lum_weight_int_method(self):
@@ -317,28 +329,45 @@ class NumericKinematics(Anisotropy):
 
         return IR_sigma2 * 2 * const.G / (const.arcsec * self.cosmo.dd * const.Mpc), IR
 
-    def I_R_sigma2_and_IR(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+    def I_R_sigma2_and_IR(
+        self, R, kwargs_mass, kwargs_light, kwargs_anisotropy, pool=None
+    ):
         """Return I(R)*sigma^2 equation A15 in Mamon&Lokas 2005 as interpolation in log
         space, and I(R)
 
-        :param R: projected radius
+        :param R: projected radius (float or numpy array)
         :param kwargs_mass: mass profile keyword arguments
         :param kwargs_light: light model keyword arguments
         :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :param pool: (optional) pool with a map() method over which the radial
+            integrals of the interpolation table are distributed
         :return: a tuple containing (I(R)*sigma^2, IR)
         """
-        return self._I_R_sigma2_interp(R, kwargs_mass, kwargs_light, kwargs_anisotropy)
+        return self._I_R_sigma2_interp(
+            R, kwargs_mass, kwargs_light, kwargs_anisotropy, pool=pool
+        )
 
-    def _I_R_sigma2_interp(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+    def _I_R_sigma2_interp(
+        self, R, kwargs_mass, kwargs_light, kwargs_anisotropy, pool=None
+    ):
         """Equation A15 in Mamon&Lokas 2005 as interpolation in log space.
 
         :param R: projected radius
         :param kwargs_mass: mass profile keyword arguments
         :param kwargs_light: light model keyword arguments
         :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :param pool: (optional) pool with a map() method over which the radial
+            integrals of the interpolation table are distributed
         :return: interpolated value of I(R)*sigma^2
         """
         R = np.maximum(R, self._min_integrate)
+        if self._emulator is not None:
+            sigma2 = self._emulator.sigma2(
+                R, kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+            if sigma2 is not None:
+                I_R = self.lightProfile.light_2d(R, kwargs_light)
+                return sigma2 * self.cosmo.ds / self.cosmo.dds * I_R, I_R
 
         if not hasattr(self, "_interp_I_R_sigma2"):
             min_log = np.log10(self._min_integrate)
@@ -346,20 +375,22 @@ class NumericKinematics(Anisotropy):
             R_array = np.logspace(
                 min_log, max_log, self._interp_grid_num
             )  # self._interp_grid_num
-            I_R_sigma2_array = []
-            I_R_array = []
-            for R_i in R_array:
-                I_R_sigma2_, IR_ = self._I_R_sigma2(
-                    R_i, kwargs_mass, kwargs_light, kwargs_anisotropy
-                )
-                I_R_sigma2_array.append(I_R_sigma2_)
-                I_R_array.append(IR_)
+            I_R_sigma2_array, I_R_array = util.map_array(
+                functools.partial(
+                    self._I_R_sigma2,
+                    kwargs_mass=kwargs_mass,
+                    kwargs_light=kwargs_light,
+                    kwargs_anisotropy=kwargs_anisotropy,
+                ),
+                R_array,
+                pool=pool,
+            ).T
 
             self._interp_I_R_sigma2 = interp1d(
-                np.log(R_array), np.array(I_R_sigma2_array), fill_value="extrapolate"
+                np.log(R_array), I_R_sigma2_array, fill_value="extrapolate"
             )
             self._interp_I_R = interp1d(
-                np.log(R_array), np.array(I_R_array), fill_value="extrapolate"
+                np.log(R_array), I_R_array, fill_value="extrapolate"
             )
         return self._interp_I_R_sigma2(np.log(R)), self._interp_I_R(np.log(R))
 
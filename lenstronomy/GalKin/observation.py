@@ -1,7 +1,7 @@
 from lenstronomy.GalKin.aperture import Aperture
 from lenstronomy.GalKin.psf import PSF
 import lenstronomy.Util.util as util
-from scipy.signal import convolve2d
+from scipy.signal import convolve2d, fftconvolve
 import numpy as np
 
 __all__ = ["GalkinObservation"]
@@ -52,3 +52,167 @@ class GalkinObservation(PSF, Aperture):
                 num_pix = int(np.ceil(num_pix)) // 2 * 2 + 1
         kernel = self.convolution_kernel(delta_pix_psf, num_pix)
         return convolve2d(data, kernel, mode="same")
+
+    @staticmethod
+    def _extract_center(kwargs):
+        if not isinstance(kwargs, dict):
+            if "center_x" in kwargs[0]:
+                return kwargs[0]["center_x"], kwargs[0]["center_y"]
+            else:
+                return 0, 0
+        else:
+            if "center_x" in kwargs:
+                return kwargs["center_x"], kwargs["center_y"]
+            else:
+                return 0, 0
+
+    def _delta_pix_xy(self):
+        """Get the pixel scale of the grid.
+
+        :return: delta_x, delta_y
+        """
+        x_grid = self._aperture.x_grid
+        y_grid = self._aperture.y_grid
+        delta_x = x_grid[0, 1] - x_grid[0, 0]
+        delta_y = y_grid[1, 0] - y_grid[0, 0]
+
+        return delta_x, delta_y
+
+    def _get_grid(self, kwargs_mass, supersampling_factor=1):
+        """Compute the grid to compute the dispersion map on.
+
+        :param kwargs_mass: keyword arguments of the mass model
+        :param supersampling_factor: sampling factor for the grid to do the 2D
+            convolution on
+        :return: x_grid, y_grid, log10_radial_distance_from_center
+        """
+        mass_center_x, mass_center_y = self._extract_center(kwargs_mass)
+
+        delta_x, delta_y = self._delta_pix_xy()
+        assert np.abs(delta_x) == np.abs(delta_y)
+
+        x_grid = self._aperture.x_grid
+        y_grid = self._aperture.y_grid
+
+        new_delta_x = delta_x / supersampling_factor
+        new_delta_y = delta_y / supersampling_factor
+        x_start = x_grid[0, 0] - delta_x / 2.0 * (1 - 1 / supersampling_factor)
+        x_end = x_grid[0, -1] + delta_x / 2.0 * (1 - 1 / supersampling_factor)
+        y_start = y_grid[0, 0] - delta_y / 2.0 * (1 - 1 / supersampling_factor)
+        y_end = y_grid[-1, 0] + delta_y / 2.0 * (1 - 1 / supersampling_factor)
+
+        xs = np.arange(x_start, x_end * (1 + 1e-6), new_delta_x)
+        ys = np.arange(y_start, y_end * (1 + 1e-6), new_delta_y)
+
+        x_grid_supersampled, y_grid_supersmapled = np.meshgrid(xs, ys)
+
+        log10_radial_distance_from_center = np.log10(
+            np.sqrt(
+                (x_grid_supersampled - mass_center_x) ** 2
+                + (y_grid_supersmapled - mass_center_y) ** 2
+            )
+        )
+
+        return (
+            x_grid_supersampled,
+            y_grid_supersmapled,
+            log10_radial_distance_from_center,
+        )
+
+    def _get_convolution_kernel(self, fwhm_factor=3, supersampling_factor=1):
+        """Normalized convolution kernel.
+
+        :param delta_x: pixel scale of kernel
+        :param delta_y: pixel scale of kernel
+        :param fwhm_factor: number of FWHM to compute the kernel on
+        :param supersampling_factor: number of sub-pixels to compute the kernel on
+        """
+        delta_x, delta_y = self._delta_pix_xy()
+
+        delta_x_sub = np.abs(delta_x) / supersampling_factor
+        num_x = int(round(2 * fwhm_factor * self._psf.fwhm / delta_x_sub + 0.5))
+        if num_x % 2 == 0:
+            num_x += 1
+
+        psf_x = np.arange(
+            -delta_x_sub * (num_x - 1) / 2,
+            delta_x_sub * (num_x + 1) / 2,
+            delta_x_sub,
+        )
+
+        delta_y_sub = np.abs(delta_y) / supersampling_factor
+        num_y = int(round(2 * fwhm_factor * self._psf.fwhm / delta_y_sub + 0.5))
+        if num_y % 2 == 0:
+            num_y += 1
+
+        psf_y = np.arange(
+            -delta_y_sub * (num_y - 1) / 2,
+            delta_y_sub * (num_y + 1) / 2,
+            delta_y_sub,
+        )
+
+        psf_x_grid, psf_y_grid = np.meshgrid(psf_x, psf_y)
+
+        return self.convolution_kernel_grid(psf_x_grid, psf_y_grid)
+
+    def _convolve_and_bin(
+        self, sigma2_IR_grid, IR_grid, supersampling_factor=1, voronoi_bins=None
+    ):
+        """Convolves the (supersampled) grids of I(R)*sigma^2 and I(R) with the PSF
+        and sums them in the IFU pixels or Voronoi bins.
+
+        :param sigma2_IR_grid: I(R)*sigma^2 on the supersampled grid of _get_grid()
+        :param IR_grid: I(R) on the supersampled grid of _get_grid()
+        :param supersampling_factor: supersampling factor of the grids
+        :param voronoi_bins: mapping of the voronoi bins, bin indices should start from
+            0, -1 values for pixels not binned
+        :return: I(R)*sigma^2 and I(R) summed in each pixel or bin
+        """
+        convolution_kernel = self._get_convolution_kernel(
+            fwhm_factor=3, supersampling_factor=supersampling_factor
+        )
+        # both grids are convolved in one batched FFT
+        sigma2_IR_convolved, IR_convolved = fftconvolve(
+            np.array([sigma2_IR_grid, IR_grid]),
+            convolution_kernel[np.newaxis],
+            mode="same",
+            axes=(1, 2),
+        )
+
+        if voronoi_bins is not None:
+            n_bins = int(np.max(voronoi_bins)) + 1
+            supersampled_voronoi_bins = (
+                voronoi_bins.repeat(supersampling_factor, axis=0)
+                .repeat(supersampling_factor, axis=1)
+                .astype(int)
+                .flatten()
+            )
+            binned = supersampled_voronoi_bins >= 0
+            sigma2_IR_integrated = np.bincount(
+                supersampled_voronoi_bins[binned],
+                weights=sigma2_IR_convolved.flatten()[binned],
+                minlength=n_bins,
+            )
+            IR_integrated = np.bincount(
+                supersampled_voronoi_bins[binned],
+                weights=IR_convolved.flatten()[binned],
+                minlength=n_bins,
+            )
+        else:
+            x_grid = self._aperture.x_grid
+            y_grid = self._aperture.y_grid
+            sigma2_IR_integrated = (
+                sigma2_IR_convolved.reshape(
+                    len(x_grid), supersampling_factor, len(y_grid), supersampling_factor
+                )
+                .sum(3)
+                .sum(1)
+            )
+            IR_integrated = (
+                IR_convolved.reshape(
+                    len(x_grid), supersampling_factor, len(y_grid), supersampling_factor
+                )
+                .sum(3)
+                .sum(1)
+            )
+        return sigma2_IR_integrated, IR_integrated
@@ -1,5 +1,7 @@
 __author__ = "sibirrer"
 
+import functools
+
 import numpy as np
 
 from lenstronomy.Util.package_util import exporter
@@ -17,6 +19,21 @@ def hyp_2F1(a, b, c, z):
     return mp.hyp2f1(a, b, c, z)
 
 
+@export
+def hyp_2F1_array(a, b, c, z):
+    """Vectorized Gauss hypergeometric function 2F1(a, b; c; z) for real arguments.
+
+    :param a: parameter a (float or numpy array)
+    :param b: parameter b (float or numpy array)
+    :param c: parameter c (float or numpy array)
+    :param z: argument (float or numpy array)
+    :return: 2F1(a, b; c; z), broadcasted over the inputs
+    """
+    from scipy.special import hyp2f1
+
+    return hyp2f1(a, b, c, z)
+
+
 @export
 def displace_PSF_gaussian(x, y, FWHM):
     """
@@ -28,8 +45,9 @@ def displace_PSF_gaussian(x, y, FWHM):
     """
     sigma = FWHM / (2 * np.sqrt(2 * np.log(2)))
     sigma_one_direction = sigma
-    x_ = x + np.random.normal() * sigma_one_direction
-    y_ = y + np.random.normal() * sigma_one_direction
+    size = _size(x)
+    x_ = x + np.random.normal(size=size) * sigma_one_direction
+    y_ = y + np.random.normal(size=size) * sigma_one_direction
     return x_, y_
 
 
@@ -57,15 +75,16 @@ def moffat_fwhm_alpha(FWHM, beta):
 
 
 @export
-def draw_moffat_r(FWHM, beta):
+def draw_moffat_r(FWHM, beta, size=None):
     """
 
     :param FWHM: full width at half maximum
     :param beta: Moffat beta parameter
+    :param size: number (or shape) of draws, None for a single draw
     :return: draw from radial Moffat distribution
     """
     alpha = moffat_fwhm_alpha(FWHM, beta)
-    y = draw_cdf_y(beta)
+    y = draw_cdf_y(beta, size=size)
     # equation B3 in Berge et al. paper
     X = alpha * np.sqrt((y - 1))
     return X
@@ -81,19 +100,21 @@ def displace_psf_moffat(x, y, FWHM, beta):
     :param beta: Moffat beta parameter
     :return: displaced ray by PSF
     """
-    X = draw_moffat_r(FWHM, beta)
+    X = draw_moffat_r(FWHM, beta, size=_size(x))
     dx, dy = draw_xy(X)
     return x + dx, y + dy
 
 
 @export
-def draw_cdf_y(beta):
+def draw_cdf_y(beta, size=None):
     """Draw c.d.f for Moffat function according to Berge et al. Ufig paper, equation B2
     cdf(Y) = 1-Y**(1-beta)
 
+    :param beta: Moffat beta parameter
+    :param size: number (or shape) of draws, None for a single draw
     :return:
     """
-    x = np.random.uniform(0, 1)
+    x = np.random.uniform(0, 1, size=size)
     return (1 - x) ** (1.0 / (1 - beta))
 
 
@@ -125,21 +146,62 @@ def draw_xy(R):
     :param R: projected radius
     :return:
     """
-    phi = np.random.uniform(0, 2 * np.pi)
+    phi = np.random.uniform(0, 2 * np.pi, size=_size(R))
     x = R * np.cos(phi)
     y = R * np.sin(phi)
     return x, y
 
 
 @export
-def draw_hernquist(a):
+def draw_hernquist(a, size=None):
     """
 
     :param a: 0.551*r_eff
+    :param size: number (or shape) of draws, None for a single draw
     :return: realisation of radius of Hernquist luminosity weighting in 3d
     """
-    P = np.random.uniform()  # draws uniform between [0,1)
+    P = np.random.uniform(size=size)  # draws uniform between [0,1)
     r = (
         a * np.sqrt(P) * (np.sqrt(P) + 1) / (1 - P)
     )  # solves analytically to r from P(r)
     return r
+
+
+@export
+def map_array(func, x, pool=None, num_chunks=20):
+    """Evaluates a function for each element of a 1d array, optionally distributed in
+    chunks over a pool of threads or processes.
+
+    :param func: function of a float returning a float or a tuple of floats
+    :param x: 1d numpy array
+    :param pool: (optional) pool with a map() method (e.g. a
+        concurrent.futures.ThreadPoolExecutor or a pool returned by
+        lenstronomy.Sampling.Pool.pool.choose_pool()), if None, evaluates serially
+    :param num_chunks: number of chunks x is split into when distributed over the pool
+    :return: numpy array of func(x_i), with the elements of x along the first axis
+    """
+    if pool is None or len(x) <= 1:
+        return _map_chunk(func, x)
+    chunks = np.array_split(x, min(num_chunks, len(x)))
+    return np.concatenate(list(pool.map(functools.partial(_map_chunk, func), chunks)))
+
+
+def _map_chunk(func, x):
+    """Evaluates a function for each element of an array.
+
+    :param func: function of a float
+    :param x: 1d numpy array
+    :return: numpy array of func(x_i)
+    """
+    return np.array([func(x_i) for x_i in x])
+
+
+def _size(x):
+    """Size argument of the numpy random draws matching the shape of x.
+
+    :param x: float or numpy array
+    :return: None for scalars (single draw), shape of x otherwise
+    """
+    if np.ndim(x) == 0:
+        return None
+    return np.shape(x)
@@ -47,6 +47,19 @@ class MultiDataBase(object):
         for imageModel in self._image_model_list:
             imageModel.reset_point_source_cache(cache=cache)
 
+    def set_ray_tracing_batch(self, kwargs_lens_list):
+        """Registers the lens model parameters of an ensemble of samples that are
+        subsequently evaluated one by one in all bands (see
+        ImageModel.set_ray_tracing_batch()).
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample, or None
+            to delete the registered samples
+        :return: None
+        """
+        for i, imageModel in enumerate(self._image_model_list):
+            if self._compute_bool[i] is True or kwargs_lens_list is None:
+                imageModel.set_ray_tracing_batch(kwargs_lens_list)
+
     @property
     def num_data_evaluate(self):
         num = 0
@@ -29,6 +29,8 @@ class MultiLinear(MultiDataBase):
         compute_bool=None,
         kwargs_pixelbased=None,
         linear_solver=True,
+        linear_solver_cache=False,
+        ray_tracing_cache_size=0,
     ):
         """
 
@@ -38,6 +40,10 @@ class MultiLinear(MultiDataBase):
         :param compute_bool: (optional), bool list to indicate which band to be included in the modeling
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param linear_solver_cache: bool, if True, re-uses the unchanged blocks of the linear response matrix and
+         normal equations between calls in each band (see ImageLinearFit)
+        :param ray_tracing_cache_size: int, number of sets of ray-traced source plane coordinates kept in a
+         least-recently-used cache in each band (see Image2SourceMapping). 0 (default) disables the cache.
         """
         self.type = "multi-linear"
         image_model_list = []
@@ -53,6 +59,8 @@ class MultiLinear(MultiDataBase):
                 band_index=band_index,
                 kwargs_pixelbased=kwargs_pixelbased,
                 linear_solver=linear_solver,
+                linear_solver_cache=linear_solver_cache,
+                ray_tracing_cache_size=ray_tracing_cache_size,
             )
             image_model_list.append(image_model)
         super(MultiLinear, self).__init__(image_model_list, compute_bool=compute_bool)
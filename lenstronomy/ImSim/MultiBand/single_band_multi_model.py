@@ -34,6 +34,8 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
         band_index=0,
         kwargs_pixelbased=None,
         linear_solver=True,
+        linear_solver_cache=False,
+        ray_tracing_cache_size=0,
     ):
         """
 
@@ -45,6 +47,10 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param linear_solver_cache: bool, if True, re-uses the unchanged blocks of the linear response matrix and
+         normal equations between calls (see ImageLinearFit)
+        :param ray_tracing_cache_size: int, number of sets of ray-traced source plane coordinates kept in a
+         least-recently-used cache (see Image2SourceMapping). 0 (default) disables the cache.
         """
         self.type = "single-band-multi-model"
         if likelihood_mask_list is None:
@@ -87,8 +93,10 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
 
         if linear_solver:
             imageClass = ImageLinearFit
+            kwargs_linear = {"linear_solver_cache": linear_solver_cache}
         else:
             imageClass = ImageModel
+            kwargs_linear = {}
 
         imageClass.__init__(
             self,
@@ -102,6 +110,8 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
             kwargs_numerics=kwargs_numerics,
             likelihood_mask=likelihood_mask_list[band_index],
             kwargs_pixelbased=kwargs_pixelbased,
+            ray_tracing_cache_size=ray_tracing_cache_size,
+            **kwargs_linear
         )
 
     def image(
@@ -589,6 +599,21 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
         else:
             return []
 
+    def set_ray_tracing_batch(self, kwargs_lens_list):
+        """Registers the lens model parameters of an ensemble of samples that are
+        subsequently evaluated one by one (see ImageModel.set_ray_tracing_batch()).
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample, or None
+            to delete the registered samples
+        :return: None
+        """
+        if kwargs_lens_list is not None:
+            kwargs_lens_list = [
+                self.select_kwargs(kwargs_lens=kwargs_lens)[0]
+                for kwargs_lens in kwargs_lens_list
+            ]
+        ImageModel.set_ray_tracing_batch(self, kwargs_lens_list)
+
     def select_kwargs(
         self,
         kwargs_lens=None,
@@ -49,7 +49,9 @@ class AdaptiveConvolution(object):
         kernel = kernel_util.degrade_kernel(
             kernel_super, degrading_factor=supersampling_factor
         )
-        self._low_res_conv = PixelKernelConvolution(kernel, convolution_type="fft")
+        self._low_res_conv = PixelKernelConvolution(
+            kernel, convolution_type="fft_static"
+        )
         if supersampling_kernel_size is None:
             supersampling_kernel_size = len(kernel)
 
@@ -1,6 +1,8 @@
 from scipy import fftpack, ndimage, signal
 import numpy as np
+import hashlib
 import threading
+from collections import OrderedDict
 import lenstronomy.Util.kernel_util as kernel_util
 import lenstronomy.Util.util as util
 import lenstronomy.Util.image_util as image_util
@@ -9,8 +11,93 @@ from lenstronomy.Util.package_util import exporter
 
 export, __all__ = exporter()
 
-_rfft_mt_safe = True  # (NumpyVersion(np.__version__) >= '1.9.0.dev-e24486e')
-_rfft_lock = threading.Lock()
+
+class _KernelSpectrumCache(object):
+    """Process-wide least-recently-used cache of the Fourier transformed convolution
+    kernels and the padded FFT shapes ('plans') of the static FFT convolution.
+
+    The cache is shared by all PixelKernelConvolution instances, such that the same
+    PSF used in different bands, sub-frames or numerics instances is only transformed
+    once per image shape. The lock only protects the bookkeeping of the dictionary, the
+    FFTs are computed outside of it and are not serialized between threads.
+    """
+
+    def __init__(self, max_size=32):
+        """
+
+        :param max_size: maximum number of kernel spectra kept in memory
+        """
+        self._max_size = max_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """Returns the cached entry of key or computes and stores it.
+
+        :param key: hashable key of the entry
+        :param compute: function without arguments computing the entry
+        :return: cached entry
+        """
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                return value
+        # two threads may compute the same entry simultaneously, the result is identical
+        value = compute()
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Deletes all cached entries.
+
+        :return: None
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def set_max_size(self, max_size):
+        """Sets the maximum number of cached entries and evicts the least recently
+        used ones if needed.
+
+        :param max_size: int, maximum number of entries
+        :return: None
+        """
+        with self._lock:
+            self._max_size = max_size
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+
+    def __len__(self):
+        return len(self._cache)
+
+
+_kernel_spectrum_cache = _KernelSpectrumCache()
+
+
+@export
+def clear_kernel_spectrum_cache():
+    """Deletes the Fourier transformed kernels shared between all
+    PixelKernelConvolution instances.
+
+    :return: None
+    """
+    _kernel_spectrum_cache.clear()
+
+
+@export
+def set_kernel_spectrum_cache_size(max_size):
+    """Sets the maximum number of Fourier transformed kernels (per kernel and image
+    shape) shared between all PixelKernelConvolution instances.
+
+    :param max_size: int, maximum number of cached kernel spectra
+    :return: None
+    """
+    _kernel_spectrum_cache.set_max_size(max_size)
 
 
 def _centered(arr, newshape):
@@ -38,6 +125,7 @@ class PixelKernelConvolution(object):
             raise ValueError("convolution_type %s not supported!" % convolution_type)
         self._type = convolution_type
         self._pre_computed = False
+        self._kernel_key = None
 
     def pixel_kernel(self, num_pix=None):
         """Access pixelated kernel.
@@ -73,6 +161,31 @@ class PixelKernelConvolution(object):
             raise ValueError("convolution_type %s not supported!" % self._type)
         return image_conv
 
+    def convolution2d_batch(self, images):
+        """Convolves a stack of images with the same kernel. In 'fft_static' mode, all
+        images are transformed with a single batched real FFT re-using the cached
+        Fourier transform of the kernel.
+
+        :param images: 3d array (n_images, nx, ny) of images to be convolved
+        :return: 3d array of convolved images
+        """
+        images = np.asarray(images)
+        if (
+            self._type != "fft_static"
+            or len(images) == 0
+            or np.issubdtype(images.dtype, np.complexfloating)
+        ):
+            return np.array([self.convolution2d(image) for image in images])
+        self._set_pre_compute(images[0])
+        if self._complex_result:
+            return np.array([self.convolution2d(image) for image in images])
+        axes = (1, 2)
+        sp1 = np.fft.rfftn(images, self._fshape, axes=axes)
+        sp1 *= self._sp2
+        ret = np.fft.irfftn(sp1, self._fshape, axes=axes)
+        fslice = (slice(None),) + self._fslice
+        return _centered(ret[fslice], (len(images),) + tuple(self._s1))
+
     def _static_fft(self, image, mode="same"):
         """Scipy fft convolution with saved static fft kernel.
 
@@ -81,17 +194,7 @@ class PixelKernelConvolution(object):
         """
         in1 = image
         in1 = np.asarray(in1)
-        if self._pre_computed is False:
-            (
-                self._s1,
-                self._s2,
-                self._complex_result,
-                self._shape,
-                self._fshape,
-                self._fslice,
-                self._sp2,
-            ) = self._static_pre_compute(image)
-            self._pre_computed = True
+        self._set_pre_compute(in1)
         s1, s2, complex_result, shape, fshape, fslice, sp2 = (
             self._s1,
             self._s2,
@@ -114,20 +217,10 @@ class PixelKernelConvolution(object):
         # only applicable for 'valid' mode
         #    in1, s1, in2, s2 = in2, s2, in1, s1
 
-        # Pre-1.9 NumPy FFT routines are not threadsafe.  For older NumPys, make
-        # sure we only call rfftn/irfftn from one thread at a time.
-        if not complex_result and (_rfft_mt_safe or _rfft_lock.acquire(False)):
-            try:
-                sp1 = np.fft.rfftn(in1, fshape)
-                ret = np.fft.irfftn(sp1 * sp2, fshape)[fslice].copy()
-            finally:
-                if not _rfft_mt_safe:
-                    _rfft_lock.release()
+        if not complex_result:
+            sp1 = np.fft.rfftn(in1, fshape)
+            ret = np.fft.irfftn(sp1 * sp2, fshape)[fslice].copy()
         else:
-            # If we're here, it's either because we need a complex result, or we
-            # failed to acquire _rfft_lock (meaning rfftn isn't threadsafe and
-            # is already in use by another thread).  In either case, use the
-            # (threadsafe but slower) SciPy complex-FFT routines instead.
             sp1 = fftpack.fftn(in1, fshape)
             ret = fftpack.ifftn(sp1 * sp2)[fslice].copy()
             if not complex_result:
@@ -142,15 +235,65 @@ class PixelKernelConvolution(object):
         else:
             raise ValueError("Acceptable mode flags are 'valid'," " 'same', or 'full'.")
 
+    def _set_pre_compute(self, image):
+        """Sets the pre-computed Fourier transformed kernel and shape quantities for the
+        shape of the image, if not already set for this shape.
+
+        :param image: 2d numpy array
+        :return: None
+        """
+        if self._pre_computed is True and np.array_equal(self._s1, np.shape(image)):
+            return
+        (
+            self._s1,
+            self._s2,
+            self._complex_result,
+            self._shape,
+            self._fshape,
+            self._fslice,
+            self._sp2,
+        ) = self._static_pre_compute(image)
+        self._pre_computed = True
+
     def _static_pre_compute(self, image):
         """Pre-compute Fourier transformed kernel and shape quantities to speed up
+        convolution. The results are shared between all instances with the same kernel
+        through a process-wide least-recently-used cache keyed by the kernel hash, the
+        image shape and whether the convolution is complex valued. Supersampled kernels
+        and images differ in their shapes from the regular ones and are cached
+        separately.
+
+        :param image: 2d numpy array
+        :return: s1, s2, complex_result, shape, fshape, fslice, sp2
+        """
+        image = np.asarray(image)
+        if self._kernel_key is None:
+            kernel = np.ascontiguousarray(self._kernel)
+            self._kernel_key = (
+                hashlib.sha1(kernel.view(np.uint8)).hexdigest(),
+                kernel.shape,
+                kernel.dtype.str,
+            )
+        key = (
+            self._kernel_key,
+            image.shape,
+            bool(np.issubdtype(image.dtype, np.complexfloating)),
+        )
+        return _kernel_spectrum_cache.get(
+            key, lambda: self._kernel_spectrum(image, self._kernel)
+        )
+
+    @staticmethod
+    def _kernel_spectrum(image, kernel):
+        """Fourier transformed kernel and shape quantities for the static FFT
         convolution.
 
         :param image: 2d numpy array
-        :return:
+        :param kernel: 2d numpy array, convolution kernel
+        :return: s1, s2, complex_result, shape, fshape, fslice, sp2
         """
         in1 = image
-        in2 = self._kernel
+        in2 = kernel
         s1 = np.array(in1.shape)
         s2 = np.array(in2.shape)
         complex_result = np.issubdtype(in1.dtype, np.complexfloating) or np.issubdtype(
@@ -167,20 +310,12 @@ class PixelKernelConvolution(object):
         # Speed up FFT by padding to optimal size for FFTPACK
         fshape = [fftpack.next_fast_len(int(d)) for d in shape]
         fslice = tuple([slice(0, int(sz)) for sz in shape])
-        # Pre-1.9 NumPy FFT routines are not threadsafe.  For older NumPys, make
-        # sure we only call rfftn/irfftn from one thread at a time.
-        if not complex_result and (_rfft_mt_safe or _rfft_lock.acquire(False)):
-            try:
-                sp2 = np.fft.rfftn(in2, fshape)
-            finally:
-                if not _rfft_mt_safe:
-                    _rfft_lock.release()
+        if not complex_result:
+            sp2 = np.fft.rfftn(in2, fshape)
         else:
-            # If we're here, it's either because we need a complex result, or we
-            # failed to acquire _rfft_lock (meaning rfftn isn't threadsafe and
-            # is already in use by another thread).  In either case, use the
-            # (threadsafe but slower) SciPy complex-FFT routines instead.
             sp2 = fftpack.fftn(in2, fshape)
+        # the spectrum is shared between instances and must not be modified in place
+        sp2.flags.writeable = False
         return s1, s2, complex_result, shape, fshape, fslice, sp2
 
     def re_size_convolve(self, image_low_res, image_high_res=None):
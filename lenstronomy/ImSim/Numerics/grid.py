@@ -275,6 +275,24 @@ class RegularGrid(Coordinates1D):
             image_low_res = image
         return image_low_res, image_high_res
 
+    def flux_arrays2image_low(self, flux_arrays):
+        """Batched version of flux_array2image_low_high() returning only the regular
+        resolution images.
+
+        :param flux_arrays: 2d array (n_images, n_evaluate) of flux values
+            corresponding to the coordinates_evaluate order
+        :return: 3d array (n_images, nx, ny) of images in regular resolution
+        """
+        flux_arrays = np.asarray(flux_arrays)
+        num_images = len(flux_arrays)
+        nx, ny = self.num_grid_points_axes
+        grid1d = np.zeros((num_images, nx * ny))
+        grid1d[:, self._compute_indexes] = flux_arrays
+        f = self._supersampling_factor
+        if f == 1:
+            return grid1d.reshape(num_images, nx, ny)
+        return grid1d.reshape(num_images, self._nx, f, self._ny, f).mean(axis=(2, 4))
+
     @staticmethod
     def _subgrid_index(idex_mask, subgrid_res, nx, ny):
         """
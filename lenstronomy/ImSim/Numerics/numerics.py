@@ -8,6 +8,7 @@ from lenstronomy.ImSim.Numerics.point_source_rendering import PointSourceRenderi
 from lenstronomy.Util import util
 from lenstronomy.Util import kernel_util
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["Numerics"]
 
@@ -190,6 +191,7 @@ class Numerics(PointSourceRendering):
         else:
             self._high_res_return = False
 
+    @timed("Numerics.re_size_convolve")
     def re_size_convolve(self, flux_array, unconvolved=False):
         """
 
@@ -210,6 +212,36 @@ class Numerics(PointSourceRendering):
             )
         return image_conv * self._pixel_width**2
 
+    @timed("Numerics.re_size_convolve_batch")
+    def re_size_convolve_batch(self, flux_arrays, unconvolved=False):
+        """Batched version of re_size_convolve() for a stack of flux arrays. For a
+        regular grid convolved on the regular pixel scale with a pixel kernel, all
+        images are re-sized and convolved together. Otherwise, the images are
+        processed one by one.
+
+        :param flux_arrays: 2d array (n_images, n_evaluate), flux values corresponding
+            to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array (n_images, nx, ny)
+        """
+        convolve = unconvolved is False and self._psf_type != "NONE"
+        if (
+            isinstance(self._grid, RegularGrid)
+            and self._high_res_return is False
+            and (convolve is False or isinstance(self._conv, PixelKernelConvolution))
+        ):
+            images = self._grid.flux_arrays2image_low(flux_arrays)
+            if convolve is True:
+                images = self._conv.convolution2d_batch(images)
+            images *= self._pixel_width**2
+            return images
+        return np.array(
+            [
+                self.re_size_convolve(flux_array, unconvolved=unconvolved)
+                for flux_array in flux_arrays
+            ]
+        )
+
     @property
     def grid_supersampling_factor(self):
         """
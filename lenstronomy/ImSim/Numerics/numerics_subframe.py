@@ -2,6 +2,7 @@ import numpy as np
 from lenstronomy.ImSim.Numerics.numerics import Numerics
 from lenstronomy.ImSim.Numerics.point_source_rendering import PointSourceRendering
 from lenstronomy.Data.pixel_grid import PixelGrid
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["NumericsSubFrame"]
 
@@ -82,6 +83,7 @@ class NumericsSubFrame(PointSourceRendering):
             psf=psf,
         )
 
+    @timed("Numerics.re_size_convolve")
     def re_size_convolve(self, flux_array, unconvolved=False):
         """
 
@@ -94,6 +96,27 @@ class NumericsSubFrame(PointSourceRendering):
         )
         return self._complete_frame(image_sub_frame)
 
+    @timed("Numerics.re_size_convolve_batch")
+    def re_size_convolve_batch(self, flux_arrays, unconvolved=False):
+        """
+
+        :param flux_arrays: 2d array (n_images, n_evaluate), flux values corresponding to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array (n_images, nx, ny)
+        """
+        images_sub_frame = self._numerics_subframe.re_size_convolve_batch(
+            flux_arrays, unconvolved=unconvolved
+        )
+        if self._subframe_calc is True:
+            images = np.zeros((len(images_sub_frame), self._nx, self._ny))
+            images[
+                :,
+                self._x_min_sub : self._x_max_sub + 1,
+                self._y_min_sub : self._y_max_sub + 1,
+            ] = images_sub_frame
+            return images
+        return images_sub_frame
+
     @property
     def grid_supersampling_factor(self):
         """
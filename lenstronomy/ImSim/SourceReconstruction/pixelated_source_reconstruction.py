@@ -1,4 +1,6 @@
 import numpy as np
+import scipy.sparse as sparse
+from scipy.signal import fftconvolve
 from tqdm import tqdm
 
 import lenstronomy.Util.util as util
@@ -13,9 +15,13 @@ class PixelatedSourceReconstruction(object):
     'placeholder for Nan Zhang's paper) for source reconstruction based on different
     likelihood methods.
 
-    All sparse matrices (sp) in this class are represented as a list of lists:
-    [[y_coord, x_coord, pixel_value], ...], where [y_coord, x_coord] are
-    the pixel coordinates and pixel_value is the corresponding pixel's value.
+    The linear operators (lensing and PSF convolution) are assembled as scipy.sparse
+    matrices acting on flattened (row-major) image and source pixel vectors, and the M
+    matrix and b vector are formed with sparse matrix products.
+
+    Sparse images (sp) handled by the helper functions of this class are represented as
+    a list of lists: [[y_coord, x_coord, pixel_value], ...], where [y_coord, x_coord]
+    are the pixel coordinates and pixel_value is the corresponding pixel's value.
     """
 
     def __init__(
@@ -131,38 +137,28 @@ class PixelatedSourceReconstruction(object):
         """
         if verbose:
             print("Step 1: Lensing the source pixels")
-        lensed_sp = self.lens_pixel_source_of_a_rectangular_region(kwargs_lens)
+        lensing_operator = self.lensing_operator(kwargs_lens)
         if verbose:
             print("Step 1: Finished!")
 
         if verbose:
             print("Step 2: Convolve the lensed pixels")
-        N_lensed = len(lensed_sp)
-        lensed_pixel_conv_set = np.zeros((N_lensed, self._num_pix, self._num_pix))
-        for i in range(N_lensed):
-            lensed_pixel_conv_set[i] = self.sparse_convolution(
-                lensed_sp[i], self._kernel
-            )
+        lensed_conv = (self.convolution_operator() @ lensing_operator).tocsc()
         if verbose:
             print("Step 2: Finished!")
 
         if verbose:
             print("Step 3: Compute the matrix M and vector b")
-        M = np.zeros((N_lensed, N_lensed))
-        b = np.zeros((N_lensed))
-        for i in tqdm(
-            range(N_lensed),
+        inv_C_D = util.image2array(1 / self._C_D)
+        lensed_conv_weighted = sparse.diags(inv_C_D) @ lensed_conv
+        b = lensed_conv.T @ (util.image2array(self._image_data) * inv_C_D)
+        M = np.zeros((self._num_pixel_source, self._num_pixel_source))
+        for block in tqdm(
+            self._source_pixel_blocks(),
             desc="Running (iteration times vary)",
             disable=not show_progress,
         ):
-            b[i] = np.sum(lensed_pixel_conv_set[i] * self._image_data / self._C_D)
-            for j in range(N_lensed):
-                if j < i:
-                    M[i, j] = M[j, i]  # Exploit symmetry
-                else:
-                    M[i, j] = np.sum(
-                        lensed_pixel_conv_set[i] * lensed_pixel_conv_set[j] / self._C_D
-                    )
+            M[:, block] = (lensed_conv_weighted.T @ lensed_conv[:, block]).toarray()
         if verbose:
             print("Step 3: Finished!")
 
@@ -174,8 +170,9 @@ class PixelatedSourceReconstruction(object):
         """Generates the M and b matrices for interferometric data with natural
         weighting.
 
-        This method integrates the convolution step implicitly via specialized sparse
-        product functions.
+        The PSF kernel covers the full image for this likelihood, hence the convolution
+        of the lensed source pixels is performed with FFTs on blocks of source pixels
+        and projected back with the sparse lensing operator.
 
         :param kwargs_lens: List of keyword arguments for the lens_model_class.
         :param verbose: If True, print progress messages during matrix generation steps.
@@ -186,7 +183,7 @@ class PixelatedSourceReconstruction(object):
         """
         if verbose:
             print("Step 1: Lensing the source pixels")
-        lensed_sp = self.lens_pixel_source_of_a_rectangular_region(kwargs_lens)
+        lensing_operator = self.lensing_operator(kwargs_lens).tocsc()
         if verbose:
             print("Step 1: Finished!")
 
@@ -194,25 +191,19 @@ class PixelatedSourceReconstruction(object):
             print(
                 "Step 2: Compute the matrix M and vector b (including the convolution step)"
             )
-        N_lensed = len(lensed_sp)
-        M = np.zeros((N_lensed, N_lensed))
-        b = np.zeros((N_lensed))
-        for i in tqdm(
-            range(N_lensed),
+        b = lensing_operator.T @ util.image2array(self._image_data)
+        M = np.zeros((self._num_pixel_source, self._num_pixel_source))
+        for block in tqdm(
+            self._source_pixel_blocks(),
             desc="Running (iteration times vary)",
             disable=not show_progress,
         ):
-            b[i] = self.sum_sparse_elementwise_product(lensed_sp[i], self._image_data)
-            pixel_lensed_convolved = self.sparse_convolution(
-                lensed_sp[i], self._kernel
-            )  # convolution
-            for j in range(N_lensed):
-                if j < i:
-                    M[i, j] = M[j, i]  # Exploit symmetry
-                else:
-                    M[i, j] = self.sum_sparse_elementwise_product(
-                        lensed_sp[j], pixel_lensed_convolved
-                    )
+            lensed_block = lensing_operator[:, block].T.toarray()
+            lensed_block = lensed_block.reshape(-1, self._num_pix, self._num_pix)
+            convolved_block = fftconvolve(
+                lensed_block, self._kernel[np.newaxis], mode="same", axes=(1, 2)
+            )
+            M[:, block] = lensing_operator.T @ convolved_block.reshape(len(block), -1).T
         b /= self._noise_rms**2
         M /= self._noise_rms**2
         if verbose:
@@ -220,34 +211,27 @@ class PixelatedSourceReconstruction(object):
 
         return M, b
 
-    def lens_pixel_source_of_a_rectangular_region(self, kwargs_lens):
-        """Maps image plane pixels to source plane pixels within a specified rectangular
-        source grid, considering lensing deflections and applying bilinear
-        interpolation.
+    def lensing_operator(self, kwargs_lens):
+        """Sparse linear operator mapping the source pixel values to the (unconvolved)
+        lensed image, using ray-shooting and bilinear interpolation on the source grid.
 
         :param kwargs_lens: List of keyword arguments for the lens_model_class.
-        :returns: A list of lists. Each element in the outer list corresponds to a single source pixel
-            within the defined source grid (ordered by their linear index). Each inner list contains
-            `[y_coord, x_coord, weight]` tuples, indicating that the source pixel at this index
-            contributes with `weight` to the image plane pixel at `(y_coord, x_coord)` when lensed.
-        :rtype: list
+        :returns: scipy.sparse.csr_matrix of shape (num_pix**2, number of source pixels).
+            Rows are the flattened (row-major) image pixels, columns the linear indices
+            of the source pixels. Entries with zero weight within the source region are
+            stored explicitly.
         """
-
-        lensed_pixel_sp = [[] for _ in range(self._num_pixel_source)]
-
         beta_x_grid_2d, beta_y_grid_2d = self._lens_model_class.ray_shooting(
             self._x_grid_data, self._y_grid_data, kwargs=kwargs_lens
         )
 
-        # Calculate integer pixel indices (floor/ceiling) in the source plane
+        # Calculate integer pixel indices (floor) in the source plane
         x_floor = np.floor(
             (beta_x_grid_2d - self._source_min_x) / self._pixel_width_source
         ).astype(int)
-        x_ceiling = x_floor + 1
         y_floor = np.floor(
             (beta_y_grid_2d - self._source_min_y) / self._pixel_width_source
         ).astype(int)
-        y_ceiling = y_floor + 1
 
         # Calculate fractional pixel offsets for bilinear interpolation
         delta_x_pixel = (
@@ -257,71 +241,103 @@ class PixelatedSourceReconstruction(object):
             beta_y_grid_2d - self._source_min_y
         ) / self._pixel_width_source - y_floor
 
-        # Compute bilinear interpolation weights
-        w00 = (1 - delta_x_pixel) * (1 - delta_y_pixel)
-        w10 = delta_x_pixel * (1 - delta_y_pixel)
-        w01 = delta_y_pixel * (1 - delta_x_pixel)
-        w11 = delta_x_pixel * delta_y_pixel
+        image_pixel_index = np.arange(self._num_pix**2).reshape(
+            self._num_pix, self._num_pix
+        )
+        rows, cols, weights = [], [], []
+        # bilinear interpolation weights of the four surrounding source pixels
+        for dx, dy in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            x_source = x_floor + dx
+            y_source = y_floor + dy
+            weight = (delta_x_pixel if dx else 1 - delta_x_pixel) * (
+                delta_y_pixel if dy else 1 - delta_y_pixel
+            )
+            # Apply the ratio (data image pixel area / source grid pixel area) to ensure the flux conservation
+            weight *= self._ratio_data_pixel_source_pixel
+            # Apply primary beam modulation if specified
+            if self._primary_beam is not None:
+                weight *= self._primary_beam
+            inside = (
+                (x_source >= 0)
+                & (x_source < self._nx_source)
+                & (y_source >= 0)
+                & (y_source < self._ny_source)
+            )
+            rows.append(image_pixel_index[inside])
+            cols.append(self._nx_source * y_source[inside] + x_source[inside])
+            weights.append(weight[inside])
+        return sparse.csr_matrix(
+            (np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(self._num_pix**2, self._num_pixel_source),
+        )
 
-        # Apply the ratio (data image pixel area / source grid pixel area) to ensure the flux conservation
-        w00 *= self._ratio_data_pixel_source_pixel
-        w10 *= self._ratio_data_pixel_source_pixel
-        w01 *= self._ratio_data_pixel_source_pixel
-        w11 *= self._ratio_data_pixel_source_pixel
-
-        # Apply primary beam modulation if specified
-        if self._primary_beam is not None:
-            w00 *= self._primary_beam
-            w10 *= self._primary_beam
-            w01 *= self._primary_beam
-            w11 *= self._primary_beam
+    def convolution_operator(self, kernel=None):
+        """Sparse linear operator of the PSF convolution acting on a flattened
+        (row-major) image. Equivalent to :meth:`sparse_convolution`.
 
-        for i in range(self._num_pix):
-            for j in range(self._num_pix):
-                # Skip if the lensed image pixel falls entirely outside the source region
-                if (
-                    x_ceiling[i][j] < 0
-                    or x_floor[i][j] > (self._nx_source - 1)
-                    or y_ceiling[i][j] < 0
-                    or y_floor[i][j] > (self._ny_source - 1)
-                ):
-                    continue
-
-                # Calculate linear indices of the four potential source pixels
-                source_pixel_index00 = self._nx_source * (y_floor[i][j]) + x_floor[i][j]
-                source_pixel_index10 = source_pixel_index00 + 1
-                source_pixel_index01 = source_pixel_index00 + self._nx_source
-                source_pixel_index11 = source_pixel_index01 + 1
-
-                # Flags for boundary checking
-                check00, check01, check10, check11 = True, True, True, True
-
-                # Adjust flags for contributions near the boundary
-                if x_floor[i][j] == -1:
-                    check00 = False
-                    check01 = False
-                elif x_ceiling[i][j] == self._nx_source:
-                    check10 = False
-                    check11 = False
-
-                if y_floor[i][j] == -1:
-                    check00 = False
-                    check10 = False
-                elif y_ceiling[i][j] == self._ny_source:
-                    check11 = False
-                    check01 = False
-
-                # Append the contribution of each source pixel to the image pixel (i,j) with weight.
-                if check00:
-                    lensed_pixel_sp[source_pixel_index00].append([i, j, w00[i][j]])
-                if check10:
-                    lensed_pixel_sp[source_pixel_index10].append([i, j, w10[i][j]])
-                if check01:
-                    lensed_pixel_sp[source_pixel_index01].append([i, j, w01[i][j]])
-                if check11:
-                    lensed_pixel_sp[source_pixel_index11].append([i, j, w11[i][j]])
+        :param kernel: The 2D PSF kernel (NumPy array). Assumed to be square with odd dimensions,
+                       with its center at the central pixel. If None, `self._kernel` is used
+        :returns: scipy.sparse.csr_matrix of shape (num_pix**2, num_pix**2)
+        """
+        if kernel is None:
+            kernel = self._kernel
+        kernel_center = int(len(kernel) / 2)
+        y_image, x_image = np.indices((self._num_pix, self._num_pix))
+        rows, cols, values = [], [], []
+        for k_y, k_x in zip(*np.nonzero(kernel)):
+            y_conv = y_image + k_y - kernel_center
+            x_conv = x_image + k_x - kernel_center
+            inside = (
+                (y_conv >= 0)
+                & (y_conv < self._num_pix)
+                & (x_conv >= 0)
+                & (x_conv < self._num_pix)
+            )
+            rows.append(y_conv[inside] * self._num_pix + x_conv[inside])
+            cols.append(y_image[inside] * self._num_pix + x_image[inside])
+            values.append(np.full(np.count_nonzero(inside), kernel[k_y, k_x]))
+        return sparse.csr_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(self._num_pix**2, self._num_pix**2),
+        )
+
+    def lens_pixel_source_of_a_rectangular_region(self, kwargs_lens):
+        """Maps image plane pixels to source plane pixels within a specified rectangular
+        source grid, considering lensing deflections and applying bilinear
+        interpolation.
+
+        :param kwargs_lens: List of keyword arguments for the lens_model_class.
+        :returns: A list of lists. Each element in the outer list corresponds to a single source pixel
+            within the defined source grid (ordered by their linear index). Each inner list contains
+            `[y_coord, x_coord, weight]` tuples, indicating that the source pixel at this index
+            contributes with `weight` to the image plane pixel at `(y_coord, x_coord)` when lensed.
+        :rtype: list
+        """
+        lensing_operator = self.lensing_operator(kwargs_lens).tocsc()
+        lensing_operator.sort_indices()
+        lensed_pixel_sp = []
+        for k in range(self._num_pixel_source):
+            index = slice(lensing_operator.indptr[k], lensing_operator.indptr[k + 1])
+            y_coords, x_coords = np.divmod(
+                lensing_operator.indices[index], self._num_pix
+            )
+            lensed_pixel_sp.append(
+                [
+                    [int(y), int(x), w]
+                    for y, x, w in zip(y_coords, x_coords, lensing_operator.data[index])
+                ]
+            )
         return lensed_pixel_sp
 
+    def _source_pixel_blocks(self, block_size=100):
+        """Splits the source pixel indices in blocks for the assembly of M.
+
+        :param block_size: maximum number of source pixels per block
+        :return: list of index arrays
+        """
+        num_blocks = int(np.ceil(self._num_pixel_source / block_size))
+        return np.array_split(np.arange(self._num_pixel_source), num_blocks)
+
     def lens_an_image_by_rayshooting(self, kwargs_lens, source_image):
         """Lenses a pixelated source plane image to the image plane using ray-shooting
         and bilinear interpolation. The imput image should have the same dimension and
@@ -486,9 +502,8 @@ class PixelatedSourceReconstruction(object):
         :rtype: numpy.ndarray
         """
         image = np.zeros((self._num_pix, self._num_pix))
-        num_of_elements = len(sparse)
-        for i in range(num_of_elements):
-            image[sparse[i][0], sparse[i][1]] = sparse[i][2]
+        y_coords, x_coords, values = self._sparse_columns(sparse)
+        image[y_coords, x_coords] = values
         return image
 
     def sum_sparse_elementwise_product(self, sparse, ordinary):
@@ -501,11 +516,8 @@ class PixelatedSourceReconstruction(object):
         :returns: The sum of the element-wise products.
         :rtype: float
         """
-        sum_temp = 0
-        num_element = len(sparse)
-        for i in range(num_element):
-            sum_temp += sparse[i][2] * ordinary[sparse[i][0], sparse[i][1]]
-        return sum_temp
+        y_coords, x_coords, values = self._sparse_columns(sparse)
+        return np.sum(values * ordinary[y_coords, x_coords])
 
     def sparse_convolve_and_dot_product(self, sp1, sp2, kernel=None):
         """Computes the convolution product of two sparse matrices using a given kernel.
@@ -521,29 +533,9 @@ class PixelatedSourceReconstruction(object):
         """
         if kernel is None:
             kernel = self._kernel
-        inner_product = 0
-        num_elements_1 = len(sp1)
-        num_elements_2 = len(sp2)
-        kernel_center = int(
-            len(kernel) / 2
-        )  # Assumes kernel is square and has odd dimensions
-
-        for i in range(num_elements_1):
-            for j in range(num_elements_2):
-                delta_y = sp2[j][0] - sp1[i][0]
-                delta_x = sp2[j][1] - sp1[i][1]
-                if (
-                    kernel_center + delta_y >= 0
-                    and kernel_center + delta_y < self._shape_kernel[0]
-                    and kernel_center + delta_x >= 0
-                    and kernel_center + delta_x < self._shape_kernel[1]
-                ):
-                    inner_product += (
-                        sp1[i][2]
-                        * sp2[j][2]
-                        * kernel[kernel_center + delta_y, kernel_center + delta_x]
-                    )
-        return inner_product
+        return self.sum_sparse_elementwise_product(
+            sp2, self.sparse_convolution(sp1, kernel)
+        )
 
     def sparse_convolution(self, sp, kernel=None):
         """Performs convolution of a sparse matrix with a given kernel.
@@ -559,6 +551,7 @@ class PixelatedSourceReconstruction(object):
         kernel_center = int(
             len(kernel) / 2
         )  # Assumes kernel is square and has odd dimensions
+        shape_kernel = np.shape(kernel)
         convolved = np.zeros((self._num_pix, self._num_pix))
         num_element_sparse = len(sp)
 
@@ -568,20 +561,20 @@ class PixelatedSourceReconstruction(object):
             # Calculate slice indices for the kernel relative to the sparse element
             slice_y_start = np.max([kernel_center - y_sp, 0])
             slice_y_end = np.min(
-                [kernel_center - y_sp + self._num_pix, self._shape_kernel[0]]
+                [kernel_center - y_sp + self._num_pix, shape_kernel[0]]
             )
             slice_x_start = np.max([kernel_center - x_sp, 0])
             slice_x_end = np.min(
-                [kernel_center - x_sp + self._num_pix, self._shape_kernel[1]]
+                [kernel_center - x_sp + self._num_pix, shape_kernel[1]]
             )
 
             convolved_image_y_start = y_sp - np.min([y_sp, kernel_center])
             convolved_image_y_end = y_sp + np.min(
-                [self._num_pix - y_sp, self._shape_kernel[0] - kernel_center]
+                [self._num_pix - y_sp, shape_kernel[0] - kernel_center]
             )
             convolved_image_x_start = x_sp - np.min([x_sp, kernel_center])
             convolved_image_x_end = x_sp + np.min(
-                [self._num_pix - x_sp, self._shape_kernel[1] - kernel_center]
+                [self._num_pix - x_sp, shape_kernel[1] - kernel_center]
             )
 
             convolved[
@@ -591,3 +584,16 @@ class PixelatedSourceReconstruction(object):
                 val_sp * kernel[slice_y_start:slice_y_end, slice_x_start:slice_x_end]
             )
         return convolved
+
+    @staticmethod
+    def _sparse_columns(sp):
+        """Splits a sparse image representation into its coordinate and value arrays.
+
+        :param sp: Sparse matrix representation (list of `[y_coord, x_coord, value]`
+            tuples).
+        :return: y_coords, x_coords, values as numpy arrays
+        """
+        if len(sp) == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0)
+        y_coords, x_coords, values = np.asarray(sp, dtype=float).T
+        return y_coords.astype(int), x_coords.astype(int), values
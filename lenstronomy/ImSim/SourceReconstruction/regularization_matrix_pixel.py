@@ -10,11 +10,14 @@ Currently supported regularization types include:
 """
 
 import numpy as np
+import scipy.sparse as sparse
 
 __all__ = ["pixelated_regularization_matrix"]
 
 
-def pixelated_regularization_matrix(xlen, ylen, regularization_type):
+def pixelated_regularization_matrix(
+    xlen, ylen, regularization_type, sparse_matrix=False
+):
     """Constructs the regularization matrix for a rectangular pixelated source region.
 
     The regularization term for pixel amplitudes :math:`\\mathbf{a}` (flattened into a 1D vector)
@@ -30,7 +33,11 @@ def pixelated_regularization_matrix(xlen, ylen, regularization_type):
     :param ylen: int, Number of pixels in the y-direction (vertical dimension of the source grid).
     :param regularization_type: str, Type of regularization to apply.
                                 Supported options are 'zeroth_order', 'gradient', 'curvature'.
-    :return: numpy.ndarray, The regularization matrix :math:`U` with shape `(xlen * ylen, xlen * ylen)`.
+    :param sparse_matrix: bool, if True, returns the matrix in scipy.sparse CSR format.
+                          Recommended for large source grids, as the dense matrix scales as
+                          `(xlen * ylen)**2` in memory.
+    :return: numpy.ndarray (or scipy.sparse.csr_matrix if `sparse_matrix` is True), The
+             regularization matrix :math:`U` with shape `(xlen * ylen, xlen * ylen)`.
     :raises TypeError: If `xlen` or `ylen` are not integers.
     :raises ValueError: If an unsupported `regularization_type` is provided.
     """
@@ -39,16 +46,42 @@ def pixelated_regularization_matrix(xlen, ylen, regularization_type):
     if not isinstance(ylen, int):
         raise TypeError(f"ylen must be an integer, but got {type(ylen).__name__}.")
     if regularization_type == "zeroth_order":
-        return _zeroth_order_regularization_matrix_pixel(xlen, ylen)
+        Umatrix = _zeroth_order_regularization_matrix_pixel(xlen, ylen)
     elif regularization_type == "gradient":
-        return _gradient_regularization_matrix_pixel(xlen, ylen)
+        Umatrix = _gradient_regularization_matrix_pixel(xlen, ylen)
     elif regularization_type == "curvature":
-        return _curvature_regularization_matrix_pixel(xlen, ylen)
+        Umatrix = _curvature_regularization_matrix_pixel(xlen, ylen)
     else:
         raise ValueError(
             f"Unsupported regularization_type: '{regularization_type}'. "
             "Supported options are: 'zeroth_order', 'gradient', 'curvature'."
         )
+    if sparse_matrix:
+        return Umatrix
+    return Umatrix.toarray()
+
+
+def _separable_regularization_matrix(xlen, ylen, stencil):
+    """Constructs the sparse regularization matrix of a symmetric finite difference
+    stencil applied along the x- and y-direction of the source grid.
+
+    :param xlen: int, Number of pixels in the x-direction.
+    :param ylen: int, Number of pixels in the y-direction.
+    :param stencil: list of floats, the diagonals [c_0, c_1, ...] of the one-dimensional
+        operator, with c_0 on the main diagonal and c_k on the k-th off-diagonals.
+    :return: scipy.sparse.csr_matrix, kron(I_y, D_x) + kron(D_y, I_x)
+    """
+
+    def _band(n):
+        offsets = [k for k in range(-len(stencil) + 1, len(stencil)) if abs(k) < n]
+        return sparse.diags(
+            [stencil[abs(k)] * np.ones(n - abs(k)) for k in offsets], offsets
+        )
+
+    return sparse.csr_matrix(
+        sparse.kron(sparse.identity(ylen), _band(xlen))
+        + sparse.kron(_band(ylen), sparse.identity(xlen))
+    )
 
 
 def _zeroth_order_regularization_matrix_pixel(xlen, ylen):
@@ -64,10 +97,9 @@ def _zeroth_order_regularization_matrix_pixel(xlen, ylen):
 
     :param xlen: int, Number of pixels in the x-direction.
     :param ylen: int, Number of pixels in the y-direction.
-    :return: numpy.ndarray, The (xlen * ylen, xlen * ylen) sized identity matrix.
+    :return: scipy.sparse.csr_matrix, The (xlen * ylen, xlen * ylen) sized identity matrix.
     """
-    Umatrix = np.identity(xlen * ylen)
-    return Umatrix
+    return sparse.identity(xlen * ylen, format="csr")
 
 
 def _gradient_regularization_matrix_pixel(xlen, ylen):
@@ -79,38 +111,15 @@ def _gradient_regularization_matrix_pixel(xlen, ylen):
 
     .. math::
         \\sum_{ij}U_{ij} a_i a_j = \\sum_{i_x=0}^{n}\\sum_{i_y=0}^{m} ((a_{i_x,i_y} - a_{i_x+1,i_y})^2 +
-        (a_{i_x,i_y} - a_{i_x,i_y+1})^2\),
+        (a_{i_x,i_y} - a_{i_x,i_y+1})^2),
 
     where the summation is over all pixels.
     Pixels outside the defined rectangular region (`xlen`, `ylen`) are implicitly
     treated as having zero amplitude (Dirichlet boundary conditions).
 
-    :return: numpy.ndarray, The (xlen * ylen, xlen * ylen) sized gradient regularization matrix.
+    :return: scipy.sparse.csr_matrix, The (xlen * ylen, xlen * ylen) sized gradient regularization matrix.
     """
-    num_pixels_total = xlen * ylen
-    Umatrix = np.zeros((num_pixels_total, num_pixels_total))
-
-    block0 = 4 * np.identity(xlen)
-    for i in range(xlen - 1):
-        block0[i, i + 1] = -1
-        block0[i + 1, i] = -1
-
-    block1 = -1 * np.identity(xlen)
-
-    # Populate the main diagonal blocks with block0
-    for i_y in range(ylen):
-        Umatrix[xlen * i_y : xlen * (i_y + 1), xlen * i_y : xlen * (i_y + 1)] = block0
-
-    # Populate the off-diagonal blocks with block1
-    for i_y in range(ylen - 1):
-        Umatrix[xlen * (i_y + 1) : xlen * (i_y + 2), xlen * i_y : xlen * (i_y + 1)] = (
-            block1
-        )
-        Umatrix[xlen * i_y : xlen * (i_y + 1), xlen * (i_y + 1) : xlen * (i_y + 2)] = (
-            block1
-        )
-
-    return Umatrix
+    return _separable_regularization_matrix(xlen, ylen, stencil=[2, -1])
 
 
 def _curvature_regularization_matrix_pixel(xlen, ylen):
@@ -127,41 +136,6 @@ def _curvature_regularization_matrix_pixel(xlen, ylen):
     Pixels outside the defined rectangular region (`xlen`, `ylen`) are implicitly
     treated as having zero amplitude (Dirichlet boundary conditions).
 
-    :return: numpy.ndarray, The (xlen * ylen, xlen * ylen) sized curvature regularization matrix.
+    :return: scipy.sparse.csr_matrix, The (xlen * ylen, xlen * ylen) sized curvature regularization matrix.
     """
-    num_pixels_total = xlen * ylen
-    Umatrix = np.zeros((num_pixels_total, num_pixels_total))
-
-    block0 = np.zeros((xlen, xlen))
-    for i in range(xlen):
-        block0[i, i] = 12
-    for i in range(xlen - 1):
-        block0[i, i + 1] = -4
-        block0[i + 1, i] = -4
-    for i in range(xlen - 2):
-        block0[i, i + 2] = 1
-        block0[i + 2, i] = 1
-
-    block1 = -4 * np.identity(xlen)
-    block2 = np.identity(xlen)
-
-    for i_y in range(ylen):
-        Umatrix[xlen * i_y : xlen * (i_y + 1), xlen * i_y : xlen * (i_y + 1)] = block0
-
-    for i_y in range(ylen - 1):
-        Umatrix[xlen * (i_y + 1) : xlen * (i_y + 2), xlen * i_y : xlen * (i_y + 1)] = (
-            block1
-        )
-        Umatrix[xlen * i_y : xlen * (i_y + 1), xlen * (i_y + 1) : xlen * (i_y + 2)] = (
-            block1
-        )
-
-    for i_y in range(ylen - 2):
-        Umatrix[xlen * (i_y + 2) : xlen * (i_y + 3), xlen * i_y : xlen * (i_y + 1)] = (
-            block2
-        )
-        Umatrix[xlen * i_y : xlen * (i_y + 1), xlen * (i_y + 2) : xlen * (i_y + 3)] = (
-            block2
-        )
-
-    return Umatrix
+    return _separable_regularization_matrix(xlen, ylen, stencil=[6, -4, 1])
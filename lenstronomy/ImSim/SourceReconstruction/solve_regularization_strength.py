@@ -1,4 +1,6 @@
 import numpy as np
+import scipy.sparse as sparse
+from scipy.linalg import cho_factor, cho_solve, eigh
 from typing import Callable
 
 
@@ -16,25 +18,27 @@ def d_log_evi_d_lambda(l: float, U: np.ndarray, M: np.ndarray, b: np.ndarray) ->
     - M: The M matrix
     - b: The b vector
 
+    The matrix (M+lambda*U) is Cholesky-factorized once and the factorization is reused
+    for the trace and the quadratic term.
+
     :param l: The current value of the regularization strength (lambda).
-    :param U: The regularization matrix (numpy.ndarray).
-    :param M: The M matrix (numpy.ndarray).
+    :param U: The regularization matrix (numpy.ndarray or scipy.sparse matrix).
+    :param M: The M matrix (numpy.ndarray or scipy.sparse matrix).
     :param b: The b vector (numpy.ndarray).
     :return: The computed derivative value (float).
     """
+    U, M = _dense(U), _dense(M)
     N_source = U.shape[0]
-    lambda_U = l * U
-    M_plus_lambda_U = M + lambda_U
+    M_plus_lambda_U = M + l * U
 
-    # Compute the inverse of (M + lambda * U)
-    M_plus_lambda_U_inv = np.linalg.inv(M_plus_lambda_U)
+    # Cholesky factorization of the positive definite (M + lambda * U)
+    factor = cho_factor(M_plus_lambda_U)
 
     # Compute the trace term: tr[(M+lambda*U)^-1 * U]
-    trace_term_matrix = np.matmul(M_plus_lambda_U_inv, U)
-    trace_term = np.trace(trace_term_matrix)
+    trace_term = np.trace(cho_solve(factor, U))
 
     # Compute the quadratic term: b^T * (M+lambda*U)^-1 * U * (M+lambda*U)^-1 * b
-    M_plus_lambda_U_inv_b = np.matmul(M_plus_lambda_U_inv, b)
+    M_plus_lambda_U_inv_b = cho_solve(factor, b)
     U_times_M_plus_lambda_U_inv_b = np.matmul(U, M_plus_lambda_U_inv_b)
 
     # Using np.sum(v1 * v2) is equivalent to v1^T @ v2 for 1D vectors
@@ -44,6 +48,56 @@ def d_log_evi_d_lambda(l: float, U: np.ndarray, M: np.ndarray, b: np.ndarray) ->
     return derivative_value
 
 
+def generalized_eigen_decomposition(U: np.ndarray, M: np.ndarray, b: np.ndarray):
+    """Solves the generalized eigenvalue problem M v = mu U v, which simultaneously
+    diagonalizes M and the (positive definite) regularization matrix U. With V the
+    matrix of eigenvectors, V^T U V = I and V^T M V = diag(mu), hence for any
+    regularization strength lambda
+
+    (M+lambda*U)^-1 = V * diag(1 / (mu + lambda)) * V^T.
+
+    The decomposition is computed once and reused for all lambda values, see
+    :func:`d_log_evi_d_lambda_eigen`.
+
+    :param U: The regularization matrix (numpy.ndarray or scipy.sparse matrix).
+    :param M: The M matrix (numpy.ndarray or scipy.sparse matrix).
+    :param b: The b vector (numpy.ndarray).
+    :return: eigenvalues mu, and the b vector projected on the eigenvectors c = V^T b
+    """
+    mu, V = eigh(_dense(M), _dense(U))
+    return mu, np.matmul(V.T, b)
+
+
+def d_log_evi_d_lambda_eigen(l: float, mu: np.ndarray, c: np.ndarray) -> float:
+    """Computes the derivative of the logarithm of the Bayesian evidence with respect to
+    the regularization strength (lambda, l), given the generalized eigenvalue
+    decomposition of (M, U). Equivalent to :func:`d_log_evi_d_lambda`:
+
+    d(ln(Evidence))/d(lambda) ~ N_s/lambda - sum_i 1/(mu_i+lambda) - sum_i c_i^2/(mu_i+lambda)^2
+
+    :param l: The current value of the regularization strength (lambda).
+    :param mu: generalized eigenvalues of (M, U), see :func:`generalized_eigen_decomposition`
+    :param c: b vector projected on the generalized eigenvectors
+    :return: The computed derivative value (float).
+    """
+    inv_mu_plus_lambda = 1 / (mu + l)
+    trace_term = np.sum(inv_mu_plus_lambda)
+    quadratic_term = np.sum((c * inv_mu_plus_lambda) ** 2)
+    return len(mu) / l - trace_term - quadratic_term
+
+
+def _dense(matrix):
+    """Converts a scipy.sparse matrix to a dense numpy array, other inputs are returned
+    as numpy arrays.
+
+    :param matrix: numpy.ndarray or scipy.sparse matrix
+    :return: numpy.ndarray
+    """
+    if sparse.issparse(matrix):
+        return matrix.toarray()
+    return np.asarray(matrix)
+
+
 def solve_optimal_lambda(
     derivative_function: Callable[[float, np.ndarray, np.ndarray, np.ndarray], float],
     U: np.ndarray,
@@ -67,8 +121,12 @@ def solve_optimal_lambda(
                                 d(ln(Evidence))/d(lambda). It must accept
                                 (regularization_strength, data_matrix, regularization_matrix, data_vector)
                                 as its arguments.
-    :param U: The regularization matrix (numpy.ndarray).
-    :param M: The M matrix (numpy.ndarray).
+                                If this is :func:`d_log_evi_d_lambda`, a single generalized
+                                eigenvalue decomposition of (M, U) is computed and reused
+                                for all lambda values (see :func:`d_log_evi_d_lambda_eigen`),
+                                which requires U to be positive definite.
+    :param U: The regularization matrix (numpy.ndarray or scipy.sparse matrix).
+    :param M: The M matrix (numpy.ndarray or scipy.sparse matrix).
     :param b: The b vector (numpy.ndarray).
     :param initial_lower_bound: The lower bound for the search range of lambda.
                                 It is expected that `derivative_function(initial_lower_bound, ...)` > 0.
@@ -92,6 +150,12 @@ def solve_optimal_lambda(
                         or if the derivative function does not yield the expected signs
                         at the initial bounds (i.e., the root is not bracketed).
     """
+    if derivative_function is d_log_evi_d_lambda:
+        mu, c = generalized_eigen_decomposition(U, M, b)
+
+        def derivative_function(l, *args):
+            return d_log_evi_d_lambda_eigen(l, mu, c)
+
     if check_initial_bounds:
         if not (initial_lower_bound < initial_upper_bound):
             raise ValueError(
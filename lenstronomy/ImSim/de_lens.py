@@ -4,11 +4,13 @@ import numpy as np
 import sys
 
 from lenstronomy.Util.package_util import exporter
+from lenstronomy.Util.profiling import timed
 
 export, __all__ = exporter()
 
 
 @export
+@timed("de_lens.get_param_WLS")
 def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     """Returns the parameter values given.
 
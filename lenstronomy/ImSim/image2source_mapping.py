@@ -1,10 +1,19 @@
 import numpy as np
 from lenstronomy.Cosmo.background import Background
 from lenstronomy.ImSim.multiplane_organizer import MultiPlaneOrganizer
+from lenstronomy.ImSim.ray_tracing_cache import RayTracingCache, kwargs_key
 from lenstronomy.Util.cosmo_util import get_astropy_cosmology
+from lenstronomy.Util.profiling import timed
+from lenstronomy.Util.util import stack_kwargs_list
 
 __all__ = ["Image2SourceMapping"]
 
+# keyword arguments of the sampled cosmology (see get_astropy_cosmology())
+_COSMOLOGY_KEYS = ["H0", "Om0", "Ode0", "w0", "wa"]
+# maximum number of coordinates times samples ray-traced at once in a batch (see
+# set_ray_tracing_batch())
+_MAX_BATCH_SIZE = 2**21
+
 
 class Image2SourceMapping(object):
     """This class handles multiple source planes and performs the computation of
@@ -23,7 +32,7 @@ class Image2SourceMapping(object):
     the mapping between source to image plane.
     """
 
-    def __init__(self, lens_model, source_model):
+    def __init__(self, lens_model, source_model, ray_tracing_cache_size=0):
         """
 
         :param lens_model: LensModel() class instance
@@ -32,6 +41,9 @@ class Image2SourceMapping(object):
 
          - source_scale_factor_list: list of floats corresponding to the rescaled deflection angles to the specific source components. None indicates that the list will be set to 1, meaning a single source plane model (in single lens plane mode).
          - source_redshift_list: list of redshifts of the light components (in multi lens plane mode)
+        :param ray_tracing_cache_size: int, number of sets of ray-traced source plane coordinates kept in a
+         least-recently-used cache keyed on the coordinate arrays, the lens keyword arguments and the sampled distances.
+         0 (default) disables the cache.
         """
 
         self._light_model = source_model
@@ -40,6 +52,8 @@ class Image2SourceMapping(object):
         self._multi_lens_plane = lens_model.multi_plane
         self._distance_ratio_sampling = False
         self._cosmology_sampling = False
+        self.set_ray_tracing_cache_size(ray_tracing_cache_size)
+        self.set_ray_tracing_batch(None)
 
         # sort out source redshifts in the multi-lens-plane case
         if self._multi_lens_plane:
@@ -153,6 +167,9 @@ class Image2SourceMapping(object):
         self._lens_model.lens_model.set_background_cosmo(cosmo)
         self._bkg_cosmo.cosmo = cosmo
         self.set_T_ij_arrays()
+        if not self._cosmology_sampling:
+            # with cosmology sampling, the cosmological parameters are part of the cache key
+            self.clear_ray_tracing_cache()
 
     @property
     def T_ij_start_list(self):
@@ -178,6 +195,96 @@ class Image2SourceMapping(object):
         plane."""
         self._T_ij_end_list = T_ij_end_list
 
+    def set_ray_tracing_cache_size(self, max_size):
+        """Sets the number of sets of ray-traced source plane coordinates kept in the
+        least-recently-used cache. The cache is re-used when the same coordinate
+        arrays are ray-traced with lens keyword arguments (and sampled distances) of
+        identical values, e.g. in fitting stages that only vary the light models.
+
+        :param max_size: int, maximum number of entries, 0 disables the cache
+        :return: None
+        """
+        if max_size > 0:
+            self._ray_tracing_cache = RayTracingCache(max_size=max_size)
+        else:
+            self._ray_tracing_cache = None
+
+    def clear_ray_tracing_cache(self):
+        """Deletes the cached ray-traced source plane coordinates.
+
+        :return: None
+        """
+        if self._ray_tracing_cache is not None:
+            self._ray_tracing_cache.clear()
+
+    def set_ray_tracing_batch(self, kwargs_lens_list):
+        """Registers the lens model parameters of an ensemble of samples (e.g. all
+        walkers of a MCMC) that are subsequently evaluated one by one. When coordinates
+        are ray-traced for one of the samples, they are ray-traced for this and the
+        following samples at once with LensModel.alpha_batch() (in chunks of at most
+        _MAX_BATCH_SIZE coordinates times samples) and re-used when the following
+        samples are evaluated. Only the single lens plane mode without sampled distances
+        is supported, otherwise the samples are ray-traced one by one.
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample, or None
+            to delete the registered samples
+        :return: None
+        """
+        self._batch_kwargs_lens_list = None
+        self._batch_index = None
+        self._batch_cache = None
+        if (
+            kwargs_lens_list is None
+            or self._multi_lens_plane
+            or self._distance_ratio_sampling
+            or self._cosmology_sampling
+        ):
+            return
+        self._batch_kwargs_lens_list = kwargs_lens_list
+        self._batch_index = {}
+        for i, kwargs_lens in enumerate(kwargs_lens_list):
+            self._batch_index.setdefault(kwargs_key(kwargs_lens), i)
+
+    def _batch_source_plane_coordinates(self, x, y, kwargs_lens):
+        """Ray-traced coordinates of a sample registered with set_ray_tracing_batch().
+
+        :param x: coordinate in image plane
+        :param y: coordinate in image plane
+        :param kwargs_lens: lens model kwargs list
+        :return: list of (x_source, y_source), see _ray_shooting_planes(), or None if
+            the lens model parameters are not registered
+        """
+        if self._batch_cache is not None:
+            key, beta_list = self._batch_cache.get(x, y, kwargs_lens)
+            if beta_list is not None:
+                return beta_list
+        index = self._batch_index.get(kwargs_key(kwargs_lens), None)
+        if index is None:
+            return None
+        num_samples = max(_MAX_BATCH_SIZE // max(np.size(x), 1), 1)
+        kwargs_lens_list = self._batch_kwargs_lens_list[index : index + num_samples]
+        kwargs_batch = stack_kwargs_list(kwargs_lens_list)
+        if kwargs_batch is None:
+            # parameters that can not be stacked, the samples are ray-traced one by one
+            self.set_ray_tracing_batch(None)
+            return None
+        f_x, f_y = self._lens_model.alpha_batch(x, y, kwargs_batch)
+        if self._multi_source_plane is False:
+            scale_factor_list = [1]
+        else:
+            scale_factor_list = self._deflection_scaling_list
+        self._batch_cache = RayTracingCache(max_size=len(kwargs_lens_list))
+        for j, kwargs_lens_j in enumerate(kwargs_lens_list):
+            f_x_j = f_x[j].reshape(np.shape(x))
+            f_y_j = f_y[j].reshape(np.shape(y))
+            beta_list = [
+                (x - f_x_j * scale_factor, y - f_y_j * scale_factor)
+                for scale_factor in scale_factor_list
+            ]
+            key, _ = self._batch_cache.get(x, y, kwargs_lens_j)
+            self._batch_cache.put(key, x, y, beta_list)
+        return self._batch_cache.get(x, y, kwargs_lens)[1]
+
     def image2source(self, x, y, kwargs_lens, index_source, kwargs_special=None):
         """
         mapping of image plane to source plane coordinates
@@ -192,6 +299,17 @@ class Image2SourceMapping(object):
         """
         self.update_distances(kwargs_special)
 
+        if self._ray_tracing_cache is not None:
+            beta_list = self._source_plane_coordinates(
+                x, y, kwargs_lens, kwargs_special
+            )
+            if self._multi_source_plane is False:
+                return beta_list[0]
+            if self._multi_lens_plane is False:
+                return beta_list[index_source]
+            i = list(self._sorted_source_redshift_index).index(index_source)
+            return beta_list[i]
+
         if self._multi_source_plane is False:
             x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
         else:
@@ -255,57 +373,29 @@ class Image2SourceMapping(object):
             y)
         """
         self.update_distances(kwargs_special)
+        beta_list = self._source_plane_coordinates(x, y, kwargs_lens, kwargs_special)
 
         if self._multi_source_plane is False:
-            x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
+            x_source, y_source = beta_list[0]
             return self._light_model.surface_brightness(
                 x_source, y_source, kwargs_source, k=k
             )
         else:
             flux = np.zeros_like(x)
             if self._multi_lens_plane is False:
-                x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
                 for i in range(len(self._deflection_scaling_list)):
-                    scale_factor = self._deflection_scaling_list[i]
-                    x_source = x - x_alpha * scale_factor
-                    y_source = y - y_alpha * scale_factor
+                    x_source, y_source = beta_list[i]
                     if k is None or k == i:
                         flux += self._light_model.surface_brightness(
                             x_source, y_source, kwargs_source, k=i
                         )
             else:
-                alpha_x, alpha_y = x, y
-                x_source, y_source = np.zeros_like(x), np.zeros_like(y)
-                z_start = 0
                 for i, index_source in enumerate(self._sorted_source_redshift_index):
-                    z_stop = self._source_redshift_list[index_source]
-                    if z_stop > z_start:
-                        T_ij_start = self._T_ij_start_list[i]
-                        T_ij_end = self._T_ij_end_list[i]
-
-                        (
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                        ) = self._lens_model.lens_model.ray_shooting_partial(
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                            z_start,
-                            z_stop,
-                            kwargs_lens,
-                            include_z_start=False,
-                            T_ij_start=T_ij_start,
-                            T_ij_end=T_ij_end,
-                        )
-
+                    x_source, y_source = beta_list[i]
                     if k is None or k == i:
                         flux += self._light_model.surface_brightness(
                             x_source, y_source, kwargs_source, k=index_source
                         )
-                    z_start = z_stop
             return flux
 
     def image_flux_split(self, x, y, kwargs_lens, kwargs_source, kwargs_special=None):
@@ -320,66 +410,128 @@ class Image2SourceMapping(object):
             amplitude amp=1, in the same order as the light_model_list
         """
         self.update_distances(kwargs_special)
+        beta_list = self._source_plane_coordinates(x, y, kwargs_lens, kwargs_special)
 
         if self._multi_source_plane is False:
-            x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
+            x_source, y_source = beta_list[0]
             return self._light_model.functions_split(x_source, y_source, kwargs_source)
         else:
             response = []
             n = 0
             if self._multi_lens_plane is False:
-                x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
                 for i in range(len(self._deflection_scaling_list)):
-                    scale_factor = self._deflection_scaling_list[i]
-                    x_source = x - x_alpha * scale_factor
-                    y_source = y - y_alpha * scale_factor
+                    x_source, y_source = beta_list[i]
                     response_i, n_i = self._light_model.functions_split(
                         x_source, y_source, kwargs_source, k=i
                     )
                     response += response_i
                     n += n_i
             else:
-                n_i_list = []
-                alpha_x, alpha_y = x, y
-                x_source, y_source = np.zeros_like(x), np.zeros_like(y)
-                z_start = 0
                 for i, index_source in enumerate(self._sorted_source_redshift_index):
-                    z_stop = self._source_redshift_list[index_source]
-                    if z_stop > z_start:
-                        T_ij_start = self._T_ij_start_list[i]
-                        T_ij_end = self._T_ij_end_list[i]
-
-                        (
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                        ) = self._lens_model.lens_model.ray_shooting_partial(
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                            z_start,
-                            z_stop,
-                            kwargs_lens,
-                            include_z_start=False,
-                            T_ij_start=T_ij_start,
-                            T_ij_end=T_ij_end,
-                        )
-
+                    x_source, y_source = beta_list[i]
                     response_i, n_i = self._light_model.functions_split(
                         x_source, y_source, kwargs_source, k=index_source
                     )
-
-                    n_i_list.append(n_i)
                     response += response_i
                     n += n_i
-                    z_start = z_stop
                 n_list = self._light_model.num_param_linear_list(kwargs_source)
                 response = self._re_order_split(response, n_list)
 
             return response, n
 
+    def _source_plane_coordinates(self, x, y, kwargs_lens, kwargs_special=None):
+        """Ray-traced coordinates on all source planes, re-using the ray-tracing cache
+        if enabled. The distances need to be updated with update_distances() before.
+
+        :param x: coordinate in image plane
+        :param y: coordinate in image plane
+        :param kwargs_lens: lens model kwargs list
+        :param kwargs_special: keyword arguments of the special parameters
+        :return: list of (x_source, y_source), in order of the deflection scaling list
+            (single lens plane) or in ascending source redshift (multi lens plane)
+        """
+        if self._batch_index is not None:
+            beta_list = self._batch_source_plane_coordinates(x, y, kwargs_lens)
+            if beta_list is not None:
+                return beta_list
+        cache = self._ray_tracing_cache
+        if cache is None:
+            return self._ray_shooting_planes(x, y, kwargs_lens)
+        key, beta_list = cache.get(
+            x, y, kwargs_lens, kwargs_distances=self._kwargs_distances(kwargs_special)
+        )
+        if beta_list is None:
+            beta_list = cache.put(
+                key, x, y, self._ray_shooting_planes(x, y, kwargs_lens)
+            )
+        return beta_list
+
+    def _kwargs_distances(self, kwargs_special):
+        """Entries of the special keyword arguments the ray-tracing depends on.
+
+        :param kwargs_special: keyword arguments of the special parameters
+        :return: dict or None
+        """
+        if kwargs_special is None or not (
+            self._distance_ratio_sampling or self._cosmology_sampling
+        ):
+            return None
+        return {
+            key: value
+            for key, value in kwargs_special.items()
+            if key.startswith("factor_beta_") or key in _COSMOLOGY_KEYS
+        }
+
+    @timed("Image2SourceMapping.ray_shooting")
+    def _ray_shooting_planes(self, x, y, kwargs_lens):
+        """Ray-traces the coordinates to all source planes.
+
+        :param x: coordinate in image plane
+        :param y: coordinate in image plane
+        :param kwargs_lens: lens model kwargs list
+        :return: list of (x_source, y_source), in order of the deflection scaling list
+            (single lens plane) or in ascending source redshift (multi lens plane)
+        """
+        if self._multi_source_plane is False:
+            return [self._lens_model.ray_shooting(x, y, kwargs_lens)]
+        beta_list = []
+        if self._multi_lens_plane is False:
+            x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
+            for scale_factor in self._deflection_scaling_list:
+                beta_list.append(
+                    (x - x_alpha * scale_factor, y - y_alpha * scale_factor)
+                )
+        else:
+            alpha_x, alpha_y = x, y
+            x_source, y_source = np.zeros_like(x), np.zeros_like(y)
+            z_start = 0
+            for i, index_source in enumerate(self._sorted_source_redshift_index):
+                z_stop = self._source_redshift_list[index_source]
+                if z_stop > z_start:
+                    T_ij_start = self._T_ij_start_list[i]
+                    T_ij_end = self._T_ij_end_list[i]
+
+                    (
+                        x_source,
+                        y_source,
+                        alpha_x,
+                        alpha_y,
+                    ) = self._lens_model.lens_model.ray_shooting_partial(
+                        x_source,
+                        y_source,
+                        alpha_x,
+                        alpha_y,
+                        z_start,
+                        z_stop,
+                        kwargs_lens,
+                        include_z_start=False,
+                        T_ij_start=T_ij_start,
+                        T_ij_end=T_ij_end,
+                    )
+                beta_list.append((x_source, y_source))
+                z_start = z_stop
+        return beta_list
+
     @staticmethod
     def _index_ordering(redshift_list):
         """Orders the redshifts in ascending order.
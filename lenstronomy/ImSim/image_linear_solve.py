@@ -1,9 +1,11 @@
 from lenstronomy.ImSim.image_model import ImageModel
+from lenstronomy.ImSim.linear_solver_cache import LinearSolverCache
 import lenstronomy.ImSim.de_lens as de_lens
 from lenstronomy.Util import util
 from lenstronomy.Util import primary_beam_util
 from lenstronomy.ImSim.Numerics.convolution import PixelKernelConvolution
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["ImageLinearFit"]
 
@@ -16,6 +18,9 @@ class ImageLinearFit(ImageModel):
     solver. The current pixel-based solver is provided by the SLITronomy plug-in.
     """
 
+    # set in __init__(), also defined for sub-classes that initialize only ImageModel
+    _linear_solver_cache = None
+
     def __init__(
         self,
         data_class,
@@ -29,6 +34,8 @@ class ImageLinearFit(ImageModel):
         likelihood_mask=None,
         psf_error_map_bool_list=None,
         kwargs_pixelbased=None,
+        linear_solver_cache=False,
+        ray_tracing_cache_size=0,
     ):
         """
 
@@ -46,6 +53,11 @@ class ImageLinearFit(ImageModel):
          Indicates whether PSF error map is used for the point source model stated as the index.
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
          (see SLITronomy documentation) being applied to the point sources.
+        :param linear_solver_cache: bool, if True, caches the blocks (lensed source, deflector light, point sources)
+         of the linear response matrix and of the normal equations between calls and only re-computes the blocks
+         whose non-linear parameters changed. Only applies to the 'diagonal' likelihood method.
+        :param ray_tracing_cache_size: int, number of sets of ray-traced source plane coordinates kept in a
+         least-recently-used cache (see Image2SourceMapping). 0 (default) disables the cache.
         """
         super(ImageLinearFit, self).__init__(
             data_class,
@@ -59,6 +71,7 @@ class ImageLinearFit(ImageModel):
             likelihood_mask=likelihood_mask,
             psf_error_map_bool_list=psf_error_map_bool_list,
             kwargs_pixelbased=kwargs_pixelbased,
+            ray_tracing_cache_size=ray_tracing_cache_size,
         )
 
         # prepare to use fft convolution for the natwt linear solver
@@ -66,6 +79,10 @@ class ImageLinearFit(ImageModel):
             self._convolution = PixelKernelConvolution(
                 kernel=self.PSF.kernel_point_source
             )
+        if linear_solver_cache is True:
+            self._linear_solver_cache = LinearSolverCache()
+        else:
+            self._linear_solver_cache = None
 
     def image_linear_solve(
         self,
@@ -110,6 +127,23 @@ class ImageLinearFit(ImageModel):
                 kwargs_extinction,
                 kwargs_special,
             )
+        elif (
+            self.Data.likelihood_method() == "diagonal"
+            and self._linear_solver_cache is not None
+        ):
+            param, cov_param, wls_model, model_error = self._image_linear_solve_cached(
+                kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                kwargs_extinction,
+                kwargs_special,
+                inv_bool=inv_bool,
+            )
+            model = self.array_masked2image(wls_model)
+            _, _, _, _ = ImageLinearFit.update_linear_kwargs(
+                self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+            )
         elif self.Data.likelihood_method() == "diagonal":
             A = ImageLinearFit.linear_response_matrix(
                 self,
@@ -152,6 +186,83 @@ class ImageLinearFit(ImageModel):
             )
         return model, model_error, cov_param, param
 
+    def _image_linear_solve_cached(
+        self,
+        kwargs_lens,
+        kwargs_source,
+        kwargs_lens_light,
+        kwargs_ps,
+        kwargs_extinction,
+        kwargs_special,
+        inv_bool=False,
+    ):
+        """Weighted linear least square solution re-using the blocks of the response
+        matrix and of the normal equations that did not change since the previous call
+        (see LinearSolverCache).
+
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition
+            of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the
+            superposition of different source light profiles
+        :param kwargs_lens_light: list of keyword arguments corresponding to different
+            lens light surface brightness profiles
+        :param kwargs_ps: keyword arguments corresponding to "other" parameters, such as
+            external shear and point source image positions
+        :param kwargs_extinction: list of keyword arguments for extinction model
+        :param kwargs_special: list of special keyword arguments
+        :param inv_bool: if True, invert the full linear solver Matrix Ax = y for the
+            purpose of the covariance matrix.
+        :return: linear parameters, covariance matrix (or None), 1d array of the masked
+            model, 2d array of the model error
+        """
+        cache = self._linear_solver_cache
+        block_keys = [
+            (kwargs_lens, kwargs_source, kwargs_special, kwargs_extinction),
+            (kwargs_lens_light,),
+            (kwargs_ps, kwargs_lens, kwargs_special),
+        ]
+        dirty = cache.dirty_blocks(block_keys)
+        A, block_sizes = self._linear_response_matrix(
+            kwargs_lens,
+            kwargs_source,
+            kwargs_lens_light,
+            kwargs_ps,
+            kwargs_extinction=kwargs_extinction,
+            kwargs_special=kwargs_special,
+            A=cache.response,
+            block_sizes=cache.block_sizes,
+            block_bool=dirty,
+        )
+        cache.update_response(A, block_sizes, block_keys, dirty)
+        C_D_response, model_error = ImageModel.error_response(
+            self, kwargs_lens, kwargs_ps, kwargs_special=kwargs_special
+        )
+        param, cov_param, wls_model = cache.solve(
+            1 / C_D_response, self.data_response, inv_bool=inv_bool
+        )
+        return param, cov_param, wls_model, model_error
+
+    def update_psf(self, psf_class):
+        """Update the instance of the class with a new instance of PSF() with a
+        potentially different point spread function.
+
+        :param psf_class: instance of lenstronomy.Data.psf.PSF class
+        :return: no return. Class is updated.
+        """
+        super(ImageLinearFit, self).update_psf(psf_class)
+        if self._linear_solver_cache is not None:
+            self._linear_solver_cache.reset()
+
+    def update_data(self, data_class):
+        """
+
+        :param data_class: instance of Data() class
+        :return: no return. Class is updated.
+        """
+        super(ImageLinearFit, self).update_data(data_class)
+        if self._linear_solver_cache is not None:
+            self._linear_solver_cache.reset()
+
     def image_pixelbased_solve(
         self,
         kwargs_lens=None,
@@ -356,50 +467,126 @@ class ImageLinearFit(ImageModel):
         :param unconvolved: bool, if True, computes components without convolution kernel (will not work for point sources)
         :return: response matrix (m x n)
         """
-        x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
-
-        source_light_response, n_source = self.source_mapping.image_flux_split(
-            x_grid, y_grid, kwargs_lens, kwargs_source, kwargs_special
-        )
-        extinction = self._extinction.extinction(
-            x_grid,
-            y_grid,
+        A, _ = self._linear_response_matrix(
+            kwargs_lens,
+            kwargs_source,
+            kwargs_lens_light,
+            kwargs_ps,
             kwargs_extinction=kwargs_extinction,
             kwargs_special=kwargs_special,
+            unconvolved=unconvolved,
         )
-        lens_light_response, n_lens_light = self.LensLightModel.functions_split(
-            x_grid, y_grid, kwargs_lens_light
-        )
+        return A
 
-        ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(
-            kwargs_ps, kwargs_lens, kwargs_special, with_amp=False
-        )
-        num_param = n_points + n_lens_light + n_source
+    @timed("ImageLinearFit.linear_response_matrix")
+    def _linear_response_matrix(
+        self,
+        kwargs_lens,
+        kwargs_source,
+        kwargs_lens_light,
+        kwargs_ps,
+        kwargs_extinction=None,
+        kwargs_special=None,
+        unconvolved=False,
+        A=None,
+        block_sizes=None,
+        block_bool=None,
+    ):
+        """Computes the linear response matrix in three blocks of rows (lensed source,
+        deflector light, point sources) with the option to only re-compute a subset of
+        the blocks of an existing response matrix.
 
-        num_response = self.num_data_evaluate
-        A = np.zeros((num_param, num_response))
-        n = 0
-        # response of lensed source profile
-        for i in range(0, n_source):
-            image = source_light_response[i]
-            image *= extinction
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
-        # response of deflector light profile (or any other un-lensed extended components)
-        for i in range(0, n_lens_light):
-            image = lens_light_response[i]
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
-        # response of point sources
-        for i in range(0, n_points):
-            image = self.ImageNumerics.point_source_rendering(
-                ra_pos[i], dec_pos[i], amp[i]
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the superposition of different source light profiles
+        :param kwargs_lens_light: list of keyword arguments corresponding to different lens light surface brightness profiles
+        :param kwargs_ps: keyword arguments corresponding to "other" parameters, such as external shear and point source image positions
+        :param kwargs_extinction: list of keyword arguments for extinction model
+        :param kwargs_special: list of special keyword arguments
+        :param unconvolved: bool, if True, computes components without convolution kernel (will not work for point sources)
+        :param A: (optional) existing response matrix that gets updated in place
+        :param block_sizes: number of linear coefficients in each block of A (required when A is provided)
+        :param block_bool: list of three bools, blocks of A to be re-computed (only used when A is provided)
+        :return: response matrix (m x n), list of the number of coefficients in each block
+        """
+        if A is None:
+            block_bool = [True, True, True]
+            block_sizes = [0, 0, 0]
+        n_source, n_lens_light, n_points = block_sizes
+        x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
+
+        if block_bool[0]:
+            source_light_response, n_source = self.source_mapping.image_flux_split(
+                x_grid, y_grid, kwargs_lens, kwargs_source, kwargs_special
             )
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
-        return A * self._flux_scaling
+            extinction = self._extinction.extinction(
+                x_grid,
+                y_grid,
+                kwargs_extinction=kwargs_extinction,
+                kwargs_special=kwargs_special,
+            )
+        if block_bool[1]:
+            lens_light_response, n_lens_light = self.LensLightModel.functions_split(
+                x_grid, y_grid, kwargs_lens_light
+            )
+        if block_bool[2]:
+            ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(
+                kwargs_ps, kwargs_lens, kwargs_special, with_amp=False
+            )
+        if A is None or [n_source, n_lens_light, n_points] != list(block_sizes):
+            if not all(block_bool):
+                return self._linear_response_matrix(
+                    kwargs_lens,
+                    kwargs_source,
+                    kwargs_lens_light,
+                    kwargs_ps,
+                    kwargs_extinction=kwargs_extinction,
+                    kwargs_special=kwargs_special,
+                    unconvolved=unconvolved,
+                )
+            num_param = n_points + n_lens_light + n_source
+            num_response = self.num_data_evaluate
+            A = np.zeros((num_param, num_response))
+
+        # responses of the lensed source profile and the deflector light profile (or any other un-lensed extended
+        # components) are stacked, re-sized and convolved together
+        n_extended = block_bool[0] * n_source + block_bool[1] * n_lens_light
+        if n_extended > 0:
+            flux_arrays = np.zeros((n_extended, len(x_grid)))
+            rows = np.zeros(n_extended, dtype=int)
+            n = 0
+            if block_bool[0]:
+                for i in range(0, n_source):
+                    flux_arrays[n] = source_light_response[i]
+                    rows[n] = i
+                    n += 1
+                flux_arrays[:n_source] *= extinction
+            if block_bool[1]:
+                for i in range(0, n_lens_light):
+                    flux_arrays[n] = lens_light_response[i]
+                    rows[n] = n_source + i
+                    n += 1
+            images = self.ImageNumerics.re_size_convolve_batch(
+                flux_arrays, unconvolved=unconvolved
+            )
+            A[rows, :] = images.reshape(n_extended, -1)[:, self._mask1d]
+        # response of point sources
+        if block_bool[2]:
+            n = n_source + n_lens_light
+            for i in range(0, n_points):
+                image = self.ImageNumerics.point_source_rendering(
+                    ra_pos[i], dec_pos[i], amp[i]
+                )
+                A[n, :] = self.image2array_masked(image)
+                n += 1
+        for i, n_start, n_end in [
+            (0, 0, n_source),
+            (1, n_source, n_source + n_lens_light),
+            (2, n_source + n_lens_light, len(A)),
+        ]:
+            if block_bool[i]:
+                np.nan_to_num(A[n_start:n_end], copy=False)
+                A[n_start:n_end] *= self._flux_scaling
+        return A, [n_source, n_lens_light, n_points]
 
     def update_linear_kwargs(
         self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
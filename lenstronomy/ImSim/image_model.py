@@ -10,6 +10,7 @@ from lenstronomy.Util import util
 from lenstronomy.Util import primary_beam_util
 
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["ImageModel"]
 
@@ -31,6 +32,7 @@ class ImageModel(object):
         likelihood_mask=None,
         psf_error_map_bool_list=None,
         kwargs_pixelbased=None,
+        ray_tracing_cache_size=0,
     ):
         """
         :param data_class: instance of ImageData() or PixelGrid() class
@@ -47,6 +49,9 @@ class ImageModel(object):
             Indicates whether PSF error map is used for the point source model stated as the index.
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
             (see SLITronomy documentation)
+        :param ray_tracing_cache_size: int, number of sets of ray-traced source plane coordinates kept in a
+            least-recently-used cache (see Image2SourceMapping). Useful when only the light models vary. 0 (default)
+            disables the cache.
         """
 
         self.type = "single-band"
@@ -128,7 +133,9 @@ class ImageModel(object):
             self.source_mapping = None  # handled with pixelated operator
         else:
             self.source_mapping = Image2SourceMapping(
-                lens_model=lens_model_class, source_model=source_model_class
+                lens_model=lens_model_class,
+                source_model=source_model_class,
+                ray_tracing_cache_size=ray_tracing_cache_size,
             )
 
         self._pb = data_class.primary_beam
@@ -232,6 +239,7 @@ class ImageModel(object):
         variance_map = c_d + np.abs(model_error)
         return variance_map
 
+    @timed("ImageModel.source_surface_brightness")
     def source_surface_brightness(
         self,
         kwargs_source,
@@ -436,6 +444,7 @@ class ImageModel(object):
         source_light_final = source_light / self.Data.pixel_width**2
         return source_light_final * self._flux_scaling
 
+    @timed("ImageModel.lens_surface_brightness")
     def lens_surface_brightness(
         self, kwargs_lens_light, unconvolved=False, apply_primary_beam=True, k=None
     ):
@@ -508,6 +517,7 @@ class ImageModel(object):
         lens_light_final = util.array2image(lens_light)
         return lens_light_final * self._flux_scaling
 
+    @timed("ImageModel.point_source")
     def point_source(
         self,
         kwargs_ps,
@@ -551,6 +561,7 @@ class ImageModel(object):
         )
         return point_source_image * self._flux_scaling
 
+    @timed("ImageModel.image")
     def image(
         self,
         kwargs_lens=None,
@@ -678,6 +689,19 @@ class ImageModel(object):
         self.PointSource.delete_lens_model_cache()
         self.PointSource.set_save_cache(cache)
 
+    def set_ray_tracing_batch(self, kwargs_lens_list):
+        """Registers the lens model parameters of an ensemble of samples that are
+        subsequently evaluated one by one, such that the coordinates of the image are
+        ray-traced for several samples at once (see
+        Image2SourceMapping.set_ray_tracing_batch()).
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample, or None
+            to delete the registered samples
+        :return: None
+        """
+        if self.source_mapping is not None:
+            self.source_mapping.set_ray_tracing_batch(kwargs_lens_list)
+
     def update_psf(self, psf_class):
         """Update the instance of the class with a new instance of PSF() with a
         potentially different point spread function.
@@ -0,0 +1,243 @@
+__author__ = "sibirrer"
+
+import numpy as np
+from scipy import linalg
+
+import lenstronomy.ImSim.de_lens as de_lens
+from lenstronomy.Util.profiling import timed
+
+__all__ = ["LinearSolverCache"]
+
+# keyword arguments that hold the linear amplitudes. They are set by the linear solver and do not change the response
+# of the linear basis functions.
+_LINEAR_KEYS = ["amp", "point_amp", "source_amp"]
+
+
+class LinearSolverCache(object):
+    """Block-aware cache of the weighted linear least square problem solved in
+    ImageLinearFit.
+
+    The rows of the response matrix A are organized in three blocks (lensed source,
+    deflector light, point sources). Each block is tagged with the keyword arguments
+    its response depends on. When only a subset of the blocks changes between two
+    calls (e.g. only the deflector light profile moves), only those rows of A, the
+    corresponding rows and columns of the normal matrix M = A W A^T and of the
+    projected data vector R = A W d are re-computed. The normal equations are then
+    solved with the Schur complement of the unchanged blocks, re-using their cached
+    Cholesky factorization.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Deletes all cached quantities.
+
+        :return: None
+        """
+        self._keys = None
+        self._A = None
+        self._block_sizes = None
+        self._block_version = [0, 0, 0]
+        self._dirty = [True, True, True]
+        self._weights = None
+        self._M = None
+        self._R = None
+        self._cho_key = None
+        self._cho = None
+
+    def dirty_blocks(self, block_keys):
+        """Evaluates which blocks of the response matrix need to be re-computed.
+
+        :param block_keys: list of three tuples of keyword arguments (lensed source,
+            deflector light, point sources) the response of each block depends on
+        :return: list of three bools, True for blocks to be re-computed
+        """
+        if self._keys is None:
+            return [True, True, True]
+        return [
+            not _kwargs_equal(_strip_linear(key), self._keys[i])
+            for i, key in enumerate(block_keys)
+        ]
+
+    @property
+    def response(self):
+        """Cached response matrix to be partially updated in place.
+
+        :return: response matrix (n_param x n_data) or None
+        """
+        return self._A
+
+    @property
+    def block_sizes(self):
+        """Number of linear parameters in each block of the cached response matrix.
+
+        :return: list of three integers or None
+        """
+        return self._block_sizes
+
+    def update_response(self, A, block_sizes, block_keys, dirty):
+        """Stores the (partially) re-computed response matrix.
+
+        :param A: response matrix (n_param x n_data)
+        :param block_sizes: number of linear parameters in each block
+        :param block_keys: list of three tuples of keyword arguments of each block
+        :param dirty: list of bools, blocks that have been re-computed
+        :return: None
+        """
+        if self._A is not A or self._block_sizes != list(block_sizes):
+            dirty = [True, True, True]
+            self._M = None
+        self._A = A
+        self._block_sizes = list(block_sizes)
+        self._keys = [_strip_linear(key) for key in block_keys]
+        for i in range(3):
+            if dirty[i]:
+                self._block_version[i] += 1
+        self._dirty = dirty
+
+    @timed("LinearSolverCache.solve")
+    def solve(self, weights, d, inv_bool=False):
+        """Solves the weighted linear least square problem for the current response
+        matrix.
+
+        :param weights: 1d array, inverse variance of the data points
+        :param d: 1d data array
+        :param inv_bool: boolean, whether returning also the inverse matrix
+        :return: linear parameters, inverse of the normal matrix (or None), linear
+            model
+        """
+        A = self._A
+        index_dirty = self._block_index(self._dirty)
+        A_w = A * weights
+        if self._M is None or not np.array_equal(weights, self._weights):
+            self._M = A_w.dot(A.T)
+            self._R = A_w.dot(d)
+            self._weights = np.array(weights, copy=True)
+            self._cho_key = None
+            index_dirty = np.arange(len(A))
+        elif len(index_dirty) > 0:
+            M_dirty = A_w[index_dirty].dot(A.T)
+            self._M[index_dirty, :] = M_dirty
+            self._M[:, index_dirty] = M_dirty.T
+            self._R[index_dirty] = A_w[index_dirty].dot(d)
+        self._dirty = [False, False, False]
+
+        B = None
+        # same condition number check as de_lens.get_param_WLS(), ill-conditioned normal
+        # matrices are handed to get_param_WLS_interferometry() and return zero amplitudes
+        if inv_bool is False and de_lens._cond_inv(self._M):
+            B = self._solve_schur(index_dirty)
+        if B is not None:
+            M_inv = None
+        else:
+            B, M_inv = de_lens.get_param_WLS_interferometry(
+                self._M, self._R, inv_bool=inv_bool
+            )
+        image = B.dot(A)
+        return B, M_inv, image
+
+    def _solve_schur(self, index_dirty):
+        """Solves the normal equations with the Schur complement of the blocks that did
+        not change, re-using their cached Cholesky factorization.
+
+        :param index_dirty: indexes of the linear parameters that changed
+        :return: linear parameters or None if the Schur complement solution is not
+            applicable
+        """
+        num_param = len(self._M)
+        clean = np.ones(num_param, dtype=bool)
+        clean[index_dirty] = False
+        index_clean = np.where(clean)[0]
+        if len(index_clean) == 0:
+            return None
+        cho_key = (
+            tuple(index_clean),
+            tuple(
+                self._block_version[i] for i in range(3) if self._block_clean(i, clean)
+            ),
+        )
+        M = self._M
+        try:
+            if self._cho_key != cho_key:
+                self._cho = linalg.cho_factor(M[np.ix_(index_clean, index_clean)])
+                self._cho_key = cho_key
+            y_c = linalg.cho_solve(self._cho, self._R[index_clean])
+            if len(index_dirty) == 0:
+                return y_c
+            M_cd = M[np.ix_(index_clean, index_dirty)]
+            X = linalg.cho_solve(self._cho, M_cd)
+            S = M[np.ix_(index_dirty, index_dirty)] - M_cd.T.dot(X)
+            B_d = linalg.cho_solve(
+                linalg.cho_factor(S), self._R[index_dirty] - M_cd.T.dot(y_c)
+            )
+        except (linalg.LinAlgError, ValueError):
+            self._cho_key = None
+            return None
+        B = np.zeros(num_param)
+        B[index_dirty] = B_d
+        B[index_clean] = y_c - X.dot(B_d)
+        return B
+
+    def _block_index(self, block_bool):
+        """
+
+        :param block_bool: list of three bools
+        :return: indexes of the linear parameters in the selected blocks
+        """
+        index = []
+        n = 0
+        for i, size in enumerate(self._block_sizes):
+            if block_bool[i]:
+                index += list(range(n, n + size))
+            n += size
+        return np.array(index, dtype=int)
+
+    def _block_clean(self, i, clean):
+        """
+
+        :param i: block index
+        :param clean: bool array of linear parameters that did not change
+        :return: bool, True if block i is non-empty and unchanged
+        """
+        n = int(np.sum(self._block_sizes[:i]))
+        size = self._block_sizes[i]
+        return size > 0 and bool(np.all(clean[n : n + size]))
+
+
+def _strip_linear(kwargs):
+    """Removes the linear amplitude parameters from (nested lists of) keyword
+    arguments.
+
+    :param kwargs: keyword argument dictionary, list or tuple
+    :return: same structure without the linear amplitude entries
+    """
+    if isinstance(kwargs, dict):
+        return {
+            key: _strip_linear(value)
+            for key, value in kwargs.items()
+            if key not in _LINEAR_KEYS
+        }
+    if isinstance(kwargs, (list, tuple)):
+        return [_strip_linear(value) for value in kwargs]
+    return kwargs
+
+
+def _kwargs_equal(kwargs_1, kwargs_2):
+    """Checks whether two (nested) keyword argument structures are identical.
+
+    :param kwargs_1: keyword argument dictionary, list, array or number
+    :param kwargs_2: keyword argument dictionary, list, array or number
+    :return: bool
+    """
+    if isinstance(kwargs_1, dict):
+        if not isinstance(kwargs_2, dict) or kwargs_1.keys() != kwargs_2.keys():
+            return False
+        return all(_kwargs_equal(kwargs_1[key], kwargs_2[key]) for key in kwargs_1)
+    if isinstance(kwargs_1, (list, tuple)):
+        if not isinstance(kwargs_2, (list, tuple)) or len(kwargs_1) != len(kwargs_2):
+            return False
+        return all(_kwargs_equal(k_1, k_2) for k_1, k_2 in zip(kwargs_1, kwargs_2))
+    if isinstance(kwargs_1, np.ndarray) or isinstance(kwargs_2, np.ndarray):
+        return np.array_equal(kwargs_1, kwargs_2)
+    return kwargs_1 == kwargs_2
@@ -0,0 +1,120 @@
+__author__ = "sibirrer"
+
+from collections import OrderedDict
+import numpy as np
+
+__all__ = ["RayTracingCache"]
+
+
+class RayTracingCache(object):
+    """Least-recently-used cache of ray-traced source plane coordinates.
+
+    Each entry holds the source plane coordinates (beta_x, beta_y) of all source planes
+    for a given set of image plane coordinates and lens model keyword arguments. The
+    image plane coordinate arrays are identified by object identity (the entry keeps a
+    reference to them, such that their id can not be re-used while the entry exists).
+    They are not allowed to be modified in place. The lens keyword arguments are
+    identified by value, such that new keyword argument dictionaries with unchanged
+    values (e.g. in a fitting stage that only varies the source parameters) are cache
+    hits.
+    """
+
+    def __init__(self, max_size=1):
+        """
+
+        :param max_size: maximum number of entries held. Each entry requires 2 x (number
+            of source planes) arrays of the size of the coordinate arrays.
+        """
+        self._max_size = int(max_size)
+        self._entries = OrderedDict()
+
+    @property
+    def max_size(self):
+        """Maximum number of entries held.
+
+        :return: int
+        """
+        return self._max_size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, x, y, kwargs_lens, kwargs_distances=None):
+        """Looks up the ray-traced coordinates.
+
+        :param x: image plane coordinate array
+        :param y: image plane coordinate array
+        :param kwargs_lens: lens model keyword argument list
+        :param kwargs_distances: (optional) keyword arguments (dict) with the distance
+            entries the ray-tracing depends on
+        :return: key of the entry, list of (beta_x, beta_y) per source plane or None
+        """
+        key = (
+            id(x),
+            id(y),
+            kwargs_key(kwargs_lens),
+            kwargs_key(kwargs_distances),
+        )
+        entry = self._entries.get(key, None)
+        if entry is None or entry[0] is not x or entry[1] is not y:
+            return key, None
+        self._entries.move_to_end(key)
+        return key, entry[2]
+
+    def put(self, key, x, y, beta_list):
+        """Stores ray-traced coordinates and evicts the least recently used entries
+        beyond the maximum size.
+
+        :param key: key returned by get()
+        :param x: image plane coordinate array
+        :param y: image plane coordinate array
+        :param beta_list: list of (beta_x, beta_y) per source plane
+        :return: list of read-only (beta_x, beta_y) per source plane
+        """
+        beta_list = [
+            (_read_only(beta_x), _read_only(beta_y)) for beta_x, beta_y in beta_list
+        ]
+        if self._max_size > 0:
+            self._entries[key] = (x, y, beta_list)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return beta_list
+
+    def clear(self):
+        """Deletes all entries.
+
+        :return: None
+        """
+        self._entries.clear()
+
+
+def kwargs_key(kwargs):
+    """Hashable representation of (nested) keyword arguments by value.
+
+    :param kwargs: keyword argument dictionary, list, tuple, array or number
+    :return: hashable tuple
+    """
+    if isinstance(kwargs, dict):
+        return tuple((key, kwargs_key(kwargs[key])) for key in sorted(kwargs.keys()))
+    if isinstance(kwargs, (list, tuple)):
+        return tuple(kwargs_key(value) for value in kwargs)
+    if isinstance(kwargs, np.ndarray):
+        return kwargs.shape, kwargs.dtype.str, kwargs.tobytes()
+    if isinstance(kwargs, np.generic):
+        return kwargs.item()
+    return kwargs
+
+
+def _read_only(array):
+    """Returns the array as a read-only numpy array (cached coordinates are shared
+    between calls and must not be modified)
+
+    :param array: array or number
+    :return: read-only numpy array
+    """
+    array = np.asarray(array)
+    if array.flags.writeable:
+        array = array.view()
+        array.flags.writeable = False
+    return array
@@ -212,3 +212,188 @@ def adaptive_boundary_mesh(
         subset_image_centers_x,
         subset_image_centers_y,
     )
+
+
+def adaptive_boundary_mesh_light_curve(
+    source_positions_x,
+    source_positions_y,
+    L,
+    beta_0,
+    beta_s,
+    n_p,
+    eta,
+    number_of_iterations,
+    kwargs_lens,
+    lens_model_list=None,
+    image_center=(0, 0),
+    segment_size=32,
+    processes=1,
+):
+    """ABM algorithm (Meena et al. 2022) for a track of source positions (e.g. the
+    epochs of a microlensing light curve).
+
+    The positions are split into segments of consecutive positions. Within a segment,
+    the image-plane pixel hierarchy is shared: on each iteration, the children of all
+    pixels that are kept for at least one position of the segment are ray-shot in bulk.
+    For each position, a pixel is kept if its parent was kept for that position and
+    its ray lands within the search radius delta_beta (on the last iteration within
+    beta_s) of the position. The pixels kept for each position do not depend on the
+    segment_size, while the pixels common to nearby positions are only ray-shot once.
+    Segments are independent and can be distributed over a process pool.
+
+    This differs from adaptive_boundary_mesh(), which refines all pixels of the
+    previous iteration:
+
+    - only the kept pixels are refined, so the source radius beta_s is only applied on
+      the last iteration (applying it earlier would discard the parents of pixels
+      landing within beta_s at the final resolution). As long as delta_beta is a
+      sufficient margin, the pixels mapped within beta_s are the same.
+    - the final scale factor of loop_information() is not needed, as it only rescales
+      delta_beta after the last iteration in adaptive_boundary_mesh().
+    - total_number_of_rays_shot counts all the rays that are shot, not only those of
+      the kept pixels.
+
+    :param source_positions_x: x-coordinates of the source positions
+    :type source_positions_x: nparray
+    :param source_positions_y: y-coordinates of the source positions
+    :type source_positions_y: nparray
+    :param L: Side length of square area in image plane. Same as lenstronomy grid width
+    :type L: float
+    :param beta_0: Initial search radius (delta_beta)
+    :type beta_0: float
+    :param beta_s: Radius of the source
+    :type beta_s: float
+    :param n_p: number of subsquares per side by which each (valid) pixel is divided in
+        the next iteration
+    :type n_p: int
+    :param eta: Factor by which the search radius is reduced in each iteration
+    :type eta: float
+    :param number_of_iterations: Number of iterations (see loop_information())
+    :type number_of_iterations: int
+    :param kwargs_lens: Keyword arguments for lens model
+    :type kwargs_lens: list of dict
+    :param lens_model_list: list of lens model names, default ["POINT_MASS"]
+    :type lens_model_list: list of str
+    :param image_center: center of the square area in the image plane
+    :type image_center: tuple
+    :param segment_size: number of consecutive source positions sharing a pixel
+        hierarchy
+    :type segment_size: int
+    :param processes: number of processes over which the segments are distributed
+    :type processes: int
+    :return: side_length: side length of the high resolution image-plane pixels
+    :rtype: side_length: float
+    :return: total_number_of_rays_shot: total number of rays shot for the track
+    :rtype: total_number_of_rays_shot: int
+    :return: number_of_pixels: number of high resolution image-plane pixels mapped
+        within beta_s of each source position
+    :rtype: number_of_pixels: nparray
+    :return: magnification: number_of_pixels * side_length^2 / (pi beta_s^2)
+    :rtype: magnification: nparray
+    """
+    if lens_model_list is None:
+        lens_model_list = ["POINT_MASS"]
+    source_positions_x = np.atleast_1d(np.array(source_positions_x, dtype=float))
+    source_positions_y = np.atleast_1d(np.array(source_positions_y, dtype=float))
+    num_positions = len(source_positions_x)
+    segment_size = max(int(segment_size), 1)
+    segments = [
+        (
+            source_positions_x[i : i + segment_size],
+            source_positions_y[i : i + segment_size],
+            L,
+            beta_0,
+            beta_s,
+            n_p,
+            eta,
+            number_of_iterations,
+            kwargs_lens,
+            lens_model_list,
+            image_center,
+        )
+        for i in range(0, num_positions, segment_size)
+    ]
+    if processes == 1:
+        results = list(map(_abm_segment, segments))
+    else:
+        # imported here to avoid requiring the multiprocessing dependencies at import time
+        from lenstronomy.Sampling.Pool.pool import choose_pool
+
+        pool = choose_pool(mpi=False, processes=processes)
+        results = list(pool.map(_abm_segment, segments))
+        pool.close()
+    number_of_pixels = np.zeros(num_positions, dtype=int)
+    total_number_of_rays_shot = 0
+    for i, (num_rays, num_pix) in enumerate(results):
+        total_number_of_rays_shot += num_rays
+        number_of_pixels[i * segment_size : i * segment_size + len(num_pix)] = num_pix
+    side_length = L / n_p ** max(number_of_iterations - 1, 0)
+    magnification = number_of_pixels * side_length**2 / (np.pi * beta_s**2)
+    return side_length, total_number_of_rays_shot, number_of_pixels, magnification
+
+
+# maximum number of children evaluated at once against all positions of a segment
+_ABM_CHUNK_SIZE = 2**15
+
+
+def _abm_segment(args):
+    """ABM algorithm for a segment of source positions sharing the image-plane pixel
+    hierarchy.
+
+    :param args: tuple (source_x, source_y, L, beta_0, beta_s, n_p, eta,
+        number_of_iterations, kwargs_lens, lens_model_list, image_center), see
+        adaptive_boundary_mesh_light_curve()
+    :return: number of rays shot, number of high resolution pixels per position
+    """
+    (
+        source_x,
+        source_y,
+        L,
+        beta_0,
+        beta_s,
+        n_p,
+        eta,
+        number_of_iterations,
+        kwargs_lens,
+        lens_model_list,
+        image_center,
+    ) = args
+    lens = LensModel(lens_model_list=lens_model_list)
+    image_centers_x = np.array([image_center[0]], dtype=float)
+    image_centers_y = np.array([image_center[1]], dtype=float)
+    # mask[k, j]: pixel k is kept for source position j
+    mask = np.ones((1, len(source_x)), dtype=bool)
+    side_length = L
+    delta_beta = beta_0
+    number_of_rays_shot = 0
+    for i in range(2, number_of_iterations + 1):
+        num_parent = len(image_centers_x)
+        image_centers_x, image_centers_y, side_length = splitting_centers(
+            image_centers_x, image_centers_y, side_length, n_p
+        )
+        # splitting_centers() stores child k of pixel p at index p * n_p**2 + k
+        parent = np.repeat(np.arange(num_parent), n_p**2)
+        if i < number_of_iterations:
+            threshold = delta_beta
+        else:
+            threshold = min(delta_beta, beta_s)
+        keep = np.zeros((len(image_centers_x), len(source_x)), dtype=bool)
+        for start in range(0, len(image_centers_x), _ABM_CHUNK_SIZE):
+            chunk = slice(start, start + _ABM_CHUNK_SIZE)
+            beta_x, beta_y = lens.ray_shooting(
+                image_centers_x[chunk], image_centers_y[chunk], kwargs=kwargs_lens
+            )
+            distances_sq = np.subtract.outer(beta_x, source_x)
+            distances_sq *= distances_sq
+            delta_y = np.subtract.outer(beta_y, source_y)
+            delta_y *= delta_y
+            distances_sq += delta_y
+            keep[chunk] = distances_sq < threshold**2
+            keep[chunk] &= mask[parent[chunk]]
+        number_of_rays_shot += len(image_centers_x)
+        kept = np.any(keep, axis=1)
+        image_centers_x = image_centers_x[kept]
+        image_centers_y = image_centers_y[kept]
+        mask = keep[kept]
+        delta_beta /= eta
+    return number_of_rays_shot, np.sum(mask, axis=0)
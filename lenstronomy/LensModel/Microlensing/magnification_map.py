@@ -0,0 +1,202 @@
+import numpy as np
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Profiles.point_mass import PointMass
+from lenstronomy.LensModel.Util.multipole_tree import MultipoleTree
+
+# maximum number of elements of the (n_stars x n_rays) broadcast arrays of the exactly
+# evaluated stars
+_MAX_BROADCAST_SIZE = 2**20
+
+
+def inverse_ray_shooting_magnification_map(
+    lens_model_list,
+    kwargs_lens,
+    source_width,
+    num_pix_source,
+    image_width,
+    num_rays_side,
+    source_center=(0, 0),
+    image_center=(0, 0),
+    opening_angle=0.5,
+    multipole_order=6,
+    leaf_size=8,
+    num_rays_patch_side=64,
+    filename=None,
+    dtype=float,
+):
+    """Magnification map of the source plane behind a star field by inverse
+    ray-shooting.
+
+    A regular grid of num_rays_side x num_rays_side rays covering the square image-plane
+    region is shot to the source plane in square patches of num_rays_patch_side x
+    num_rays_patch_side rays and the rays landing in each source-plane pixel are
+    counted. The magnification of a pixel is the number of rays times the ratio of the
+    image-plane area per ray and the source-plane pixel area. The image-plane region
+    needs to be larger than the source-plane region to collect all the rays of the map.
+
+    If opening_angle is set, the POINT_MASS models of the lens_model_list are treated as
+    the stars and sorted into a quadtree (see MultipoleTree): for each patch, the stars
+    of the cells well separated from the patch are summed in a local expansion around
+    the patch center and only the stars close to the patch are evaluated exactly. All
+    other models (e.g. CONVERGENCE and SHEAR of the macro model), or all models if
+    opening_angle is None, are evaluated with the LensModel class.
+
+    :param lens_model_list: list of lens model names
+    :param kwargs_lens: list of keyword arguments of the lens models
+    :param source_width: side length of the square source-plane region of the map
+    :param num_pix_source: number of pixels per side of the map
+    :param image_width: side length of the square image-plane region of the rays
+    :param num_rays_side: number of rays per side of the image-plane region
+    :param source_center: center (x, y) of the source-plane region
+    :param image_center: center (x, y) of the image-plane region
+    :param opening_angle: None or opening angle of the tree code approximation of the
+        stars (None: all stars are evaluated exactly)
+    :param multipole_order: highest order of the multipole and local expansions
+    :param leaf_size: maximum number of stars in a leaf of the tree
+    :param num_rays_patch_side: number of rays per side of the patches shot at once
+    :param filename: None or path of a .npy file. If set, the map is accumulated in a
+        memory-mapped file instead of in memory
+    :param dtype: data type of the map
+    :return: magnification map of shape (num_pix_source, num_pix_source) with the
+        first axis along y and the second along x (numpy.memmap if filename is set)
+    """
+    if opening_angle is None:
+        star_index = []
+    else:
+        star_index = [
+            i for i, model in enumerate(lens_model_list) if model == "POINT_MASS"
+        ]
+    macro_index = [i for i in range(len(lens_model_list)) if i not in star_index]
+    if len(macro_index) > 0:
+        macro_model = LensModel(
+            lens_model_list=[lens_model_list[i] for i in macro_index]
+        )
+        kwargs_macro = [kwargs_lens[i] for i in macro_index]
+    if len(star_index) > 0:
+        theta_E = np.array([kwargs_lens[i]["theta_E"] for i in star_index], dtype=float)
+        center_x = np.array(
+            [kwargs_lens[i].get("center_x", 0) for i in star_index], dtype=float
+        )
+        center_y = np.array(
+            [kwargs_lens[i].get("center_y", 0) for i in star_index], dtype=float
+        )
+        tree = MultipoleTree(
+            center_x, center_y, theta_E**2, leaf_size=leaf_size, order=multipole_order
+        )
+    point_mass = PointMass()
+
+    num_pix_source = int(num_pix_source)
+    num_rays_side = int(num_rays_side)
+    num_rays_patch_side = max(int(num_rays_patch_side), 1)
+    if filename is None:
+        magnification_map = np.zeros((num_pix_source, num_pix_source), dtype=dtype)
+    else:
+        magnification_map = np.lib.format.open_memmap(
+            filename,
+            mode="w+",
+            dtype=dtype,
+            shape=(num_pix_source, num_pix_source),
+        )
+    map_flat = magnification_map.reshape(-1)
+    delta_ray = image_width / num_rays_side
+    delta_pix = source_width / num_pix_source
+    # magnification per ray: image-plane area per ray over source-plane pixel area
+    weight = delta_ray**2 / delta_pix**2
+    coords_ray_x = image_center[0] + (np.arange(num_rays_side) + 0.5) * delta_ray
+    coords_ray_x -= image_width / 2.0
+    coords_ray_y = image_center[1] + (np.arange(num_rays_side) + 0.5) * delta_ray
+    coords_ray_y -= image_width / 2.0
+    beta_x_min = source_center[0] - source_width / 2.0
+    beta_y_min = source_center[1] - source_width / 2.0
+
+    for i in range(0, num_rays_side, num_rays_patch_side):
+        for j in range(0, num_rays_side, num_rays_patch_side):
+            x, y = np.meshgrid(
+                coords_ray_x[j : j + num_rays_patch_side],
+                coords_ray_y[i : i + num_rays_patch_side],
+            )
+            x, y = x.ravel(), y.ravel()
+            if len(macro_index) > 0:
+                beta_x, beta_y = macro_model.ray_shooting(x, y, kwargs_macro)
+            else:
+                beta_x, beta_y = np.copy(x), np.copy(y)
+            if len(star_index) > 0:
+                patch_center_x = (np.min(x) + np.max(x)) / 2.0
+                patch_center_y = (np.min(y) + np.max(y)) / 2.0
+                patch_radius = np.hypot(
+                    np.max(x) - patch_center_x, np.max(y) - patch_center_y
+                )
+                coeffs, index = tree.local_expansion(
+                    patch_center_x, patch_center_y, patch_radius, opening_angle
+                )
+                f_x, f_y = tree.evaluate_local(
+                    "derivatives", coeffs, patch_center_x, patch_center_y, x, y
+                )
+                f_x_, f_y_ = _point_mass_derivatives(
+                    point_mass, x, y, theta_E[index], center_x[index], center_y[index]
+                )
+                beta_x -= f_x + f_x_
+                beta_y -= f_y + f_y_
+            i_x = np.floor((beta_x - beta_x_min) / delta_pix).astype(int)
+            i_y = np.floor((beta_y - beta_y_min) / delta_pix).astype(int)
+            inside = (
+                (i_x >= 0)
+                & (i_x < num_pix_source)
+                & (i_y >= 0)
+                & (i_y < num_pix_source)
+            )
+            _bin_counts(map_flat, i_y[inside] * num_pix_source + i_x[inside], weight)
+    if filename is not None:
+        magnification_map.flush()
+    return magnification_map
+
+
+def _point_mass_derivatives(point_mass, x, y, theta_E, center_x, center_y):
+    """Summed deflection angles of point masses, evaluated in broadcast blocks of
+    stars.
+
+    :param point_mass: PointMass instance
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param theta_E: array of Einstein radii of the point masses
+    :param center_x: array of x-coordinates of the point masses
+    :param center_y: array of y-coordinates of the point masses
+    :return: summed deflection angles f_x, f_y
+    """
+    f_x, f_y = np.zeros_like(x), np.zeros_like(y)
+    block_size = max(_MAX_BROADCAST_SIZE // max(len(x), 1), 1)
+    for start in range(0, len(theta_E), block_size):
+        block = slice(start, start + block_size)
+        f_x_, f_y_ = point_mass.derivatives(
+            x[None, :],
+            y[None, :],
+            theta_E[block, None],
+            center_x[block, None],
+            center_y[block, None],
+        )
+        f_x += np.sum(f_x_, axis=0)
+        f_y += np.sum(f_y_, axis=0)
+    return f_x, f_y
+
+
+def _bin_counts(map_flat, index, weight):
+    """Adds the weighted number of occurrences of each index to a flattened map.
+
+    The indexes of a patch of neighbouring rays typically cover a small window of the
+    map. They are then counted with a single np.bincount over that window, otherwise
+    with np.unique.
+
+    :param map_flat: flattened map (modified in place)
+    :param index: indexes of the map pixels of the rays
+    :param weight: weight of each ray
+    :return: None
+    """
+    if len(index) == 0:
+        return
+    index_min, index_max = np.min(index), np.max(index)
+    if index_max - index_min < 4 * len(index):
+        counts = np.bincount(index - index_min, minlength=index_max - index_min + 1)
+        map_flat[index_min : index_max + 1] += counts * weight
+    else:
+        index_unique, counts = np.unique(index, return_counts=True)
+        map_flat[index_unique] += counts * weight
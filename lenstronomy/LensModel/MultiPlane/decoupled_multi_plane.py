@@ -33,6 +33,7 @@ class MultiPlaneDecoupled(MultiPlane):
         alpha_y_interp_background=None,
         z_split=None,
         use_jax=False,
+        kwargs_profile_grouping=None,
     ):
         """A class for multiplane lensing in which the deflection angles at certain
         coordinates are fixed through user-specified interpolation functions. These
@@ -66,6 +67,8 @@ class MultiPlaneDecoupled(MultiPlane):
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy. Can also
             be a list of bools, selecting which models in the lens_model_list to use
             from jaxtronomy
+        :param kwargs_profile_grouping: None or dict, settings for the grouped
+            evaluation of profiles of the same type (see ProfileListBase)
         """
         self._alphax_interp_foreground = alpha_x_interp_foreground
         self._alphay_interp_foreground = alpha_y_interp_foreground
@@ -90,6 +93,7 @@ class MultiPlaneDecoupled(MultiPlane):
             distance_ratio_sampling=distance_ratio_sampling,
             cosmology_sampling=cosmology_sampling,
             cosmology_model=cosmology_model,
+            kwargs_profile_grouping=kwargs_profile_grouping,
         )
 
         cosmo_bkg = Background(cosmo)
@@ -102,7 +106,10 @@ class MultiPlaneDecoupled(MultiPlane):
         self._Td = cosmo_bkg.T_xy(0, z_split)
         self._Tds = cosmo_bkg.T_xy(self._z_split, z_source)
         self._main_deflector = SinglePlane(
-            lens_model_list, profile_kwargs_list=profile_kwargs_list, use_jax=use_jax
+            lens_model_list,
+            profile_kwargs_list=profile_kwargs_list,
+            use_jax=use_jax,
+            kwargs_profile_grouping=kwargs_profile_grouping,
         )
         # useful to have these saved to access later outside the class
         self.kwargs_multiplane_model = {
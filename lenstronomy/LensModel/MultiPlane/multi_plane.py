@@ -36,6 +36,7 @@ class MultiPlane(object):
         cosmology_sampling=False,
         cosmology_model="FlatLambdaCDM",
         use_jax=False,
+        kwargs_profile_grouping=None,
     ):
         """
 
@@ -70,6 +71,8 @@ class MultiPlane(object):
         :param cosmology_model: str, name of the cosmology model to use for
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
+        :param kwargs_profile_grouping: None or dict, settings of the grouped evaluation of the deflectors
+            of the same profile on each lens plane, see ProfileListBase
         """
         self.cosmology_sampling = cosmology_sampling
         self.cosmology_model = cosmology_model
@@ -113,6 +116,7 @@ class MultiPlane(object):
             "distance_ratio_sampling": distance_ratio_sampling,
             "cosmology_sampling": cosmology_sampling,
             "cosmology_model": cosmology_model,
+            "kwargs_profile_grouping": kwargs_profile_grouping,
         }
         if z_source_convention is None:
             z_source_convention = z_source
@@ -145,6 +149,7 @@ class MultiPlane(object):
             num_z_interp=num_z_interp,
             profile_kwargs_list=profile_kwargs_list,
             use_jax=use_jax,
+            kwargs_profile_grouping=kwargs_profile_grouping,
         )
         self._z_source = z_source
         self._set_source_distances(z_source)
@@ -24,6 +24,7 @@ class MultiPlaneBase(ProfileListBase):
         num_z_interp=100,
         profile_kwargs_list=None,
         use_jax=False,
+        kwargs_profile_grouping=None,
     ):
         """
         A description of the recursive multi-plane formalism can be found e.g. here: https://arxiv.org/abs/1312.1536
@@ -43,6 +44,8 @@ class MultiPlaneBase(ProfileListBase):
             profile will be initialized using default settings.
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
+        :param kwargs_profile_grouping: None or dict, settings of the grouped evaluation of the deflectors
+            of the same profile on each lens plane, see ProfileListBase
         """
         self._lens_model_list = lens_model_list
 
@@ -72,12 +75,16 @@ class MultiPlaneBase(ProfileListBase):
             z_source_convention=z_source_convention,
             profile_kwargs_list=profile_kwargs_list,
             use_jax=use_jax,
+            kwargs_profile_grouping=kwargs_profile_grouping,
         )
 
         if len(self._lens_model_list) < 1:
             self._sorted_redshift_index = []
         else:
             self._sorted_redshift_index = self._index_ordering(lens_redshift_list)
+        self._plane_schedule = self._plane_grouping(
+            lens_redshift_list, self._sorted_redshift_index
+        )
 
         self._T_ij_list = []
         self._T_z_list = []
@@ -192,19 +199,18 @@ class MultiPlaneBase(ProfileListBase):
             function gets executed.
         :return: co-moving position and angles at redshift z_stop
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-
-        alpha_x = np.array(alpha_x)
-        alpha_y = np.array(alpha_y)
+        # the positions and angles are copied once into buffers that are updated in-place
+        x, y, alpha_x, alpha_y = [
+            np.array(a, dtype=float)
+            for a in np.broadcast_arrays(x, y, alpha_x, alpha_y)
+        ]
+        step_buffer = np.empty_like(x)
 
         # NOTE: jax arrays are converted back into regular numpy arrays in cases where use_jax is True.
 
         z_lens_last = z_start
         first_deflector = True
-        for i, idex in enumerate(self._sorted_redshift_index):
-            z_lens = self._lens_redshift_list[idex]
-
+        for z_lens, i_plane, index_list in self._plane_schedule:
             if (
                 self._start_condition(include_z_start, z_lens, z_start)
                 and z_lens <= z_stop
@@ -219,10 +225,10 @@ class MultiPlaneBase(ProfileListBase):
                         delta_T = T_ij_start
                     first_deflector = False
                 else:
-                    delta_T = self._T_ij_list[i]
-                x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
-                alpha_x, alpha_y = self._add_deflection(
-                    x, y, alpha_x, alpha_y, kwargs_lens, i
+                    delta_T = self._T_ij_list[i_plane]
+                self._ray_step_inplace(x, y, alpha_x, alpha_y, delta_T, step_buffer)
+                self._add_deflection_plane_inplace(
+                    x, y, alpha_x, alpha_y, kwargs_lens, i_plane, index_list
                 )
                 z_lens_last = z_lens
         if T_ij_end is None:
@@ -232,8 +238,8 @@ class MultiPlaneBase(ProfileListBase):
                 delta_T = self._cosmo_bkg.T_xy(z_lens_last, z_stop)
         else:
             delta_T = T_ij_end
-        x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
-        return np.asarray(x), np.asarray(y), np.asarray(alpha_x), np.asarray(alpha_y)
+        self._ray_step_inplace(x, y, alpha_x, alpha_y, delta_T, step_buffer)
+        return x, y, alpha_x, alpha_y
 
     def ray_shooting_partial(
         self,
@@ -409,6 +415,28 @@ class MultiPlaneBase(ProfileListBase):
         #    Warning("There is no lens object between observer at z=0 and source at z=%s" % z_source)
         return sort_index
 
+    @staticmethod
+    def _plane_grouping(redshift_list, sorted_redshift_index):
+        """Groups the deflectors sharing the same redshift into lens planes, such that
+        the ray-tracing needs only one ray step and one co-moving to angle conversion
+        per plane.
+
+        :param redshift_list: list of redshifts of the deflectors
+        :param sorted_redshift_index: indexes of the deflectors in ascending redshift
+            order
+        :return: list of (z_lens, index of the first deflector of the plane, list of
+            indexes of all deflectors of the plane) in ascending redshift order, where
+            the indexes are in the sorted redshift convention
+        """
+        schedule = []
+        for i, idex in enumerate(sorted_redshift_index):
+            z_lens = redshift_list[idex]
+            if len(schedule) > 0 and schedule[-1][0] == z_lens:
+                schedule[-1][2].append(i)
+            else:
+                schedule.append((z_lens, i, [i]))
+        return schedule
+
     def _reduced2physical_deflection(self, alpha_reduced, index_lens):
         """alpha_reduced = D_ds/Ds alpha_physical.
 
@@ -514,6 +542,64 @@ class MultiPlaneBase(ProfileListBase):
         y += alpha_y * delta_T
         return x, y
 
+    @staticmethod
+    def _ray_step_inplace(x, y, alpha_x, alpha_y, delta_T, buffer):
+        """Ray propagation with small angle approximation, updating the co-moving
+        positions (x, y) in-place without allocating temporary arrays.
+
+        :param x: co-moving x-position (numpy array, gets overwritten)
+        :param y: co-moving y-position (numpy array, gets overwritten)
+        :param alpha_x: deflection angle in x-direction at (x, y)
+        :param alpha_y: deflection angle in y-direction at (x, y)
+        :param delta_T: transverse angular diameter distance to the next step
+        :param buffer: numpy array of the same shape as x used as work space
+        :return: None
+        """
+        np.multiply(alpha_x, delta_T, out=buffer)
+        x += buffer
+        np.multiply(alpha_y, delta_T, out=buffer)
+        y += buffer
+
+    def _add_deflection_plane_inplace(
+        self, x, y, alpha_x, alpha_y, kwargs_lens, index, index_list
+    ):
+        """Adds the physical deflection angles of all deflectors of a lens plane to the
+        deflection field in-place.
+
+        :param x: co-moving distance at the deflector plane
+        :param y: co-moving distance at the deflector plane
+        :param alpha_x: physical angle (radian) before the deflector plane (numpy array,
+            gets overwritten)
+        :param alpha_y: physical angle (radian) before the deflector plane (numpy array,
+            gets overwritten)
+        :param kwargs_lens: lens model parameter kwargs
+        :param index: index of the lens plane (first deflector of the plane in sorted
+            redshift list convention)
+        :param index_list: indexes of all the deflectors of the lens plane in sorted
+            redshift list convention
+        :return: None
+        """
+        theta_x, theta_y = self._co_moving2angle(x, y, index)
+        if self.profile_grouping:
+            # all deflectors of the plane share the reduced to physical conversion
+            alpha_x_red, alpha_y_red = self._grouped_function(
+                "derivatives",
+                theta_x,
+                theta_y,
+                kwargs_lens,
+                [self._sorted_redshift_index[i] for i in index_list],
+            )
+            alpha_x -= self._reduced2physical_deflection(alpha_x_red, index)
+            alpha_y -= self._reduced2physical_deflection(alpha_y_red, index)
+            return
+        for i in index_list:
+            k = self._sorted_redshift_index[i]
+            alpha_x_red, alpha_y_red = self.func_list[k].derivatives(
+                theta_x, theta_y, **kwargs_lens[k]
+            )
+            alpha_x -= self._reduced2physical_deflection(np.asarray(alpha_x_red), i)
+            alpha_y -= self._reduced2physical_deflection(np.asarray(alpha_y_red), i)
+
     def _add_deflection(self, x, y, alpha_x, alpha_y, kwargs_lens, index):
         """Adds the physical deflection angle of a single lens plane to the deflection
         field.
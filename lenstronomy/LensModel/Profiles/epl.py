@@ -5,7 +5,7 @@ import lenstronomy.Util.util as util
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 from lenstronomy.LensModel.Profiles.spp import SPP
-from scipy.special import hyp2f1
+from lenstronomy.LensModel.Util import epl_util
 
 __all__ = ["EPL", "EPLMajorAxis", "EPLQPhi"]
 
@@ -37,12 +37,12 @@ class EPL(LensProfileBase):
         \\left(\\frac{\\theta'_{\\rm E}}{\\theta_{\\rm E}}\\right)^{2} = \\frac{2q}{1+q^2}.
 
     The mathematical form of the calculation is presented by Tessore & Metcalf (2015), https://arxiv.org/abs/1507.01819.
-    The current implementation is using hyperbolic functions. The paper presents an iterative calculation scheme,
-    converging in few iterations to high precision and accuracy.
+    The paper presents an iterative calculation scheme, converging in few iterations to high precision and accuracy.
+    The current implementation evaluates the series with the number of terms set by the requested precision (see
+    EPLMajorAxis), compiled with numba if available and vectorized with numpy otherwise.
 
-    A (faster) implementation of the same model using numba is accessible as 'EPL_NUMBA' with the iterative calculation
-    scheme. An alternative implementation of the same model using a fortran code FASTELL is implemented as 'PEMD'
-    profile.
+    The same series is used by 'EPL_NUMBA' (with all the computation compiled with numba). An alternative
+    implementation of the same model using a fortran code FASTELL is implemented as 'PEMD' profile.
     """
 
     param_names = ["theta_E", "gamma", "e1", "e2", "center_x", "center_y"]
@@ -63,8 +63,12 @@ class EPL(LensProfileBase):
         "center_y": 100,
     }
 
-    def __init__(self):
-        self.epl_major_axis = EPLMajorAxis()
+    def __init__(self, tol=1e-16):
+        """
+
+        :param tol: absolute precision of the series of the angular function (see EPLMajorAxis)
+        """
+        self.epl_major_axis = EPLMajorAxis(tol=tol)
         self.spp = SPP()
         super(EPL, self).__init__()
 
@@ -251,11 +255,20 @@ class EPLMajorAxis(LensProfileBase):
     critical radius b, axis ratio q.
 
     Tessore & Metcalf (2015), https://arxiv.org/abs/1507.01819
+
+    The angular function is evaluated with the series of eq. (29) of the paper. The
+    number of terms is chosen from the requested precision and the axis ratio. The
+    deflection and the Hessian are computed with a single evaluation of the series.
     """
 
     param_names = ["b", "t", "q", "center_x", "center_y"]
 
-    def __init__(self):
+    def __init__(self, tol=1e-16):
+        """
+
+        :param tol: absolute precision of the series of the angular function
+        """
+        self._tol = tol
         super(EPLMajorAxis, self).__init__()
 
     def function(self, x, y, b, t, q):
@@ -286,24 +299,7 @@ class EPLMajorAxis(LensProfileBase):
         :param q: axis ratio
         :return: f_x, f_y
         """
-        # elliptical radius, eq. (5)
-        Z = np.empty(np.shape(x), dtype=complex)
-        Z.real = q * x
-        Z.imag = y
-        R = np.abs(Z)
-        R = np.maximum(R, 0.000000001)
-
-        # angular dependency with extra factor of R, eq. (23)
-        R_omega = Z * hyp2f1(1, t / 2, 2 - t / 2, -(1 - q) / (1 + q) * (Z / Z.conj()))
-
-        # deflection, eq. (22)
-        alpha = 2 / (1 + q) * (b / R) ** t * R_omega
-
-        # return real and imaginary part
-        alpha_real = np.nan_to_num(alpha.real, posinf=10**10, neginf=-(10**10))
-        alpha_imag = np.nan_to_num(alpha.imag, posinf=10**10, neginf=-(10**10))
-
-        return alpha_real, alpha_imag
+        return self._evaluate(epl_util.epl_major_axis_alpha, x, y, b, t, q)
 
     def hessian(self, x, y, b, t, q):
         """Hessian matrix of the lensing potential.
@@ -315,32 +311,56 @@ class EPLMajorAxis(LensProfileBase):
         :param q: axis ratio
         :return: f_xx, f_yy, f_xy
         """
-        R = np.hypot(q * x, y)
-        R = np.maximum(R, 0.00000001)
-        r = np.hypot(x, y)
-
-        cos, sin = x / r, y / r
-        cos2, sin2 = cos * cos * 2 - 1, sin * cos * 2
+        f_xx, f_xy, f_yy = self.derivatives_hessian(x, y, b, t, q)[2:]
+        return f_xx, f_xy, f_xy, f_yy
 
-        # convergence, eq. (2)
-        kappa = (2 - t) / 2 * (b / R) ** t
-        kappa = np.nan_to_num(kappa, posinf=10**10, neginf=-(10**10))
+    def derivatives_hessian(self, x, y, b, t, q):
+        """Deflection angles and Hessian matrix of the lensing potential from a single
+        evaluation of the angular function.
 
-        # deflection via method
-        alpha_x, alpha_y = self.derivatives(x, y, b, t, q)
+        :param x: x-coordinate in image plane relative to center (major axis)
+        :param y: y-coordinate in image plane relative to center (minor axis)
+        :param b: critical radius
+        :param t: projected power-law slope
+        :param q: axis ratio
+        :return: f_x, f_y, f_xx, f_xy, f_yy
+        """
+        return self._evaluate(epl_util.epl_major_axis_alpha_hessian, x, y, b, t, q)
 
-        # shear, eq. (17), corrected version from arXiv/corrigendum
-        gamma_1 = (1 - t) * (alpha_x * cos - alpha_y * sin) / r - kappa * cos2
-        gamma_2 = (1 - t) * (alpha_y * cos + alpha_x * sin) / r - kappa * sin2
-        gamma_1 = np.nan_to_num(gamma_1, posinf=10**10, neginf=-(10**10))
-        gamma_2 = np.nan_to_num(gamma_2, posinf=10**10, neginf=-(10**10))
+    def _evaluate(self, kernel, x, y, b, t, q):
+        """Evaluates a kernel of epl_util on flattened arrays.
 
-        # second derivatives from convergence and shear
-        f_xx = kappa + gamma_1
-        f_yy = kappa - gamma_1
-        f_xy = gamma_2
+        :param kernel: epl_util.epl_major_axis_alpha or epl_major_axis_alpha_hessian
+        :param x: x-coordinate in image plane relative to center (major axis)
+        :param y: y-coordinate in image plane relative to center (minor axis)
+        :param b: critical radius (float or array broadcastable with x)
+        :param t: projected power-law slope (float or array broadcastable with x)
+        :param q: axis ratio (float or array broadcastable with x)
+        :return: tuple of kernel outputs in the broadcast shape of the inputs
+        """
+        shape = np.broadcast(x, y, b, t, q).shape
+        niter = epl_util.epl_num_terms(q, tol=self._tol)
+        params = [b, t, q]
+        if np.ndim(b) == 0 and np.ndim(t) == 0 and np.ndim(q) == 0:
+            params = [float(param) for param in params]
+        else:
+            params = [_flatten(param, shape) for param in params]
+        result = kernel(_flatten(x, shape), _flatten(y, shape), *params, niter)
+        if shape == ():
+            return tuple(value[0] for value in result)
+        return tuple(value.reshape(shape) for value in result)
+
+
+def _flatten(array, shape):
+    """
 
-        return f_xx, f_xy, f_xy, f_yy
+    :param array: number or array broadcastable to shape
+    :param shape: shape
+    :return: 1d contiguous float array
+    """
+    return np.ascontiguousarray(
+        np.broadcast_to(np.asarray(array, dtype=float), shape)
+    ).reshape(-1)
 
 
 class EPLQPhi(LensProfileBase):
@@ -4,6 +4,7 @@ import numpy as np
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 from lenstronomy.Util.numba_util import jit
+from lenstronomy.LensModel.Util.epl_util import epl_omega_series
 
 __all__ = ["EPL_numba"]
 
@@ -191,19 +192,20 @@ def alpha(x, y, b, q, t, Omega=None):
     return alph
 
 
-@jit(
-    fastmath=True
-)  # Because of the reduction nature of this, relaxing commutativity actually matters a lot (4x speedup).
+@jit()
 def omega(phi, t, q, niter_max=200, tol=1e-16):
+    """Angular function of the deflection, summed with the series shared with the EPL
+    profile (see epl_util.epl_omega_series)
+
+    :param phi: elliptical angle
+    :param t: logarithmic power-law slope. Is t=gamma-1
+    :param q: axis ratio
+    :param niter_max: maximum number of terms of the series
+    :param tol: absolute precision of the series
+    :return: complex angular function
+    """
     f = (1 - q) / (1 + q)
-    omegas = np.zeros_like(phi, dtype=np.complex128)
     niter = min(
         niter_max, int(np.log(tol) / np.log(f)) + 2
     )  # The absolute value of each summand is always less than f, hence this limit for the number of iterations.
-    Omega = 1 * np.exp(1j * phi)
-    fact = -f * np.exp(2j * phi)
-    for n in range(1, niter):
-        omegas += Omega
-        Omega *= (2 * n - (2 - t)) / (2 * n + (2 - t)) * fact
-    omegas += Omega
-    return omegas
+    return epl_omega_series(phi, t, q, niter)
@@ -89,8 +89,7 @@ class NFW(LensProfileBase):
         :return: lensing potential
         """
         rho0_input = self.alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs)
-        if Rs < 0.0000001:
-            Rs = 0.0000001
+        Rs = np.maximum(Rs, 0.0000001)
         x_ = x - center_x
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
@@ -110,8 +109,7 @@ class NFW(LensProfileBase):
         :return: deflection angle in x, deflection angle in y
         """
         rho0_input = self.alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs)
-        if Rs < 0.0000001:
-            Rs = 0.0000001
+        Rs = np.maximum(Rs, 0.0000001)
         x_ = x - center_x
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
@@ -130,8 +128,7 @@ class NFW(LensProfileBase):
         :return: Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2
         """
         rho0_input = self.alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs)
-        if Rs < 0.0000001:
-            Rs = 0.0000001
+        Rs = np.maximum(Rs, 0.0000001)
         x_ = x - center_x
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
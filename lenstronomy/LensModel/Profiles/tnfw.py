@@ -190,7 +190,7 @@ class TNFW(LensProfileBase):
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
         x = R * Rs**-1
-        tau = float(r_trunc) * Rs**-1
+        tau = r_trunc / Rs
         Fx = self._F(x, tau)
         return 2 * rho0 * Rs * Fx
 
@@ -236,7 +236,7 @@ class TNFW(LensProfileBase):
         """
         x = R / Rs
         x = np.maximum(x, self._s)
-        tau = float(r_trunc) / Rs
+        tau = r_trunc / Rs
         hx = self._h(x, tau)
         return 2 * rho0 * Rs**3 * hx
 
@@ -258,7 +258,7 @@ class TNFW(LensProfileBase):
         R = np.maximum(R, self._s * Rs)
         x = R / Rs
         x = np.maximum(x, self._s)
-        tau = float(r_trunc) / Rs
+        tau = r_trunc / Rs
         gx = self._g(x, tau)
         a = 4 * rho0 * Rs * gx / x**2
         return a * ax_x, a * ax_y
@@ -281,7 +281,7 @@ class TNFW(LensProfileBase):
         """
         R = np.maximum(R, self._s * Rs)
         x = R / Rs
-        tau = float(r_trunc) * Rs**-1
+        tau = r_trunc / Rs
         gx = self._g(x, tau)
         Fx = self._F(x, tau)
         a = 2 * rho0 * Rs * (2 * gx / x**2 - Fx)
@@ -304,6 +304,27 @@ class TNFW(LensProfileBase):
         m_2d = 4 * rho0 * Rs * R**2 * gx / x**2 * np.pi
         return m_2d
 
+    @staticmethod
+    def mass_tot(Rs, rho0, r_trunc):
+        """Total mass of the truncated NFW profile (Baltz et al. 2009).
+
+        :param Rs: scale radius
+        :param rho0: density normalization (characteristic density)
+        :param r_trunc: truncation radius (angular units)
+        :return: total mass (in angular units, modulo epsilon_crit)
+        """
+        tau = r_trunc / Rs
+        t2 = tau**2
+        return (
+            4
+            * np.pi
+            * rho0
+            * Rs**3
+            * t2
+            / (t2 + 1) ** 2
+            * ((t2 - 1) * np.log(tau) + tau * np.pi - (t2 + 1))
+        )
+
     def _F(self, X, tau):
         """Analytic solution of the projection integral (convergence)
 
@@ -316,9 +337,12 @@ class TNFW(LensProfileBase):
         a = t2 * (t2 + 1) ** -2
         if isinstance(X, np.ndarray):
             # b = (t2 + 1) * (X ** 2 - 1) ** -1 * (1 - _F)
-            b = np.ones_like(X)
-            b[X == 1] = (t2 + 1) * 1.0 / 3
-            b[X != 1] = (t2 + 1) * (X[X != 1] ** 2 - 1) ** -1 * (1 - _F[X != 1])
+            X_ = np.where(X == 1, 2, X)  # avoids the division by zero at X = 1
+            b = np.where(
+                X == 1,
+                (t2 + 1) * 1.0 / 3,
+                (t2 + 1) * (X_**2 - 1) ** -1 * (1 - _F),
+            )
 
         elif isinstance(X, float) or isinstance(X, int):
             if X == 1:
@@ -5,6 +5,7 @@ import lenstronomy.Util.util as util
 import lenstronomy.Util.image_util as image_util
 from scipy.optimize import minimize
 from lenstronomy.LensModel.Solver.epl_shear_solver import solve_lenseq_pemd
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["LensEquationSolver"]
 
@@ -18,6 +19,10 @@ SUPPORTED_LENS_MODELS_ANALYTICAL = (
     ["EPL"],
 )
 
+# absolute magnification below which a converged solution of the batched solver is
+# considered to sit on a singular point of the lens mapping (dimensionless)
+_SINGULAR_MAGNIFICATION_LIMIT = 1e-10
+
 
 class LensEquationSolver(object):
     """Class to solve for image positions given lens model and source position."""
@@ -244,6 +249,7 @@ class LensEquationSolver(object):
             y_mins = y_mins[mag >= magnification_limit]
         return x_mins, y_mins
 
+    @timed("LensEquationSolver.image_position_from_source")
     def image_position_from_source(
         self, sourcePos_x, sourcePos_y, kwargs_lens, solver="lenstronomy", **kwargs
     ):
@@ -400,6 +406,336 @@ class LensEquationSolver(object):
         self.lensModel.set_dynamic()
         return x_mins, y_mins
 
+    def image_position_lenstronomy_batch(
+        self,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        min_distance=0.1,
+        search_window=10,
+        precision_limit=10 ** (-10),
+        num_iter_max=100,
+        arrival_time_sort=True,
+        x_center=0,
+        y_center=0,
+        magnification_limit=None,
+    ):
+        """Finds the image positions of many source positions behind the same lens
+        model. The search grid in the lens plane is ray-traced only once and split into
+        triangles. The triangles mapped onto the source plane are sorted into a
+        spatial index, such that the candidate image positions of each source are the
+        interpolated positions within the triangles containing the source. All
+        candidates of all sources are then refined simultaneously with a vectorized
+        gradient decent. In contrast to image_position_lenstronomy, images within a grid
+        pixel of a singular lens center can be missed, as the lens mapping is not
+        continuous there.
+
+        :param sourcePos_x: array of source positions in units of angle
+        :param sourcePos_y: array of source positions in units of angle
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param min_distance: minimum separation to consider for two images in units of
+            angle
+        :param search_window: window size to be considered by the solver. Will not find
+            image position outside this window
+        :param precision_limit: required precision in the lens equation solver (in units
+            of angle in the source plane).
+        :param num_iter_max: maximum iteration of lens-source mapping conducted by
+            solver to match the required precision
+        :param arrival_time_sort: bool, if True, sorts image position in arrival time
+            (first arrival photon first listed)
+        :param x_center: float, center of the window to search for point sources
+        :param y_center: float, center of the window to search for point sources
+        :param magnification_limit: None or float, if set will only return image
+            positions that have an abs(magnification) larger than this number
+        :returns: lists (one entry per source) of arrays of the (exact) angular
+            positions of the images ra_pos, dec_pos in units of angle
+        """
+        sourcePos_x = np.atleast_1d(np.array(sourcePos_x, dtype=float))
+        sourcePos_y = np.atleast_1d(np.array(sourcePos_y, dtype=float))
+        num_source = len(sourcePos_x)
+        if num_source == 0:
+            return [], []
+        kwargs_lens = self.lensModel.set_static(kwargs_lens)
+        source_index, x_mins, y_mins = self._triangle_candidates(
+            sourcePos_x,
+            sourcePos_y,
+            kwargs_lens,
+            min_distance,
+            search_window,
+            x_center,
+            y_center,
+        )
+        x_mins, y_mins, solver_precision = self._gradient_decent_batch(
+            x_mins,
+            y_mins,
+            sourcePos_x[source_index],
+            sourcePos_y[source_index],
+            kwargs_lens,
+            precision_limit,
+            num_iter_max,
+            max_step=min_distance,
+        )
+        # only select iterative results that match the precision limit
+        solved = solver_precision <= precision_limit
+        # reject solutions at singular points of the lens mapping (e.g. the center of a
+        # power-law profile where the deflection vanishes by convention), where the
+        # magnification is not finite or vanishes
+        mag = self.lensModel.magnification(x_mins[solved], y_mins[solved], kwargs_lens)
+        solved[solved] = np.isfinite(mag) & (
+            np.abs(mag) > _SINGULAR_MAGNIFICATION_LIMIT
+        )
+        source_index, x_mins, y_mins = (
+            source_index[solved],
+            x_mins[solved],
+            y_mins[solved],
+        )
+        # find redundant solutions within the min_distance criterion for each source
+        order = np.argsort(source_index, kind="stable")
+        source_index, x_mins, y_mins = (
+            source_index[order],
+            x_mins[order],
+            y_mins[order],
+        )
+        split = np.searchsorted(source_index, np.arange(1, num_source))
+        x_list, y_list, index_list = [], [], []
+        for i, (x_i, y_i) in enumerate(
+            zip(np.split(x_mins, split), np.split(y_mins, split))
+        ):
+            x_i, y_i = image_util.findOverlap(x_i, y_i, min_distance)
+            x_list.append(x_i)
+            y_list.append(y_i)
+            index_list.append(np.full(len(x_i), i))
+        source_index = np.concatenate(index_list)
+        x_mins, y_mins = np.concatenate(x_list), np.concatenate(y_list)
+        if magnification_limit is not None and len(x_mins) > 0:
+            mag = np.abs(self.lensModel.magnification(x_mins, y_mins, kwargs_lens))
+            keep = mag >= magnification_limit
+            source_index, x_mins, y_mins = (
+                source_index[keep],
+                x_mins[keep],
+                y_mins[keep],
+            )
+        if arrival_time_sort and len(x_mins) > 0:
+            arrival_time = self._arrival_times(x_mins, y_mins, kwargs_lens)
+            order = np.lexsort((arrival_time, source_index))
+            source_index, x_mins, y_mins = (
+                source_index[order],
+                x_mins[order],
+                y_mins[order],
+            )
+        self.lensModel.set_dynamic()
+        split = np.searchsorted(source_index, np.arange(1, num_source))
+        return np.split(x_mins, split), np.split(y_mins, split)
+
+    def _triangle_candidates(
+        self,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        min_distance,
+        search_window,
+        x_center,
+        y_center,
+    ):
+        """Candidate image positions of many sources from a single ray-tracing of the
+        search grid. Each grid cell is split into two triangles, the triangles are
+        mapped onto the source plane and binned into a regular grid of the size of a
+        typical mapped triangle covering the source positions. For each source, the
+        triangles of its bin are tested for containing the source and the image
+        position is linearly interpolated within the triangle.
+
+        :param sourcePos_x: array of source positions
+        :param sourcePos_y: array of source positions
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param min_distance: pixel size of the search grid
+        :param search_window: window size of the search grid
+        :param x_center: center of the search grid
+        :param y_center: center of the search grid
+        :return: source indexes, x- and y-positions of the candidates
+        """
+        num_pix = int(round(search_window / min_distance) + 0.5)
+        x_grid, y_grid = util.make_grid(num_pix, min_distance)
+        x_grid += x_center
+        y_grid += y_center
+        beta_x, beta_y = self.lensModel.ray_shooting(x_grid, y_grid, kwargs_lens)
+
+        # two triangles per grid cell, vertices given as indexes of the flattened grid
+        corner = (
+            np.arange(num_pix - 1)[np.newaxis, :]
+            + num_pix * np.arange(num_pix - 1)[:, np.newaxis]
+        ).flatten()
+        triangles = np.concatenate(
+            [
+                np.array([corner, corner + 1, corner + num_pix + 1]).T,
+                np.array([corner, corner + num_pix + 1, corner + num_pix]).T,
+            ]
+        )
+        tri_x, tri_y = beta_x[triangles], beta_y[triangles]
+
+        # bounding boxes of the mapped triangles in units of the bins
+        tri_x_min, tri_x_max = np.min(tri_x, axis=1), np.max(tri_x, axis=1)
+        tri_y_min, tri_y_max = np.min(tri_y, axis=1), np.max(tri_y, axis=1)
+        bin_size = np.median(np.maximum(tri_x_max - tri_x_min, tri_y_max - tri_y_min))
+        bin_size = max(bin_size, 10 ** (-10))
+        x_0, y_0 = np.min(sourcePos_x), np.min(sourcePos_y)
+        num_x = int((np.max(sourcePos_x) - x_0) / bin_size) + 1
+        num_y = int((np.max(sourcePos_y) - y_0) / bin_size) + 1
+        ix_min = np.floor((tri_x_min - x_0) / bin_size).astype(int)
+        ix_max = np.floor((tri_x_max - x_0) / bin_size).astype(int)
+        iy_min = np.floor((tri_y_min - y_0) / bin_size).astype(int)
+        iy_max = np.floor((tri_y_max - y_0) / bin_size).astype(int)
+        overlap = (ix_max >= 0) & (ix_min < num_x) & (iy_max >= 0) & (iy_min < num_y)
+        ix_min, ix_max = np.maximum(ix_min, 0), np.minimum(ix_max, num_x - 1)
+        iy_min, iy_max = np.maximum(iy_min, 0), np.minimum(iy_max, num_y - 1)
+        tri_index = np.where(overlap)[0]
+
+        # (bin, triangle) pairs of all bins covered by the bounding box of a triangle
+        n_x = ix_max[tri_index] - ix_min[tri_index] + 1
+        n_y = iy_max[tri_index] - iy_min[tri_index] + 1
+        pair_tri, offset = self._expand_ranges(n_x * n_y)
+        pair_tri = tri_index[pair_tri]
+        n_x_pair = ix_max[pair_tri] - ix_min[pair_tri] + 1
+        pair_bin = (ix_min[pair_tri] + offset % n_x_pair) + num_x * (
+            iy_min[pair_tri] + offset // n_x_pair
+        )
+        order = np.argsort(pair_bin, kind="stable")
+        pair_bin, pair_tri = pair_bin[order], pair_tri[order]
+
+        # (source, triangle) pairs of the triangles sharing the bin of the source
+        source_bin = np.floor((sourcePos_x - x_0) / bin_size).astype(int) + num_x * (
+            np.floor((sourcePos_y - y_0) / bin_size).astype(int)
+        )
+        start = np.searchsorted(pair_bin, source_bin, side="left")
+        end = np.searchsorted(pair_bin, source_bin, side="right")
+        source_index, offset = self._expand_ranges(end - start)
+        tri = pair_tri[start[source_index] + offset]
+
+        # barycentric coordinates of the sources within the mapped triangles
+        v0_x = tri_x[tri, 1] - tri_x[tri, 0]
+        v0_y = tri_y[tri, 1] - tri_y[tri, 0]
+        v1_x = tri_x[tri, 2] - tri_x[tri, 0]
+        v1_y = tri_y[tri, 2] - tri_y[tri, 0]
+        v2_x = sourcePos_x[source_index] - tri_x[tri, 0]
+        v2_y = sourcePos_y[source_index] - tri_y[tri, 0]
+        det = v0_x * v1_y - v1_x * v0_y
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = (v2_x * v1_y - v1_x * v2_y) / det
+            v = (v0_x * v2_y - v2_x * v0_y) / det
+        eps = 10 ** (-6)
+        inside = (det != 0) & (u >= -eps) & (v >= -eps) & (u + v <= 1 + eps)
+        source_index, tri, u, v = (
+            source_index[inside],
+            tri[inside],
+            u[inside],
+            v[inside],
+        )
+        vertex = triangles[tri]
+        x_mins = (
+            x_grid[vertex[:, 0]]
+            + u * (x_grid[vertex[:, 1]] - x_grid[vertex[:, 0]])
+            + v * (x_grid[vertex[:, 2]] - x_grid[vertex[:, 0]])
+        )
+        y_mins = (
+            y_grid[vertex[:, 0]]
+            + u * (y_grid[vertex[:, 1]] - y_grid[vertex[:, 0]])
+            + v * (y_grid[vertex[:, 2]] - y_grid[vertex[:, 0]])
+        )
+        return source_index, x_mins, y_mins
+
+    @staticmethod
+    def _expand_ranges(counts):
+        """Expands a list of counts into the index of the entry and the running
+        offset within each entry, e.g. [2, 3] -> [0, 0, 1, 1, 1], [0, 1, 0, 1, 2].
+
+        :param counts: array of non-negative integers
+        :return: entry index, offset
+        """
+        index = np.repeat(np.arange(len(counts)), counts)
+        start = np.cumsum(counts) - counts
+        offset = np.arange(len(index)) - start[index]
+        return index, offset
+
+    def _gradient_decent_batch(
+        self,
+        x_guess,
+        y_guess,
+        source_x,
+        source_y,
+        kwargs_lens,
+        precision_limit,
+        num_iter_max,
+        max_step,
+    ):
+        """Vectorized version of _solve_single_proposal for many proposals (and source
+        positions) at once. Steps that do not improve the precision in the source plane
+        are rejected and the step size of the proposal is halved.
+
+        :param x_guess: array of starting guess positions in the image plane
+        :param y_guess: array of starting guess positions in the image plane
+        :param source_x: array of source positions to solve for
+        :param source_y: array of source positions to solve for
+        :param kwargs_lens: keyword argument list of the lens model
+        :param precision_limit: float, required match in the solution in the source
+            plane
+        :param num_iter_max: int, maximum number of iterations before the algorithm
+            stops
+        :param max_step: maximum correction applied per step (to avoid over-shooting in
+            instable regions)
+        :return: x_position array, y_position array, error in the source plane array
+        """
+        x_guess = np.array(x_guess, dtype=float)
+        y_guess = np.array(y_guess, dtype=float)
+        if len(x_guess) == 0:
+            return x_guess, y_guess, np.zeros(0)
+        beta_x, beta_y = self.lensModel.ray_shooting(x_guess, y_guess, kwargs_lens)
+        delta = np.sqrt((beta_x - source_x) ** 2 + (beta_y - source_y) ** 2)
+        step_scale = np.ones(len(x_guess))
+        for _ in range(num_iter_max):
+            idx = np.where(delta > precision_limit)[0]
+            if len(idx) == 0:
+                break
+            x, y = x_guess[idx], y_guess[idx]
+            f_xx, f_xy, f_yx, f_yy = self.lensModel.hessian(x, y, kwargs_lens)
+            det = (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
+            d_x, d_y = beta_x[idx] - source_x[idx], beta_y[idx] - source_y[idx]
+            step_x = ((1 - f_yy) * d_x + f_yx * d_y) / det
+            step_y = (f_xy * d_x + (1 - f_xx) * d_y) / det
+            dist = np.sqrt(step_x**2 + step_y**2)
+            scale = step_scale[idx] * np.minimum(1, max_step / dist)
+            x_new, y_new = x - step_x * scale, y - step_y * scale
+            x_mapped, y_mapped = self.lensModel.ray_shooting(x_new, y_new, kwargs_lens)
+            delta_new = np.sqrt(
+                (x_mapped - source_x[idx]) ** 2 + (y_mapped - source_y[idx]) ** 2
+            )
+            improved = delta_new <= delta[idx]
+            idx_improved = idx[improved]
+            x_guess[idx_improved] = x_new[improved]
+            y_guess[idx_improved] = y_new[improved]
+            beta_x[idx_improved] = x_mapped[improved]
+            beta_y[idx_improved] = y_mapped[improved]
+            delta[idx_improved] = delta_new[improved]
+            step_scale[idx_improved] = 1
+            step_scale[idx[~improved]] *= 0.5
+        return x_guess, y_guess, delta
+
+    def _arrival_times(self, x_mins, y_mins, kwargs_lens):
+        """Arrival times (or Fermat potential in single plane mode) used to sort the
+        image positions.
+
+        :param x_mins: ra position of images
+        :param y_mins: dec position of images
+        :param kwargs_lens: keyword arguments of lens model
+        :return: arrival times
+        """
+        if hasattr(self.lensModel, "_no_potential"):
+            raise Exception(
+                "Instance of `LensModel` passed to this class does not compute the lensing potential, "
+                "and therefore cannot compute time delays."
+            )
+        if self.lensModel.multi_plane:
+            return self.lensModel.arrival_time(x_mins, y_mins, kwargs_lens)
+        return self.lensModel.fermat_potential(x_mins, y_mins, kwargs_lens)
+
     def _find_gradient_decent(
         self,
         x_min,
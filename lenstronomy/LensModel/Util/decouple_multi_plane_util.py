@@ -250,59 +250,63 @@ def decoupled_multiplane_class_setup(
         specifies the image coordinates
     :param y_image: optional keyword argument passed to multiple images argument that
         specifies the image coordinates
-    :param method: the interpolation method used by RegularGridInterpolator if
-        coordinate_type=='GRID'
-    :param bounds_error: passed to RegularGridInterpolater, see documentation there
-    :param fill_value: passed to RegularGridInterpolator, see documentation there
+    :param method: the interpolation method if coordinate_type=='GRID'; 'linear' uses
+        the vectorized BilinearGridInterpolator if the axes of interp_points are
+        equally spaced, other methods and non-uniform axes are passed to
+        RegularGridInterpolator
+    :param bounds_error: if True, interpolating outside of the grid raises a ValueError
+        (see documentation of RegularGridInterpolator)
+    :param fill_value: value returned outside of the grid; if None, the values are
+        extrapolated (see documentation of RegularGridInterpolator)
     :return: keyword arguments that can be passed into a LensModel class to create a
         decoupled-multiplane lens model
     """
     if coordinate_type == "GRID":
-        from scipy.interpolate import RegularGridInterpolator
-
         npix = int(len(x) ** 0.5)
-        interp_xD = RegularGridInterpolator(
-            interp_points,
-            x.reshape(npix, npix).T,
-            bounds_error=bounds_error,
-            fill_value=fill_value,
-            method=method,
-        )
-        interp_yD = RegularGridInterpolator(
-            interp_points,
-            y.reshape(npix, npix).T,
-            bounds_error=bounds_error,
-            fill_value=fill_value,
-            method=method,
-        )
-        interp_foreground_alpha_x = RegularGridInterpolator(
-            interp_points,
-            alpha_x_foreground.reshape(npix, npix).T,
-            bounds_error=bounds_error,
-            fill_value=fill_value,
-            method=method,
-        )
-        interp_foreground_alpha_y = RegularGridInterpolator(
-            interp_points,
-            alpha_y_foreground.reshape(npix, npix).T,
-            bounds_error=bounds_error,
-            fill_value=fill_value,
-            method=method,
-        )
-        interp_deltabeta_x = RegularGridInterpolator(
-            interp_points,
-            alpha_beta_subx.reshape(npix, npix).T,
-            bounds_error=bounds_error,
-            fill_value=fill_value,
-            method=method,
-        )
-        interp_deltabeta_y = RegularGridInterpolator(
-            interp_points,
-            alpha_beta_suby.reshape(npix, npix).T,
-            bounds_error=bounds_error,
-            fill_value=fill_value,
-            method=method,
-        )
+        fields = [
+            x,
+            y,
+            alpha_x_foreground,
+            alpha_y_foreground,
+            alpha_beta_subx,
+            alpha_beta_suby,
+        ]
+        if (
+            method == "linear"
+            and _equally_spaced(interp_points[0])
+            and _equally_spaced(interp_points[1])
+        ):
+            interp_list = [
+                BilinearGridInterpolator(
+                    interp_points[0],
+                    interp_points[1],
+                    field.reshape(npix, npix),
+                    bounds_error=bounds_error,
+                    fill_value=fill_value,
+                )
+                for field in fields
+            ]
+        else:
+            from scipy.interpolate import RegularGridInterpolator
+
+            interp_list = [
+                RegularGridInterpolator(
+                    interp_points,
+                    field.reshape(npix, npix).T,
+                    bounds_error=bounds_error,
+                    fill_value=fill_value,
+                    method=method,
+                )
+                for field in fields
+            ]
+        (
+            interp_xD,
+            interp_yD,
+            interp_foreground_alpha_x,
+            interp_foreground_alpha_y,
+            interp_deltabeta_x,
+            interp_deltabeta_y,
+        ) = interp_list
     elif coordinate_type == "POINT":
         interp_xD = lambda *args: x
         interp_yD = lambda *args: y
@@ -361,6 +365,9 @@ def setup_raytracing_lensmodels(
     index_lens_split,
     grid_size,
     grid_resolution,
+    deflection_fields=None,
+    processes=1,
+    filename=None,
 ):
     """This function sets up the lens model used for high-resolution ray tracing with
     the decoupled multi-plane approximation.
@@ -374,6 +381,12 @@ def setup_raytracing_lensmodels(
         class)
     :param grid_size: the size of the ray-tracing grid in arcsec
     :param grid_resolution: the resolution of the ray tracing grid in arcsec/pixel
+    :param deflection_fields: None or array of shape (len(x_image), 6, npix, npix) of
+        previously computed fields (see setup_deflection_fields()), e.g. reloaded with
+        np.load(filename, mmap_mode='r'). If None, the fields are computed
+    :param processes: number of processes used to compute the fields
+    :param filename: None or path of a .npy file in which the computed fields are stored
+        (memory-mapped)
     :return: a list of DecoupledMultiPlane lens models and corresponding keyword
         arguments
     """
@@ -387,38 +400,32 @@ def setup_raytracing_lensmodels(
         z_split,
         cosmo_bkg,
     ) = setup_lens_model(lens_model, kwargs_lens, index_lens_split)
+    if deflection_fields is None:
+        deflection_fields = setup_deflection_fields(
+            x_image,
+            y_image,
+            lens_model,
+            kwargs_lens,
+            index_lens_split,
+            grid_size,
+            grid_resolution,
+            processes=processes,
+            filename=filename,
+        )
     kwargs_multiplane_lens_model_list = []
     multiplane_lens_model_list = []
     for image_index in range(0, len(x_image)):
-        grid_x, grid_y, interp_points, npix = setup_grids(
+        _, _, interp_points, npix = setup_grids(
             grid_size, grid_resolution, x_image[image_index], y_image[image_index]
         )
-        (
-            xD,
-            yD,
-            alpha_x_foreground,
-            alpha_y_foreground,
-            alpha_x_background,
-            alpha_y_background,
-        ) = coordinates_and_deflections(
-            lens_model_fixed,
-            lens_model_free,
-            kwargs_lens_fixed,
-            kwargs_lens_free,
-            grid_x,
-            grid_y,
-            z_split,
-            z_source,
-            cosmo_bkg,
-        )
+        if deflection_fields[image_index].shape != (6, npix, npix):
+            raise ValueError(
+                "deflection_fields of shape %s do not match the grids of %s pixels."
+                % (np.shape(deflection_fields), npix)
+            )
         kwargs_multiplane_lens_model = decoupled_multiplane_class_setup(
             lens_model_free,
-            xD,
-            yD,
-            alpha_x_foreground,
-            alpha_y_foreground,
-            alpha_x_background,
-            alpha_y_background,
+            *[field.ravel() for field in deflection_fields[image_index]],
             z_split,
             coordinate_type="GRID",
             interp_points=interp_points,
@@ -426,3 +433,194 @@ def setup_raytracing_lensmodels(
         kwargs_multiplane_lens_model_list.append(kwargs_multiplane_lens_model)
         multiplane_lens_model_list.append(LensModel(**kwargs_multiplane_lens_model))
     return multiplane_lens_model_list, kwargs_multiplane_lens_model_list
+
+
+def setup_deflection_fields(
+    x_image,
+    y_image,
+    lens_model,
+    kwargs_lens,
+    index_lens_split,
+    grid_size,
+    grid_resolution,
+    processes=1,
+    filename=None,
+    chunk_size=2**16,
+):
+    """Computes the comoving coordinates and deflection fields of the decoupled
+    multi-plane approximation on the ray-tracing grids around all images (see
+    coordinates_and_deflections()). The grid points of all images are computed together
+    in chunks, which are distributed over a process pool if processes > 1.
+
+    :param x_image: list of x-coordinates of lensed image
+    :param y_image: list of y-coordinates of lensed image
+    :param lens_model: an instance of LensModel
+    :param kwargs_lens: keyword arguments for the lens model
+    :param index_lens_split: list of integers specifying the lens models to be split
+        from the line-of-sight population
+    :param grid_size: the size of the ray-tracing grid in arcsec
+    :param grid_resolution: the resolution of the ray tracing grid in arcsec/pixel
+    :param processes: number of processes
+    :param filename: None or path of a .npy file. If set, the fields are stored in a
+        memory-mapped file that can be reloaded with np.load(filename, mmap_mode='r')
+    :param chunk_size: maximum number of grid points per chunk
+    :return: array of shape (len(x_image), 6, npix, npix) with the comoving coordinates
+        x, y at the main deflector, the foreground and the background deflection angles
+        in x and y on the grid of each image (numpy.memmap if filename is set)
+    """
+    setup = setup_lens_model(lens_model, kwargs_lens, index_lens_split)
+    _, _, _, npix = setup_grids(grid_size, grid_resolution)
+    grid_x, grid_y = [np.zeros(0)], [np.zeros(0)]
+    for image_index in range(0, len(x_image)):
+        grid_x_, grid_y_, _, _ = setup_grids(
+            grid_size, grid_resolution, x_image[image_index], y_image[image_index]
+        )
+        grid_x.append(grid_x_)
+        grid_y.append(grid_y_)
+    grid_x, grid_y = np.concatenate(grid_x), np.concatenate(grid_y)
+    chunk_size = max(int(chunk_size), 1)
+    chunks = [
+        (setup, grid_x[i : i + chunk_size], grid_y[i : i + chunk_size])
+        for i in range(0, len(grid_x), chunk_size)
+    ]
+    if processes == 1:
+        results = list(map(_coordinates_and_deflections_chunk, chunks))
+    else:
+        # imported here to avoid requiring the multiprocessing dependencies at import time
+        from lenstronomy.Sampling.Pool.pool import choose_pool
+
+        pool = choose_pool(mpi=False, processes=processes)
+        results = list(pool.map(_coordinates_and_deflections_chunk, chunks))
+        pool.close()
+    shape = (len(x_image), 6, npix, npix)
+    if filename is None:
+        deflection_fields = np.zeros(shape)
+    else:
+        deflection_fields = np.lib.format.open_memmap(
+            filename, mode="w+", dtype=float, shape=shape
+        )
+    # grid points are ordered by image, then by pixel
+    fields_flat = np.concatenate([np.zeros((6, 0))] + results, axis=1)
+    deflection_fields[:] = fields_flat.reshape(6, len(x_image), npix, npix).transpose(
+        1, 0, 2, 3
+    )
+    if filename is not None:
+        deflection_fields.flush()
+    return deflection_fields
+
+
+def _coordinates_and_deflections_chunk(args):
+    """Evaluates coordinates_and_deflections() on a chunk of grid points.
+
+    :param args: tuple of the output of setup_lens_model() and the x- and y-coordinates
+        of the chunk
+    :return: array of shape (6, n) with the outputs of coordinates_and_deflections()
+    """
+    setup, x, y = args
+    (
+        lens_model_fixed,
+        lens_model_free,
+        kwargs_lens_fixed,
+        kwargs_lens_free,
+        z_source,
+        z_split,
+        cosmo_bkg,
+    ) = setup
+    return np.array(
+        coordinates_and_deflections(
+            lens_model_fixed,
+            lens_model_free,
+            kwargs_lens_fixed,
+            kwargs_lens_free,
+            x,
+            y,
+            z_split,
+            z_source,
+            cosmo_bkg,
+        )
+    )
+
+
+class BilinearGridInterpolator(object):
+    """Vectorized bilinear interpolation of a field sampled on a regular grid (such as
+    the grids of setup_grids()). Outside of the grid, the values are extrapolated
+    linearly from the closest grid cell, as RegularGridInterpolator does with
+    fill_value=None. The field can be a memory-mapped array.
+
+    Instances are called with a tuple of coordinates (x, y), like a
+    RegularGridInterpolator, and can be passed as interpolation functions to the
+    decoupled multi-plane lens model.
+    """
+
+    def __init__(self, x, y, values, bounds_error=False, fill_value=None):
+        """
+
+        :param x: 1d array of equally spaced x-coordinates of the grid (increasing)
+        :param y: 1d array of equally spaced y-coordinates of the grid (increasing)
+        :param values: 2d array of shape (len(y), len(x)) of the field on the grid
+        :param bounds_error: if True, interpolating outside of the grid raises a
+            ValueError
+        :param fill_value: value returned outside of the grid; if None, the values are
+            extrapolated
+        """
+        if not (_equally_spaced(x) and _equally_spaced(y)):
+            raise ValueError(
+                "BilinearGridInterpolator requires equally spaced and increasing "
+                "coordinates, use RegularGridInterpolator instead."
+            )
+        self._x_min, self._y_min = x[0], y[0]
+        self._x_max, self._y_max = x[-1], y[-1]
+        self._delta_x = (x[-1] - x[0]) / (len(x) - 1)
+        self._delta_y = (y[-1] - y[0]) / (len(y) - 1)
+        self._nx, self._ny = len(x), len(y)
+        self._values_flat = np.ravel(values)
+        self._bounds_error = bounds_error
+        self._fill_value = fill_value
+
+    def __call__(self, coordinates):
+        """Interpolated field.
+
+        :param coordinates: tuple (x, y) of floats or arrays of coordinates
+        :return: interpolated values of the shape of the coordinates
+        """
+        x, y = np.broadcast_arrays(*[np.asarray(c, dtype=float) for c in coordinates])
+        f_x = (x - self._x_min) / self._delta_x
+        f_y = (y - self._y_min) / self._delta_y
+        i_x = np.clip(np.floor(f_x).astype(int), 0, self._nx - 2)
+        i_y = np.clip(np.floor(f_y).astype(int), 0, self._ny - 2)
+        t_x = f_x - i_x
+        t_y = f_y - i_y
+        # flat indexes of the lower left corners of the grid cells
+        index = i_y * self._nx + i_x
+        v_00 = self._values_flat.take(index)
+        v_01 = self._values_flat.take(index + 1)
+        v_10 = self._values_flat.take(index + self._nx)
+        v_11 = self._values_flat.take(index + self._nx + 1)
+        v_0 = v_00 + t_x * (v_01 - v_00)
+        v_1 = v_10 + t_x * (v_11 - v_10)
+        output = v_0 + t_y * (v_1 - v_0)
+        if self._bounds_error is True or self._fill_value is not None:
+            outside = (
+                (x < self._x_min)
+                | (x > self._x_max)
+                | (y < self._y_min)
+                | (y > self._y_max)
+            )
+            if self._bounds_error is True and np.any(outside):
+                raise ValueError("One of the requested coordinates is out of bounds.")
+            output = np.where(outside, self._fill_value, output)
+        return output
+
+
+def _equally_spaced(x):
+    """Checks whether the coordinates of a grid axis are equally spaced and increasing.
+
+    :param x: 1d array of coordinates
+    :return: bool
+    """
+    x = np.asarray(x, dtype=float)
+    if x.ndim != 1 or len(x) < 2:
+        return False
+    diff = np.diff(x)
+    delta_x = (x[-1] - x[0]) / (len(x) - 1)
+    return bool(delta_x > 0 and np.allclose(diff, delta_x, rtol=1e-6, atol=0))
@@ -71,6 +71,98 @@ def ell_to_pol(rell, theta, q):
     return r, phi
 
 
+def epl_num_terms(q, tol=1e-16, niter_max=200):
+    """Number of terms of the series of the angular function of the elliptical power-
+    law (Tessore & Metcalf 2015, eq. 29) required to reach a given precision. The
+    absolute value of the n-th term is smaller than f**n with f = (1 - q) / (1 + q).
+
+    :param q: axis ratio (float or array, the smallest axis ratio sets the number)
+    :param tol: requested absolute precision of the series
+    :param niter_max: maximum number of terms
+    :return: number of terms (int)
+    """
+    f = np.max((1 - np.asarray(q, dtype=float)) / (1 + np.asarray(q, dtype=float)))
+    if f <= 0:
+        return 1
+    return int(min(niter_max, np.log(tol) / np.log(f) + 2))
+
+
+@jit(fastmath=True)
+def epl_omega_series(phi, t, q, niter):
+    """Angular function of the elliptical power-law deflection (Tessore & Metcalf
+    2015, eq. 29) summed with the recursion of the series terms.
+
+    :param phi: elliptical angle (float or array)
+    :param t: projected power-law slope (float or array broadcastable with phi)
+    :param q: axis ratio (float or array broadcastable with phi)
+    :param niter: number of terms of the series (see epl_num_terms())
+    :return: complex angular function Omega(phi)
+    """
+    f = (1 - q) / (1 + q)
+    Omega = np.exp(1j * phi)
+    fact = -f * np.exp(2j * phi)
+    omegas = Omega
+    for n in range(1, niter):
+        Omega = Omega * ((2 * n - (2 - t)) / (2 * n + (2 - t)) * fact)
+        omegas = omegas + Omega
+    return omegas
+
+
+@jit()
+def epl_major_axis_alpha(x, y, b, t, q, niter):
+    """Deflection of the elliptical power-law aligned with the major axis, eq. (22) of
+    Tessore & Metcalf (2015).
+
+    :param x: 1d array of x-coordinates relative to the center (major axis)
+    :param y: 1d array of y-coordinates relative to the center (minor axis)
+    :param b: critical radius (float or 1d array of the size of x)
+    :param t: projected power-law slope (float or 1d array of the size of x)
+    :param q: axis ratio (float or 1d array of the size of x)
+    :param niter: number of terms of the series of the angular function
+    :return: alpha_x, alpha_y
+    """
+    zz = q * x + 1j * y
+    R = np.abs(zz)
+    R_ = np.maximum(R, 0.000000001)
+    alpha = (
+        2 / (1 + q) * (b / R_) ** t * R_ * epl_omega_series(np.angle(zz), t, q, niter)
+    )
+    # the deflection vanishes at the center
+    alpha = alpha * (R > 0)
+    return alpha.real, alpha.imag
+
+
+@jit()
+def epl_major_axis_alpha_hessian(x, y, b, t, q, niter):
+    """Deflection and Hessian of the elliptical power-law aligned with the major axis
+    evaluated with a single evaluation of the angular function, eq. (2), (17) and (22)
+    of Tessore & Metcalf (2015).
+
+    :param x: 1d array of x-coordinates relative to the center (major axis)
+    :param y: 1d array of y-coordinates relative to the center (minor axis)
+    :param b: critical radius (float or 1d array of the size of x)
+    :param t: projected power-law slope (float or 1d array of the size of x)
+    :param q: axis ratio (float or 1d array of the size of x)
+    :param niter: number of terms of the series of the angular function
+    :return: alpha_x, alpha_y, f_xx, f_xy, f_yy
+    """
+    alpha_x, alpha_y = epl_major_axis_alpha(x, y, b, t, q, niter)
+    R = np.maximum(np.sqrt((q * x) ** 2 + y**2), 0.00000001)
+    r = np.sqrt(x**2 + y**2)
+    center = r == 0
+    r_ = r + center
+    cos, sin = x / r_, y / r_
+    cos2, sin2 = cos * cos * 2 - 1, sin * cos * 2
+
+    # convergence, eq. (2)
+    kappa = (2 - t) / 2 * (b / R) ** t
+
+    # shear, eq. (17), corrected version from arXiv/corrigendum, vanishing at the center
+    gamma_1 = ((1 - t) * (alpha_x * cos - alpha_y * sin) / r_ - kappa * cos2) * ~center
+    gamma_2 = ((1 - t) * (alpha_y * cos + alpha_x * sin) / r_ - kappa * sin2) * ~center
+    return alpha_x, alpha_y, kappa + gamma_1, gamma_2, kappa - gamma_1
+
+
 def geomlinspace(a, b, N):
     """Constructs a geomspace from a to b, with a linspace prepended to it from 0 to a,
     with the same spacing as the geomspace would have at a."""
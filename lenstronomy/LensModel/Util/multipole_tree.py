@@ -0,0 +1,228 @@
+__author__ = "sibirrer"
+
+import numpy as np
+from scipy.special import comb
+
+__all__ = ["MultipoleTree"]
+
+
+class MultipoleTree(object):
+    """Quadtree (Barnes-Hut) approximation of the summed deflection angles and Hessians
+    of many compact deflectors (e.g. truncated sub-halos).
+
+    Each deflector is described by the Einstein radius squared of a point mass with the
+    same total mass and by its extent, the radius beyond which it acts as a point mass.
+    The deflectors are sorted into a quadtree. Cells that are seen under an angle
+    smaller than the opening angle from an evaluation point are approximated by a
+    complex multipole expansion of their mass, closer deflectors are evaluated exactly.
+
+    In complex notation w = x + i y, the deflection of the point masses m_k at w_k is
+    conj(F(w)) with F(w) = sum_k m_k / (w - w_k) = sum_p a_p / (w - w_0)^(p+1) and the
+    multipole coefficients a_p = sum_k m_k (w_k - w_0)^p of a cell centered at w_0.
+    """
+
+    def __init__(self, center_x, center_y, mass, extent=None, leaf_size=8, order=4):
+        """
+
+        :param center_x: array of x-coordinates of the deflectors
+        :param center_y: array of y-coordinates of the deflectors
+        :param mass: array of the Einstein radii squared of point masses with the same
+            total mass as the deflectors
+        :param extent: None or array of radii beyond which the deflectors act as point
+            masses
+        :param leaf_size: maximum number of deflectors in a leaf of the tree
+        :param order: highest order of the multipole expansion (0: monopole)
+        """
+        self._w = np.array(center_x, dtype=float) + 1j * np.array(center_y, dtype=float)
+        self._mass = np.array(mass, dtype=float)
+        if extent is None:
+            extent = np.zeros(len(self._mass))
+        self._extent = np.array(extent, dtype=float)
+        self._leaf_size = max(int(leaf_size), 1)
+        self._order = int(order)
+        self._nodes = []
+        # signed binomial coefficients (-1)^l C(p + l, l) and powers p + l + 1 of the
+        # conversion of the multipole into local expansions (see local_expansion())
+        p, l = np.meshgrid(np.arange(self._order + 1), np.arange(self._order + 1))
+        self._m2l_binom = (-1.0) ** l * comb(p + l, l, exact=False)
+        self._m2l_power = p + l + 1
+        if len(self._mass) > 0:
+            self._build(np.arange(len(self._mass)))
+
+    @property
+    def num_nodes(self):
+        """Number of cells in the tree.
+
+        :return: int
+        """
+        return len(self._nodes)
+
+    def _build(self, index):
+        """Builds the quadtree. Each node is stored as a dictionary with the indexes of
+        its deflectors, the expansion center, the radius enclosing the deflectors
+        (including their extent), the multipole coefficients and the indexes of its
+        children.
+
+        :param index: indexes of all deflectors
+        :return: None
+        """
+        stack = [(index, None)]
+        while len(stack) > 0:
+            index, parent = stack.pop()
+            w = self._w[index]
+            x_min, x_max = np.min(w.real), np.max(w.real)
+            y_min, y_max = np.min(w.imag), np.max(w.imag)
+            w0 = 0.5 * (x_min + x_max) + 0.5j * (y_min + y_max)
+            dw = w - w0
+            radius = np.max(np.abs(dw) + self._extent[index])
+            coeffs = self._mass[index] @ np.vander(dw, self._order + 1, increasing=True)
+            node = {
+                "index": index,
+                "center": w0,
+                "radius": radius,
+                "coeffs": coeffs,
+                "mass": np.sum(np.abs(self._mass[index])),
+                "children": [],
+            }
+            self._nodes.append(node)
+            node_id = len(self._nodes) - 1
+            if parent is not None:
+                self._nodes[parent]["children"].append(node_id)
+            if len(index) <= self._leaf_size or (x_max == x_min and y_max == y_min):
+                continue
+            right = w.real > w0.real
+            top = w.imag > w0.imag
+            for mask in [~right & ~top, right & ~top, ~right & top, right & top]:
+                if np.any(mask):
+                    stack.append((index[mask], node_id))
+
+    def evaluate(self, function_name, x, y, exact_function, opening_angle=0.5):
+        """Sum of the deflection angles or Hessians of all deflectors.
+
+        :param function_name: 'derivatives' or 'hessian'
+        :param x: 1d array of x-coordinates
+        :param y: 1d array of y-coordinates
+        :param exact_function: function(x, y, index) returning the exact summed output
+            (array of shape (n_output, len(x))) of the deflectors with the given indexes
+        :param opening_angle: maximum ratio of the cell radius and the distance to the
+            expansion center for a cell to be approximated by its multipole expansion
+            (< 1)
+        :return: array of shape (n_output, len(x)), upper bound of the multipole
+            truncation error on the absolute deflection angle at each coordinate
+        """
+        num_output = 2 if function_name == "derivatives" else 4
+        output = np.zeros((num_output, len(x)))
+        error = np.zeros(len(x))
+        if len(self._nodes) == 0:
+            return output, error
+        w = x + 1j * y
+        stack = [(0, np.arange(len(x)))]
+        while len(stack) > 0:
+            node_id, idx = stack.pop()
+            node = self._nodes[node_id]
+            dw = w[idx] - node["center"]
+            d = np.abs(dw)
+            accept = node["radius"] < opening_angle * d
+            if np.any(accept):
+                idx_accept = idx[accept]
+                output[:, idx_accept] += self._multipole(
+                    function_name, node["coeffs"], dw[accept]
+                )
+                ratio = node["radius"] / d[accept]
+                error[idx_accept] += (
+                    node["mass"] / d[accept] * ratio ** (self._order + 1) / (1 - ratio)
+                )
+            idx_reject = idx[~accept]
+            if len(idx_reject) == 0:
+                continue
+            if len(node["children"]) == 0:
+                output[:, idx_reject] += exact_function(
+                    x[idx_reject], y[idx_reject], node["index"]
+                )
+            else:
+                for child in node["children"]:
+                    stack.append((child, idx_reject))
+        return output, error
+
+    def local_expansion(self, center_x, center_y, radius, opening_angle=0.5):
+        """Local (Taylor) expansion of the summed deflection angles of the deflectors
+        well separated from a disk, e.g. a patch of rays shot together.
+
+        Cells whose radius plus the radius of the disk is smaller than the opening angle
+        times the distance to the center of the disk contribute with their multipole
+        expansion converted into F(w) = sum_l b_l (w - z_0)^l around the center z_0 of
+        the disk. The deflectors of the remaining leaves need to be evaluated exactly.
+
+        :param center_x: x-coordinate of the center of the disk
+        :param center_y: y-coordinate of the center of the disk
+        :param radius: radius of the disk
+        :param opening_angle: maximum ratio of the summed cell and disk radii and the
+            distance between their centers for a cell to be included in the local
+            expansion (< 1)
+        :return: complex local coefficients b_l, indexes of the deflectors to be
+            evaluated exactly
+        """
+        z0 = center_x + 1j * center_y
+        coeffs = np.zeros(self._order + 1, dtype=complex)
+        index_near = []
+        stack = [0] if len(self._nodes) > 0 else []
+        while len(stack) > 0:
+            node = self._nodes[stack.pop()]
+            d = z0 - node["center"]
+            if node["radius"] + radius < opening_angle * np.abs(d):
+                # 1 / (u + d)^(p+1) = sum_l C(p + l, l) (-u)^l / d^(p+l+1)
+                coeffs += (self._m2l_binom / d**self._m2l_power) @ node["coeffs"]
+            elif len(node["children"]) > 0:
+                stack.extend(node["children"])
+            else:
+                index_near.append(node["index"])
+        if len(index_near) == 0:
+            return coeffs, np.zeros(0, dtype=int)
+        return coeffs, np.concatenate(index_near)
+
+    @staticmethod
+    def evaluate_local(function_name, coeffs, center_x, center_y, x, y):
+        """Deflection angles or Hessian of a local expansion.
+
+        :param function_name: 'derivatives' or 'hessian'
+        :param coeffs: complex local coefficients b_l (see local_expansion())
+        :param center_x: x-coordinate of the center of the expansion
+        :param center_y: y-coordinate of the center of the expansion
+        :param x: array of x-coordinates
+        :param y: array of y-coordinates
+        :return: array of shape (n_output, len(x))
+        """
+        u = (x - center_x) + 1j * (y - center_y)
+        if function_name == "derivatives":
+            f = np.zeros_like(u)
+            for b_l in coeffs[::-1]:
+                f = f * u + b_l
+            return np.array([f.real, -f.imag])
+        df = np.zeros_like(u)
+        for l in range(len(coeffs) - 1, 0, -1):
+            df = df * u + l * coeffs[l]
+        return np.array([df.real, -df.imag, -df.imag, -df.real])
+
+    @staticmethod
+    def _multipole(function_name, coeffs, dw):
+        """Deflection angles or Hessian of a multipole expansion.
+
+        :param function_name: 'derivatives' or 'hessian'
+        :param coeffs: complex multipole coefficients a_p
+        :param dw: complex distances of the coordinates to the expansion center
+        :return: array of shape (n_output, len(dw))
+        """
+        inv_dw = 1.0 / dw
+        if function_name == "derivatives":
+            f = np.zeros_like(dw)
+            inv_dw_p = inv_dw
+            for a_p in coeffs:
+                f += a_p * inv_dw_p
+                inv_dw_p = inv_dw_p * inv_dw
+            return np.array([f.real, -f.imag])
+        df = np.zeros_like(dw)
+        inv_dw_p = inv_dw**2
+        for p, a_p in enumerate(coeffs):
+            df -= (p + 1) * a_p * inv_dw_p
+            inv_dw_p = inv_dw_p * inv_dw
+        return np.array([df.real, -df.imag, -df.imag, -df.real])
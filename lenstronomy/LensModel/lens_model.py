@@ -1,4 +1,5 @@
 __author__ = "sibirrer"
+import numpy as np
 from lenstronomy.LensModel.single_plane import SinglePlane
 from lenstronomy.LensModel.LineOfSight.single_plane_los import SinglePlaneLOS
 from lenstronomy.LensModel.LineOfSight.single_plane_los_flexion import (
@@ -42,6 +43,7 @@ class LensModel(object):
         cosmology_sampling=False,
         cosmology_model="FlatLambdaCDM",
         use_jax=False,
+        kwargs_profile_grouping=None,
     ):
         """
 
@@ -80,6 +82,9 @@ class LensModel(object):
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
             Only supported for MultiPlane(), MultiPlaneDecoupled(), and SinglePlane() at the moment
+        :param kwargs_profile_grouping: None or dict, if set, profiles of the same type are evaluated jointly with
+            broadcast arrays (see ProfileListBase for the options). Only supported for MultiPlane(),
+            MultiPlaneDecoupled(), and SinglePlane()
         """
         self.lens_model_list = lens_model_list
         self.z_lens = z_lens
@@ -183,6 +188,7 @@ class LensModel(object):
                     num_z_interp=num_z_interp,
                     profile_kwargs_list=profile_kwargs_list,
                     use_jax=use_jax,
+                    kwargs_profile_grouping=kwargs_profile_grouping,
                     **kwargs_multiplane_model
                 )
                 self.type = "MultiPlaneDecoupled"
@@ -203,6 +209,7 @@ class LensModel(object):
                     cosmology_sampling=cosmology_sampling,
                     cosmology_model=cosmology_model,
                     use_jax=use_jax,
+                    kwargs_profile_grouping=kwargs_profile_grouping,
                 )
                 self.type = "MultiPlane"
 
@@ -232,6 +239,7 @@ class LensModel(object):
                     z_source_convention=z_source_convention,
                     profile_kwargs_list=profile_kwargs_list,
                     use_jax=use_jax,
+                    kwargs_profile_grouping=kwargs_profile_grouping,
                 )
                 self.type = "SinglePlane"
                 if z_source is not None and z_source_convention is not None:
@@ -290,6 +298,29 @@ class LensModel(object):
         """
         return self.lens_model.ray_shooting(x, y, kwargs, k=k)
 
+    def ray_shooting_batch(self, x, y, kwargs_batch, k=None):
+        """Maps image to source positions for many samples of lens model parameters
+        (e.g. a particle swarm or an ensemble of walkers) at once. In single-plane
+        mode, profiles that support numpy broadcasting are evaluated in a single
+        vectorized call, all other profiles and lensing modes are evaluated sample by
+        sample.
+
+        :param x: x-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type y: numpy array
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in the lens model
+            param_names, or dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: source plane positions, each of shape (n_samples, n_points)
+        """
+        if self.type == "SinglePlane":
+            return self.lens_model.ray_shooting_batch(x, y, kwargs_batch, k=k)
+        return self._batch_loop(self.lens_model.ray_shooting, x, y, kwargs_batch, k=k)
+
     def fermat_potential(
         self, x_image, y_image, kwargs_lens, x_source=None, y_source=None
     ):
@@ -328,6 +359,31 @@ class LensModel(object):
                 "effective Fermat potential is evaluated"
             )
 
+    def fermat_potential_batch(self, x_image, y_image, kwargs_batch):
+        """Fermat potential for many samples of lens model parameters at once, with the
+        source positions ray-traced from the image positions (see fermat_potential()).
+        In single-plane mode, profiles that support numpy broadcasting are evaluated in
+        a single vectorized call, all other lensing modes are evaluated sample by
+        sample.
+
+        :param x_image: image positions, shared by all samples or of shape (n_samples,
+            n_points) with positions per sample
+        :param y_image: image positions, shared by all samples or of shape (n_samples,
+            n_points) with positions per sample
+        :param kwargs_batch: batched lens model parameters, see ray_shooting_batch()
+        :return: fermat potential in arcsec**2 of shape (n_samples, n_points)
+        """
+        if self.type == "SinglePlane":
+            return self.lens_model.fermat_potential_batch(
+                x_image, y_image, kwargs_batch
+            )
+        return self._batch_loop(
+            lambda x, y, kwargs, k=None: (self.fermat_potential(x, y, kwargs),),
+            x_image,
+            y_image,
+            kwargs_batch,
+        )[0]
+
     def arrival_time(
         self,
         x_image,
@@ -409,6 +465,72 @@ class LensModel(object):
                 "setting as analytical form of lensing potential is not available."
             )
 
+    def alpha_batch(self, x, y, kwargs_batch, k=None):
+        """Deflection angles for many samples of lens model parameters at once.
+
+        :param x: x-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type y: numpy array
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in the lens model
+            param_names, or dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: deflection angles in units of arcsec, each of shape (n_samples,
+            n_points)
+        """
+        if self.type == "SinglePlane":
+            return self.lens_model.alpha_batch(x, y, kwargs_batch, k=k)
+        return self._batch_loop(self.lens_model.alpha, x, y, kwargs_batch, k=k)
+
+    def hessian_batch(self, x, y, kwargs_batch, k=None):
+        """Hessian matrix for many samples of lens model parameters at once.
+
+        :param x: x-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type y: numpy array
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in the lens model
+            param_names, or dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: f_xx, f_xy, f_yx, f_yy components, each of shape (n_samples,
+            n_points)
+        """
+        if self.type == "SinglePlane":
+            return self.lens_model.hessian_batch(x, y, kwargs_batch, k=k)
+        return self._batch_loop(self.lens_model.hessian, x, y, kwargs_batch, k=k)
+
+    def _batch_loop(self, function, x, y, kwargs_batch, k=None):
+        """Evaluates a lensing function sample by sample for batched lens model
+        parameters.
+
+        :param function: lensing function with signature (x, y, kwargs, k=k)
+        :param x: x-position (preferentially arcsec)
+        :param y: y-position (preferentially arcsec)
+        :param kwargs_batch: batched lens model parameters, see ray_shooting_batch()
+        :param k: only evaluate the k-th lens model
+        :return: tuple of output arrays, each of shape (n_samples, n_points)
+        """
+        profile_list = getattr(self.lens_model, "multi_plane_base", self.lens_model)
+        x, y = profile_list._batch_coordinates(x, y)
+        kwargs_stacked, num_samples = profile_list._batch_kwargs(kwargs_batch)
+        output = None
+        for j in range(num_samples):
+            x_j, y_j = (x[j], y[j]) if x.ndim == 2 else (x, y)
+            output_j = function(
+                x_j, y_j, profile_list._kwargs_sample(kwargs_stacked, j), k=k
+            )
+            if output is None:
+                output = np.zeros((len(output_j), num_samples, x.shape[-1]))
+            for n, out in enumerate(output_j):
+                output[n, j] = out
+        return tuple(output)
+
     def hessian(self, x, y, kwargs, k=None, diff=None, diff_method="square"):
         """Hessian matrix.
 
@@ -4,6 +4,9 @@ from lenstronomy.Util.magnification_finite_util import setup_mag_finite
 
 __all__ = ["LensModelExtensions"]
 
+# maximum number of coordinates ray-traced in a single call by the batched routines
+_RAY_TRACING_CHUNK_SIZE = 2**15
+
 
 class LensModelExtensions(object):
     """Class with extension routines not part of the LensModel core routines."""
@@ -100,29 +103,15 @@ class LensModelExtensions(object):
         magnifications = []
 
         for xi, yi in zip(x_image, y_image):
-            if axis_ratio == 1:
-                grid_r = np.hypot(grid_x_0, grid_y_0)
-            else:
-                w1, w2, v11, v12, v21, v22 = self.hessian_eigenvectors(
-                    xi, yi, kwargs_lens
-                )
-                _v = [np.array([v11, v12]), np.array([v21, v22])]
-                _w = [abs(w1), abs(w2)]
-                if use_largest_eigenvalue:
-                    idx = int(np.argmax(_w))
-                else:
-                    idx = int(np.argmin(_w))
-                v = _v[idx]
-
-                rotation_angle = np.arctan(v[1] / v[0]) - np.pi / 2
-                grid_x, grid_y = util.rotate(grid_x_0, grid_y_0, rotation_angle)
-
-                if axis_ratio == 0:
-                    sort = np.argsort(_w)
-                    q = _w[sort[0]] / _w[sort[1]]
-                    grid_r = np.hypot(grid_x, grid_y / q).ravel()
-                else:
-                    grid_r = np.hypot(grid_x, grid_y / axis_ratio).ravel()
+            grid_r = self._adaptive_aperture_radius(
+                xi,
+                yi,
+                kwargs_lens,
+                grid_x_0,
+                grid_y_0,
+                axis_ratio,
+                use_largest_eigenvalue,
+            )
 
             flux_array = np.zeros_like(grid_x_0)
             step = step_size * grid_radius_arcsec
@@ -167,6 +156,261 @@ class LensModelExtensions(object):
 
         return np.array(magnifications)
 
+    def magnification_finite_adaptive_batch(
+        self,
+        x_image,
+        y_image,
+        kwargs_lens,
+        source_model,
+        kwargs_source,
+        grid_resolution,
+        grid_radius_arcsec,
+        axis_ratio=0.5,
+        tol=0.001,
+        step_size=0.05,
+        use_largest_eigenvalue=True,
+        fixed_aperture_size=False,
+    ):
+        """Batched version of magnification_finite_adaptive. The apertures of all
+        images grow simultaneously: at each growth step only the pixels of the new
+        annuli of the images that are not yet converged are ray-traced, in a single
+        call, and the convergence of the magnifications is tracked for each image.
+        Optionally, a stack of lens model realizations (e.g. different substructure
+        realizations of the same lens model list) can be provided.
+
+        The functions auto_raytracing_grid_size and auto_raytracing_grid_resolution give
+        good estimates for appropriate parameter choices for grid_radius_arcsec and
+        grid_resolution.
+
+        :param x_image: a list or array of x coordinates [units arcsec], or a 2d array
+            (realizations, images) if the image positions differ between realizations
+        :param y_image: a list or array of y coordinates [units arcsec], or a 2d array
+            (realizations, images) if the image positions differ between realizations
+        :param kwargs_lens: keyword arguments for the lens model, or a list of keyword
+            arguments of several lens model realizations
+        :param source_model: instance of LightModel for the source
+        :param kwargs_source: keyword arguments for the light profile of the source
+            (list of dictionary)
+        :param grid_resolution: the grid resolution in units arcsec/pixel
+        :param grid_radius_arcsec: the size of the ray tracing region in arcsec
+        :param axis_ratio: the axis ratio of the ellipse used for ray tracing; if
+            axis_ratio = 0, then the eigenvalues the hessian matrix will be used to
+            estimate an appropriate axis ratio
+        :param tol: tolerance for convergence in the magnification
+        :param step_size: sets the increment for the successively larger ray tracing
+            windows
+        :param use_largest_eigenvalue: bool; if True, then the major axis of the ray
+            tracing ellipse region will be aligned with the eigenvector corresponding to
+            the largest eigenvalue of the hessian matrix
+        :param fixed_aperture_size: bool, if True the flux is computed inside a fixed
+            aperture size with radius grid_radius_arcsec
+        :return: an array of image magnifications, with shape (realizations, images) if
+            a list of lens model realizations is provided
+        """
+        (
+            grid_x_0,
+            grid_y_0,
+            source_model,
+            kwargs_source,
+            grid_resolution,
+            grid_radius_arcsec,
+        ) = setup_mag_finite(
+            grid_radius_arcsec, grid_resolution, source_model, kwargs_source
+        )
+        grid_x_0, grid_y_0 = grid_x_0.ravel(), grid_y_0.ravel()
+
+        multiple_realizations = len(kwargs_lens) > 0 and not isinstance(
+            kwargs_lens[0], dict
+        )
+        kwargs_lens_list = kwargs_lens if multiple_realizations else [kwargs_lens]
+        x_image = np.array(x_image, dtype=float)
+        y_image = np.array(y_image, dtype=float)
+        if x_image.ndim == 1:
+            x_image = np.tile(x_image, (len(kwargs_lens_list), 1))
+            y_image = np.tile(y_image, (len(kwargs_lens_list), 1))
+
+        # edges of the annuli of the growing apertures
+        if fixed_aperture_size:
+            r_edges = [0, grid_radius_arcsec]
+        else:
+            step = step_size * grid_radius_arcsec
+            r_edges = [0, step]
+            while r_edges[-1] < grid_radius_arcsec:
+                r_edges.append(r_edges[-1] + step)
+        r_edges = np.array(r_edges)
+        num_annuli = len(r_edges) - 1
+
+        magnifications = np.zeros(x_image.shape)
+        for n, kwargs_lens_n in enumerate(kwargs_lens_list):
+            magnifications[n] = self._magnification_adaptive_batch(
+                x_image[n],
+                y_image[n],
+                kwargs_lens_n,
+                source_model,
+                kwargs_source,
+                grid_x_0,
+                grid_y_0,
+                grid_resolution,
+                r_edges,
+                num_annuli,
+                axis_ratio,
+                tol,
+                use_largest_eigenvalue,
+            )
+        if multiple_realizations:
+            return magnifications
+        return magnifications[0]
+
+    def _magnification_adaptive_batch(
+        self,
+        x_image,
+        y_image,
+        kwargs_lens,
+        source_model,
+        kwargs_source,
+        grid_x_0,
+        grid_y_0,
+        grid_resolution,
+        r_edges,
+        num_annuli,
+        axis_ratio,
+        tol,
+        use_largest_eigenvalue,
+    ):
+        """Finite-source magnifications of all images of a single lens model
+        realization with simultaneously growing apertures.
+
+        :param x_image: array of x coordinates of the images
+        :param y_image: array of y coordinates of the images
+        :param kwargs_lens: keyword arguments for the lens model
+        :param source_model: instance of LightModel for the source
+        :param kwargs_source: keyword arguments for the light profile of the source
+        :param grid_x_0: 1d array of x coordinates of the ray tracing grid
+        :param grid_y_0: 1d array of y coordinates of the ray tracing grid
+        :param grid_resolution: the grid resolution in units arcsec/pixel
+        :param r_edges: edges of the annuli of the growing apertures
+        :param num_annuli: number of annuli
+        :param axis_ratio: axis ratio of the apertures (see
+            magnification_finite_adaptive)
+        :param tol: tolerance for convergence in the magnification
+        :param use_largest_eigenvalue: bool, orientation of the apertures (see
+            magnification_finite_adaptive)
+        :return: array of image magnifications
+        """
+        minimum_magnification = 1e-5
+        num_image = len(x_image)
+        if num_image == 0:
+            return np.zeros(0)
+        eigen = None
+        if axis_ratio != 1:
+            eigen = self.hessian_eigenvectors(x_image, y_image, kwargs_lens)
+        # pixel indexes of each image sorted by annulus and the boundaries of the annuli
+        pixel_order, annulus_bounds = [], []
+        for i in range(num_image):
+            grid_r = self._adaptive_aperture_radius(
+                x_image[i],
+                y_image[i],
+                kwargs_lens,
+                grid_x_0,
+                grid_y_0,
+                axis_ratio,
+                use_largest_eigenvalue,
+                eigen=None if eigen is None else [e[i] for e in eigen],
+            )
+            inside = np.where(grid_r < r_edges[-1])[0]
+            annulus = np.searchsorted(r_edges, grid_r[inside], side="right") - 1
+            order = np.argsort(annulus, kind="stable")
+            pixel_order.append(inside[order])
+            annulus_bounds.append(
+                np.searchsorted(annulus[order], np.arange(num_annuli + 1))
+            )
+
+        magnification = np.zeros(num_image)
+        converged = np.zeros(num_image, dtype=bool)
+        for k in range(num_annuli):
+            active = np.where(~converged)[0]
+            pixels = [
+                pixel_order[i][annulus_bounds[i][k] : annulus_bounds[i][k + 1]]
+                for i in active
+            ]
+            image_index = np.repeat(active, [len(p) for p in pixels])
+            pixels = np.concatenate(pixels)
+            x = grid_x_0[pixels] + x_image[image_index]
+            y = grid_y_0[pixels] + y_image[image_index]
+            flux = np.zeros(len(pixels))
+            # ray-tracing in chunks keeps the temporary arrays of the lens profiles small
+            for start in range(0, len(pixels), _RAY_TRACING_CHUNK_SIZE):
+                chunk = slice(start, start + _RAY_TRACING_CHUNK_SIZE)
+                beta_x, beta_y = self._lensModel.ray_shooting(
+                    x[chunk], y[chunk], kwargs_lens
+                )
+                flux[chunk] = source_model.surface_brightness(
+                    beta_x, beta_y, kwargs_source
+                )
+            new_magnification = (
+                magnification
+                + np.bincount(image_index, weights=flux, minlength=num_image)
+                * grid_resolution**2
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                diff = np.abs(new_magnification - magnification) / new_magnification
+            converged[active] = (diff[active] < tol) & (
+                new_magnification[active] > minimum_magnification
+            )
+            magnification[active] = new_magnification[active]
+            if np.all(converged):
+                break
+        return magnification
+
+    def _adaptive_aperture_radius(
+        self,
+        x_image,
+        y_image,
+        kwargs_lens,
+        grid_x_0,
+        grid_y_0,
+        axis_ratio,
+        use_largest_eigenvalue,
+        eigen=None,
+    ):
+        """Elliptical radius of the ray tracing grid around an image, with the
+        aperture oriented along an eigenvector of the magnification tensor.
+
+        :param x_image: image x coordinate
+        :param y_image: image y coordinate
+        :param kwargs_lens: keyword arguments for the lens model
+        :param grid_x_0: 1d array of x coordinates of the ray tracing grid
+        :param grid_y_0: 1d array of y coordinates of the ray tracing grid
+        :param axis_ratio: axis ratio of the aperture (see
+            magnification_finite_adaptive)
+        :param use_largest_eigenvalue: bool, orientation of the aperture (see
+            magnification_finite_adaptive)
+        :param eigen: None or pre-computed output of hessian_eigenvectors at the image
+            position
+        :return: array of elliptical radii of the grid coordinates
+        """
+        if axis_ratio == 1:
+            return np.hypot(grid_x_0, grid_y_0)
+        if eigen is None:
+            eigen = self.hessian_eigenvectors(x_image, y_image, kwargs_lens)
+        w1, w2, v11, v12, v21, v22 = eigen
+        _v = [np.array([v11, v12]), np.array([v21, v22])]
+        _w = [abs(w1), abs(w2)]
+        if use_largest_eigenvalue:
+            idx = int(np.argmax(_w))
+        else:
+            idx = int(np.argmin(_w))
+        v = _v[idx]
+
+        rotation_angle = np.arctan(v[1] / v[0]) - np.pi / 2
+        grid_x, grid_y = util.rotate(grid_x_0, grid_y_0, rotation_angle)
+
+        if axis_ratio == 0:
+            sort = np.argsort(_w)
+            q = _w[sort[0]] / _w[sort[1]]
+            return np.hypot(grid_x, grid_y / q).ravel()
+        return np.hypot(grid_x, grid_y / axis_ratio).ravel()
+
     @staticmethod
     def _magnification_adaptive_iteration(
         flux_array,
@@ -390,23 +634,34 @@ class LensModelExtensions(object):
                 dec_crit_list += dec_crit  # list addition
         return np.array(ra_crit_list), np.array(dec_crit_list)
 
-    def caustic_area(self, kwargs_lens, kwargs_caustic_num, index_vertices=0):
+    def caustic_area(
+        self, kwargs_lens, kwargs_caustic_num=None, index_vertices=0, caustics=None
+    ):
         """Computes the area inside a connected caustic curve.
 
         :param kwargs_lens: lens model keyword argument list
         :param kwargs_caustic_num: keyword arguments for the numerical calculation of
             the caustics, as input of self.critical_curve_caustics()
         :param index_vertices: integer, index of connected vortex from the output of
-            self.critical_curve_caustics() of disconnected curves.
+            self.critical_curve_caustics() of disconnected curves. Both
+            self.critical_curve_caustics() and self.critical_curve_caustics_adaptive()
+            typically return the outer tangential critical curve (index 0) before the
+            inner radial one.
+        :param caustics: None or the output of self.critical_curve_caustics() or
+            self.critical_curve_caustics_adaptive(), which is then used instead of
+            re-computing the caustics
         :return: area within the caustic curve selected
         """
-
+        if caustics is None:
+            if kwargs_caustic_num is None:
+                kwargs_caustic_num = {}
+            caustics = self.critical_curve_caustics(kwargs_lens, **kwargs_caustic_num)
         (
             ra_crit_list,
             dec_crit_list,
             ra_caustic_list,
             dec_caustic_list,
-        ) = self.critical_curve_caustics(kwargs_lens, **kwargs_caustic_num)
+        ) = caustics
 
         # select specific vortex
         ra_caustic_inner = ra_caustic_list[index_vertices]
@@ -523,6 +778,318 @@ class LensModelExtensions(object):
             dec_caustic_list.append(dec_caustics)
         return ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list
 
+    def critical_curve_caustics_adaptive(
+        self,
+        kwargs_lens,
+        compute_window=5,
+        grid_scale=0.01,
+        start_scale=0.1,
+        center_x=0,
+        center_y=0,
+    ):
+        """Critical curves and caustics from the sign changes of the determinant of the
+        lensing Jacobian. The determinant is evaluated on a coarse grid and only the
+        cells in which it changes sign are successively split in four (with the new
+        points of all cells evaluated in a single call) until the grid_scale is reached.
+        The critical curves are then traced with marching squares on the refined cells
+        and ordered into connected polylines.
+
+        Critical curves that do not cross any edge of the coarse grid of size
+        start_scale (e.g. small loops around a low-mass perturber) can be missed.
+
+        :param kwargs_lens: lens model kwargs
+        :param compute_window: window size in arcsec where the critical curve is computed
+        :param grid_scale: maximum grid spacing of the refined cells
+        :param start_scale: grid spacing of the coarse grid
+        :param center_x: float, center of the window to compute critical curves and
+            caustics
+        :param center_y: float, center of the window to compute critical curves and
+            caustics
+        :return: lists of ra and dec arrays corresponding to different disconnected
+            critical curves and their caustic counterparts, ordered by decreasing area
+            enclosed by the critical curves (i.e. the outer tangential critical curve
+            first). Closed curves repeat their first vertex at the end.
+        """
+        # an even number of grid points avoids evaluating the center of the window
+        num_pix = int(compute_window / start_scale)
+        if num_pix % 2 == 1:
+            num_pix += 1
+        num_level = int(max(np.ceil(np.log2(start_scale / grid_scale)), 0))
+        x_0 = center_x - start_scale * (num_pix - 1) / 2.0
+        y_0 = center_y - start_scale * (num_pix - 1) / 2.0
+
+        # coarse grid and its cells with a sign change of the determinant
+        i_grid, j_grid = np.meshgrid(np.arange(num_pix), np.arange(num_pix))
+        i_grid, j_grid = i_grid.flatten(), j_grid.flatten()
+        det = self._jacobian_determinant(
+            x_0 + i_grid * start_scale, y_0 + j_grid * start_scale, kwargs_lens
+        ).reshape(num_pix, num_pix)
+        i_cell, j_cell = np.meshgrid(np.arange(num_pix - 1), np.arange(num_pix - 1))
+        i_cell, j_cell = i_cell.flatten(), j_cell.flatten()
+        corners = np.array(
+            [
+                det[j_cell, i_cell],
+                det[j_cell, i_cell + 1],
+                det[j_cell + 1, i_cell + 1],
+                det[j_cell + 1, i_cell],
+            ]
+        ).T
+        i_cell, j_cell, corners = self._sign_change_cells(i_cell, j_cell, corners)
+
+        # successive refinement of the cells crossed by the critical curves
+        scale = start_scale
+        num_cells = num_pix - 1
+        for level in range(num_level):
+            scale /= 2.0
+            num_cells *= 2
+            i_cell, j_cell, corners = self._refine_cells(
+                i_cell, j_cell, corners, x_0, y_0, scale, kwargs_lens
+            )
+            i_cell, j_cell, corners = self._close_cells(
+                i_cell, j_cell, corners, x_0, y_0, scale, num_cells, kwargs_lens
+            )
+
+        ra_crit_list, dec_crit_list = self._marching_squares(
+            i_cell, j_cell, corners, x_0, y_0, scale
+        )
+        # order the curves by decreasing enclosed area, such that the outer (tangential)
+        # critical curve comes first as in self.critical_curve_caustics()
+        areas = [
+            np.abs(np.sum(ra[:-1] * dec[1:] - ra[1:] * dec[:-1]))
+            for ra, dec in zip(ra_crit_list, dec_crit_list)
+        ]
+        order = np.argsort(areas, kind="stable")[::-1]
+        ra_crit_list = [ra_crit_list[i] for i in order]
+        dec_crit_list = [dec_crit_list[i] for i in order]
+        ra_caustic_list, dec_caustic_list = [], []
+        if len(ra_crit_list) > 0:
+            ra_caustics, dec_caustics = self._lensModel.ray_shooting(
+                np.concatenate(ra_crit_list), np.concatenate(dec_crit_list), kwargs_lens
+            )
+            split = np.cumsum([len(ra) for ra in ra_crit_list])[:-1]
+            ra_caustic_list = np.split(ra_caustics, split)
+            dec_caustic_list = np.split(dec_caustics, split)
+        return ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list
+
+    def _jacobian_determinant(self, x, y, kwargs_lens):
+        """Determinant of the lensing Jacobian (inverse magnification).
+
+        :param x: x-coordinates
+        :param y: y-coordinates
+        :param kwargs_lens: lens model kwargs
+        :return: determinant of the lensing Jacobian
+        """
+        f_xx, f_xy, f_yx, f_yy = self._lensModel.hessian(x, y, kwargs_lens)
+        return (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
+
+    @staticmethod
+    def _sign_change_cells(i_cell, j_cell, corners):
+        """Selects the cells in which the determinant changes sign.
+
+        :param i_cell: integer x-coordinates of the lower left corners of the cells
+        :param j_cell: integer y-coordinates of the lower left corners of the cells
+        :param corners: determinant at the corners (lower left, lower right, upper
+            right, upper left) of the cells, shape (n_cells, 4)
+        :return: i_cell, j_cell, corners of the selected cells
+        """
+        positive = corners > 0
+        change = np.any(positive, axis=1) & ~np.all(positive, axis=1)
+        return i_cell[change], j_cell[change], corners[change]
+
+    def _refine_cells(self, i_cell, j_cell, corners, x_0, y_0, scale, kwargs_lens):
+        """Splits the cells into four and keeps the sub-cells in which the
+        determinant changes sign. The determinant at the five new points per cell is
+        evaluated in a single call for all cells.
+
+        :param i_cell: integer x-coordinates of the lower left corners of the cells
+        :param j_cell: integer y-coordinates of the lower left corners of the cells
+        :param corners: determinant at the corners of the cells, shape (n_cells, 4)
+        :param x_0: x-coordinate of the lattice origin
+        :param y_0: y-coordinate of the lattice origin
+        :param scale: grid spacing of the refined cells
+        :param kwargs_lens: lens model kwargs
+        :return: i_cell, j_cell, corners of the refined cells
+        """
+        i_2, j_2 = 2 * i_cell, 2 * j_cell
+        # bottom, right, top, left edge centers and cell center
+        i_new = np.array([i_2 + 1, i_2 + 2, i_2 + 1, i_2, i_2 + 1]).T
+        j_new = np.array([j_2, j_2 + 1, j_2 + 2, j_2 + 1, j_2 + 1]).T
+        num_lattice = 2 * (np.max(i_cell, initial=0) + 1) + 1
+        key = (j_new * num_lattice + i_new).flatten()
+        key_unique, inverse = np.unique(key, return_inverse=True)
+        det_unique = self._jacobian_determinant(
+            x_0 + (key_unique % num_lattice) * scale,
+            y_0 + (key_unique // num_lattice) * scale,
+            kwargs_lens,
+        )
+        det_new = det_unique[inverse.flatten()].reshape(-1, 5)
+        d_00, d_10, d_11, d_01 = corners.T
+        d_b, d_r, d_t, d_l, d_c = det_new.T
+        i_cell = np.concatenate([i_2, i_2 + 1, i_2 + 1, i_2])
+        j_cell = np.concatenate([j_2, j_2, j_2 + 1, j_2 + 1])
+        corners = np.concatenate(
+            [
+                np.array([d_00, d_b, d_c, d_l]).T,
+                np.array([d_b, d_10, d_r, d_c]).T,
+                np.array([d_c, d_r, d_11, d_t]).T,
+                np.array([d_l, d_c, d_t, d_01]).T,
+            ]
+        )
+        return self._sign_change_cells(i_cell, j_cell, corners)
+
+    def _close_cells(
+        self, i_cell, j_cell, corners, x_0, y_0, scale, num_cells, kwargs_lens
+    ):
+        """Adds the missing neighboring cells across edges with a sign change of the
+        determinant, such that the traced critical curves are not interrupted where a
+        curve crosses a coarser cell edge twice.
+
+        :param i_cell: integer x-coordinates of the lower left corners of the cells
+        :param j_cell: integer y-coordinates of the lower left corners of the cells
+        :param corners: determinant at the corners of the cells, shape (n_cells, 4)
+        :param x_0: x-coordinate of the lattice origin
+        :param y_0: y-coordinate of the lattice origin
+        :param scale: grid spacing of the cells
+        :param num_cells: number of cells per axis covering the window
+        :param kwargs_lens: lens model kwargs
+        :return: i_cell, j_cell, corners including the neighboring cells
+        """
+        # edges: bottom, right, top, left as (start corner, end corner), neighbor offset
+        edges = [
+            ((0, 1), (0, -1)),
+            ((1, 2), (1, 0)),
+            ((3, 2), (0, 1)),
+            ((0, 3), (-1, 0)),
+        ]
+        offsets = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+        num_new = len(i_cell)
+        i_new, j_new, corners_new = i_cell, j_cell, corners
+        while num_new > 0:
+            key_set = j_cell * num_cells + i_cell
+            positive = corners_new > 0
+            i_list, j_list = [], []
+            for (a, b), (di, dj) in edges:
+                crossing = positive[:, a] != positive[:, b]
+                i_list.append(i_new[crossing] + di)
+                j_list.append(j_new[crossing] + dj)
+            i_n, j_n = np.concatenate(i_list), np.concatenate(j_list)
+            inside = (i_n >= 0) & (i_n < num_cells) & (j_n >= 0) & (j_n < num_cells)
+            key = np.unique(j_n[inside] * num_cells + i_n[inside])
+            key = key[~np.isin(key, key_set)]
+            num_new = len(key)
+            if num_new == 0:
+                break
+            i_new, j_new = key % num_cells, key // num_cells
+            det = self._jacobian_determinant(
+                x_0 + (i_new[:, np.newaxis] + offsets[:, 0]) * scale,
+                y_0 + (j_new[:, np.newaxis] + offsets[:, 1]) * scale,
+                kwargs_lens,
+            )
+            corners_new = det.reshape(num_new, 4)
+            i_cell = np.concatenate([i_cell, i_new])
+            j_cell = np.concatenate([j_cell, j_new])
+            corners = np.concatenate([corners, corners_new])
+        return i_cell, j_cell, corners
+
+    @staticmethod
+    def _marching_squares(i_cell, j_cell, corners, x_0, y_0, scale):
+        """Traces the zero-level of the determinant through the cells and connects the
+        segments into ordered polylines.
+
+        :param i_cell: integer x-coordinates of the lower left corners of the cells
+        :param j_cell: integer y-coordinates of the lower left corners of the cells
+        :param corners: determinant at the corners of the cells, shape (n_cells, 4)
+        :param x_0: x-coordinate of the lattice origin
+        :param y_0: y-coordinate of the lattice origin
+        :param scale: grid spacing of the cells
+        :return: list of ra arrays, list of dec arrays of the polylines
+        """
+        if len(i_cell) == 0:
+            return [], []
+        # edges: bottom, right, top, left as (start corner, end corner)
+        edge_corners = [(0, 1), (1, 2), (3, 2), (0, 3)]
+        positive = corners > 0
+        crossing = np.array(
+            [positive[:, a] != positive[:, b] for a, b in edge_corners]
+        ).T
+        # unique keys of the lattice edges: 2 * lattice point + orientation
+        num_lattice = np.max(i_cell) + 2
+        point = j_cell * num_lattice + i_cell
+        edge_key = np.array(
+            [
+                2 * point,
+                2 * (point + 1) + 1,
+                2 * (point + num_lattice),
+                2 * point + 1,
+            ]
+        ).T
+        # crossing points interpolated linearly along the edges
+        offsets = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        edge_x, edge_y = np.zeros((len(i_cell), 4)), np.zeros((len(i_cell), 4))
+        for e, (a, b) in enumerate(edge_corners):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = corners[:, a] / (corners[:, a] - corners[:, b])
+            t = np.clip(np.nan_to_num(t, nan=0.5), 0, 1)
+            edge_x[:, e] = i_cell + offsets[a][0] + t * (offsets[b][0] - offsets[a][0])
+            edge_y[:, e] = j_cell + offsets[a][1] + t * (offsets[b][1] - offsets[a][1])
+
+        # segments of cells with two crossings
+        num_crossing = np.sum(crossing, axis=1)
+        single = np.where(num_crossing == 2)[0]
+        edge_index = np.argsort(~crossing[single], axis=1, kind="stable")[:, :2]
+        segment_cell = [single, single]
+        segment_edge = [edge_index[:, 0], edge_index[:, 1]]
+        # saddle cells with four crossings, disambiguated with the cell center
+        saddle = np.where(num_crossing == 4)[0]
+        center_positive = np.mean(corners[saddle], axis=1) > 0
+        same = center_positive == positive[saddle, 0]
+        for pair_same, pair_other in [((0, 1), (0, 3)), ((3, 2), (1, 2))]:
+            segment_cell.append(saddle)
+            segment_cell.append(saddle)
+            segment_edge.append(np.where(same, pair_same[0], pair_other[0]))
+            segment_edge.append(np.where(same, pair_same[1], pair_other[1]))
+        cells_a = np.concatenate(segment_cell[0::2])
+        cells_b = np.concatenate(segment_cell[1::2])
+        edges_a = np.concatenate(segment_edge[0::2])
+        edges_b = np.concatenate(segment_edge[1::2])
+        key_a, key_b = edge_key[cells_a, edges_a], edge_key[cells_b, edges_b]
+        position = {}
+        for cells, edges, keys in [
+            (cells_a, edges_a, key_a),
+            (cells_b, edges_b, key_b),
+        ]:
+            for k, x, y in zip(keys, edge_x[cells, edges], edge_y[cells, edges]):
+                position[k] = (x, y)
+
+        # connect the segments through their shared edges
+        neighbors = {}
+        for a, b in zip(key_a.tolist(), key_b.tolist()):
+            neighbors.setdefault(a, []).append(b)
+            neighbors.setdefault(b, []).append(a)
+        visited = set()
+        ra_list, dec_list = [], []
+        # open curves start at an end point, closed curves at any point
+        starts = [k for k, v in neighbors.items() if len(v) == 1] + list(neighbors)
+        for start in starts:
+            if start in visited:
+                continue
+            path = [start]
+            visited.add(start)
+            current = start
+            while True:
+                candidates = [k for k in neighbors[current] if k not in visited]
+                if len(candidates) == 0:
+                    if len(path) > 2 and start in neighbors[current]:
+                        path.append(start)
+                    break
+                current = candidates[0]
+                visited.add(current)
+                path.append(current)
+            xy = np.array([position[k] for k in path])
+            ra_list.append(x_0 + xy[:, 0] * scale)
+            dec_list.append(y_0 + xy[:, 1] * scale)
+        return ra_list, dec_list
+
     def hessian_eigenvectors(self, x, y, kwargs_lens, diff=None):
         """Computes magnification eigenvectors at position (x, y)
 
@@ -1,4 +1,6 @@
+import numpy as np
 from lenstronomy.Util.util import convert_bool_list
+from lenstronomy.LensModel.Util.multipole_tree import MultipoleTree
 
 __all__ = ["ProfileListBase"]
 
@@ -127,6 +129,55 @@ DYNAMIC_PROFILES = [
     "TRIPLE_CHAMELEON",
 ]
 
+# These models evaluate their derivatives and hessians with pure numpy broadcasting such that
+# parameters with shape (n_samples, 1) and coordinates with shape (1, n_points) return the
+# (n_samples, n_points) results in a single call. All other models are evaluated sample by sample
+# in the batched evaluation routines.
+BATCH_BROADCAST_PROFILES = [
+    "CORED_DENSITY",
+    "CORED_DENSITY_2",
+    "CORED_DENSITY_2_MST",
+    "CORED_DENSITY_EXP",
+    "CORED_DENSITY_EXP_MST",
+    "CORED_DENSITY_MST",
+    "CORED_DENSITY_ULDM_MST",
+    "CSE",
+    "DIPOLE",
+    "EPL",
+    "EPL_BOXYDISKY",
+    "EPL_MULTIPOLE_M1M3M4",
+    "EPL_MULTIPOLE_M3M4",
+    "EPL_Q_PHI",
+    "FLEXION",
+    "FLEXIONFG",
+    "GAUSSIAN",
+    "GAUSSIAN_ELLIPSE_POTENTIAL",
+    "GAUSSIAN_POTENTIAL",
+    "HERNQUIST",
+    "HERNQUIST_ELLIPSE_POTENTIAL",
+    "HERNQUIST_ELLIPSE_CSE",
+    "NFW",
+    "NFW_ELLIPSE_CSE",
+    "NIE_POTENTIAL",
+    "POINT_MASS",
+    "POINT_MASS_LOG_SCALED",
+    "SERSIC",
+    "SERSIC_ELLIPSE_POTENTIAL",
+    "SPP",
+    "TNFW",
+]
+
+# Truncated models that can be replaced by a point mass of the same total mass when all the
+# evaluated coordinates are far outside of the truncation radius (see kwargs_profile_grouping).
+TRUNCATED_POINT_MASS_PROFILES = ["TNFW"]
+
+# Models with a finite total mass that can be approximated by the tree code (see
+# kwargs_profile_grouping and lenstronomy.LensModel.Util.multipole_tree).
+TREE_CODE_PROFILES = ["POINT_MASS"] + TRUNCATED_POINT_MASS_PROFILES
+
+# number of outputs of the profile functions that can be evaluated in groups
+_GROUPED_FUNCTION_NUM_OUTPUT = {"derivatives": 2, "hessian": 4}
+
 
 class ProfileListBase(object):
     """Class that manages the list of lens model class instances.
@@ -141,6 +192,7 @@ class ProfileListBase(object):
         lens_redshift_list=None,
         z_source_convention=None,
         use_jax=False,
+        kwargs_profile_grouping=None,
     ):
         """
 
@@ -150,6 +202,19 @@ class ProfileListBase(object):
             profile will be initialized using default settings.
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
+        :param kwargs_profile_grouping: None or dict. If a dict is provided, lens models of the same profile
+            (e.g. hundreds of NFW or TNFW sub-halos) are stacked and evaluated in a single broadcast call
+            (n_profiles x n_points) for the deflection angles and the Hessian. Supported keys are
+            'truncation_factor' (float or None, default None): models in TRUNCATED_POINT_MASS_PROFILES whose
+            truncation radius times this factor is smaller than the distance to all evaluated coordinates are
+            replaced by a point mass of the same total mass;
+            'max_chunk_size' (int, default 10**4): maximum number of elements of the broadcast arrays;
+            'opening_angle' (float or None, default None): if set, models in TREE_CODE_PROFILES are evaluated with a
+            quadtree (Barnes-Hut) approximation, cells of the tree seen under a smaller ratio of cell radius and
+            distance are approximated by a multipole expansion of their mass (the truncation_factor then defaults
+            to 10);
+            'multipole_order' (int, default 4): highest order of the multipole expansion;
+            'leaf_size' (int, default 8): maximum number of models in a leaf of the tree
         """
         self.func_list = self._load_model_instances(
             lens_model_list,
@@ -160,12 +225,25 @@ class ProfileListBase(object):
         )
         self._num_func = len(self.func_list)
         self._model_list = lens_model_list
+        if isinstance(use_jax, bool):
+            use_jax = [use_jax] * self._num_func
+        self._batch_broadcast = [
+            lens_type in BATCH_BROADCAST_PROFILES and use_jax[i] is False
+            for i, lens_type in enumerate(lens_model_list)
+        ]
 
         name_list = []
         for i, func in enumerate(self.func_list):
             name_list.append(func.param_names)
         self._param_name_list = name_list
 
+        self._kwargs_profile_grouping = kwargs_profile_grouping
+        self._profile_groups_cache = {}
+        if kwargs_profile_grouping is not None:
+            from lenstronomy.LensModel.Profiles.point_mass import PointMass
+
+            self._point_mass = PointMass()
+
     def _load_model_instances(
         self,
         lens_model_list,
@@ -237,6 +315,329 @@ class ProfileListBase(object):
         """
         return convert_bool_list(n=self._num_func, k=k)
 
+    def _batch_kwargs(self, kwargs_batch):
+        """Converts batched lens model parameters into a list of dictionaries with one
+        array entry of length n_samples per parameter.
+
+        :param kwargs_batch: list (one entry per lens model) of either a 2d array of
+            shape (n_samples, n_params) with the columns ordered as in
+            param_name_list, or a dictionary with parameter names as keys and floats or
+            arrays of length n_samples as values
+        :return: list of dictionaries of arrays of length n_samples, n_samples
+        """
+        if len(kwargs_batch) != self._num_func:
+            raise ValueError(
+                "length of batched parameter list %s does not match length of lens models %s"
+                % (len(kwargs_batch), self._num_func)
+            )
+        kwargs_stacked = []
+        for i, kwargs_i in enumerate(kwargs_batch):
+            if isinstance(kwargs_i, dict):
+                kwargs_stacked.append(
+                    {key: np.atleast_1d(value) for key, value in kwargs_i.items()}
+                )
+            else:
+                param_array = np.atleast_2d(np.asarray(kwargs_i, dtype=float))
+                names = self._param_name_list[i]
+                if param_array.shape[1] != len(names):
+                    raise ValueError(
+                        "batched parameter array of lens model %s (%s) has %s columns but the model "
+                        "requires the parameters %s."
+                        % (i, self._model_list[i], param_array.shape[1], names)
+                    )
+                kwargs_stacked.append(
+                    {name: param_array[:, j] for j, name in enumerate(names)}
+                )
+        num_samples = 1
+        for kwargs_i in kwargs_stacked:
+            for value in kwargs_i.values():
+                if len(value) != 1:
+                    if num_samples != 1 and len(value) != num_samples:
+                        raise ValueError(
+                            "batched parameters have inconsistent numbers of samples (%s and %s)."
+                            % (num_samples, len(value))
+                        )
+                    num_samples = len(value)
+        for kwargs_i in kwargs_stacked:
+            for key, value in kwargs_i.items():
+                kwargs_i[key] = np.broadcast_to(value, (num_samples,))
+        return kwargs_stacked, num_samples
+
+    @staticmethod
+    def _batch_coordinates(x, y):
+        """Coordinates of the batched functions as float arrays, either flattened (shared
+        by all samples) or of shape (n_samples, n_points) (positions per sample).
+
+        :param x: x-coordinates
+        :param y: y-coordinates
+        :return: x, y
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        if x.ndim == 2:
+            return x, y
+        return x.flatten(), y.flatten()
+
+    @staticmethod
+    def _kwargs_sample(kwargs_stacked, j):
+        """Keyword argument list of a single sample of batched lens model parameters.
+
+        :param kwargs_stacked: list of dictionaries of arrays as returned by
+            _batch_kwargs()
+        :param j: index of the sample
+        :return: list of keyword arguments of lens model parameters
+        """
+        return [
+            {key: value[j] for key, value in kwargs_i.items()}
+            for kwargs_i in kwargs_stacked
+        ]
+
+    def _batch_function(self, i, function, x, y, kwargs_i, num_samples):
+        """Evaluates a profile function for all samples of batched parameters. Models
+        listed in BATCH_BROADCAST_PROFILES are evaluated in a single broadcast call, all
+        other models sample by sample.
+
+        :param i: index of the lens model
+        :param function: bound profile method, e.g. func.derivatives
+        :param x: 1d array of x-coordinates shared by all samples or 2d array of shape
+            (num_samples, n_points)
+        :param y: 1d array of y-coordinates shared by all samples or 2d array of shape
+            (num_samples, n_points)
+        :param kwargs_i: dictionary of parameter arrays of length num_samples
+        :param num_samples: number of samples
+        :return: array of shape (n_output, num_samples, n_points)
+        """
+        num_points = x.shape[-1]
+        if self._batch_broadcast[i] is True:
+            kwargs_broadcast = {
+                key: value[:, np.newaxis] for key, value in kwargs_i.items()
+            }
+            output = function(np.atleast_2d(x), np.atleast_2d(y), **kwargs_broadcast)
+            return np.array(
+                [np.broadcast_to(out, (num_samples, num_points)) for out in output]
+            )
+        output = None
+        for j in range(num_samples):
+            x_j, y_j = (x[j], y[j]) if x.ndim == 2 else (x, y)
+            output_j = function(
+                x_j, y_j, **{key: value[j] for key, value in kwargs_i.items()}
+            )
+            if output is None:
+                output = np.zeros((len(output_j), num_samples, num_points))
+            for n, out in enumerate(output_j):
+                output[n, j] = out
+        return output
+
+    @property
+    def profile_grouping(self):
+        """Whether the lens models are evaluated in groups of the same profile.
+
+        :return: bool
+        """
+        return self._kwargs_profile_grouping is not None
+
+    def _profile_groups(self, index_list):
+        """Groups the lens models that share the same profile instance and support
+        broadcasting. All other lens models form groups of their own. The grouping is
+        cached for each index list.
+
+        :param index_list: list of indexes of the lens models to be evaluated
+        :return: list of lists of indexes
+        """
+        key = tuple(index_list)
+        if key not in self._profile_groups_cache:
+            groups = {}
+            single_list = []
+            for i in index_list:
+                if (
+                    self._batch_broadcast[i] is True
+                    and self._model_list[i] not in DYNAMIC_PROFILES
+                ):
+                    groups.setdefault(id(self.func_list[i]), []).append(i)
+                else:
+                    single_list.append([i])
+            self._profile_groups_cache[key] = list(groups.values()) + single_list
+        return self._profile_groups_cache[key]
+
+    def _grouped_function(
+        self, function_name, x, y, kwargs, index_list, return_error=False
+    ):
+        """Sum of a profile function over the lens models in index_list, evaluating
+        the lens models of the same profile in groups.
+
+        :param function_name: 'derivatives' or 'hessian'
+        :param x: numpy array of x-coordinates
+        :param y: numpy array of y-coordinates
+        :param kwargs: list of keyword arguments of the lens models
+        :param index_list: list of indexes of the lens models to be evaluated
+        :param return_error: bool, if True, also returns the upper bound of the
+            multipole truncation error of the tree code on the deflection angle
+        :return: list of the summed outputs of the profile function, each of the shape of
+            x (and the error bound of the shape of x)
+        """
+        x_, y_ = x.flatten(), y.flatten()
+        output = np.zeros((_GROUPED_FUNCTION_NUM_OUTPUT[function_name], len(x_)))
+        error = np.zeros(len(x_))
+        for group in self._profile_groups(index_list):
+            output_group, error_group = self._group_function(
+                function_name, x_, y_, kwargs, group
+            )
+            output += output_group
+            error += error_group
+        output = [out.reshape(x.shape) for out in output]
+        if return_error is True:
+            return output, error.reshape(x.shape)
+        return output
+
+    def _group_function(self, function_name, x, y, kwargs, group):
+        """Sum of a profile function over a group of lens models sharing the same
+        profile.
+
+        :param function_name: 'derivatives' or 'hessian'
+        :param x: 1d array of x-coordinates
+        :param y: 1d array of y-coordinates
+        :param kwargs: list of keyword arguments of the lens models
+        :param group: list of indexes of lens models sharing the same profile instance
+        :return: array of shape (n_output, len(x)), upper bound of the multipole
+            truncation error on the deflection angle of shape len(x)
+        """
+        function = getattr(self.func_list[group[0]], function_name)
+        keys = kwargs[group[0]].keys()
+        if len(group) == 1 or any(kwargs[i].keys() != keys for i in group):
+            output = np.zeros((_GROUPED_FUNCTION_NUM_OUTPUT[function_name], len(x)))
+            for i in group:
+                output += np.array(
+                    [
+                        np.broadcast_to(out, x.shape)
+                        for out in function(x, y, **kwargs[i])
+                    ]
+                )
+            return output, np.zeros(len(x))
+        kwargs_stacked = {
+            key: np.array([kwargs[i][key] for i in group], dtype=float) for key in keys
+        }
+        model_type = self._model_list[group[0]]
+        opening_angle = self._kwargs_profile_grouping.get("opening_angle")
+        truncation_factor = self._kwargs_profile_grouping.get("truncation_factor")
+        if opening_angle is not None and model_type in TREE_CODE_PROFILES:
+            if truncation_factor is None:
+                truncation_factor = 10
+            mass, extent = self._point_mass_equivalent(
+                model_type, self.func_list[group[0]], kwargs_stacked, truncation_factor
+            )
+            tree = MultipoleTree(
+                kwargs_stacked.get("center_x", np.zeros(len(mass))),
+                kwargs_stacked.get("center_y", np.zeros(len(mass))),
+                mass,
+                extent=extent,
+                leaf_size=self._kwargs_profile_grouping.get("leaf_size", 8),
+                order=self._kwargs_profile_grouping.get("multipole_order", 4),
+            )
+
+            def _exact_function(x_, y_, index):
+                kwargs_sub = {
+                    key: value[index] for key, value in kwargs_stacked.items()
+                }
+                return self._broadcast_sum(function, x_, y_, kwargs_sub)
+
+            return tree.evaluate(
+                function_name, x, y, _exact_function, opening_angle=opening_angle
+            )
+        if (
+            truncation_factor is not None
+            and model_type in TRUNCATED_POINT_MASS_PROFILES
+        ):
+            mass, extent = self._point_mass_equivalent(
+                model_type, self.func_list[group[0]], kwargs_stacked, truncation_factor
+            )
+            far = self._far_from_coordinates(x, y, kwargs_stacked, extent)
+            if np.any(far):
+                kwargs_point_mass = {
+                    "theta_E": np.sqrt(mass[far]),
+                    "center_x": kwargs_stacked.get("center_x", np.zeros(len(mass)))[
+                        far
+                    ],
+                    "center_y": kwargs_stacked.get("center_y", np.zeros(len(mass)))[
+                        far
+                    ],
+                }
+                kwargs_stacked = {
+                    key: value[~far] for key, value in kwargs_stacked.items()
+                }
+                output = self._broadcast_sum(
+                    getattr(self._point_mass, function_name), x, y, kwargs_point_mass
+                ) + self._broadcast_sum(function, x, y, kwargs_stacked)
+                return output, np.zeros(len(x))
+        return self._broadcast_sum(function, x, y, kwargs_stacked), np.zeros(len(x))
+
+    @staticmethod
+    def _point_mass_equivalent(model_type, func, kwargs_stacked, truncation_factor):
+        """Einstein radii squared of point masses with the same total mass as the lens
+        models and the radii beyond which the lens models act as point masses.
+
+        :param model_type: lens model name in TREE_CODE_PROFILES
+        :param func: profile instance of the lens models
+        :param kwargs_stacked: dictionary of parameter arrays of length n_profiles
+        :param truncation_factor: radius in units of the truncation radius beyond which
+            truncated profiles are treated as point masses
+        :return: Einstein radius squared, extent; arrays of length n_profiles
+        """
+        if model_type in ["POINT_MASS"]:
+            mass = kwargs_stacked["theta_E"] ** 2
+            return mass, np.zeros(len(mass))
+        rho0 = func.alpha2rho0(kwargs_stacked["alpha_Rs"], kwargs_stacked["Rs"])
+        mass = func.mass_tot(kwargs_stacked["Rs"], rho0, kwargs_stacked["r_trunc"])
+        return mass / np.pi, truncation_factor * kwargs_stacked["r_trunc"]
+
+    def _broadcast_sum(self, function, x, y, kwargs_stacked):
+        """Evaluates a profile function with stacked parameters in a broadcast call
+        (chunked in the number of profiles) and sums over the profiles.
+
+        :param function: bound profile method, e.g. func.derivatives
+        :param x: 1d array of x-coordinates
+        :param y: 1d array of y-coordinates
+        :param kwargs_stacked: dictionary of parameter arrays of length n_profiles
+        :return: array of shape (n_output, len(x))
+        """
+        output = 0
+        num_profiles = len(next(iter(kwargs_stacked.values())))
+        max_chunk_size = self._kwargs_profile_grouping.get("max_chunk_size", 10**4)
+        chunk = max(1, int(max_chunk_size / max(len(x), 1)))
+        for start in range(0, num_profiles, chunk):
+            kwargs_chunk = {
+                key: value[start : start + chunk, np.newaxis]
+                for key, value in kwargs_stacked.items()
+            }
+            output_chunk = function(x[np.newaxis, :], y[np.newaxis, :], **kwargs_chunk)
+            num_chunk = min(chunk, num_profiles - start)
+            output = output + np.array(
+                [
+                    np.sum(np.broadcast_to(out, (num_chunk, len(x))), axis=0)
+                    for out in output_chunk
+                ]
+            )
+        return output
+
+    @staticmethod
+    def _far_from_coordinates(x, y, kwargs_stacked, radius):
+        """Selects the profiles whose center is further than a given radius from all
+        coordinates. The distance is conservatively estimated from the bounding box of
+        the coordinates.
+
+        :param x: 1d array of x-coordinates
+        :param y: 1d array of y-coordinates
+        :param kwargs_stacked: dictionary of parameter arrays of length n_profiles
+        :param radius: array of radii of length n_profiles
+        :return: bool array of length n_profiles
+        """
+        if len(x) == 0:
+            return np.zeros(len(radius), dtype=bool)
+        center_x = kwargs_stacked.get("center_x", np.zeros(len(radius)))
+        center_y = kwargs_stacked.get("center_y", np.zeros(len(radius)))
+        dx = np.maximum(np.maximum(np.min(x) - center_x, center_x - np.max(x)), 0)
+        dy = np.maximum(np.maximum(np.min(y) - center_y, center_y - np.max(y)), 0)
+        return dx**2 + dy**2 > radius**2
+
     def set_static(self, kwargs_list):
         """
 
@@ -17,6 +17,7 @@ class SinglePlane(ProfileListBase):
         z_source_convention=None,
         alpha_scaling=1,
         use_jax=False,
+        kwargs_profile_grouping=None,
     ):
         """
 
@@ -27,6 +28,8 @@ class SinglePlane(ProfileListBase):
         :param alpha_scaling: scaling factor of deflection angle relative to z_source_convention
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
+        :param kwargs_profile_grouping: None or dict, settings of the grouped evaluation of lens models
+            of the same profile in alpha() and hessian(), see ProfileListBase
         """
         self._alpha_scaling = alpha_scaling
         ProfileListBase.__init__(
@@ -36,6 +39,7 @@ class SinglePlane(ProfileListBase):
             lens_redshift_list=lens_redshift_list,
             z_source_convention=z_source_convention,
             use_jax=use_jax,
+            kwargs_profile_grouping=kwargs_profile_grouping,
         )
 
     def ray_shooting(self, x, y, kwargs, k=None):
@@ -120,18 +124,49 @@ class SinglePlane(ProfileListBase):
             f_x, f_y = self.func_list[k].derivatives(x, y, **kwargs[k])
             return np.asarray(f_x), np.asarray(f_y)
         bool_list = self._bool_list(k)
-        f_x, f_y = np.zeros_like(x), np.zeros_like(x)
-        for i, func in enumerate(self.func_list):
-            if bool_list[i] is True:
-                f_x_i, f_y_i = func.derivatives(x, y, **kwargs[i])
-                f_x += f_x_i
-                f_y += f_y_i
+        if self.profile_grouping:
+            index_list = [i for i in range(self._num_func) if bool_list[i] is True]
+            f_x, f_y = self._grouped_function("derivatives", x, y, kwargs, index_list)
+        else:
+            f_x, f_y = np.zeros_like(x), np.zeros_like(x)
+            for i, func in enumerate(self.func_list):
+                if bool_list[i] is True:
+                    f_x_i, f_y_i = func.derivatives(x, y, **kwargs[i])
+                    f_x += f_x_i
+                    f_y += f_y_i
 
         return (
             np.asarray(f_x) * self._alpha_scaling,
             np.asarray(f_y) * self._alpha_scaling,
         )
 
+    def alpha_error_estimate(self, x, y, kwargs, k=None):
+        """Upper bound of the error of the deflection angles introduced by the
+        multipole expansion of the tree code (see 'opening_angle' in
+        kwargs_profile_grouping). The bound does not include the mass of truncated
+        profiles beyond truncation_factor * r_trunc.
+
+        :param x: x-position (preferentially arcsec)
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec)
+        :type y: numpy array
+        :param kwargs: list of keyword arguments of lens model parameters matching the
+            lens model classes
+        :param k: only evaluate the k-th lens model
+        :return: upper bound of the absolute error of the deflection angle in units of
+            arcsec
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        if not self.profile_grouping:
+            return np.zeros_like(x)
+        bool_list = self._bool_list(k)
+        index_list = [i for i in range(self._num_func) if bool_list[i] is True]
+        _, error = self._grouped_function(
+            "derivatives", x, y, kwargs, index_list, return_error=True
+        )
+        return error * np.abs(self._alpha_scaling)
+
     def hessian(self, x, y, kwargs, k=None):
         """Hessian matrix.
 
@@ -158,26 +193,168 @@ class SinglePlane(ProfileListBase):
             )
 
         bool_list = self._bool_list(k)
-        f_xx, f_xy, f_yx, f_yy = (
-            np.zeros_like(x),
-            np.zeros_like(x),
-            np.zeros_like(x),
-            np.zeros_like(x),
+        if self.profile_grouping:
+            index_list = [i for i in range(self._num_func) if bool_list[i] is True]
+            f_xx, f_xy, f_yx, f_yy = self._grouped_function(
+                "hessian", x, y, kwargs, index_list
+            )
+        else:
+            f_xx, f_xy, f_yx, f_yy = (
+                np.zeros_like(x),
+                np.zeros_like(x),
+                np.zeros_like(x),
+                np.zeros_like(x),
+            )
+            for i, func in enumerate(self.func_list):
+                if bool_list[i] is True:
+                    f_xx_i, f_xy_i, f_yx_i, f_yy_i = func.hessian(x, y, **kwargs[i])
+                    f_xx += f_xx_i
+                    f_xy += f_xy_i
+                    f_yx += f_yx_i
+                    f_yy += f_yy_i
+        return (
+            np.asarray(f_xx) * self._alpha_scaling,
+            np.asarray(f_xy) * self._alpha_scaling,
+            np.asarray(f_yx) * self._alpha_scaling,
+            np.asarray(f_yy) * self._alpha_scaling,
         )
+
+    def ray_shooting_batch(self, x, y, kwargs_batch, k=None):
+        """Maps image to source positions for many samples of lens model parameters at
+        once.
+
+        :param x: x-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type y: numpy array
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in param_name_list, or
+            dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: source plane positions, each of shape (n_samples, n_points)
+        """
+        x, y = self._batch_coordinates(x, y)
+        f_x, f_y = self.alpha_batch(x, y, kwargs_batch, k=k)
+        return x - f_x, y - f_y
+
+    def alpha_batch(self, x, y, kwargs_batch, k=None):
+        """Deflection angles for many samples of lens model parameters at once.
+
+        :param x: x-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type y: numpy array
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in param_name_list, or
+            dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: deflection angles in units of arcsec, each of shape (n_samples,
+            n_points)
+        """
+        x, y = self._batch_coordinates(x, y)
+        kwargs_stacked, num_samples = self._batch_kwargs(kwargs_batch)
+        bool_list = self._bool_list(k)
+        f_x, f_y = np.zeros((2, num_samples, x.shape[-1]))
+        for i, func in enumerate(self.func_list):
+            if bool_list[i] is True:
+                f_x_i, f_y_i = self._batch_function(
+                    i, func.derivatives, x, y, kwargs_stacked[i], num_samples
+                )
+                f_x += f_x_i
+                f_y += f_y_i
+        return f_x * self._alpha_scaling, f_y * self._alpha_scaling
+
+    def hessian_batch(self, x, y, kwargs_batch, k=None):
+        """Hessian matrix for many samples of lens model parameters at once.
+
+        :param x: x-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type y: numpy array
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in param_name_list, or
+            dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: f_xx, f_xy, f_yx, f_yy components, each of shape (n_samples,
+            n_points)
+        """
+        x, y = self._batch_coordinates(x, y)
+        kwargs_stacked, num_samples = self._batch_kwargs(kwargs_batch)
+        bool_list = self._bool_list(k)
+        f_xx, f_xy, f_yx, f_yy = np.zeros((4, num_samples, x.shape[-1]))
         for i, func in enumerate(self.func_list):
             if bool_list[i] is True:
-                f_xx_i, f_xy_i, f_yx_i, f_yy_i = func.hessian(x, y, **kwargs[i])
+                f_xx_i, f_xy_i, f_yx_i, f_yy_i = self._batch_function(
+                    i, func.hessian, x, y, kwargs_stacked[i], num_samples
+                )
                 f_xx += f_xx_i
                 f_xy += f_xy_i
                 f_yx += f_yx_i
                 f_yy += f_yy_i
         return (
-            np.asarray(f_xx) * self._alpha_scaling,
-            np.asarray(f_xy) * self._alpha_scaling,
-            np.asarray(f_yx) * self._alpha_scaling,
-            np.asarray(f_yy) * self._alpha_scaling,
+            f_xx * self._alpha_scaling,
+            f_xy * self._alpha_scaling,
+            f_yx * self._alpha_scaling,
+            f_yy * self._alpha_scaling,
         )
 
+    def potential_batch(self, x, y, kwargs_batch, k=None):
+        """Lensing potential for many samples of lens model parameters at once.
+
+        :param x: x-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec), shared by all samples or of shape
+            (n_samples, n_points) with positions per sample
+        :type y: numpy array
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in param_name_list, or
+            dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: lensing potential in units of arcsec^2 of shape (n_samples, n_points)
+        """
+        x, y = self._batch_coordinates(x, y)
+        kwargs_stacked, num_samples = self._batch_kwargs(kwargs_batch)
+        bool_list = self._bool_list(k)
+        potential = np.zeros((num_samples, x.shape[-1]))
+        for i, func in enumerate(self.func_list):
+            if bool_list[i] is True:
+                potential += self._batch_function(
+                    i,
+                    lambda *args, **kwargs: (func.function(*args, **kwargs),),
+                    x,
+                    y,
+                    kwargs_stacked[i],
+                    num_samples,
+                )[0]
+        return potential * self._alpha_scaling
+
+    def fermat_potential_batch(self, x_image, y_image, kwargs_batch, k=None):
+        """Fermat potential for many samples of lens model parameters at once, with the
+        source positions ray-traced from the image positions.
+
+        :param x_image: image positions, shared by all samples or of shape (n_samples,
+            n_points) with positions per sample
+        :param y_image: image positions, shared by all samples or of shape (n_samples,
+            n_points) with positions per sample
+        :param kwargs_batch: list (one entry per lens model) of either 2d arrays of
+            shape (n_samples, n_params) with columns ordered as in param_name_list, or
+            dictionaries of parameter arrays of length n_samples
+        :param k: only evaluate the k-th lens model
+        :return: fermat potential in arcsec**2 of shape (n_samples, n_points)
+        """
+        x_image, y_image = self._batch_coordinates(x_image, y_image)
+        potential = self.potential_batch(x_image, y_image, kwargs_batch, k=k)
+        f_x, f_y = self.alpha_batch(x_image, y_image, kwargs_batch, k=k)
+        geometry = (f_x**2 + f_y**2) / 2.0
+        return geometry - potential
+
     def change_redshift_scaling(self, alpha_scaling):
         """
 
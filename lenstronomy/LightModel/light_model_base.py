@@ -4,6 +4,7 @@ __author__ = "sibirrer"
 
 import numpy as np
 from lenstronomy.Util.util import convert_bool_list
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["LightModelBase"]
 
@@ -223,6 +224,7 @@ class LightModelBase(object):
                 )
         self._num_func = len(self.func_list)
 
+    @timed("LightModel.surface_brightness")
     def surface_brightness(self, x, y, kwargs_list, k=None):
         """
         :param x: coordinate in units of arcsec relative to the center of the image
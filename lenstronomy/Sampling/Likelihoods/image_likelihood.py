@@ -19,6 +19,8 @@ class ImageLikelihood(object):
         check_positive_flux=False,
         kwargs_pixelbased=None,
         linear_solver=True,
+        linear_solver_cache=False,
+        ray_tracing_cache_size=0,
     ):
         """
 
@@ -36,6 +38,10 @@ class ImageLikelihood(object):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param linear_solver_cache: bool, if True, re-uses the unchanged blocks of the linear response matrix and
+         normal equations between likelihood calls (only 'single-band' and 'multi-linear' modes)
+        :param ray_tracing_cache_size: int, number of sets of ray-traced source plane coordinates kept in a
+         least-recently-used cache (only 'single-band' and 'multi-linear' modes). 0 (default) disables the cache.
         """
         self.imSim = class_creator.create_im_sim(
             multi_band_list,
@@ -45,6 +51,8 @@ class ImageLikelihood(object):
             image_likelihood_mask_list=image_likelihood_mask_list,
             kwargs_pixelbased=kwargs_pixelbased,
             linear_solver=linear_solver,
+            linear_solver_cache=linear_solver_cache,
+            ray_tracing_cache_size=ray_tracing_cache_size,
         )
         self._model_type = self.imSim.type
         self._source_marg = source_marg
@@ -112,6 +120,18 @@ class ImageLikelihood(object):
             kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
         )
 
+    def set_ray_tracing_batch(self, kwargs_lens_list):
+        """Registers the lens model parameters of an ensemble of samples that are
+        subsequently evaluated one by one, such that the coordinates of the images are
+        ray-traced for several samples at once (see
+        ImageModel.set_ray_tracing_batch()).
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample, or None
+            to delete the registered samples
+        :return: None
+        """
+        self.imSim.set_ray_tracing_batch(kwargs_lens_list)
+
     def reset_point_source_cache(self, cache=True):
         """
 
@@ -1,6 +1,7 @@
 import numpy as np
 from numpy.linalg import inv
 from lenstronomy.Util.cosmo_util import get_astropy_cosmology
+from lenstronomy.Util.util import stack_kwargs_list
 
 import warnings
 
@@ -89,13 +90,22 @@ class PositionLikelihood(object):
             dec_image_list = []
         self._ra_image_list, self._dec_image_list = ra_image_list, dec_image_list
 
-    def logL(self, kwargs_lens, kwargs_ps, kwargs_special, verbose=False):
+    def logL(
+        self,
+        kwargs_lens,
+        kwargs_ps,
+        kwargs_special,
+        verbose=False,
+        logL_source_position=None,
+    ):
         """
 
         :param kwargs_lens: lens model parameter keyword argument list
         :param kwargs_ps: point source model parameter keyword argument list
         :param kwargs_special: special keyword arguments
         :param verbose: bool
+        :param logL_source_position: (optional) source position likelihood already
+            evaluated for these parameters (e.g. with source_position_logL_batch())
         :return: log likelihood of the optional likelihoods being computed
         """
 
@@ -134,13 +144,16 @@ class PositionLikelihood(object):
                         % (len(ra_image_list[0]), self._max_num_images)
                     )
         if self._source_position_likelihood:
-            logL_source_pos = self.source_position_likelihood(
-                kwargs_lens,
-                kwargs_ps,
-                self._source_position_sigma,
-                hard_bound_rms=self._bound_source_position_tolerance,
-                verbose=verbose,
-            )
+            if logL_source_position is None:
+                logL_source_pos = self.source_position_likelihood(
+                    kwargs_lens,
+                    kwargs_ps,
+                    self._source_position_sigma,
+                    hard_bound_rms=self._bound_source_position_tolerance,
+                    verbose=verbose,
+                )
+            else:
+                logL_source_pos = logL_source_position
             logL += logL_source_pos
             if verbose is True:
                 print("source position likelihood %s" % logL_source_pos)
@@ -155,6 +168,28 @@ class PositionLikelihood(object):
                 print("image position likelihood %s" % logL_image_pos)
         return logL
 
+    def source_position_logL_batch(self, kwargs_lens_list, kwargs_ps_list):
+        """Source position likelihood of logL() for an ensemble of samples at once (see
+        source_position_likelihood_batch()).
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample
+        :param kwargs_ps_list: list of point source kwargs lists, one per sample
+        :return: 1d numpy array of the source position log likelihoods of the samples,
+            or None if the source position likelihood is not evaluated or the ensemble
+            can not be evaluated at once
+        """
+        if (
+            self._source_position_likelihood is False
+            or self._lensModel.cosmology_sampling
+        ):
+            return None
+        return self.source_position_likelihood_batch(
+            kwargs_lens_list,
+            kwargs_ps_list,
+            self._source_position_sigma,
+            hard_bound_rms=self._bound_source_position_tolerance,
+        )
+
     def check_additional_images(self, kwargs_ps, kwargs_lens):
         """Checks whether additional images have been found and placed in kwargs_ps.
 
@@ -313,6 +348,77 @@ class PositionLikelihood(object):
                     logL -= chi2 / 2
         return logL
 
+    def source_position_likelihood_batch(
+        self, kwargs_lens_list, kwargs_ps_list, sigma, hard_bound_rms=None
+    ):
+        """Source position likelihood (see source_position_likelihood()) of an ensemble
+        of samples. The image positions of all samples are ray-traced and the Hessians
+        evaluated at once with LensModel.ray_shooting_batch() and
+        LensModel.hessian_batch(), the scatter in the source plane is evaluated as array
+        operations. This requires lens model parameters that can be stacked over the
+        samples and the same number of images in each sample.
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample
+        :param kwargs_ps_list: list of point source kwargs lists, one per sample
+        :param sigma: 1-sigma Gaussian uncertainty in the image plane
+        :param hard_bound_rms: hard bound deviation between the mapping of the images
+            back to the source plane (in source frame)
+        :return: 1d numpy array of log likelihoods, or None if the ensemble can not be
+            evaluated at once
+        """
+        num_samples = len(kwargs_lens_list)
+        logL = np.zeros(num_samples)
+        if num_samples == 0 or len(kwargs_ps_list[0]) < 1:
+            return logL
+        kwargs_batch = stack_kwargs_list(kwargs_lens_list)
+        if kwargs_batch is None:
+            return None
+        singular = np.zeros(num_samples, dtype=bool)
+        redshift_list = self._pointSource._redshift_list
+        for k in range(len(kwargs_ps_list[0])):
+            if (
+                "ra_image" in kwargs_ps_list[0][k]
+                and self._pointSource.point_source_type_list[k] == "LENSED_POSITION"
+            ):
+                if self._pointSource.k_list(k) is not None:
+                    return None
+                x_image = [kwargs_ps[k]["ra_image"] for kwargs_ps in kwargs_ps_list]
+                y_image = [kwargs_ps[k]["dec_image"] for kwargs_ps in kwargs_ps_list]
+                if len(set(np.size(x_image_) for x_image_ in x_image)) != 1:
+                    return None
+                x_image = np.array(x_image, dtype=float).reshape(num_samples, -1)
+                y_image = np.array(y_image, dtype=float).reshape(num_samples, -1)
+                self._lensModel.change_source_redshift(redshift_list[k])
+                x_source, y_source = self._lensModel.ray_shooting_batch(
+                    x_image, y_image, kwargs_batch
+                )
+                f_xx, f_xy, f_yx, f_yy = self._lensModel.hessian_batch(
+                    x_image, y_image, kwargs_batch
+                )
+                delta_x = np.mean(x_source, axis=1, keepdims=True) - x_source
+                delta_y = np.mean(y_source, axis=1, keepdims=True) - y_source
+                if hard_bound_rms is not None:
+                    num_miss = np.sum(
+                        delta_x**2 + delta_y**2 > hard_bound_rms**2, axis=1
+                    )
+                    logL -= 10**3 * num_miss
+                # Sigma_beta = A^T Sigma_theta A with Sigma_theta = sigma^2 * 1
+                a, b, c, d = 1 - f_xx, -f_xy, -f_yx, 1 - f_yy
+                sigma_xx = (a**2 + c**2) * sigma**2
+                sigma_xy = (a * b + c * d) * sigma**2
+                sigma_yy = (b**2 + d**2) * sigma**2
+                det = sigma_xx * sigma_yy - sigma_xy**2
+                singular |= np.any(det == 0, axis=1)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    chi2 = (
+                        sigma_yy * delta_x**2
+                        - 2 * sigma_xy * delta_x * delta_y
+                        + sigma_xx * delta_y**2
+                    ) / det
+                logL -= np.sum(chi2, axis=1) / 2
+        logL[singular] = -(10**15)
+        return logL
+
     @property
     def num_data(self):
         """
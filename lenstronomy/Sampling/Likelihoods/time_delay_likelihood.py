@@ -1,5 +1,6 @@
 import numpy as np
 import lenstronomy.Util.constants as const
+from lenstronomy.Util import util
 from lenstronomy.Util.cosmo_util import get_astropy_cosmology
 
 __all__ = ["TimeDelayLikelihood"]
@@ -157,21 +158,78 @@ class TimeDelayLikelihood(object):
                     Ddt_scaled = self._lensModel.ddt_scaling * D_dt_model
                     delay_days = const.delay_arcsec2days(delay_arcsec, Ddt_scaled)
                 delay_days *= lambda_mst
-                if self._bimodal_measurement:
-                    logL1 = self._log_delay_masked(
-                        delay_days=delay_days, mask=mask, i=0
-                    )
-                    logL2 = self._log_delay_masked(
-                        delay_days=delay_days, mask=mask, i=1
-                    )
-                    logL_sum = np.log(np.exp(logL1) + np.exp(logL2))
-                    logL += logL_sum
-                else:
-                    logL += self._log_delay_masked(
-                        delay_days=delay_days, mask=mask, i=i
-                    )
+                logL += self._logL_point_source(delay_days, mask, i)
         return logL
 
+    def logL_batch(
+        self, kwargs_lens_list, kwargs_ps_list, kwargs_cosmo_list, lambda_mst=1
+    ):
+        """Log likelihoods of the time delays of an ensemble of samples (see logL()).
+        The Fermat potentials at the image positions of all samples are evaluated at
+        once with LensModel.fermat_potential_batch(). This requires 'LENSED_POSITION'
+        point source models without additional images, lens model parameters that can
+        be stacked over the samples and no cosmology sampling.
+
+        :param kwargs_lens_list: list of lens model kwargs lists, one per sample
+        :param kwargs_ps_list: list of point source kwargs lists, one per sample
+        :param kwargs_cosmo_list: list of cosmology and other kwargs, one per sample
+        :param lambda_mst: mass-sheet transform of the input lens model that is not
+            accounted for in the lens model parameters
+        :type lambda_mst: float or int
+        :return: 1d numpy array of the log likelihoods of the samples, or None if the
+            ensemble can not be evaluated at once
+        """
+        if self._lensModel.cosmology_sampling:
+            return None
+        for i in range(self._num_point_sources):
+            if (
+                self._pointSource.point_source_type_list[i] != "LENSED_POSITION"
+                or self._pointSource._additional_images_list[i]
+            ):
+                return None
+        kwargs_batch = util.stack_kwargs_list(kwargs_lens_list)
+        if kwargs_batch is None:
+            return None
+        logL = np.zeros(len(kwargs_lens_list))
+        D_dt_model = np.array(
+            [kwargs_cosmo["D_dt"] for kwargs_cosmo in kwargs_cosmo_list]
+        )
+        for i in range(self._num_point_sources):
+            mask = np.array(self._measurement_bool_list[i])
+            if np.any(mask):
+                x_pos = [kwargs_ps[i]["ra_image"] for kwargs_ps in kwargs_ps_list]
+                y_pos = [kwargs_ps[i]["dec_image"] for kwargs_ps in kwargs_ps_list]
+                if len(set(np.size(x_pos_) for x_pos_ in x_pos)) != 1:
+                    return None
+                self._lensModel.change_source_redshift(
+                    z_source=self._pointSource._redshift_list[i]
+                )
+                delay_arcsec = self._lensModel.fermat_potential_batch(
+                    np.array(x_pos), np.array(y_pos), kwargs_batch
+                )
+                Ddt_scaled = self._lensModel.ddt_scaling * D_dt_model
+                delay_days = const.delay_arcsec2days(
+                    delay_arcsec, Ddt_scaled[:, np.newaxis]
+                )
+                delay_days *= lambda_mst
+                for j in range(len(logL)):
+                    logL[j] += self._logL_point_source(delay_days[j], mask, i)
+        return logL
+
+    def _logL_point_source(self, delay_days, mask, i):
+        """Log likelihood of the delays of the images of a point source.
+
+        :param delay_days: arrival times of the images (in days)
+        :param mask: bool array of the measured delays
+        :param i: index of the point source
+        :return: log likelihood
+        """
+        if self._bimodal_measurement:
+            logL1 = self._log_delay_masked(delay_days=delay_days, mask=mask, i=0)
+            logL2 = self._log_delay_masked(delay_days=delay_days, mask=mask, i=1)
+            return np.log(np.exp(logL1) + np.exp(logL2))
+        return self._log_delay_masked(delay_days=delay_days, mask=mask, i=i)
+
     def _log_delay_masked(self, delay_days, mask, i):
         """
 
@@ -33,6 +33,52 @@ def sampler_logl_worker(args):
     return _SAMPLER_LIKELIHOOD_MODULE.logL(args)
 
 
+def sampler_logl_batch_worker(args_array):
+    """Evaluate the log-likelihood of an ensemble of parameter vectors from
+    worker-local sampler state.
+
+    :param args_array: 2d array (n_samples, n_param) of parameter vectors
+    :return: 1d array of log-likelihood values
+    """
+    if _SAMPLER_LIKELIHOOD_MODULE is None:
+        raise RuntimeError(
+            "Worker likelihood module is not initialized. "
+            "Call set_sampler_likelihood_module before evaluating logL."
+        )
+    return _SAMPLER_LIKELIHOOD_MODULE.logL_batch(args_array)
+
+
+class PoolBatchLogL(object):
+    """Vectorized log-likelihood callable that splits an ensemble of parameter vectors
+    in one chunk per process of a pool and evaluates each chunk with a single batched
+    call on the workers."""
+
+    def __init__(self, pool, logl_batch_worker=sampler_logl_batch_worker):
+        """
+
+        :param pool: pool instance with a map() method and a size attribute
+        :param logl_batch_worker: picklable function evaluating a 2d array of parameter
+            vectors on a worker
+        """
+        self._pool = pool
+        self._num_chunks = max(int(getattr(pool, "size", 1)), 1)
+        self._logl_batch_worker = logl_batch_worker
+
+    def __call__(self, args_array):
+        """
+
+        :param args_array: 2d array (n_samples, n_param) of parameter vectors
+        :return: 1d array of log-likelihood values
+        """
+        args_array = np.atleast_2d(args_array)
+        chunks = [
+            chunk
+            for chunk in np.array_split(args_array, self._num_chunks)
+            if len(chunk) > 0
+        ]
+        return np.concatenate(list(self._pool.map(self._logl_batch_worker, chunks)))
+
+
 def set_nested_likelihood_module(likelihood_module, n_dims):
     """Set the nested-sampler likelihood and dimensionality on each worker.
 
@@ -0,0 +1,349 @@
+"""Process pool that keeps its workers alive between sampling stages and ships the
+likelihood to them through shared memory.
+
+The numpy arrays of the likelihood (image data, noise maps, PSF kernels, pre-computed
+coordinate grids, ...) are placed in ``multiprocessing.shared_memory`` blocks. Only a
+small pickled skeleton of the likelihood, with references to those blocks in place of
+the arrays, is transferred. Workers attach the blocks zero-copy as read-only arrays.
+Blocks are de-duplicated by content, such that a new likelihood of a later stage
+sharing the same data only publishes a new skeleton.
+"""
+
+import atexit
+import hashlib
+import io
+
+import dill
+import numpy as np
+from multiprocessing import shared_memory
+
+from lenstronomy.Sampling.Pool.multiprocessing import MultiPool
+from lenstronomy.Sampling.Pool.parallelization_util import PoolBatchLogL
+
+__all__ = [
+    "SharedArrayStore",
+    "SharedMemoryPool",
+    "SharedLogL",
+    "get_shared_memory_pool",
+    "loads_shared",
+]
+
+# arrays smaller than this number of bytes are pickled with the skeleton
+_MIN_SHARED_BYTES = 2**12
+_PERSISTENT_TAG = "lenstronomy_shared_array"
+
+# worker-side state: attached blocks by name and the currently loaded likelihood
+_WORKER_BLOCKS = {}
+_WORKER_LIKELIHOOD = {"name": None, "likelihood": None}
+
+# names of the blocks created (and unlinked) by this process
+_OWNED_BLOCKS = set()
+
+# process-wide persistent pool of the master process
+_POOL = None
+
+
+class _AttachedSharedMemory(shared_memory.SharedMemory):
+    """SharedMemory attached by a consumer process. Arrays created from it keep the
+    memory mapped after this instance is garbage collected."""
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            # arrays still reference the memory, it is un-mapped together with them
+            pass
+
+
+def _attach(name):
+    """Attaches an existing shared memory block without registering it with the
+    resource tracker of this process (the master process owns and unlinks it).
+
+    :param name: name of the shared memory block
+    :return: SharedMemory instance
+    """
+    try:
+        return _AttachedSharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers attached blocks with the resource tracker
+        from multiprocessing import resource_tracker
+
+        shm = _AttachedSharedMemory(name=name)
+        if name not in _OWNED_BLOCKS:
+            try:
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:  # pragma: no cover
+                pass
+        return shm
+
+
+class _SharedPickler(dill.Pickler):
+    """Pickler replacing large numpy arrays by references to shared memory blocks."""
+
+    def __init__(self, file, store):
+        super(_SharedPickler, self).__init__(file)
+        self._store = store
+
+    def persistent_id(self, obj):
+        if (
+            type(obj) is np.ndarray
+            and not obj.dtype.hasobject
+            and obj.nbytes >= _MIN_SHARED_BYTES
+        ):
+            return self._store.put(obj)
+        return None
+
+
+class _SharedUnpickler(dill.Unpickler):
+    """Unpickler attaching the shared memory blocks referenced by _SharedPickler."""
+
+    def __init__(self, file, blocks):
+        super(_SharedUnpickler, self).__init__(file)
+        self._blocks = blocks
+        self.used = set()
+
+    def persistent_load(self, pid):
+        tag, name, shape, dtype = pid
+        if tag != _PERSISTENT_TAG:
+            raise dill.UnpicklingError("unsupported persistent id %s" % tag)
+        if name not in self._blocks:
+            self._blocks[name] = _attach(name)
+        self.used.add(name)
+        # the array holds its own export of the memory map, such that the memory stays
+        # mapped as long as the array is alive
+        array = np.frombuffer(
+            memoryview(self._blocks[name].buf),
+            dtype=np.dtype(dtype),
+            count=int(np.prod(shape)),
+        ).reshape(shape)
+        # the memory is shared between all workers and must not be modified
+        array.flags.writeable = False
+        return array
+
+
+class SharedArrayStore(object):
+    """Owner (master process) side store of numpy arrays placed in shared memory,
+    de-duplicated by content."""
+
+    def __init__(self):
+        self._blocks = {}
+        self._used = set()
+
+    def put(self, array):
+        """Places an array in a shared memory block (or re-uses an existing block with
+        identical content).
+
+        :param array: numpy array
+        :return: persistent reference to the block
+        """
+        array = np.ascontiguousarray(array)
+        key = (
+            hashlib.sha1(array.view(np.uint8)).hexdigest(),
+            array.shape,
+            array.dtype.str,
+        )
+        if key not in self._blocks:
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            _OWNED_BLOCKS.add(shm.name)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+            self._blocks[key] = shm
+        self._used.add(key)
+        return _PERSISTENT_TAG, self._blocks[key].name, array.shape, array.dtype.str
+
+    def dumps(self, obj):
+        """Pickles an object with its large arrays placed in shared memory. Blocks not
+        referenced by the object are released.
+
+        :param obj: object to be pickled
+        :return: bytes of the pickled skeleton
+        """
+        self._used = set()
+        file = io.BytesIO()
+        _SharedPickler(file, self).dump(obj)
+        for key in list(self._blocks.keys()):
+            if key not in self._used:
+                self._release(key)
+        return file.getvalue()
+
+    @property
+    def num_blocks(self):
+        """Number of shared memory blocks currently held.
+
+        :return: int
+        """
+        return len(self._blocks)
+
+    def close(self):
+        """Releases all shared memory blocks.
+
+        :return: None
+        """
+        for key in list(self._blocks.keys()):
+            self._release(key)
+
+    def _release(self, key):
+        shm = self._blocks.pop(key)
+        _OWNED_BLOCKS.discard(shm.name)
+        try:
+            shm.unlink()
+        except FileNotFoundError:  # pragma: no cover
+            pass
+        try:
+            shm.close()
+        except BufferError:  # pragma: no cover
+            # arrays of this process still reference the block, the memory is freed with them
+            pass
+
+
+def loads_shared(data, blocks=None):
+    """Inverse of SharedArrayStore.dumps().
+
+    :param data: bytes of the pickled skeleton
+    :param blocks: dictionary of already attached blocks by name (updated in place)
+    :return: un-pickled object, set of names of the blocks it references
+    """
+    if blocks is None:
+        blocks = {}
+    unpickler = _SharedUnpickler(io.BytesIO(data), blocks)
+    obj = unpickler.load()
+    return obj, unpickler.used
+
+
+def _worker_likelihood(name, size):
+    """Returns the likelihood published in the skeleton block name, loading it if it
+    differs from the one currently held by this worker.
+
+    :param name: name of the shared memory block holding the pickled skeleton
+    :param size: number of bytes of the pickled skeleton
+    :return: likelihood instance
+    """
+    if _WORKER_LIKELIHOOD["name"] != name:
+        shm = _attach(name)
+        data = bytes(shm.buf[:size])
+        shm.close()
+        likelihood, used = loads_shared(data, _WORKER_BLOCKS)
+        _WORKER_LIKELIHOOD["name"] = name
+        _WORKER_LIKELIHOOD["likelihood"] = likelihood
+        # blocks of previous likelihoods are un-mapped once no array references them
+        for block_name in list(_WORKER_BLOCKS.keys()):
+            if block_name not in used:
+                del _WORKER_BLOCKS[block_name]
+    return _WORKER_LIKELIHOOD["likelihood"]
+
+
+class SharedLogL(object):
+    """Picklable log-likelihood callable referencing a likelihood published by a
+    SharedMemoryPool. Only the name of the skeleton block is transferred with each
+    task."""
+
+    def __init__(self, name, size, batch=False):
+        """
+
+        :param name: name of the shared memory block holding the pickled skeleton
+        :param size: number of bytes of the pickled skeleton
+        :param batch: bool, if True, evaluates Likelihood.logL_batch()
+        """
+        self._name = name
+        self._size = size
+        self._batch = batch
+
+    def __call__(self, args):
+        """
+
+        :param args: parameter vector (or 2d array of parameter vectors if batch=True)
+        :return: log-likelihood (array if batch=True)
+        """
+        likelihood = _worker_likelihood(self._name, self._size)
+        if self._batch is True:
+            return likelihood.logL_batch(args)
+        return likelihood.logL(args)
+
+
+class SharedMemoryPool(MultiPool):
+    """MultiPool whose workers receive the likelihood through shared memory and stay
+    alive when a new likelihood is published (e.g. in the next stage of a
+    FittingSequence)."""
+
+    def __init__(self, processes=None, **kwargs):
+        """
+
+        :param processes: number of worker processes
+        :param kwargs: keyword arguments of MultiPool
+        """
+        super(SharedMemoryPool, self).__init__(processes=processes, **kwargs)
+        self._store = SharedArrayStore()
+        self._skeleton = None
+
+    def set_likelihood(self, likelihood_module, vectorize=False):
+        """Publishes a likelihood to the workers.
+
+        :param likelihood_module: instance of the Likelihood class (or any picklable
+            object with logL() and logL_batch() methods)
+        :param vectorize: bool, if True, returns a callable evaluating 2d arrays of
+            parameter vectors split in one batch per process
+        :return: log-likelihood callable to be used with map() of this pool
+        """
+        data = self._store.dumps(likelihood_module)
+        skeleton = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        _OWNED_BLOCKS.add(skeleton.name)
+        skeleton.buf[: len(data)] = data
+        self._release_skeleton()
+        self._skeleton = skeleton
+        if vectorize is True:
+            return PoolBatchLogL(
+                self, logl_batch_worker=SharedLogL(skeleton.name, len(data), batch=True)
+            )
+        return SharedLogL(skeleton.name, len(data))
+
+    @property
+    def is_running(self):
+        """
+
+        :return: bool, True if the pool accepts new tasks
+        """
+        return self._state == "RUN"
+
+    def close(self):
+        super(SharedMemoryPool, self).close()
+        self._release_shared_memory()
+
+    def terminate(self):
+        super(SharedMemoryPool, self).terminate()
+        self._release_shared_memory()
+
+    def _release_skeleton(self):
+        if self._skeleton is not None:
+            _OWNED_BLOCKS.discard(self._skeleton.name)
+            self._skeleton.close()
+            self._skeleton.unlink()
+            self._skeleton = None
+
+    def _release_shared_memory(self):
+        # terminate() may be called while the pool is garbage collected before __init__ finished
+        if hasattr(self, "_store"):
+            self._release_skeleton()
+            self._store.close()
+
+
+def get_shared_memory_pool(processes):
+    """Returns the process-wide persistent SharedMemoryPool, creating a new one if none
+    is running with the requested number of processes.
+
+    :param processes: number of worker processes
+    :return: SharedMemoryPool instance
+    """
+    global _POOL
+    if _POOL is not None and (not _POOL.is_running or _POOL.size != processes):
+        _POOL.terminate()
+        _POOL = None
+    if _POOL is None:
+        _POOL = SharedMemoryPool(processes=processes)
+    return _POOL
+
+
+@atexit.register
+def _close_shared_memory_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL.terminate()
+        _POOL = None
@@ -32,7 +32,15 @@ class ParticleSwarmOptimizer(object):
     """
 
     def __init__(
-        self, func, low, high, particle_count=25, pool=None, args=None, kwargs=None
+        self,
+        func,
+        low,
+        high,
+        particle_count=25,
+        pool=None,
+        args=None,
+        kwargs=None,
+        vectorize=False,
     ):
         """
 
@@ -52,11 +60,16 @@ class ParticleSwarmOptimizer(object):
         :param kwargs: keyword arguments to send to `func`. The function
             will be called as `func(x, *args, **kwargs)`
         :type kwargs: `dict`
+        :param vectorize: if True, `func` takes a 2d array of positions of all
+            particles (n_particles, n_param) and returns their log likelihoods in a
+            single call. The pool is then not used to map over the particles.
+        :type vectorize: bool
         """
         self.low = [l for l in low]
         self.high = [h for h in high]
         self.particleCount = particle_count
         self.pool = pool
+        self._vectorize = vectorize
 
         self.param_count = len(self.low)
 
@@ -257,11 +270,14 @@ class ParticleSwarmOptimizer(object):
         :rtype:
         """
         position = [particle.position for particle in swarm]
-        if self.pool is None:
-            map_func = map
+        if self._vectorize is True:
+            ln_probability = self.func(np.array(position))
         else:
-            map_func = self.pool.map
-        ln_probability = list(map_func(self.func, position))
+            if self.pool is None:
+                map_func = map
+            else:
+                map_func = self.pool.map
+            ln_probability = list(map_func(self.func, position))
 
         for i, particle in enumerate(swarm):
             particle.fitness = ln_probability[i]
@@ -9,6 +9,7 @@ from lenstronomy.Sampling.Likelihoods.prior_likelihood import PriorLikelihood
 from lenstronomy.Sampling.Likelihoods.kinematic_2D_likelihood import KinLikelihood
 import lenstronomy.Util.class_creator as class_creator
 import numpy as np
+from lenstronomy.Util.profiling import Profiler, timed
 
 __all__ = ["Likelihood"]
 
@@ -76,6 +77,9 @@ class Likelihood(object):
         kin_lens_light_idx=0,
         tracer_likelihood=False,
         tracer_likelihood_mask=None,
+        linear_solver_cache=False,
+        ray_tracing_cache_size=0,
+        profiling=False,
     ):
         """Initializing class.
 
@@ -127,6 +131,18 @@ class Likelihood(object):
         :param bimodal_time_delay_measurement: if True, two sets of delays are required.
             Only allowed for one set of point sources
         :type bimodal_time_delay_measurement: bool
+        :param linear_solver_cache: bool, if True, re-uses the blocks of the linear
+            response matrix and of the normal equations of the imaging likelihood whose
+            non-linear parameters did not change since the previous call
+        :param ray_tracing_cache_size: int, number of sets of ray-traced source plane
+            coordinates of the imaging likelihood kept in a least-recently-used cache.
+            Avoids re-computing the ray-tracing when the lens parameters do not change
+            (e.g. in stages only sampling the light models). 0 (default) disables the
+            cache.
+        :param profiling: bool, if True, records the wall time and number of calls of
+            the computational components (ray-shooting, light profiles, convolution,
+            linear solver, lens equation solver, kinematics) of all likelihood
+            evaluations in this process, accessible with the profiler attribute
         """
         # TODO unpack also tracer model from kwargs_data
         (
@@ -189,6 +205,8 @@ class Likelihood(object):
             "check_positive_flux": check_positive_flux,
             "kwargs_pixelbased": kwargs_pixelbased,
             "linear_solver": linear_solver,
+            "linear_solver_cache": linear_solver_cache,
+            "ray_tracing_cache_size": ray_tracing_cache_size,
         }
         self._kwargs_image_sim = {
             "multi_band_list": multi_band_list,
@@ -219,6 +237,10 @@ class Likelihood(object):
             "flux_ratio_errors": flux_ratio_errors,
         }
         self._kwargs_flux.update(self._kwargs_flux_compute)
+        if profiling is True:
+            self._profiler = Profiler()
+        else:
+            self._profiler = None
 
         if self._kinematic_2D_likelihood is True:
             print(
@@ -356,6 +378,124 @@ class Likelihood(object):
         kwargs_return = self.param.args2kwargs(args)
         return self.log_likelihood(kwargs_return, verbose=verbose)
 
+    def logL_batch(self, args_array, verbose=False):
+        """Log likelihood of an ensemble of parameter vectors (e.g. all walkers of an
+        MCMC or all particles of a PSO iteration) in a single call.
+
+        The bound checks are evaluated for the full ensemble at once and samples outside
+        the bounds are not converted and evaluated. The remaining samples are evaluated
+        with log_likelihood_batch().
+
+        :param args_array: ordered parameter values that are being sampled
+        :type args_array: 2d numpy array of shape (n_samples, n_param)
+        :param verbose: if True, makes print statements about individual likelihood
+            components
+        :type verbose: boolean
+        :returns: 1d numpy array of the log likelihoods of the samples
+        """
+        args_array = np.atleast_2d(np.asarray(args_array, dtype=float))
+        logL = np.full(len(args_array), -(10.0**18))
+        if self._check_bounds is True:
+            in_bounds = ~np.any(
+                (args_array < self._lower_limit) | (args_array > self._upper_limit),
+                axis=1,
+            )
+        else:
+            in_bounds = np.ones(len(args_array), dtype=bool)
+        index = np.where(in_bounds)[0]
+        kwargs_list = self.param.args2kwargs_batch(args_array[index])
+        logL[index] = self.log_likelihood_batch(kwargs_list, verbose=verbose)
+        return logL
+
+    def log_likelihood_batch(self, kwargs_list, verbose=False):
+        """Log likelihoods of an ensemble of samples (see log_likelihood()).
+
+        The source position likelihood of the point sources and the time-delay
+        likelihood are evaluated for all samples at once, with the image positions of
+        all samples ray-traced in a single call of the lens model (see
+        PositionLikelihood.source_position_logL_batch() and
+        TimeDelayLikelihood.logL_batch()). The coordinates of the imaging likelihood
+        are ray-traced for several samples at once (see
+        ImageLikelihood.set_ray_tracing_batch()). All other likelihood terms are
+        evaluated sample by sample. With verbose=True or sampled redshifts, the samples
+        are evaluated one by one.
+
+        :param kwargs_list: list of keyword arguments of log_likelihood(), one per
+            sample
+        :param verbose: if True, makes print statements about individual likelihood
+            components
+        :type verbose: boolean
+        :return: 1d numpy array of the log likelihoods of the samples
+        """
+        if self._profiler is None:
+            return self._log_likelihood_batch(kwargs_list, verbose=verbose)
+        with self._profiler:
+            return self._log_likelihood_batch(kwargs_list, verbose=verbose)
+
+    @timed("Likelihood.log_likelihood_batch")
+    def _log_likelihood_batch(self, kwargs_list, verbose=False):
+        """Evaluates the log likelihoods of an ensemble, see log_likelihood_batch().
+
+        :param kwargs_list: list of keyword arguments of log_likelihood(), one per
+            sample
+        :param verbose: if True, makes print statements about individual likelihood
+            components
+        :return: 1d numpy array of the log likelihoods of the samples
+        """
+        num_samples = len(kwargs_list)
+        logL = np.zeros(num_samples)
+        if num_samples == 0:
+            return logL
+        kwargs_lens_list = [kwargs.get("kwargs_lens", {}) for kwargs in kwargs_list]
+        kwargs_ps_list = [kwargs.get("kwargs_ps", {}) for kwargs in kwargs_list]
+        kwargs_special_list = [
+            kwargs.get("kwargs_special", {}) for kwargs in kwargs_list
+        ]
+        # sampled redshifts change the model instances from sample to sample
+        _, update_bool = self.param.update_kwargs_model(kwargs_special_list[0])
+        if verbose is True or update_bool is True:
+            for j, kwargs_return in enumerate(kwargs_list):
+                logL[j] = self._log_likelihood(kwargs_return, verbose=verbose)
+            return logL
+
+        self._reset_point_source_cache(bool_input=False)
+        logL_source_position = self._position_likelihood.source_position_logL_batch(
+            kwargs_lens_list, kwargs_ps_list
+        )
+        logL_time_delay = None
+        if self._time_delay_likelihood is True:
+            logL_time_delay = self.time_delay_likelihood.logL_batch(
+                kwargs_lens_list, kwargs_ps_list, kwargs_special_list
+            )
+        if self._image_likelihood is True:
+            self.image_likelihood.set_ray_tracing_batch(kwargs_lens_list)
+        try:
+            for j, kwargs_return in enumerate(kwargs_list):
+                logL[j] = self._log_likelihood(
+                    kwargs_return,
+                    logL_source_position=(
+                        None
+                        if logL_source_position is None
+                        else logL_source_position[j]
+                    ),
+                    logL_time_delay=(
+                        None if logL_time_delay is None else logL_time_delay[j]
+                    ),
+                )
+        finally:
+            if self._image_likelihood is True:
+                self.image_likelihood.set_ray_tracing_batch(None)
+        return logL
+
+    @property
+    def profiler(self):
+        """Profiler recording the timings of the likelihood evaluations (only if
+        profiling=True).
+
+        :return: Profiler instance or None
+        """
+        return self._profiler
+
     def log_likelihood(self, kwargs_return, verbose=False):
         """
 
@@ -370,6 +510,29 @@ class Likelihood(object):
         :returns:
          - logL (float) log likelihood of the data given the model (natural logarithm)
         """
+        if self._profiler is None:
+            return self._log_likelihood(kwargs_return, verbose=verbose)
+        with self._profiler:
+            return self._log_likelihood(kwargs_return, verbose=verbose)
+
+    @timed("Likelihood.log_likelihood")
+    def _log_likelihood(
+        self,
+        kwargs_return,
+        verbose=False,
+        logL_source_position=None,
+        logL_time_delay=None,
+    ):
+        """Evaluates the log likelihood, see log_likelihood().
+
+        :param kwargs_return: keyword arguments of the model parameters
+        :param verbose: if True, makes print statements about individual likelihood components
+        :param logL_source_position: (optional) source position likelihood of the point sources already evaluated
+         for these parameters (see PositionLikelihood.source_position_logL_batch())
+        :param logL_time_delay: (optional) time-delay likelihood already evaluated for these parameters (see
+         TimeDelayLikelihood.logL_batch())
+        :return: log likelihood of the data given the model (natural logarithm)
+        """
         kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps, kwargs_special = (
             kwargs_return.get("kwargs_lens", {}),
             kwargs_return.get("kwargs_source", {}),
@@ -407,9 +570,10 @@ class Likelihood(object):
                 param = None
 
             if self._time_delay_likelihood is True:
-                logL_time_delay = self.time_delay_likelihood.logL(
-                    kwargs_lens, kwargs_ps, kwargs_special
-                )
+                if logL_time_delay is None:
+                    logL_time_delay = self.time_delay_likelihood.logL(
+                        kwargs_lens, kwargs_ps, kwargs_special
+                    )
                 logL += logL_time_delay
                 if verbose is True:
                     print("time-delay logL = %s" % logL_time_delay)
@@ -431,7 +595,11 @@ class Likelihood(object):
                 if verbose is True:
                     print("kinematic logL = %s" % logL_kinematic_2d)
             logL += self._position_likelihood.logL(
-                kwargs_lens, kwargs_ps, kwargs_special, verbose=verbose
+                kwargs_lens,
+                kwargs_ps,
+                kwargs_special,
+                verbose=verbose,
+                logL_source_position=logL_source_position,
             )
             if self._tracer_likelihood is True:
                 logL_tracer = self.tracer_likelihood.logL(param=param, **kwargs_return)
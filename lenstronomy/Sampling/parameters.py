@@ -639,6 +639,18 @@ class Param(object):
         }
         return kwargs_return
 
+    def args2kwargs_batch(self, args_array, bijective=False):
+        """Converts an ensemble of parameter vectors (e.g. all walkers or particles of a
+        sampler) into keyword arguments.
+
+        :param args_array: 2d array (n_samples, n_param) of parameter values
+        :param bijective: boolean, see args2kwargs()
+        :return: list of keyword arguments sorted in lenstronomy conventions, one for
+            each sample
+        """
+        args_array = np.atleast_2d(args_array)
+        return [self.args2kwargs(args, bijective=bijective) for args in args_array]
+
     def kwargs2args(
         self,
         kwargs_lens=None,
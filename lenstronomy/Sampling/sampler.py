@@ -7,6 +7,7 @@ from lenstronomy.Sampling.Samplers.pso import ParticleSwarmOptimizer
 from lenstronomy.Util import sampling_util
 from lenstronomy.Sampling.Pool.pool import choose_pool
 from lenstronomy.Sampling.Pool.parallelization_util import (
+    PoolBatchLogL,
     sampler_logl_worker,
     set_sampler_likelihood_module,
 )
@@ -24,22 +25,45 @@ class Sampler(object):
 
     """
 
-    def __init__(self, likelihood_class):
+    def __init__(self, likelihood_class, shared_memory_pool=False):
         """
 
         :param likelihood_class: instance of Likelihood class
+        :param shared_memory_pool: bool, if True, multi-processing (threadCount > 1)
+            uses a persistent SharedMemoryPool. Its workers stay alive between samplers
+            and receive the data arrays of the likelihood through shared memory.
         """
         self.chain = likelihood_class
+        self._shared_memory_pool = shared_memory_pool
         self.lower_limit, self.upper_limit = self.chain.param_limits
         # Keep the worker-local log-likelihood state in sync on ranks that construct this class.
         set_sampler_likelihood_module(self.chain)
 
-    def _pool_and_logl(self, mpi, threadCount):
-        """Build a pool and return the corresponding worker-safe logL callable."""
+    def _pool_and_logl(self, mpi, threadCount, vectorize=False):
+        """Build a pool and return the corresponding worker-safe logL callable.
+
+        :param mpi: bool, if True, uses an MPI pool
+        :param threadCount: number of processes (only applied if mpi=False)
+        :param vectorize: bool, if True, the returned callable evaluates a 2d array of
+            parameter vectors (n_samples, n_param) and returns an array of logL values.
+            In parallel execution, the ensemble is split in one batch per process.
+        :return: pool, logL callable
+        """
         if mpi:
             pool = choose_pool(mpi=mpi, processes=threadCount)
+            if vectorize:
+                return pool, PoolBatchLogL(pool)
             return pool, sampler_logl_worker
 
+        if threadCount != 1 and self._shared_memory_pool is True:
+            # imported here to avoid requiring the multiprocessing dependencies at import time
+            from lenstronomy.Sampling.Pool.shared_memory_pool import (
+                get_shared_memory_pool,
+            )
+
+            pool = get_shared_memory_pool(processes=threadCount)
+            return pool, pool.set_likelihood(self.chain, vectorize=vectorize)
+
         if threadCount != 1:
             pool = choose_pool(
                 mpi=mpi,
@@ -47,9 +71,13 @@ class Sampler(object):
                 initializer=set_sampler_likelihood_module,
                 initargs=(self.chain,),
             )
+            if vectorize:
+                return pool, PoolBatchLogL(pool)
             return pool, sampler_logl_worker
 
         pool = choose_pool(mpi=mpi, processes=threadCount)
+        if vectorize:
+            return pool, self.chain.logL_batch
         return pool, self.chain.logL
 
     def simplex(self, init_pos, n_iterations, method, print_key="SIMPLEX"):
@@ -94,6 +122,7 @@ class Sampler(object):
         mpi=False,
         print_key="PSO",
         verbose=True,
+        vectorize=False,
     ):
         """Return the best fit for the lens model on catalogue basis with particle swarm
         optimizer.
@@ -110,6 +139,8 @@ class Sampler(object):
         :param mpi: bool, if True, makes instance of MPIPool to allow for MPI execution
         :param print_key: string, prints the process name in the progress bar (optional)
         :param verbose: suppress or turn on print statements
+        :param vectorize: bool, if True, evaluates all particles of an iteration with a
+            single call of Likelihood.logL_batch() (per process)
         :return: kwargs_result (of best fit), [lnlikelihood of samples, positions of
             samples, velocity of samples])
         """
@@ -122,13 +153,20 @@ class Sampler(object):
             lower_start = np.maximum(lower_start, self.lower_limit)
             upper_start = np.minimum(upper_start, self.upper_limit)
 
-        pool, logl_function = self._pool_and_logl(mpi=mpi, threadCount=threadCount)
+        pool, logl_function = self._pool_and_logl(
+            mpi=mpi, threadCount=threadCount, vectorize=vectorize
+        )
 
         if mpi is True and pool.is_master():
             print("MPI option chosen for PSO.")
 
         pso = ParticleSwarmOptimizer(
-            logl_function, lower_start, upper_start, n_particles, pool=pool
+            logl_function,
+            lower_start,
+            upper_start,
+            n_particles,
+            pool=pool,
+            vectorize=vectorize,
         )
 
         if init_pos is None:
@@ -174,6 +212,7 @@ class Sampler(object):
         initpos=None,
         backend_filename=None,
         start_from_backend=False,
+        vectorize=False,
     ):
         """Run MCMC with emcee. For details, please have a look at the documentation of
         the emcee packager.
@@ -201,6 +240,9 @@ class Sampler(object):
         :param start_from_backend: if True, start from the state saved in `backup_filename`.
          Otherwise, create a new backup file with name `backup_filename` (any already existing file is overwritten!).
         :type start_from_backend: bool
+        :param vectorize: if True, evaluates all walkers of a step with a single call of Likelihood.logL_batch()
+         (per process)
+        :type vectorize: bool
         :return: samples, ln likelihood value of samples
         :rtype: numpy 2d array, numpy 1d array
         """
@@ -216,7 +258,9 @@ class Sampler(object):
                 size=n_walkers,
             )
 
-        pool, logl_function = self._pool_and_logl(mpi=mpi, threadCount=threadCount)
+        pool, logl_function = self._pool_and_logl(
+            mpi=mpi, threadCount=threadCount, vectorize=vectorize
+        )
 
         if backend_filename is not None:
             backend = emcee.backends.HDFBackend(
@@ -247,7 +291,12 @@ class Sampler(object):
         time_start = time.time()
 
         sampler = emcee.EnsembleSampler(
-            n_walkers, num_param, logl_function, pool=pool, backend=backend
+            n_walkers,
+            num_param,
+            logl_function,
+            pool=pool,
+            backend=backend,
+            vectorize=vectorize,
         )
 
         sampler.run_mcmc(initpos, n_run_eff, progress=progress)
@@ -274,6 +323,7 @@ class Sampler(object):
         progress=False,
         initpos=None,
         backend_filename=None,
+        vectorize=False,
         **kwargs_zeus
     ):
         """
@@ -301,6 +351,8 @@ class Sampler(object):
         :type initpos: numpy array of size num param x num walkser
         :param backend_filename: name of the HDF5 file where sampling state is saved (through zeus callback function)
         :type backend_filename: string
+        :param vectorize: if True, evaluates all walkers with a single call of Likelihood.logL_batch() (per process)
+        :type vectorize: bool
         :return: samples, ln likelihood value of samples
         :rtype: numpy 2d array, numpy 1d array
         """
@@ -319,7 +371,6 @@ class Sampler(object):
         mu = kwargs_zeus.get("mu", 1.0)
         maxiter = kwargs_zeus.get("maxiter", 10000)
         pool = kwargs_zeus.get("pool", None)
-        vectorize = kwargs_zeus.get("vectorize", False)
         blobs_dtype = kwargs_zeus.get("blobs_dtype")
         verbose = kwargs_zeus.get("verbose", True)
         check_walkers = kwargs_zeus.get("check_walkers", True)
@@ -392,7 +443,12 @@ class Sampler(object):
         else:
             pass
 
-        pool, logl_function = self._pool_and_logl(mpi=mpi, threadCount=threadCount)
+        pool, logl_function = self._pool_and_logl(
+            mpi=mpi, threadCount=threadCount, vectorize=vectorize
+        )
+        if vectorize:
+            # the ensemble is distributed over the pool by the batched logL callable
+            pool = None
 
         sampler = zeus.EnsembleSampler(
             nwalkers=n_walkers,
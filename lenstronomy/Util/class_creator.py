@@ -359,6 +359,8 @@ def create_im_sim(
     band_index=0,
     kwargs_pixelbased=None,
     linear_solver=True,
+    linear_solver_cache=False,
+    ray_tracing_cache_size=0,
 ):
     """
 
@@ -376,6 +378,11 @@ def create_im_sim(
     :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver (see SLITronomy documentation)
     :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
      that they get overwritten by the linear solver solution.
+    :param linear_solver_cache: bool, if True, re-uses the unchanged blocks of the linear response matrix and normal
+     equations between calls (only supported in 'single-band' and 'multi-linear' mode)
+    :param ray_tracing_cache_size: int, number of sets of ray-traced source plane coordinates kept in a
+     least-recently-used cache (only supported in 'single-band' and 'multi-linear' mode). 0 (default) disables the
+     cache.
     :return: MultiBand class instance
     """
     if linear_solver is False and multi_band_type not in [
@@ -396,6 +403,8 @@ def create_im_sim(
             compute_bool=bands_compute,
             likelihood_mask_list=image_likelihood_mask_list,
             linear_solver=linear_solver,
+            linear_solver_cache=linear_solver_cache,
+            ray_tracing_cache_size=ray_tracing_cache_size,
         )
     elif multi_band_type == "joint-linear":
         from lenstronomy.ImSim.MultiBand.joint_linear import JointLinear
@@ -418,6 +427,8 @@ def create_im_sim(
             band_index=band_index,
             kwargs_pixelbased=kwargs_pixelbased,
             linear_solver=linear_solver,
+            linear_solver_cache=linear_solver_cache,
+            ray_tracing_cache_size=ray_tracing_cache_size,
         )
     else:
         raise ValueError("type %s is not supported!" % multi_band_type)
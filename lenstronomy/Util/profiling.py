@@ -0,0 +1,154 @@
+"""Opt-in wall time instrumentation of the computational hot paths.
+
+Functions decorated with timed() report their wall time and number of calls to all
+Profiler instances active at the time of the call. Without an active profiler, the
+overhead of a decorated function is a single check of an empty list. Timings are
+inclusive, i.e. the time of a component contains the time of the (timed) components it
+calls. Only calls in the process and thread the profiler is activated in are recorded.
+
+Example::
+
+    with Profiler() as profiler:
+        likelihood.logL(args)
+    print(profiler.summary())
+"""
+
+__author__ = "sibirrer"
+
+import functools
+import threading
+import time
+
+__all__ = ["Profiler", "timed"]
+
+# per-thread stack of the currently active profilers
+_LOCAL = threading.local()
+
+
+def _active_profilers():
+    """Stack of the profilers active in the current thread.
+
+    :return: list of Profiler instances
+    """
+    try:
+        return _LOCAL.active
+    except AttributeError:
+        _LOCAL.active = []
+        return _LOCAL.active
+
+
+def timed(component):
+    """Decorator recording the wall time and the number of calls of a function to the
+    active profilers.
+
+    :param component: name under which the timings are recorded
+    :return: decorator
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            active = getattr(_LOCAL, "active", None)
+            if not active:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                for profiler in active:
+                    profiler.add(component, elapsed)
+
+        return wrapper
+
+    return decorator
+
+
+class Profiler(object):
+    """Collects the wall time and number of calls per component of the functions
+    decorated with timed() while it is active.
+
+    A profiler is activated as a context manager (nested and repeated activations are
+    allowed, the timings accumulate until reset() is called).
+    """
+
+    def __init__(self):
+        self._time = {}
+        self._calls = {}
+
+    def __enter__(self):
+        _active_profilers().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # remove the last activation of this profiler
+        active = _active_profilers()
+        for i in range(len(active) - 1, -1, -1):
+            if active[i] is self:
+                del active[i]
+                break
+        return False
+
+    @property
+    def active(self):
+        """
+
+        :return: bool, True if the profiler is currently recording
+        """
+        return any(profiler is self for profiler in _active_profilers())
+
+    def add(self, component, elapsed, calls=1):
+        """Records timings of a component.
+
+        :param component: name of the component
+        :param elapsed: wall time [s]
+        :param calls: number of calls
+        :return: None
+        """
+        self._time[component] = self._time.get(component, 0.0) + elapsed
+        self._calls[component] = self._calls.get(component, 0) + calls
+
+    def reset(self):
+        """Deletes all recorded timings.
+
+        :return: None
+        """
+        self._time = {}
+        self._calls = {}
+
+    def report(self):
+        """Aggregated timings.
+
+        :return: dictionary {component: {'time': total wall time [s], 'calls': number
+            of calls, 'time_per_call': mean wall time per call [s]}}, ordered by
+            decreasing total time
+        """
+        report = {}
+        for component in sorted(self._time, key=self._time.get, reverse=True):
+            calls = self._calls[component]
+            report[component] = {
+                "time": self._time[component],
+                "calls": calls,
+                "time_per_call": self._time[component] / max(calls, 1),
+            }
+        return report
+
+    def summary(self):
+        """Human readable table of the aggregated timings.
+
+        :return: string
+        """
+        lines = [
+            "%-50s %10s %12s %14s" % ("component", "calls", "time [s]", "per call [ms]")
+        ]
+        for component, timing in self.report().items():
+            lines.append(
+                "%-50s %10d %12.4f %14.4f"
+                % (
+                    component,
+                    timing["calls"],
+                    timing["time"],
+                    timing["time_per_call"] * 1000,
+                )
+            )
+        return "\n".join(lines)
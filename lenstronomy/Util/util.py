@@ -772,6 +772,34 @@ def convert_bool_list(n, k=None):
     return bool_list
 
 
+@export
+def stack_kwargs_list(kwargs_list_samples):
+    """Stacks the keyword argument lists of several samples (e.g. the lens model
+    parameters of all walkers of a MCMC) into a single list of dictionaries with arrays
+    of the parameter values of all samples.
+
+    :param kwargs_list_samples: list (one entry per sample) of lists of keyword
+        argument dictionaries
+    :return: list of dictionaries with arrays of length n_samples as values, or None if
+        the samples do not share the same keys or have non-scalar parameters
+    """
+    kwargs_stacked = []
+    for kwargs_i in zip(*kwargs_list_samples):
+        keys = kwargs_i[0].keys()
+        if any(kwargs.keys() != keys for kwargs in kwargs_i):
+            return None
+        stacked_i = {}
+        for key in keys:
+            if any(np.ndim(kwargs[key]) != 0 for kwargs in kwargs_i):
+                return None
+            value = np.array([kwargs[key] for kwargs in kwargs_i])
+            if not np.issubdtype(value.dtype, np.number):
+                return None
+            stacked_i[key] = value
+        kwargs_stacked.append(stacked_i)
+    return kwargs_stacked
+
+
 def area(vs):
     """Use Green's theorem to compute the area enclosed by the given contour.
 
@@ -1,3 +1,4 @@
+import contextlib
 import copy
 
 from lenstronomy.Workflow.psf_fitting import PsfFitting
@@ -14,6 +15,7 @@ from lenstronomy.Sampling.Samplers.nautilus_sampler import NautilusSampler
 from lenstronomy.Sampling.Samplers.cobaya_sampler import CobayaSampler
 import numpy as np
 import lenstronomy.Util.analysis_util as analysis_util
+from lenstronomy.Util.profiling import Profiler
 
 __all__ = ["FittingSequence"]
 
@@ -33,6 +35,7 @@ class FittingSequence(object):
         kwargs_params,
         mpi=False,
         verbose=True,
+        shared_memory_pool=False,
     ):
         """
 
@@ -55,12 +58,16 @@ class FittingSequence(object):
         :param mpi: MPI option (bool), if True, will launch an MPI Pool job for the steps in the fitting sequence where
          possible
         :param verbose: bool, if True prints temporary results and indicators of the fitting process
+        :param shared_memory_pool: bool, if True, the PSO and MCMC steps with threadCount > 1 use a persistent pool
+         whose workers stay alive across the fitting steps and receive the likelihood data through shared memory
+         (see SharedMemoryPool)
         """
         self.kwargs_data_joint = kwargs_data_joint
         self.multi_band_list = kwargs_data_joint.get("multi_band_list", [])
         self.multi_band_type = kwargs_data_joint.get("multi_band_type", "single-band")
         self._verbose = verbose
         self._mpi = mpi
+        self._shared_memory_pool = shared_memory_pool
         self._updateManager = MultiBandUpdateManager(
             kwargs_model,
             kwargs_constraints,
@@ -71,6 +78,7 @@ class FittingSequence(object):
         self._mcmc_init_samples = None
         self._psf_iteration_memory = []
         self._psf_iteration_index = 0  # index of the sequence of the PSF iteration (how many times it is being run)
+        self._profiling_reports = []
 
     @property
     def kwargs_fixed(self):
@@ -91,138 +99,158 @@ class FittingSequence(object):
         for i, fitting in enumerate(fitting_list):
             fitting_type = fitting[0]
             kwargs = fitting[1]
-
-            if fitting_type in [
-                "PSO",
-                "SIMPLEX",
-                "MCMC",
-                "emcee",
-                "zeus",
-                "Cobaya",
-                "dynesty",
-                "dyPolyChord",
-                "MultiNest",
-                "nested_sampling",
-                "Nautilus",
-            ]:
-                self._updateManager.check_initial_state()
-            if fitting_type == "restart":
-                self._updateManager.set_init_state()
-                self._updateManager.check_initial_state()
-
-            elif fitting_type == "update_settings":
-                self.update_settings(**kwargs)
-
-            elif fitting_type == "set_param_value":
-                self.set_param_value(**kwargs)
-
-            elif fitting_type == "fix_not_computed":
-                self.fix_not_computed(**kwargs)
-
-            elif fitting_type == "psf_iteration":
-                self.psf_iteration(**kwargs)
-
-            elif fitting_type == "align_images":
-                self.align_images(**kwargs)
-
-            elif fitting_type == "calibrate_images":
-                self.flux_calibration(**kwargs)
-
-            elif fitting_type == "PSO":
-                kwargs_result, chain, param = self.pso(**kwargs)
-                self._updateManager.update_param_state(**kwargs_result)
-
-                chain_list.append([fitting_type, chain, param])
-
-            elif fitting_type == "SIMPLEX":
-                kwargs_result = self.simplex(**kwargs)
-                self._updateManager.update_param_state(**kwargs_result)
-                chain_list.append([fitting_type, kwargs_result])
-
-            elif fitting_type in ["MCMC", "emcee", "zeus"]:
-                if fitting_type == "MCMC":
-                    print("MCMC selected. Sampling with default option emcee.")
-                    fitting_type = "emcee"
-                if "init_samples" not in kwargs:
-                    kwargs["init_samples"] = self._mcmc_init_samples
-                elif kwargs["init_samples"] is None:
-                    kwargs["init_samples"] = self._mcmc_init_samples
-                mcmc_output = self.mcmc(**kwargs, sampler_type=fitting_type)
-                kwargs_result = self._result_from_mcmc(mcmc_output)
-                self._updateManager.update_param_state(**kwargs_result)
-                chain_list.append(mcmc_output)
-
-            elif fitting_type == "Cobaya":
-                print("Using the Metropolis--Hastings MCMC sampler in Cobaya.")
-                param_class = self.param_class
-                kwargs_temp = self._updateManager.parameter_state
-                mean_start = param_class.kwargs2args(**kwargs_temp)
-                kwargs_sigma = self._updateManager.sigma_kwargs
-                sigma_start = np.array(param_class.kwargs2args(**kwargs_sigma))
-                # pass the likelihood and starting info to the sampler
-                sampler = CobayaSampler(self.likelihood_class, mean_start, sigma_start)
-                # run the sampler
-                updated_info, sampler_type, best_fit_values = sampler.run(**kwargs)
-                # change the best-fit values returned by cobaya into lenstronomy kwargs format
-                best_fit_kwargs = self.param_class.args2kwargs(
-                    best_fit_values, bijective=True
-                )
-                # collect the products
-                mh_output = [updated_info, sampler_type, best_fit_kwargs]
-                # append the products to the chain list
-                chain_list.append(mh_output)
-
-            elif fitting_type in [
-                "dynesty",
-                "dyPolyChord",
-                "MultiNest",
-                "nested_sampling",
-            ]:
-                if fitting_type == "nested_sampling":
-                    print(
-                        "Nested sampling selected. Sampling with default option dynesty."
-                    )
-                    fitting_type = "dynesty"
-                ns_output = self.nested_sampling(**kwargs, sampler_type=fitting_type)
-                chain_list.append(ns_output)
-
-            elif fitting_type == "Nautilus":
-                # do importance nested sampling with Nautilus
-                nautilus = NautilusSampler(
-                    likelihood_module=self.likelihood_class, mpi=self._mpi, **kwargs
-                )
-                samples, means, log_z, log_z_err, log_l, results_object = nautilus.run(
-                    **kwargs
-                )
-                chain_list.append(
-                    [
-                        fitting_type,
-                        samples,
-                        nautilus.param_names,
-                        log_l,
-                        log_z,
-                        log_z_err,
-                        results_object,
-                    ]
-                )
-                if kwargs.get("verbose", False):
-                    print(len(samples), "number of points sampled")
-                kwargs_result = self.best_fit_from_samples(
-                    results_object["points"], results_object["log_l"]
-                )
-                self._updateManager.update_param_state(**kwargs_result)
-
+            if self._updateManager.kwargs_likelihood.get("profiling", False):
+                profiler = Profiler()
             else:
-                raise ValueError(
-                    "fitting_sequence {} is not supported. Please use: 'PSO', 'SIMPLEX', "
-                    "'MCMC' or 'emcee', 'zeus', 'Cobaya', "
-                    "'dynesty', 'dyPolyChord',  'Multinest', 'Nautilus, '"
-                    "'psf_iteration', 'restart', 'update_settings', 'calibrate_images' or "
-                    "'align_images'".format(fitting_type)
+                profiler = contextlib.nullcontext()
+            with profiler:
+                self._run_fitting_step(fitting_type, kwargs, chain_list)
+            if isinstance(profiler, Profiler):
+                self._profiling_reports.append(
+                    {
+                        "sequence": i,
+                        "fitting_type": fitting[0],
+                        "report": profiler.report(),
+                    }
                 )
 
         return chain_list
 
+    def _run_fitting_step(self, fitting_type, kwargs, chain_list):
+        """Performs a single step of the fitting sequence.
+
+        :param fitting_type: string of the fitting option
+        :param kwargs: keyword arguments passed to this option
+        :param chain_list: list of fitting results, the results of this step are appended to it
+        :return: None
+        """
+        if fitting_type in [
+            "PSO",
+            "SIMPLEX",
+            "MCMC",
+            "emcee",
+            "zeus",
+            "Cobaya",
+            "dynesty",
+            "dyPolyChord",
+            "MultiNest",
+            "nested_sampling",
+            "Nautilus",
+        ]:
+            self._updateManager.check_initial_state()
+        if fitting_type == "restart":
+            self._updateManager.set_init_state()
+            self._updateManager.check_initial_state()
+
+        elif fitting_type == "update_settings":
+            self.update_settings(**kwargs)
+
+        elif fitting_type == "set_param_value":
+            self.set_param_value(**kwargs)
+
+        elif fitting_type == "fix_not_computed":
+            self.fix_not_computed(**kwargs)
+
+        elif fitting_type == "psf_iteration":
+            self.psf_iteration(**kwargs)
+
+        elif fitting_type == "align_images":
+            self.align_images(**kwargs)
+
+        elif fitting_type == "calibrate_images":
+            self.flux_calibration(**kwargs)
+
+        elif fitting_type == "PSO":
+            kwargs_result, chain, param = self.pso(**kwargs)
+            self._updateManager.update_param_state(**kwargs_result)
+
+            chain_list.append([fitting_type, chain, param])
+
+        elif fitting_type == "SIMPLEX":
+            kwargs_result = self.simplex(**kwargs)
+            self._updateManager.update_param_state(**kwargs_result)
+            chain_list.append([fitting_type, kwargs_result])
+
+        elif fitting_type in ["MCMC", "emcee", "zeus"]:
+            if fitting_type == "MCMC":
+                print("MCMC selected. Sampling with default option emcee.")
+                fitting_type = "emcee"
+            if "init_samples" not in kwargs:
+                kwargs["init_samples"] = self._mcmc_init_samples
+            elif kwargs["init_samples"] is None:
+                kwargs["init_samples"] = self._mcmc_init_samples
+            mcmc_output = self.mcmc(**kwargs, sampler_type=fitting_type)
+            kwargs_result = self._result_from_mcmc(mcmc_output)
+            self._updateManager.update_param_state(**kwargs_result)
+            chain_list.append(mcmc_output)
+
+        elif fitting_type == "Cobaya":
+            print("Using the Metropolis--Hastings MCMC sampler in Cobaya.")
+            param_class = self.param_class
+            kwargs_temp = self._updateManager.parameter_state
+            mean_start = param_class.kwargs2args(**kwargs_temp)
+            kwargs_sigma = self._updateManager.sigma_kwargs
+            sigma_start = np.array(param_class.kwargs2args(**kwargs_sigma))
+            # pass the likelihood and starting info to the sampler
+            sampler = CobayaSampler(self.likelihood_class, mean_start, sigma_start)
+            # run the sampler
+            updated_info, sampler_type, best_fit_values = sampler.run(**kwargs)
+            # change the best-fit values returned by cobaya into lenstronomy kwargs format
+            best_fit_kwargs = self.param_class.args2kwargs(
+                best_fit_values, bijective=True
+            )
+            # collect the products
+            mh_output = [updated_info, sampler_type, best_fit_kwargs]
+            # append the products to the chain list
+            chain_list.append(mh_output)
+
+        elif fitting_type in [
+            "dynesty",
+            "dyPolyChord",
+            "MultiNest",
+            "nested_sampling",
+        ]:
+            if fitting_type == "nested_sampling":
+                print("Nested sampling selected. Sampling with default option dynesty.")
+                fitting_type = "dynesty"
+            ns_output = self.nested_sampling(**kwargs, sampler_type=fitting_type)
+            chain_list.append(ns_output)
+
+        elif fitting_type == "Nautilus":
+            # do importance nested sampling with Nautilus
+            nautilus = NautilusSampler(
+                likelihood_module=self.likelihood_class, mpi=self._mpi, **kwargs
+            )
+            samples, means, log_z, log_z_err, log_l, results_object = nautilus.run(
+                **kwargs
+            )
+            chain_list.append(
+                [
+                    fitting_type,
+                    samples,
+                    nautilus.param_names,
+                    log_l,
+                    log_z,
+                    log_z_err,
+                    results_object,
+                ]
+            )
+            if kwargs.get("verbose", False):
+                print(len(samples), "number of points sampled")
+            kwargs_result = self.best_fit_from_samples(
+                results_object["points"], results_object["log_l"]
+            )
+            self._updateManager.update_param_state(**kwargs_result)
+
+        else:
+            raise ValueError(
+                "fitting_sequence {} is not supported. Please use: 'PSO', 'SIMPLEX', "
+                "'MCMC' or 'emcee', 'zeus', 'Cobaya', "
+                "'dynesty', 'dyPolyChord',  'Multinest', 'Nautilus, '"
+                "'psf_iteration', 'restart', 'update_settings', 'calibrate_images' or "
+                "'align_images'".format(fitting_type)
+            )
+
     def best_fit(self, bijective=False):
         """
 
@@ -304,7 +332,10 @@ class FittingSequence(object):
         param_class = self.param_class
         kwargs_temp = self._updateManager.parameter_state
         init_pos = param_class.kwargs2args(**kwargs_temp)
-        sampler = Sampler(likelihood_class=self.likelihood_class)
+        sampler = Sampler(
+            likelihood_class=self.likelihood_class,
+            shared_memory_pool=self._shared_memory_pool,
+        )
         result = sampler.simplex(init_pos, n_iterations, method)
 
         kwargs_result = param_class.args2kwargs(result, bijective=True)
@@ -324,6 +355,7 @@ class FittingSequence(object):
         progress=True,
         backend_filename=None,
         start_from_backend=False,
+        vectorize=False,
         **kwargs_zeus
     ):
         """MCMC routine.
@@ -344,13 +376,18 @@ class FittingSequence(object):
         :param start_from_backend: if True, start from the state saved in `backup_filename`.
          O therwise, create a new backup file with name `backup_filename` (any already existing file is overwritten!).
         :type start_from_backend: bool
+        :param vectorize: bool, if True, all walkers of a step are evaluated with a single call of
+         Likelihood.logL_batch() (per process)
         :param kwargs_zeus: zeus-specific kwargs
         :return: list of output arguments, e.g. MCMC samples, parameter names, logL distances of all samples specified
          by the specific sampler used
         """
         param_class = self.param_class
         # run PSO
-        mcmc_class = Sampler(likelihood_class=self.likelihood_class)
+        mcmc_class = Sampler(
+            likelihood_class=self.likelihood_class,
+            shared_memory_pool=self._shared_memory_pool,
+        )
         kwargs_temp = self._updateManager.parameter_state
         mean_start = param_class.kwargs2args(**kwargs_temp)
         kwargs_sigma = self._updateManager.sigma_kwargs
@@ -389,6 +426,7 @@ class FittingSequence(object):
                 progress=progress,
                 initpos=initpos,
                 backend_filename=backend_filename,
+                vectorize=vectorize,
                 **kwargs_zeus
             )
             output = [sampler_type, samples, param_list, dist]
@@ -406,6 +444,7 @@ class FittingSequence(object):
                 initpos=initpos,
                 backend_filename=backend_filename,
                 start_from_backend=start_from_backend,
+                vectorize=vectorize,
             )
             output = [sampler_type, samples, param_list, dist]
 
@@ -413,7 +452,13 @@ class FittingSequence(object):
         return output
 
     def pso(
-        self, n_particles, n_iterations, sigma_scale=1, print_key="PSO", threadCount=1
+        self,
+        n_particles,
+        n_iterations,
+        sigma_scale=1,
+        print_key="PSO",
+        threadCount=1,
+        vectorize=False,
     ):
         """Particle Swarm Optimization.
 
@@ -423,6 +468,8 @@ class FittingSequence(object):
             width in the initial settings
         :param print_key: string, printed text when executing this routine
         :param threadCount: number of CPU threads. If MPI option is set, threadCount=1
+        :param vectorize: bool, if True, all particles of an iteration are evaluated
+            with a single call of Likelihood.logL_batch() (per process)
         :return: result of the best fit, the PSO chain of the best fit parameter after
             each iteration [lnlikelihood, parameters, velocities], list of parameters in
             same order as in chain
@@ -444,7 +491,10 @@ class FittingSequence(object):
 
         num_param, param_list = param_class.num_param()
         # run PSO
-        sampler = Sampler(likelihood_class=self.likelihood_class)
+        sampler = Sampler(
+            likelihood_class=self.likelihood_class,
+            shared_memory_pool=self._shared_memory_pool,
+        )
         result, chain = sampler.pso(
             n_particles,
             n_iterations,
@@ -455,6 +505,7 @@ class FittingSequence(object):
             mpi=self._mpi,
             print_key=print_key,
             verbose=self._verbose,
+            vectorize=vectorize,
         )
         kwargs_result = param_class.args2kwargs(result, bijective=True)
         return kwargs_result, chain, param_list
@@ -916,3 +967,20 @@ class FittingSequence(object):
         :return: list of all psf corrections
         """
         return self._psf_iteration_memory
+
+    @property
+    def profiling_reports(self):
+        """
+        returns the timings of the computational components of the fitting steps performed with
+        kwargs_likelihood['profiling'] = True. It stores a list of dictionaries:
+        "sequence": index of the fitting step in the fitting_list
+        "fitting_type": name of the fitting step
+        "report": dictionary of the wall time and number of calls per component (see Profiler.report())
+
+        Only the likelihood evaluations of the main process are timed. With threadCount > 1 or MPI, the likelihood
+        evaluations in the worker processes are not included and the reports understate the time spent in the
+        sampled likelihood components.
+
+        :return: list of timing reports
+        """
+        return self._profiling_reports
@@ -164,6 +164,135 @@ class TestKinematicsAPI(object):
         npt.assert_almost_equal(v_sigma_mge_lens / v_sigma, 1, decimal=1)
         npt.assert_almost_equal(v_sigma / v_sigma_hernquist, 1, decimal=1)
 
+    def test_velocity_dispersion_batch(self):
+        z_lens = 0.5
+        z_source = 1.5
+        kwargs_model = {
+            "lens_model_list": ["SPEP", "SHEAR"],
+            "lens_light_model_list": ["HERNQUIST"],
+        }
+        kwargs_aperture = {
+            "aperture_type": "slit",
+            "length": 3.8,
+            "width": 1.0,
+            "center_ra": 0,
+            "center_dec": 0,
+            "angle": 0,
+        }
+        kwargs_seeing = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        kwargs_lens_list, kwargs_lens_light_list, kwargs_anisotropy_list = [], [], []
+        theta_E = [1.0, 1.2, 0.9]
+        gamma = [2.0, 1.9, 2.1]
+        r_eff = [1.0, 0.7, 1.5]
+        for k in range(3):
+            kwargs_lens_list.append(
+                [
+                    {
+                        "theta_E": theta_E[k],
+                        "gamma": gamma[k],
+                        "center_x": 0,
+                        "center_y": 0,
+                        "e1": 0,
+                        "e2": 0,
+                    },
+                    {"gamma1": 0.01, "gamma2": 0},
+                ]
+            )
+            kwargs_lens_light_list.append(
+                [{"amp": 1, "Rs": 0.551 * r_eff[k], "center_x": 0, "center_y": 0}]
+            )
+            kwargs_anisotropy_list.append({"r_ani": 1.0 + k})
+
+        kin_api = KinematicsAPI(
+            z_lens,
+            z_source,
+            kwargs_model,
+            kwargs_aperture,
+            kwargs_seeing,
+            anisotropy_model="OM",
+            lens_model_kinematics_bool=[True, False],
+            analytic_kinematics=True,
+            sampling_number=10000,
+            kinematics_backend="galkin",
+        )
+        sigma_v_batch = kin_api.velocity_dispersion_batch(
+            kwargs_lens_list,
+            kwargs_lens_light_list,
+            kwargs_anisotropy_list,
+            r_eff=r_eff,
+            theta_E=theta_E,
+            gamma=gamma,
+            kappa_ext=0.1,
+        )
+        assert sigma_v_batch.shape == (3, 1)
+        for k in range(3):
+            sigma_v = kin_api.velocity_dispersion(
+                kwargs_lens_list[k],
+                kwargs_lens_light_list[k],
+                kwargs_anisotropy_list[k],
+                r_eff=r_eff[k],
+                theta_E=theta_E[k],
+                gamma=gamma[k],
+                kappa_ext=0.1,
+            )
+            npt.assert_almost_equal(sigma_v_batch[k] / sigma_v, 1, decimal=2)
+
+        # chunks distributed over a process pool
+        sigma_v_pool = kin_api.velocity_dispersion_batch(
+            kwargs_lens_list,
+            kwargs_lens_light_list,
+            kwargs_anisotropy_list,
+            r_eff=r_eff,
+            theta_E=theta_E,
+            gamma=gamma,
+            kappa_ext=[0.1, 0.1, 0.1],
+            num_processes=2,
+        )
+        npt.assert_almost_equal(sigma_v_pool / sigma_v_batch, 1, decimal=2)
+
+        # numerical kinematics match the evaluation sample by sample
+        kin_api = KinematicsAPI(
+            z_lens,
+            z_source,
+            kwargs_model,
+            kwargs_aperture,
+            kwargs_seeing,
+            anisotropy_model="OM",
+            lens_model_kinematics_bool=[True, False],
+            sampling_number=50,
+            kinematics_backend="galkin",
+        )
+        np.random.seed(42)
+        sigma_v_batch = kin_api.velocity_dispersion_batch(
+            kwargs_lens_list[:2],
+            kwargs_lens_light_list[:2],
+            kwargs_anisotropy_list[:2],
+            r_eff=r_eff[:2],
+            theta_E=theta_E[:2],
+        )
+        np.random.seed(42)
+        for k in range(2):
+            sigma_v = kin_api.velocity_dispersion(
+                kwargs_lens_list[k],
+                kwargs_lens_light_list[k],
+                kwargs_anisotropy_list[k],
+                r_eff=r_eff[k],
+                theta_E=theta_E[k],
+            )
+            npt.assert_almost_equal(sigma_v_batch[k], sigma_v, decimal=8)
+
+        with pytest.raises(ValueError):
+            kin_api.velocity_dispersion_batch(
+                kwargs_lens_list, kwargs_lens_light_list[:2], kwargs_anisotropy_list
+            )
+        with pytest.raises(ValueError):
+            kin_api.velocity_dispersion_batch(
+                kwargs_lens_list,
+                kwargs_lens_light_list,
+                kwargs_anisotropy_list,
+                r_eff=r_eff[:2],
+            )
+
     def test_mge_kinematic_settings(self):
         z_lens = 0.5
         z_source = 1.5
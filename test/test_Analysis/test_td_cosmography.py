@@ -85,6 +85,39 @@ class TestTDCosmography(object):
         ratio = fermat_pot / fermat_pot_true
         assert np.max(np.abs(ratio)) > 1.05
 
+    def test_velocity_dispersion_dimension_less_batch(self):
+        kwargs_lens_light = [{"Rs": 0.5 * 0.551, "center_x": 0, "center_y": 0}]
+        kwargs_anisotropy = {"r_ani": 1}
+        self.td_cosmo.kinematics_modeling_settings(
+            "OM",
+            {},
+            analytic_kinematics=True,
+            Hernquist_approx=False,
+            MGE_light=False,
+            MGE_mass=False,
+            sampling_number=5000,
+        )
+        J_batch = self.td_cosmo.velocity_dispersion_dimension_less_batch(
+            [self.kwargs_lens] * 2,
+            [kwargs_lens_light] * 2,
+            [kwargs_anisotropy] * 2,
+            r_eff=0.5,
+            theta_E=self.kwargs_lens[0]["theta_E"],
+            gamma=2,
+        )
+        assert J_batch.shape == (2, 1)
+        # identical samples share the same draws of the light distribution
+        npt.assert_almost_equal(J_batch[0], J_batch[1], decimal=12)
+        J = self.td_cosmo.velocity_dispersion_dimension_less(
+            self.kwargs_lens,
+            kwargs_lens_light,
+            kwargs_anisotropy,
+            r_eff=0.5,
+            theta_E=self.kwargs_lens[0]["theta_E"],
+            gamma=2,
+        )
+        npt.assert_almost_equal(J_batch[0] / J, 1, decimal=1)
+
     def test_cosmo_inference(self):
         # set up a cosmology
         # compute image postions
@@ -1,7 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from lenstronomy.GalKin.analytic_kinematics import AnalyticKinematics
 import numpy as np
 from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
+from lenstronomy.LightModel.Profiles.hernquist import Hernquist
 from astropy.cosmology import FlatLambdaCDM
 import numpy.testing as npt
 
@@ -105,7 +108,22 @@ class TestAnalyticKinematics(object):
             kwargs_light=kwargs_light,
             kwargs_anisotropy=kwargs_ani,
         )
-        assert IR_sigma2 - IR_sigma2_2 < 10
+        npt.assert_allclose(IR_sigma2_2, IR_sigma2, rtol=1e-5)
+        npt.assert_allclose(IR_2, IR, rtol=1e-5)
+
+        # array of radii, optionally distributed over a pool of threads
+        R = np.array([0.5, 1, 2])
+        IR_sigma2_array, IR_array = kin.I_R_sigma2_and_IR(
+            R, kwargs_mass, kwargs_light, kwargs_ani
+        )
+        with ThreadPoolExecutor(2) as pool:
+            IR_sigma2_pool, IR_pool = kin.I_R_sigma2_and_IR(
+                R, kwargs_mass, kwargs_light, kwargs_ani, pool=pool
+            )
+        npt.assert_almost_equal(IR_sigma2_pool, IR_sigma2_array)
+        npt.assert_almost_equal(IR_pool, IR_array)
+        npt.assert_almost_equal(IR_sigma2_array[1], IR_sigma2_2)
+        npt.assert_almost_equal(IR_array[1], IR_2)
 
     def test_against_numeric_profile(self):
         z_d = 0.295
@@ -169,10 +187,18 @@ class TestAnalyticKinematics(object):
         analytic_vel_dis = np.sqrt(analytic_s2ir / analytic_ir) / 1e3
 
         # check if matches below 1%
-        npt.assert_array_less(
-            (numeric_vel_dis - analytic_vel_dis) / numeric_vel_dis,
-            0.01 * np.ones_like(numeric_vel_dis),
+        npt.assert_allclose(analytic_s2ir, numeric_s2ir, rtol=0.01)
+        # the projected light of NumericKinematics (LightProfile.light_2d_finite) is
+        # underestimated towards the center, the analytic one is checked against the
+        # exact projection of the Hernquist profile (truncated at max_integrate)
+        R_min = np.maximum(R, 1e-4)
+        npt.assert_allclose(
+            analytic_ir,
+            Hernquist().function(R_min, 0, amp=1, Rs=r_eff * 0.551),
+            rtol=1e-3,
         )
+        index = R > 0.1
+        npt.assert_allclose(analytic_vel_dis[index], numeric_vel_dis[index], rtol=0.01)
 
 
 if __name__ == "__main__":
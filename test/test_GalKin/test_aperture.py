@@ -3,6 +3,7 @@ from lenstronomy.GalKin.aperture import Aperture
 import pytest
 import unittest
 import numpy as np
+from scipy.special import erf
 
 
 class TestAperture(object):
@@ -114,6 +115,28 @@ class TestAperture(object):
         assert bool is True
         assert i == 3
 
+    def test_aperture_gaussian_weight(self):
+        kwargs_slit = {
+            "length": 2,
+            "width": 0.5,
+            "center_ra": 0,
+            "center_dec": 0,
+            "angle": 0,
+        }
+        slit = Aperture(aperture_type="slit", **kwargs_slit)
+        weight = slit.aperture_gaussian_weight(
+            ra=np.array([0, 0.9, 1.1]), dec=np.array([0, 0.2, 0.2]), sigma=1e-5
+        )
+        np.testing.assert_almost_equal(weight, [1, 1, 0])
+        # on the edge of the slit length, the width truncates the seeing in addition
+        weight = slit.aperture_gaussian_weight(ra=1.0, dec=0, sigma=0.1)
+        np.testing.assert_almost_equal(weight, 0.5 * erf(0.25 / np.sqrt(0.02)))
+        assert slit.aperture_max_radius >= np.sqrt(1 + 0.25**2)
+
+        kwargs_shell = {"r_in": 0.2, "r_out": 1.0, "center_ra": 0, "center_dec": 0}
+        shell = Aperture(aperture_type="shell", **kwargs_shell)
+        assert shell.aperture_max_radius >= 1
+
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
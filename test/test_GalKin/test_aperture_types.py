@@ -87,6 +87,53 @@ class TestApertureTypesSelect(object):
         )
         assert bool_select is False
 
+    def test_select_array(self):
+        ra = np.array([0, 0.5, 5, 0.9, 3])
+        dec = np.array([0, 0, 5, 0, 0])
+        bool_select = aperture_types.frame_select(
+            ra, dec, width_outer=1.2, width_inner=0.6
+        )
+        assert_array_equal(bool_select, [False, True, False, False, False])
+        bool_select = aperture_types.slit_select(ra, dec, length=2, width=0.5)
+        assert_array_equal(bool_select, [True, True, False, True, False])
+        bool_select = aperture_types.shell_select(ra, dec, r_in=2, r_out=4)
+        assert_array_equal(bool_select, [False, False, False, False, True])
+
+    def test_gaussian_weight(self):
+        ra = np.array([0, 0.5, 5, 0.9, 3, -0.2])
+        dec = np.array([0.05, 0, 5, 0.1, 0, 0.7])
+        kwargs_apertures = [
+            (
+                aperture_types.slit_select,
+                aperture_types.slit_gaussian_weight,
+                {"length": 2, "width": 0.5, "center_ra": 0.1, "angle": 0.3},
+            ),
+            (
+                aperture_types.frame_select,
+                aperture_types.frame_gaussian_weight,
+                {"width_outer": 1.2, "width_inner": 0.6, "angle": 0.5},
+            ),
+            (
+                aperture_types.shell_select,
+                aperture_types.shell_gaussian_weight,
+                {"r_in": 0.2, "r_out": 1, "center_dec": 0.1},
+            ),
+        ]
+        np.random.seed(42)
+        num = 200000
+        for select, gaussian_weight, kwargs in kwargs_apertures:
+            # vanishing seeing recovers the selection
+            weight = gaussian_weight(ra, dec, 1e-5, **kwargs)
+            assert_allclose(weight, select(ra, dec, **kwargs), atol=1e-8)
+            # Monte Carlo estimate of the seeing convolved selection
+            sigma = 0.3
+            for ra_i, dec_i in zip(ra, dec):
+                ra_draw = ra_i + np.random.normal(0, sigma, num)
+                dec_draw = dec_i + np.random.normal(0, sigma, num)
+                weight_mc = np.mean(select(ra_draw, dec_draw, **kwargs))
+                weight = gaussian_weight(ra_i, dec_i, sigma, **kwargs)
+                assert_allclose(weight, weight_mc, atol=5e-3)
+
     def test_general_aperture_select(self):
         ra, dec = 1, 1
         x_cords = y_cords = np.arange(10)
@@ -365,6 +412,13 @@ class TestRaise(object):
         with pytest.raises(ValueError, match="Supersampling factor"):
             aperture.aperture_downsample(v, 2)
 
+    def test_raise_gaussian_weight(self):
+        x = y = np.arange(10)
+        b = np.zeros_like(x, dtype=int)
+        aperture = aperture_types.GeneralAperture(x, y, b)
+        with pytest.raises(ValueError):
+            aperture.gaussian_weight(0, 0, 0.1)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -1,5 +1,6 @@
 """Tests for `galkin` module."""
 
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import unittest
 import copy
@@ -9,6 +10,7 @@ import scipy.integrate as integrate
 from lenstronomy.GalKin.galkin import Galkin
 from lenstronomy.GalKin.light_profile import LightProfile
 import lenstronomy.Util.param_util as param_util
+import lenstronomy.Util.kernel_util as kernel_util
 from lenstronomy.Util import constants as const
 
 
@@ -93,6 +95,35 @@ class TestRaise(unittest.TestCase):
                 voronoi_bins=voronoi_bins,
             )
 
+        # quadrature not supported for IFU apertures and pixelated PSFs
+        kwargs_model = {"anisotropy_model": "OM"}
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        with self.assertRaises(ValueError):
+            Galkin(
+                kwargs_model,
+                {"x_grid": x_grid, "y_grid": y_grid, "aperture_type": "IFU_grid"},
+                {"psf_type": "GAUSSIAN", "fwhm": 1},
+                kwargs_cosmo,
+                kwargs_numerics={"quadrature": True},
+                analytic_kinematics=True,
+            )
+        with self.assertRaises(ValueError):
+            Galkin(
+                kwargs_model,
+                {"r_in": 0.1, "r_out": 1, "aperture_type": "shell"},
+                {
+                    "psf_type": "PIXEL",
+                    "kernel": kernel_util.kernel_gaussian(
+                        num_pix=21, delta_pix=0.1, fwhm=0.7
+                    ),
+                    "delta_pix": 0.1,
+                    "supersampling_factor": 1,
+                },
+                kwargs_cosmo,
+                kwargs_numerics={"quadrature": True},
+                analytic_kinematics=True,
+            )
+
 
 class TestGalkin(object):
     def setup_method(self):
@@ -712,6 +743,29 @@ class TestGalkin(object):
 
         npt.assert_almost_equal(sigma_v, sigma_v_ifu[0], decimal=-1)
 
+    def test_dispersion_map_grid_convolved_pool(self):
+        kwargs_mass = [{"theta_E": 1.0}]
+        kwargs_light = [{"amp": 1, "Rs": 0.5}]
+        kwargs_anisotropy = {"r_ani": 1.0}
+        sigma_v = self.galkin_ifu_grid.dispersion_map_grid_convolved(
+            kwargs_mass, kwargs_light, kwargs_anisotropy, supersampling_factor=3
+        )
+        with ThreadPoolExecutor(2) as pool:
+            sigma_v_pool = self.galkin_ifu_grid.dispersion_map_grid_convolved(
+                kwargs_mass,
+                kwargs_light,
+                kwargs_anisotropy,
+                supersampling_factor=3,
+                pool=pool,
+            )
+        npt.assert_almost_equal(sigma_v_pool, sigma_v, decimal=8)
+
+        # the interpolation of the kinematics is not re-used for other parameters
+        sigma_v_2 = self.galkin_ifu_grid.dispersion_map_grid_convolved(
+            [{"theta_E": 1.5}], kwargs_light, kwargs_anisotropy, supersampling_factor=3
+        )
+        npt.assert_almost_equal(sigma_v_2 / sigma_v, np.sqrt(1.5), decimal=5)
+
     def test_binned_ifu_aperture(self):
 
         # aperture as Voronoi binned IFU
@@ -1041,6 +1095,228 @@ class TestGalkin(object):
         assert x_grid.shape == (30, 30)
         assert y_grid.shape == (30, 30)
 
+    def test_dispersion_batch(self):
+        kwargs_aperture = {
+            "aperture_type": "slit",
+            "length": 1.0,
+            "width": 0.81,
+            "center_ra": 0,
+            "center_dec": 0,
+            "angle": 0,
+        }
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        kwargs_mass_list = [
+            {"theta_E": 1.0, "gamma": 2.0},
+            {"theta_E": 1.2, "gamma": 1.85},
+            {"theta_E": 0.9, "gamma": 2.15},
+        ]
+        kwargs_light_list = [{"r_eff": 1.0}, {"r_eff": 0.6}, {"r_eff": 1.8}]
+        kwargs_anisotropy_list = [{"r_ani": 1.0}, {"r_ani": 3.0}, {"r_ani": 0.5}]
+
+        galkin = Galkin(
+            kwargs_model={"anisotropy_model": "OM"},
+            kwargs_aperture=kwargs_aperture,
+            kwargs_psf=kwargs_psf,
+            kwargs_cosmo=kwargs_cosmo,
+            kwargs_numerics={},
+            analytic_kinematics=True,
+        )
+        sigma_v_batch = galkin.dispersion_batch(
+            copy.deepcopy(kwargs_mass_list),
+            kwargs_light_list,
+            kwargs_anisotropy_list,
+            sampling_number=20000,
+        )
+        assert sigma_v_batch.shape == (3,)
+        for k in range(3):
+            sigma_v = galkin.dispersion(
+                copy.deepcopy(kwargs_mass_list[k]),
+                kwargs_light_list[k],
+                kwargs_anisotropy_list[k],
+                sampling_number=5000,
+            )
+            npt.assert_almost_equal(sigma_v_batch[k] / sigma_v, 1, decimal=2)
+
+        # numerical kinematics evaluate the samples one after the other
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        galkin = Galkin(
+            kwargs_model=kwargs_model,
+            kwargs_aperture=kwargs_aperture,
+            kwargs_psf=kwargs_psf,
+            kwargs_cosmo=kwargs_cosmo,
+        )
+        kwargs_mass_list = [[kwargs] for kwargs in kwargs_mass_list[:2]]
+        kwargs_light_list = [
+            [{"amp": 1, "Rs": 0.551 * kwargs["r_eff"]}] for kwargs in kwargs_light_list
+        ][:2]
+        np.random.seed(42)
+        sigma_v_batch = galkin.dispersion_batch(
+            kwargs_mass_list,
+            kwargs_light_list,
+            kwargs_anisotropy_list[:2],
+            sampling_number=100,
+        )
+        np.random.seed(42)
+        sigma_v = [
+            galkin.dispersion(
+                kwargs_mass_list[k],
+                kwargs_light_list[k],
+                kwargs_anisotropy_list[k],
+                sampling_number=100,
+            )
+            for k in range(2)
+        ]
+        npt.assert_almost_equal(sigma_v_batch, sigma_v, decimal=8)
+
+        with pytest.raises(ValueError):
+            galkin.dispersion_batch(
+                kwargs_mass_list, kwargs_light_list[:1], kwargs_anisotropy_list[:2]
+            )
+
+    def test_dispersion_quadrature(self):
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_numerics = {
+            "interpol_grid_num": 1000,
+            "log_integration": True,
+            "max_integrate": 100,
+            "min_integrate": 0.001,
+        }
+        kwargs_mass = [{"theta_E": 1.2, "gamma": 2.0}]
+        kwargs_light = [{"amp": 1.0, "Rs": 0.5}]
+        kwargs_anisotropy = {"r_ani": 1.0}
+        kwargs_apertures = [
+            {
+                "aperture_type": "slit",
+                "length": 1.0,
+                "width": 0.5,
+                "center_ra": 0.1,
+                "center_dec": 0,
+                "angle": 0.3,
+            },
+            {
+                "aperture_type": "shell",
+                "r_in": 0.2,
+                "r_out": 1.0,
+                "center_ra": 0,
+                "center_dec": 0,
+            },
+            {
+                "aperture_type": "frame",
+                "width_outer": 1.5,
+                "width_inner": 0.5,
+                "center_ra": 0,
+                "center_dec": 0,
+                "angle": 0,
+            },
+        ]
+        kwargs_psfs = [
+            {"psf_type": "GAUSSIAN", "fwhm": 0.7},
+            {"psf_type": "MOFFAT", "fwhm": 0.7, "moffat_beta": 2.5},
+        ]
+        for kwargs_aperture in kwargs_apertures:
+            for kwargs_psf in kwargs_psfs:
+                galkin = Galkin(
+                    kwargs_model=kwargs_model,
+                    kwargs_aperture=kwargs_aperture,
+                    kwargs_psf=kwargs_psf,
+                    kwargs_cosmo=kwargs_cosmo,
+                    kwargs_numerics=kwargs_numerics,
+                )
+                np.random.seed(42)
+                sigma_v_mc = galkin.dispersion(
+                    kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=5000
+                )
+                galkin_quad = Galkin(
+                    kwargs_model=kwargs_model,
+                    kwargs_aperture=kwargs_aperture,
+                    kwargs_psf=kwargs_psf,
+                    kwargs_cosmo=kwargs_cosmo,
+                    kwargs_numerics=dict(kwargs_numerics, quadrature=True),
+                )
+                sigma_v = galkin_quad.dispersion(
+                    kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+                npt.assert_almost_equal(sigma_v / sigma_v_mc, 1, decimal=2)
+                # deterministic
+                sigma_v_2 = galkin_quad.dispersion(
+                    kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+                assert sigma_v_2 == sigma_v
+
+                # analytic kinematics against a high-draw reference
+                kwargs_numerics_analytic = dict(kwargs_numerics, interpol_grid_num=300)
+                galkin = Galkin(
+                    kwargs_model=kwargs_model,
+                    kwargs_aperture=kwargs_aperture,
+                    kwargs_psf=kwargs_psf,
+                    kwargs_cosmo=kwargs_cosmo,
+                    kwargs_numerics=kwargs_numerics_analytic,
+                    analytic_kinematics=True,
+                )
+                np.random.seed(42)
+                sigma_v_mc = galkin.dispersion_batch(
+                    [{"theta_E": 1.2, "gamma": 2.0}],
+                    [{"amp": 1.0, "Rs": 0.5}],
+                    [kwargs_anisotropy],
+                    sampling_number=200000,
+                )[0]
+                galkin_quad = Galkin(
+                    kwargs_model=kwargs_model,
+                    kwargs_aperture=kwargs_aperture,
+                    kwargs_psf=kwargs_psf,
+                    kwargs_cosmo=kwargs_cosmo,
+                    kwargs_numerics=dict(kwargs_numerics_analytic, quadrature=True),
+                    analytic_kinematics=True,
+                )
+                sigma_v = galkin_quad.dispersion(
+                    {"theta_E": 1.2, "gamma": 2.0},
+                    {"amp": 1.0, "Rs": 0.5},
+                    kwargs_anisotropy,
+                )
+                npt.assert_allclose(sigma_v, sigma_v_mc, rtol=2e-3)
+
+        # convergence with the number of quadrature points
+        galkin_fine = Galkin(
+            kwargs_model=kwargs_model,
+            kwargs_aperture=kwargs_apertures[0],
+            kwargs_psf=kwargs_psfs[0],
+            kwargs_cosmo=kwargs_cosmo,
+            kwargs_numerics=dict(
+                kwargs_numerics,
+                quadrature=True,
+                quadrature_num_r=300,
+                quadrature_num_phi=96,
+            ),
+        )
+        galkin_quad = Galkin(
+            kwargs_model=kwargs_model,
+            kwargs_aperture=kwargs_apertures[0],
+            kwargs_psf=kwargs_psfs[0],
+            kwargs_cosmo=kwargs_cosmo,
+            kwargs_numerics=dict(kwargs_numerics, quadrature=True),
+        )
+        npt.assert_almost_equal(
+            galkin_quad.dispersion(kwargs_mass, kwargs_light, kwargs_anisotropy)
+            / galkin_fine.dispersion(kwargs_mass, kwargs_light, kwargs_anisotropy),
+            1,
+            decimal=4,
+        )
+
+    def test_aperture_select_array(self):
+        ra, dec = np.array([0.0, 0.3, 2.0]), np.array([0.0, 0.1, 0.0])
+        bool_select = self.galkin_ifu_grid._aperture_select_array(ra, dec)
+        npt.assert_array_equal(bool_select, [True, True, False])
+
     def test_delta_pix_xy(self):
         """"""
         delta_x, delta_y = self.galkin_ifu_grid._delta_pix_xy()
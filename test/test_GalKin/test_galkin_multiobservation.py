@@ -1,4 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import numpy.testing as npt
 import pytest
+from lenstronomy.GalKin.galkin import Galkin
 from lenstronomy.GalKin.galkin_multiobservation import GalkinMultiObservation
 
 
@@ -67,6 +72,124 @@ class TestGalkinMultiObservation(object):
         assert len(sigma_v_list) == 2
         assert sigma_v_list[0] > sigma_v_list[1]
 
+    def test_dispersion_map_grid_convolved(self):
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_numerics = {
+            "interpol_grid_num": 500,
+            "log_integration": True,
+            "max_integrate": 100,
+            "min_integrate": 0.001,
+        }
+        kwargs_mass = [{"theta_E": 1.2, "gamma": 2.0}]
+        kwargs_light = [{"Rs": 0.5, "amp": 1.0}]
+        kwargs_anisotropy = {"r_ani": 2.0}
+
+        x_grid, y_grid = np.meshgrid(
+            np.arange(-0.95, 1.0, 0.1), np.arange(-0.95, 1.0, 0.1)
+        )
+        bins = np.zeros_like(x_grid, dtype=int) - 1
+        bins[(x_grid > 0) & (y_grid > 0)] = 0
+        bins[(x_grid < 0) & (y_grid < 0)] = 1
+        bins[:3, :3] = 2
+        x_grid_2, y_grid_2 = np.meshgrid(
+            np.arange(-1.4, 1.5, 0.2), np.arange(-1.4, 1.5, 0.2)
+        )
+        kwargs_aperture_list = [
+            {"aperture_type": "IFU_grid", "x_grid": x_grid, "y_grid": y_grid},
+            {
+                "aperture_type": "IFU_binned",
+                "x_grid": x_grid,
+                "y_grid": y_grid,
+                "bins": bins,
+            },
+            {"aperture_type": "IFU_grid", "x_grid": x_grid_2, "y_grid": y_grid_2},
+        ]
+        kwargs_psf_list = [
+            {"psf_type": "GAUSSIAN", "fwhm": 0.5},
+            {"psf_type": "GAUSSIAN", "fwhm": 0.7},
+            {"psf_type": "GAUSSIAN", "fwhm": 1.0},
+        ]
+        galkin_multiobs = GalkinMultiObservation(
+            kwargs_model,
+            kwargs_aperture_list,
+            kwargs_psf_list,
+            kwargs_cosmo,
+            kwargs_numerics=kwargs_numerics,
+        )
+        voronoi_bins_list = [bins, None, None]
+        sigma_v_list = galkin_multiobs.dispersion_map_grid_convolved(
+            kwargs_mass,
+            kwargs_light,
+            kwargs_anisotropy,
+            supersampling_factor=3,
+            voronoi_bins_list=voronoi_bins_list,
+        )
+        assert len(sigma_v_list) == 3
+        assert sigma_v_list[0].shape == (3,)
+        assert sigma_v_list[1].shape == (3,)
+        assert sigma_v_list[2].shape == x_grid_2.shape
+
+        # same as the individual observations
+        for i in range(3):
+            galkin = Galkin(
+                kwargs_model,
+                kwargs_aperture_list[i],
+                kwargs_psf_list[i],
+                kwargs_cosmo,
+                kwargs_numerics=kwargs_numerics,
+            )
+            sigma_v = galkin.dispersion_map_grid_convolved(
+                kwargs_mass,
+                kwargs_light,
+                kwargs_anisotropy,
+                supersampling_factor=3,
+                voronoi_bins=voronoi_bins_list[i],
+            )
+            npt.assert_almost_equal(sigma_v_list[i] / sigma_v, 1, decimal=3)
+
+        # distributed over a pool of threads
+        with ThreadPoolExecutor(2) as pool:
+            sigma_v_list_pool = galkin_multiobs.dispersion_map_grid_convolved(
+                kwargs_mass,
+                kwargs_light,
+                kwargs_anisotropy,
+                supersampling_factor=3,
+                voronoi_bins_list=voronoi_bins_list,
+                pool=pool,
+            )
+        for i in range(3):
+            npt.assert_almost_equal(sigma_v_list_pool[i], sigma_v_list[i], decimal=8)
+
+    def test_raise(self):
+        kwargs_model = {"anisotropy_model": "OM"}
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        x_grid, y_grid = np.meshgrid(np.linspace(-1, 1, 5), np.linspace(-1, 1, 5))
+        kwargs_aperture_list = [
+            {"aperture_type": "IFU_grid", "x_grid": x_grid, "y_grid": y_grid},
+            {"aperture_type": "slit", "width": 1, "length": 1.0},
+        ]
+        kwargs_psf_list = [{"psf_type": "GAUSSIAN", "fwhm": 0.7}] * 2
+        galkin_multiobs = GalkinMultiObservation(
+            kwargs_model,
+            kwargs_aperture_list,
+            kwargs_psf_list,
+            kwargs_cosmo,
+            kwargs_numerics={},
+            analytic_kinematics=True,
+        )
+        kwargs_mass = {"theta_E": 1, "gamma": 2}
+        kwargs_light = {"r_eff": 1}
+        kwargs_anisotropy = {"r_ani": 1}
+        with pytest.raises(ValueError):
+            galkin_multiobs.dispersion_map_grid_convolved(
+                kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,201 @@
+import os
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.GalKin.galkin import Galkin
+from lenstronomy.GalKin.jeans_emulator import JeansEmulator
+from lenstronomy.GalKin.numeric_kinematics import NumericKinematics
+
+
+class TestJeansEmulator(object):
+    @classmethod
+    def setup_class(cls):
+        cls.kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        cls.emulator = JeansEmulator.tabulate(
+            cls.kwargs_model,
+            gamma_range=(1.8, 2.2),
+            num_gamma=9,
+            anisotropy_range=(0.5, 5),
+            num_anisotropy=9,
+            x_range=(1e-3, 10),
+            num_x=60,
+            num_validate=2,
+            seed=42,
+        )
+        cls.kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        cls.kwargs_mass = [{"theta_E": 1.2, "gamma": 1.95}]
+        cls.kwargs_light = [{"amp": 1.0, "Rs": 0.6}]
+        cls.kwargs_anisotropy = {"r_ani": 1.1}
+
+    def test_error_bound(self):
+        assert 0 < self.emulator.error_bound < 0.02
+
+    def test_I_R_sigma2(self):
+        kinematics = NumericKinematics(self.kwargs_model, self.kwargs_cosmo)
+        kinematics_emulated = NumericKinematics(
+            self.kwargs_model, self.kwargs_cosmo, emulator=self.emulator
+        )
+        R = np.array([0.05, 0.3, 1.0, 2.0])
+        I_R_sigma2, I_R = kinematics.I_R_sigma2_and_IR(
+            R, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+        )
+        I_R_sigma2_emu, I_R_emu = kinematics_emulated.I_R_sigma2_and_IR(
+            R, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+        )
+        npt.assert_allclose(I_R_emu, I_R, rtol=0.01)
+        npt.assert_allclose(I_R_sigma2_emu / I_R_emu, I_R_sigma2 / I_R, rtol=0.02)
+        # no cached interpolation is created with the emulator
+        assert not hasattr(kinematics_emulated, "_interp_I_R_sigma2")
+
+        # parameters outside the table are computed numerically
+        kwargs_mass = [{"theta_E": 1.2, "gamma": 2.4}]
+        kinematics.delete_cache()
+        out = kinematics.I_R_sigma2_and_IR(
+            R, kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+        )
+        out_emu = kinematics_emulated.I_R_sigma2_and_IR(
+            R, kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+        )
+        npt.assert_almost_equal(out_emu[0] / out[0], 1, decimal=10)
+        assert hasattr(kinematics_emulated, "_interp_I_R_sigma2")
+
+    def test_outside_x_range(self):
+        # x_range is (1e-3, 10) and r_s = 0.6
+        for R in [np.array([0.3, 7.0]), np.array([1e-4, 0.3]), 7.0]:
+            sigma2 = self.emulator.sigma2(
+                R, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+            )
+            assert sigma2 is None
+        assert (
+            self.emulator.sigma2(
+                5.0, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+            )
+            is not None
+        )
+
+        kinematics = NumericKinematics(self.kwargs_model, self.kwargs_cosmo)
+        kinematics_emulated = NumericKinematics(
+            self.kwargs_model, self.kwargs_cosmo, emulator=self.emulator
+        )
+        R = np.array([0.3, 7.0])
+        out = kinematics.I_R_sigma2_and_IR(
+            R, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+        )
+        out_emu = kinematics_emulated.I_R_sigma2_and_IR(
+            R, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+        )
+        npt.assert_almost_equal(out_emu[0] / out[0], 1, decimal=10)
+        assert hasattr(kinematics_emulated, "_interp_I_R_sigma2")
+
+    def test_save_load(self, tmp_path):
+        path = os.path.join(tmp_path, "jeans_table.npz")
+        self.emulator.save(path)
+        emulator = JeansEmulator.load(path)
+        assert emulator.error_bound == self.emulator.error_bound
+        assert emulator.kwargs_model == self.emulator.kwargs_model
+        R = np.array([0.1, 1.0])
+        npt.assert_almost_equal(
+            emulator.sigma2(
+                R, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+            ),
+            self.emulator.sigma2(
+                R, self.kwargs_mass, self.kwargs_light, self.kwargs_anisotropy
+            ),
+        )
+
+    def test_galkin(self):
+        kwargs_aperture = {
+            "aperture_type": "slit",
+            "length": 1.0,
+            "width": 0.5,
+            "center_ra": 0,
+            "center_dec": 0,
+            "angle": 0,
+        }
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        kwargs_numerics = {
+            "interpol_grid_num": 200,
+            "log_integration": True,
+            "max_integrate": 100,
+            "min_integrate": 1e-4,
+        }
+        sigma_v = []
+        for emulator in [None, self.emulator]:
+            galkin = Galkin(
+                kwargs_model=self.kwargs_model,
+                kwargs_aperture=kwargs_aperture,
+                kwargs_psf=kwargs_psf,
+                kwargs_cosmo=self.kwargs_cosmo,
+                kwargs_numerics=dict(kwargs_numerics, emulator=emulator),
+            )
+            np.random.seed(42)
+            sigma_v.append(
+                galkin.dispersion(
+                    self.kwargs_mass,
+                    self.kwargs_light,
+                    self.kwargs_anisotropy,
+                    sampling_number=1000,
+                )
+            )
+        npt.assert_almost_equal(sigma_v[1] / sigma_v[0], 1, decimal=2)
+
+    def test_isotropic(self):
+        kwargs_model = {
+            "mass_profile_list": ["EPL"],
+            "light_profile_list": ["GAUSSIAN"],
+            "anisotropy_model": "isotropic",
+        }
+        emulator = JeansEmulator.tabulate(
+            kwargs_model, num_gamma=5, x_range=(1e-3, 5), num_x=30, num_validate=0
+        )
+        assert emulator.error_bound is None
+        kinematics = NumericKinematics(kwargs_model, self.kwargs_cosmo)
+        kwargs_mass = [{"theta_E": 1.0, "gamma": 2.0, "e1": 0, "e2": 0}]
+        kwargs_light = [{"amp": 1.0, "sigma": 0.8}]
+        R = np.array([0.2, 1.0])
+        I_R_sigma2, I_R = kinematics.I_R_sigma2_and_IR(R, kwargs_mass, kwargs_light, {})
+        sigma2 = emulator.sigma2(R, kwargs_mass, kwargs_light, {})
+        npt.assert_allclose(
+            sigma2 * self.kwargs_cosmo["d_s"] / self.kwargs_cosmo["d_ds"],
+            I_R_sigma2 / I_R,
+            rtol=0.02,
+        )
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            JeansEmulator.tabulate(
+                {
+                    "mass_profile_list": ["NFW"],
+                    "light_profile_list": ["HERNQUIST"],
+                    "anisotropy_model": "OM",
+                }
+            )
+        with pytest.raises(ValueError):
+            JeansEmulator.tabulate(
+                {
+                    "mass_profile_list": ["SPP"],
+                    "light_profile_list": ["SERSIC"],
+                    "anisotropy_model": "OM",
+                }
+            )
+        with pytest.raises(ValueError):
+            JeansEmulator.tabulate(
+                {
+                    "mass_profile_list": ["SPP"],
+                    "light_profile_list": ["HERNQUIST"],
+                    "anisotropy_model": "GOM",
+                }
+            )
+        with pytest.raises(ValueError):
+            kwargs_model = dict(self.kwargs_model, anisotropy_model="const")
+            NumericKinematics(kwargs_model, self.kwargs_cosmo, emulator=self.emulator)
+
+
+if __name__ == "__main__":
+    pytest.main()
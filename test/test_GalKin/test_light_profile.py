@@ -302,10 +302,12 @@ class TestLightProfile(object):
         lightProfile._light_cdf = 1
         lightProfile._light_cdf_log = 2
         lightProfile._f_light_3d = 3
+        lightProfile._light_3d_cdf_log = 4
         lightProfile.delete_cache()
         assert hasattr(lightProfile, "_light_cdf") is False
         assert hasattr(lightProfile, "_light_cdf_log") is False
         assert hasattr(lightProfile, "_f_light_3d") is False
+        assert hasattr(lightProfile, "_light_3d_cdf_log") is False
 
 
 if __name__ == "__main__":
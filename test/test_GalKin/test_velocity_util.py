@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import numpy.testing as npt
 import numpy as np
@@ -55,6 +57,47 @@ class TestVelocityUtil(object):
         assert x_d != x
         assert y_d != y
 
+    def test_draw_size(self):
+        np.random.seed(41)
+        num = 100000
+        FWHM = 1
+        x, y = velocity_util.displace_PSF_gaussian(np.zeros(num), np.zeros(num), FWHM)
+        assert x.shape == (num,)
+        sigma = FWHM / (2 * np.sqrt(2 * np.log(2)))
+        npt.assert_almost_equal(np.std(x), sigma, decimal=2)
+        npt.assert_almost_equal(np.std(y), sigma, decimal=2)
+
+        x, y = velocity_util.displace_psf_moffat(
+            np.zeros(num), np.zeros(num), FWHM, 2.6
+        )
+        assert x.shape == (num,)
+        assert y.shape == (num,)
+
+        # the median of the Hernquist profile in 3d is at r = a * (1 + sqrt(2))
+        r = velocity_util.draw_hernquist(a=2, size=num)
+        assert r.shape == (num,)
+        npt.assert_almost_equal(np.median(r) / (2 * (1 + np.sqrt(2))), 1, decimal=1)
+
+    def test_hyp_2F1_array(self):
+        z = np.array([-100, -1, 0.1, 0.9])
+        hyp = velocity_util.hyp_2F1_array(a=4, b=2, c=5, z=z)
+        for i in range(len(z)):
+            npt.assert_almost_equal(
+                hyp[i] / float(velocity_util.hyp_2F1(a=4, b=2, c=5, z=z[i])),
+                1,
+                decimal=10,
+            )
+
+    def test_map_array(self):
+        x = np.linspace(0, 1, 11)
+        out = velocity_util.map_array(lambda x_i: (x_i, x_i**2), x)
+        npt.assert_almost_equal(out, np.array([x, x**2]).T)
+        with ThreadPoolExecutor(2) as pool:
+            out_pool = velocity_util.map_array(
+                lambda x_i: (x_i, x_i**2), x, pool=pool, num_chunks=3
+            )
+        npt.assert_almost_equal(out_pool, out)
+
     def test_project_2d_random(self):
         r = 1
         R, x, y = velocity_util.project2d_random(r=r)
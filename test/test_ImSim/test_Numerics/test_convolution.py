@@ -7,7 +7,10 @@ from lenstronomy.ImSim.Numerics.convolution import (
     PixelKernelConvolution,
     SubgridKernelConvolution,
     MGEConvolution,
+    clear_kernel_spectrum_cache,
+    set_kernel_spectrum_cache_size,
 )
+from lenstronomy.ImSim.Numerics import convolution
 from lenstronomy.LightModel.light_model import LightModel
 import lenstronomy.Util.util as util
 import pytest
@@ -29,6 +32,54 @@ class TestPixelKernelConvolution(object):
         image_convolved = pixel_conv.convolution2d(self.model)
         npt.assert_almost_equal(np.sum(image_convolved), np.sum(self.model), decimal=2)
 
+    def test_convolution2d_batch(self):
+        kernel = np.ones((3, 5)) / 15.0
+        images = np.array([self.model, self.model.T, self.model**2])
+        for convolution_type in ["fft_static", "fft", "grid"]:
+            pixel_conv = PixelKernelConvolution(
+                kernel=kernel, convolution_type=convolution_type
+            )
+            images_convolved = pixel_conv.convolution2d_batch(images)
+            for i, image in enumerate(images):
+                npt.assert_almost_equal(
+                    images_convolved[i], pixel_conv.convolution2d(image), decimal=10
+                )
+        # the pre-computed kernel transform is updated when the image shape changes
+        pixel_conv = PixelKernelConvolution(kernel=kernel)
+        pixel_conv.convolution2d_batch(images)
+        images_small = images[:, :6, :8]
+        images_convolved = pixel_conv.convolution2d_batch(images_small)
+        npt.assert_almost_equal(
+            images_convolved[0],
+            PixelKernelConvolution(kernel=kernel).convolution2d(images_small[0]),
+            decimal=10,
+        )
+
+    def test_kernel_spectrum_cache(self):
+        clear_kernel_spectrum_cache()
+        kernel = np.zeros((5, 5))
+        kernel[2, 2] = 1
+        kernel[1, 2] = 0.5
+        pixel_conv = PixelKernelConvolution(kernel=kernel)
+        image_convolved = pixel_conv.convolution2d(self.model)
+        assert len(convolution._kernel_spectrum_cache) == 1
+        # a different instance with the same kernel re-uses the same kernel spectrum
+        pixel_conv_2 = PixelKernelConvolution(kernel=np.copy(kernel))
+        npt.assert_equal(pixel_conv_2.convolution2d(self.model), image_convolved)
+        assert pixel_conv_2._sp2 is pixel_conv._sp2
+        assert len(convolution._kernel_spectrum_cache) == 1
+        # different image shapes and kernels get their own entries
+        pixel_conv_2.convolution2d(self.model[:6, :8])
+        pixel_conv.copy_transpose().convolution2d(self.model)
+        assert len(convolution._kernel_spectrum_cache) == 3
+        # least recently used entries are evicted
+        set_kernel_spectrum_cache_size(2)
+        assert len(convolution._kernel_spectrum_cache) == 2
+        npt.assert_equal(pixel_conv.convolution2d(self.model), image_convolved)
+        set_kernel_spectrum_cache_size(32)
+        clear_kernel_spectrum_cache()
+        assert len(convolution._kernel_spectrum_cache) == 0
+
     def test_copy_transpose(self):
         kernel = np.zeros((3, 3))
         kernel[1, 1] = 1
@@ -389,6 +389,40 @@ class TestNumerics(object):
         delta = (self.image_true * self.psf_norm_factor - image_conv) / self.image_true
         npt.assert_almost_equal(delta[self._conv_pixels_partial], 0, decimal=1)
 
+    def test_re_size_convolve_batch(self):
+        x_shift = [0.0, 0.1, -0.2]
+        for kwargs_numerics in [
+            self.kwargs_numerics_true,
+            self.kwargs_numerics_low_conv_high_grid,
+            self.kwargs_numerics_low_conv_high_adaptive,
+            self.kwargs_numerics_low_res,
+            self.kwargs_numerics_partial,
+        ]:
+            image_model = ImageModel(
+                self.pixel_grid,
+                self.psf_class,
+                lens_light_model_class=self.lightModel,
+                kwargs_numerics=kwargs_numerics,
+            )
+            numerics = image_model.ImageNumerics
+            x, y = numerics.coordinates_evaluate
+            flux_arrays = np.array(
+                [
+                    self.lightModel.surface_brightness(x + dx, y, self.kwargs_light)
+                    for dx in x_shift
+                ]
+            )
+            for unconvolved in [False, True]:
+                images = numerics.re_size_convolve_batch(
+                    flux_arrays, unconvolved=unconvolved
+                )
+                for i, flux_array in enumerate(flux_arrays):
+                    npt.assert_almost_equal(
+                        images[i],
+                        numerics.re_size_convolve(flux_array, unconvolved=unconvolved),
+                        decimal=8,
+                    )
+
     def test_property_access(self):
         image_model = ImageModel(
             self.pixel_grid,
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+import numpy.testing as npt
 
 from lenstronomy.ImSim.SourceReconstruction.pixelated_source_reconstruction import (
     PixelatedSourceReconstruction,
@@ -573,6 +574,49 @@ class TestPixelatedSourceReconstruction(object):
         assert np.allclose(lensed_pixels_no_lens[3][2][2], 0.0, atol=1e-5)
         assert np.allclose(lensed_pixels_no_lens[3][3][2], 1.0, atol=1e-5)
 
+    def test_lensing_operator(self):
+        psr = PixelatedSourceReconstruction(
+            self.data_class,
+            self.psf_class,
+            self.lens_model_class,
+            self.source_pixel_grid_class,
+        )
+        lensing_operator = psr.lensing_operator(kwargs_lens=self.kwargs_lens)
+        assert lensing_operator.shape == (self.num_pix**2, 6)
+        lensed_pixels = psr.lens_pixel_source_of_a_rectangular_region(
+            kwargs_lens=self.kwargs_lens
+        )
+        for k in range(6):
+            npt.assert_almost_equal(
+                lensing_operator[:, k].toarray().reshape(self.num_pix, self.num_pix),
+                psr.sparse_to_array(lensed_pixels[k]),
+                decimal=12,
+            )
+
+        # the sparse convolution operator agrees with the convolution of sparse images
+        convolution_operator = psr.convolution_operator()
+        for k in range(6):
+            convolved = convolution_operator @ lensing_operator[:, k].toarray()
+            npt.assert_almost_equal(
+                convolved.reshape(self.num_pix, self.num_pix),
+                psr.sparse_convolution(lensed_pixels[k]),
+                decimal=12,
+            )
+        kernel_small = self.kernel[8:11, 8:11]
+        image = np.random.rand(self.num_pix, self.num_pix)
+        sp = [
+            [i, j, image[i, j]]
+            for i in range(self.num_pix)
+            for j in range(self.num_pix)
+        ]
+        npt.assert_almost_equal(
+            (psr.convolution_operator(kernel_small) @ image.flatten()).reshape(
+                self.num_pix, self.num_pix
+            ),
+            psr.sparse_convolution(sp, kernel_small),
+            decimal=12,
+        )
+
     def test_lens_an_image_by_rayshooting(self):
         psr = PixelatedSourceReconstruction(
             self.data_class,
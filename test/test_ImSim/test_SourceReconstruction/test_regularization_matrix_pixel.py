@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+import scipy.sparse as sparse
 
 from lenstronomy.ImSim.SourceReconstruction.regularization_matrix_pixel import (
     pixelated_regularization_matrix,
@@ -375,3 +376,12 @@ def test_pixelated_regularization_matrix():
         ]
     )
     assert np.allclose(result, expected, atol=1e-5)
+
+    # sparse output agrees with the dense matrices
+    for regularization_type in ["zeroth_order", "gradient", "curvature"]:
+        result = pixelated_regularization_matrix(
+            4, 3, regularization_type, sparse_matrix=True
+        )
+        assert sparse.issparse(result)
+        expected = pixelated_regularization_matrix(4, 3, regularization_type)
+        assert np.allclose(result.toarray(), expected, atol=1e-12)
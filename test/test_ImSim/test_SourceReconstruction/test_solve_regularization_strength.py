@@ -1,9 +1,15 @@
 import numpy as np
 import pytest
+import scipy.sparse as sparse
 from lenstronomy.ImSim.SourceReconstruction.solve_regularization_strength import (
     d_log_evi_d_lambda,
+    d_log_evi_d_lambda_eigen,
+    generalized_eigen_decomposition,
     solve_optimal_lambda,
 )
+from lenstronomy.ImSim.SourceReconstruction.regularization_matrix_pixel import (
+    pixelated_regularization_matrix,
+)
 
 
 def d_evidence_standard(l, num_reg_shape, Cv, M, b):
@@ -75,6 +81,22 @@ def test_d_log_evi_d_lambda():
     expected_d_evi = d_evidence_standard(l, 10, U, M, b)
     assert np.isclose(result, expected_d_evi, rtol=1e-6)
 
+    # sparse matrices as input
+    result = d_log_evi_d_lambda(l, sparse.csr_matrix(U), sparse.csr_matrix(M), b)
+    assert np.isclose(result, expected_d_evi, rtol=1e-6)
+
+
+def test_d_log_evi_d_lambda_eigen():
+    U = pixelated_regularization_matrix(4, 5, "curvature", sparse_matrix=True)
+    M = np.random.rand(20, 20)
+    M = np.matmul(M, M.T)  # positive semi-definite as M = L^T C_D^-1 L
+    b = np.random.rand(20)
+    mu, c = generalized_eigen_decomposition(U, M, b)
+    for l in [1e-2, 1.0, 1e2]:
+        result = d_log_evi_d_lambda_eigen(l, mu, c)
+        expected_d_evi = d_evidence_standard(l, 20, U.toarray(), M, b)
+        assert np.isclose(result, expected_d_evi, rtol=1e-6)
+
 
 # test solve_optimal_lambda
 def test_solve_optimal_lambda_success():
@@ -248,6 +270,19 @@ def test_solve_optimal_lambda_success():
     )
     assert np.isclose(optimal_lambda, 15136.817236328123, atol=1e-5)
 
+    # a user-defined derivative function is evaluated for every lambda
+    optimal_lambda = solve_optimal_lambda(
+        lambda l, U, M, b: d_log_evi_d_lambda(l, U, M, b),
+        sparse.csr_matrix(U),
+        M,
+        b,
+        lower_bound,
+        upper_bound,
+        tolerance=1e-5,
+        max_iterations=10,
+    )
+    assert np.isclose(optimal_lambda, 15136.817236328123, atol=1e-5)
+
     # Tests for check_initial_bounds parameter
     with pytest.raises(
         ValueError,
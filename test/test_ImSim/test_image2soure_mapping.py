@@ -337,6 +337,81 @@ class TestMultiSourcePlane(object):
             decimal=10,
         )
 
+    def test_ray_tracing_cache(self):
+        x, y = util.make_grid(num_pix=10, delta_pix=0.1)
+        kwargs_lens = self.kwargs_lens
+        kwargs_light = self.kwargs_light
+        for mapping in [
+            self.singlePlane_singlePlane,
+            self.singlePlane_pseudoMulti,
+            self.multi_single,
+            self.multi_multi,
+        ]:
+            mapping_cached = Image2SourceMapping(
+                mapping._lens_model, mapping._light_model, ray_tracing_cache_size=2
+            )
+            flux = mapping.image_flux_joint(
+                x, y, kwargs_lens=kwargs_lens, kwargs_source=kwargs_light
+            )
+            response, n = mapping.image_flux_split(
+                x, y, kwargs_lens=kwargs_lens, kwargs_source=kwargs_light
+            )
+            for _ in range(2):
+                flux_cached = mapping_cached.image_flux_joint(
+                    x, y, kwargs_lens=kwargs_lens, kwargs_source=kwargs_light
+                )
+                npt.assert_almost_equal(flux_cached, flux, decimal=10)
+                response_cached, n_cached = mapping_cached.image_flux_split(
+                    x, y, kwargs_lens=kwargs_lens, kwargs_source=kwargs_light
+                )
+                npt.assert_almost_equal(response_cached, response, decimal=10)
+                assert n_cached == n
+                for index_source in range(2):
+                    npt.assert_almost_equal(
+                        mapping_cached.image2source(x, y, kwargs_lens, index_source),
+                        mapping.image2source(x, y, kwargs_lens, index_source),
+                        decimal=8,
+                    )
+            assert len(mapping_cached._ray_tracing_cache) == 1
+
+        cache = mapping_cached._ray_tracing_cache
+        # new keyword arguments with identical values re-use the entry
+        kwargs_lens_copy = [dict(kwargs) for kwargs in kwargs_lens]
+        mapping_cached.image_flux_joint(x, y, kwargs_lens_copy, kwargs_light)
+        assert len(cache) == 1
+        # changed lens parameters are ray-traced again
+        kwargs_lens_new = [dict(kwargs) for kwargs in kwargs_lens]
+        kwargs_lens_new[0]["theta_E"] = 1.1
+        flux_new = mapping_cached.image_flux_joint(x, y, kwargs_lens_new, kwargs_light)
+        npt.assert_almost_equal(
+            flux_new,
+            self.multi_multi.image_flux_joint(x, y, kwargs_lens_new, kwargs_light),
+            decimal=10,
+        )
+        assert len(cache) == 2
+        # least recently used entries are evicted
+        mapping_cached.image_flux_joint(np.copy(x), y, kwargs_lens, kwargs_light)
+        assert len(cache) == 2
+        mapping_cached.clear_ray_tracing_cache()
+        assert len(cache) == 0
+
+        # distance ratios are part of the key
+        mapping = self.multi_lens_free_distance_ratios
+        mapping_cached = Image2SourceMapping(
+            mapping._lens_model, mapping._light_model, ray_tracing_cache_size=2
+        )
+        for factor in [1, 1.2]:
+            kwargs_special = {"factor_beta_1_2": factor, "delta_x_image": 1}
+            beta_x, beta_y = mapping.image2source(
+                x, y, kwargs_lens, 0, kwargs_special=kwargs_special
+            )
+            beta_x_cached, beta_y_cached = mapping_cached.image2source(
+                x, y, kwargs_lens, 0, kwargs_special=kwargs_special
+            )
+            npt.assert_almost_equal(beta_x_cached, beta_x, decimal=10)
+            npt.assert_almost_equal(beta_y_cached, beta_y, decimal=10)
+        assert len(mapping_cached._ray_tracing_cache) == 2
+
     def test__re_order_split(self):
         lens_model = LensModel(
             lens_model_list=["SIS", "SIS"],
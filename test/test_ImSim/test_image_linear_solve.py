@@ -127,6 +127,171 @@ class TestImageLinearFit(object):
         chi2_reduced = self.imageLinearFit.reduced_chi2(model, error_map)
         npt.assert_almost_equal(chi2_reduced, 1, decimal=1)
 
+    def test_linear_solver_cache(self):
+        image_linear_fit = self.imageLinearFit
+        image_linear_fit_cached = ImageLinearFit(
+            image_linear_fit.Data,
+            image_linear_fit.PSF,
+            image_linear_fit.LensModel,
+            image_linear_fit.SourceModel,
+            image_linear_fit.LensLightModel,
+            image_linear_fit.PointSource,
+            kwargs_numerics={
+                "supersampling_factor": 2,
+                "supersampling_convolution": False,
+            },
+            linear_solver_cache=True,
+        )
+        kwargs_lens_light_shifted = [dict(self.kwargs_lens_light[0], center_x=0.05)]
+        kwargs_source_shifted = [dict(self.kwargs_source[0], R_sersic=0.5)]
+        kwargs_ps_shifted = [dict(self.kwargs_ps[0], ra_source=0.02, dec_source=0.013)]
+        # sequence of calls changing only a subset of the blocks of the response matrix
+        for kwargs_source, kwargs_lens_light, kwargs_ps, inv_bool in [
+            (self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps, False),
+            (self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps, False),
+            (self.kwargs_source, kwargs_lens_light_shifted, self.kwargs_ps, False),
+            (kwargs_source_shifted, kwargs_lens_light_shifted, self.kwargs_ps, False),
+            (
+                kwargs_source_shifted,
+                kwargs_lens_light_shifted,
+                kwargs_ps_shifted,
+                False,
+            ),
+            (self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps, True),
+        ]:
+            # the point source positions are solved once per evaluation as done in the likelihood
+            image_linear_fit.reset_point_source_cache(cache=True)
+            model, error_map, cov_param, param = image_linear_fit.image_linear_solve(
+                self.kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                inv_bool=inv_bool,
+            )
+            (
+                model_cached,
+                error_map_cached,
+                cov_param_cached,
+                param_cached,
+            ) = image_linear_fit_cached.image_linear_solve(
+                self.kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                inv_bool=inv_bool,
+            )
+            npt.assert_allclose(param_cached, param, rtol=1e-6)
+            npt.assert_allclose(model_cached, model, rtol=1e-6, atol=1e-8)
+            npt.assert_almost_equal(error_map_cached, error_map)
+            if inv_bool is True:
+                npt.assert_allclose(cov_param_cached, cov_param, rtol=1e-6)
+
+        # the linear amplitudes do not invalidate the cache
+        cache = image_linear_fit_cached._linear_solver_cache
+        kwargs_source_amp = [dict(self.kwargs_source[0], amp=10)]
+        dirty = cache.dirty_blocks(
+            [
+                (self.kwargs_lens, kwargs_source_amp, None, None),
+                (self.kwargs_lens_light,),
+                (self.kwargs_ps, self.kwargs_lens, None),
+            ]
+        )
+        assert dirty == [False, False, False]
+
+    def test_linear_solver_cache_degenerate(self):
+        # two almost identical deflector light profiles lead to an ill-conditioned
+        # response matrix
+        image_linear_fit = self.imageLinearFit
+        lens_light_model_class = LightModel(light_model_list=["SERSIC", "SERSIC"])
+        kwargs_image_linear_fit = {
+            "data_class": image_linear_fit.Data,
+            "psf_class": image_linear_fit.PSF,
+            "lens_model_class": image_linear_fit.LensModel,
+            "source_model_class": image_linear_fit.SourceModel,
+            "lens_light_model_class": lens_light_model_class,
+            "point_source_class": image_linear_fit.PointSource,
+            "kwargs_numerics": {
+                "supersampling_factor": 2,
+                "supersampling_convolution": False,
+            },
+        }
+        image_linear_fit = ImageLinearFit(**kwargs_image_linear_fit)
+        image_linear_fit_cached = ImageLinearFit(
+            linear_solver_cache=True, **kwargs_image_linear_fit
+        )
+        # only the (ill-conditioned) deflector light block changes in the second call
+        for R_sersic in [0.1, 0.15]:
+            kwargs_lens_light = [
+                dict(self.kwargs_lens_light[0], R_sersic=R_sersic),
+                dict(self.kwargs_lens_light[0], R_sersic=R_sersic * (1 + 1e-6)),
+            ]
+            image_linear_fit.reset_point_source_cache(cache=True)
+            model, _, _, param = image_linear_fit.image_linear_solve(
+                self.kwargs_lens,
+                self.kwargs_source,
+                [dict(kwargs) for kwargs in kwargs_lens_light],
+                self.kwargs_ps,
+            )
+            model_cached, _, _, param_cached = (
+                image_linear_fit_cached.image_linear_solve(
+                    self.kwargs_lens,
+                    self.kwargs_source,
+                    [dict(kwargs) for kwargs in kwargs_lens_light],
+                    self.kwargs_ps,
+                )
+            )
+            npt.assert_array_equal(param, 0)
+            npt.assert_array_equal(param_cached, param)
+            npt.assert_array_equal(model_cached, model)
+            logL, _ = image_linear_fit.likelihood_data_given_model(
+                self.kwargs_lens,
+                self.kwargs_source,
+                [dict(kwargs) for kwargs in kwargs_lens_light],
+                self.kwargs_ps,
+            )
+            logL_cached, _ = image_linear_fit_cached.likelihood_data_given_model(
+                self.kwargs_lens,
+                self.kwargs_source,
+                [dict(kwargs) for kwargs in kwargs_lens_light],
+                self.kwargs_ps,
+            )
+            assert logL_cached == logL
+
+    def test_ray_tracing_cache(self):
+        image_linear_fit = self.imageLinearFit
+        image_linear_fit_cached = ImageLinearFit(
+            image_linear_fit.Data,
+            image_linear_fit.PSF,
+            image_linear_fit.LensModel,
+            image_linear_fit.SourceModel,
+            image_linear_fit.LensLightModel,
+            image_linear_fit.PointSource,
+            kwargs_numerics={
+                "supersampling_factor": 2,
+                "supersampling_convolution": False,
+            },
+            ray_tracing_cache_size=1,
+        )
+        # only the source parameters vary, the ray-tracing is re-used
+        for R_sersic in [0.1, 0.3]:
+            kwargs_source = [dict(self.kwargs_source[0], R_sersic=R_sersic)]
+            image_linear_fit.reset_point_source_cache(cache=True)
+            image_linear_fit_cached.reset_point_source_cache(cache=True)
+            model, _, _, param = image_linear_fit.image_linear_solve(
+                self.kwargs_lens, kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+            )
+            model_cached, _, _, param_cached = (
+                image_linear_fit_cached.image_linear_solve(
+                    self.kwargs_lens,
+                    kwargs_source,
+                    self.kwargs_lens_light,
+                    self.kwargs_ps,
+                )
+            )
+            npt.assert_allclose(param_cached, param, rtol=1e-8)
+            npt.assert_allclose(model_cached, model, rtol=1e-8, atol=1e-10)
+        assert len(image_linear_fit_cached.source_mapping._ray_tracing_cache) == 1
+
     def test_num_param_linear(self):
         num_param_linear = self.imageLinearFit.num_param_linear(
             self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
@@ -1,10 +1,14 @@
 import numpy as np
 import pytest
+import numpy.testing as npt
+from lenstronomy.Cosmo.micro_lensing import einstein_radius, source_size
+from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LensModel.Microlensing.adaptive_boundary_mesh import splitting_centers
 from lenstronomy.LensModel.Microlensing.adaptive_boundary_mesh import loop_information
 from lenstronomy.LensModel.Microlensing.adaptive_boundary_mesh import within_distance
 from lenstronomy.LensModel.Microlensing.adaptive_boundary_mesh import (
     adaptive_boundary_mesh,
+    adaptive_boundary_mesh_light_curve,
 )
 
 
@@ -111,3 +115,150 @@ class Test_adaptive_boundary_mesh:
         assert len(image_subset_centers_x) == expected_number_of_subset_centers
         assert side_length == pytest.approx(expected_side_length, rel=1e-12)
         assert total_number_of_rays_shot == expected_total_number_of_rays_shot
+
+    def test_ABM_light_curve(self):
+        """Tests the light curve mode sharing the pixel hierarchy along a track of
+        source positions against the position by position evaluation."""
+
+        L = 0.0004
+        beta_0 = 0.0016
+        beta_s = 1.16e-5
+        n_p = 5
+        eta = 0.7 * n_p
+        number_of_iterations = 5
+        kwargs_lens = [
+            {"theta_E": 0.0001, "center_x": 0.000025, "center_y": 0.00001666666}
+        ]
+        source_x = np.linspace(-0.00001, 0.00001, 5)
+        source_y = np.zeros_like(source_x)
+
+        (
+            side_length,
+            total_number_of_rays_shot,
+            number_of_pixels,
+            magnification,
+        ) = adaptive_boundary_mesh_light_curve(
+            source_x,
+            source_y,
+            L,
+            beta_0,
+            beta_s,
+            n_p,
+            eta,
+            number_of_iterations,
+            kwargs_lens,
+            segment_size=3,
+        )
+        (
+            side_length_single,
+            total_number_of_rays_shot_single,
+            number_of_pixels_single,
+            magnification_single,
+        ) = adaptive_boundary_mesh_light_curve(
+            source_x,
+            source_y,
+            L,
+            beta_0,
+            beta_s,
+            n_p,
+            eta,
+            number_of_iterations,
+            kwargs_lens,
+            segment_size=1,
+        )
+        assert side_length == pytest.approx(6.4e-7, rel=1e-12)
+        assert side_length_single == side_length
+        npt.assert_array_equal(number_of_pixels, number_of_pixels_single)
+        npt.assert_array_equal(magnification, magnification_single)
+        assert total_number_of_rays_shot < total_number_of_rays_shot_single / 2
+        # same number of pixels as ray-shooting the full high resolution grid
+        num_pix = int(round(L / side_length))
+        x_grid, y_grid = np.meshgrid(
+            (np.arange(num_pix) + 0.5) * side_length - L / 2,
+            (np.arange(num_pix) + 0.5) * side_length - L / 2,
+        )
+        lens = LensModel(lens_model_list=["POINT_MASS"])
+        beta_x, beta_y = lens.ray_shooting(x_grid, y_grid, kwargs_lens)
+        for i in range(len(source_x)):
+            num_within = np.sum(
+                (beta_x - source_x[i]) ** 2 + (beta_y - source_y[i]) ** 2 < beta_s**2
+            )
+            assert number_of_pixels[i] == num_within
+
+        # point mass magnification
+        u = (
+            np.hypot(
+                source_x - kwargs_lens[0]["center_x"],
+                source_y - kwargs_lens[0]["center_y"],
+            )
+            / kwargs_lens[0]["theta_E"]
+        )
+        mag_point_source = (u**2 + 2) / (u * np.sqrt(u**2 + 4))
+        npt.assert_allclose(magnification, mag_point_source, rtol=0.05)
+
+        # segments distributed over processes
+        _, _, number_of_pixels_pool, _ = adaptive_boundary_mesh_light_curve(
+            source_x,
+            source_y,
+            L,
+            beta_0,
+            beta_s,
+            n_p,
+            eta,
+            number_of_iterations,
+            kwargs_lens,
+            segment_size=3,
+            processes=2,
+        )
+        npt.assert_array_equal(number_of_pixels_pool, number_of_pixels)
+
+    def test_ABM_light_curve_single_position(self):
+        """Tests a light curve of a single position against adaptive_boundary_mesh()
+        with its default configuration."""
+
+        theta_E = einstein_radius(0.01, 4000, 8000)
+        beta_s = source_size(20, 8000) / 2
+        L = 4 * theta_E
+        beta_0 = 4 * L
+        n_p = 5
+        eta = 0.7 * n_p
+        number_of_iterations, final_eta = loop_information(eta, beta_0, beta_s)
+        kwargs_lens = [
+            {"theta_E": theta_E, "center_x": theta_E / 4, "center_y": theta_E / 6}
+        ]
+        (
+            side_length,
+            total_number_of_rays_shot,
+            image_subset_centers_x,
+            image_subset_centers_y,
+        ) = adaptive_boundary_mesh(
+            (0, 0),
+            L,
+            beta_0,
+            beta_s,
+            n_p,
+            eta,
+            number_of_iterations,
+            final_eta,
+            kwargs_lens,
+        )
+        (
+            side_length_light_curve,
+            total_number_of_rays_shot_light_curve,
+            number_of_pixels,
+            magnification,
+        ) = adaptive_boundary_mesh_light_curve(
+            [0],
+            [0],
+            L,
+            beta_0,
+            beta_s,
+            n_p,
+            eta,
+            number_of_iterations,
+            kwargs_lens,
+        )
+        assert side_length_light_curve == pytest.approx(side_length, rel=1e-12)
+        assert number_of_pixels[0] == len(image_subset_centers_x)
+        # all rays shot versus the rays of the kept pixels
+        assert total_number_of_rays_shot_light_curve > total_number_of_rays_shot
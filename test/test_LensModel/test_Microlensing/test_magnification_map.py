@@ -0,0 +1,93 @@
+import os
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.Microlensing.magnification_map import (
+    inverse_ray_shooting_magnification_map,
+)
+
+
+class TestMagnificationMap(object):
+    def setup_method(self):
+        np.random.seed(41)
+        num_stars = 150
+        radius = np.sqrt(num_stars / 0.3)  # star convergence of 0.3
+        r = radius * np.sqrt(np.random.rand(num_stars))
+        phi = 2 * np.pi * np.random.rand(num_stars)
+        self.kappa = 0.15
+        self.gamma = 0.1
+        self.lens_model_list = ["POINT_MASS"] * num_stars + ["CONVERGENCE", "SHEAR"]
+        self.kwargs_lens = [
+            {"theta_E": 1.0, "center_x": x, "center_y": y}
+            for x, y in zip(r * np.cos(phi), r * np.sin(phi))
+        ]
+        self.kwargs_lens += [
+            {"kappa": self.kappa},
+            {"gamma1": self.gamma, "gamma2": 0},
+        ]
+        self.kwargs_map = {
+            "source_width": 2,
+            "num_pix_source": 40,
+            "image_width": 8,
+            "num_rays_side": 400,
+        }
+
+    def test_macro_model(self):
+        kwargs_map = dict(self.kwargs_map, num_rays_side=1600)
+        magnification_map = inverse_ray_shooting_magnification_map(
+            ["CONVERGENCE", "SHEAR"],
+            self.kwargs_lens[-2:],
+            num_rays_patch_side=200,
+            **kwargs_map
+        )
+        mag = 1.0 / ((1 - self.kappa) ** 2 - self.gamma**2)
+        assert magnification_map.shape == (40, 40)
+        npt.assert_allclose(np.mean(magnification_map), mag, rtol=5e-3)
+        # aliasing of the regular grid of rays with the pixels
+        npt.assert_allclose(magnification_map, mag, rtol=0.1)
+
+    def test_star_field(self):
+        magnification_map = inverse_ray_shooting_magnification_map(
+            self.lens_model_list, self.kwargs_lens, **self.kwargs_map
+        )
+        magnification_map_exact = inverse_ray_shooting_magnification_map(
+            self.lens_model_list,
+            self.kwargs_lens,
+            opening_angle=None,
+            **self.kwargs_map
+        )
+        # rays close to pixel edges can land in a neighbouring pixel
+        npt.assert_allclose(
+            np.mean(magnification_map), np.mean(magnification_map_exact), rtol=1e-3
+        )
+        pixel_differ = magnification_map != magnification_map_exact
+        assert np.mean(pixel_differ) < 0.3
+        weight = (8 / 400.0) ** 2 / (2 / 40.0) ** 2
+        assert np.max(np.abs(magnification_map - magnification_map_exact)) < 5 * weight
+
+        # the stars produce micro caustics
+        assert np.max(magnification_map) > 2 * np.median(magnification_map)
+
+    def test_memory_map(self, tmp_path):
+        filename = os.path.join(tmp_path, "magnification_map.npy")
+        magnification_map = inverse_ray_shooting_magnification_map(
+            self.lens_model_list,
+            self.kwargs_lens,
+            filename=filename,
+            dtype=np.float32,
+            **self.kwargs_map
+        )
+        assert isinstance(magnification_map, np.memmap)
+        magnification_map_loaded = np.load(filename)
+        assert magnification_map_loaded.dtype == np.float32
+        magnification_map_memory = inverse_ray_shooting_magnification_map(
+            self.lens_model_list, self.kwargs_lens, **self.kwargs_map
+        )
+        npt.assert_allclose(
+            magnification_map_loaded, magnification_map_memory, rtol=1e-3
+        )
+
+
+if __name__ == "__main__":
+    pytest.main()
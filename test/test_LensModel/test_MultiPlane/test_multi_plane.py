@@ -348,6 +348,101 @@ class TestMultiPlane(object):
         npt.assert_almost_equal(beta_x_1, beta_x_2, decimal=8)
         npt.assert_almost_equal(beta_y_1, beta_y_2, decimal=8)
 
+    def test_plane_schedule(self):
+        z_source = 1.5
+        lens_model_list = ["SIS", "NFW", "SIS", "SHEAR", "SIS"]
+        kwargs_lens = [
+            {"theta_E": 0.1, "center_x": 0, "center_y": 0.5},
+            {"Rs": 0.2, "alpha_Rs": 0.05, "center_x": -0.3, "center_y": 0.1},
+            {"theta_E": 1.0, "center_x": 0, "center_y": 0},
+            {"gamma1": 0.05, "gamma2": -0.02},
+            {"theta_E": 0.2, "center_x": 0.5, "center_y": 0},
+        ]
+        redshift_list = [0.7, 0.3, 0.5, 0.5, 0.3]
+        multi_plane_base = MultiPlaneBase(
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+            z_source_convention=z_source,
+        )
+        schedule = multi_plane_base._plane_schedule
+        npt.assert_almost_equal([plane[0] for plane in schedule], [0.3, 0.5, 0.7])
+        assert [plane[1] for plane in schedule] == [0, 2, 4]
+        assert [plane[2] for plane in schedule] == [[0, 1], [2, 3], [4]]
+
+        # reference: ray-tracing deflector by deflector
+        theta_x = np.array([1.0, -0.5, 0.3])
+        theta_y = np.array([0.2, 0.4, -1.1])
+        x, y = np.zeros(3), np.zeros(3)
+        alpha_x, alpha_y = theta_x.copy(), theta_y.copy()
+        for i in range(len(lens_model_list)):
+            x, y = multi_plane_base._ray_step_add(
+                x, y, alpha_x, alpha_y, multi_plane_base.T_ij_list[i]
+            )
+            alpha_x, alpha_y = multi_plane_base._add_deflection(
+                x, y, alpha_x, alpha_y, kwargs_lens, i
+            )
+        T_ij_end = multi_plane_base._cosmo_bkg.T_xy(0.7, z_source)
+        x, y = multi_plane_base._ray_step_add(x, y, alpha_x, alpha_y, T_ij_end)
+
+        x_, y_, alpha_x_, alpha_y_ = multi_plane_base.ray_shooting_partial_comoving(
+            0, 0, theta_x, theta_y, 0, z_source, kwargs_lens
+        )
+        npt.assert_almost_equal(x_, x, decimal=10)
+        npt.assert_almost_equal(y_, y, decimal=10)
+        npt.assert_almost_equal(alpha_x_, alpha_x, decimal=10)
+        npt.assert_almost_equal(alpha_y_, alpha_y, decimal=10)
+        # the input arrays are not altered by the in-place ray-tracing
+        npt.assert_almost_equal(theta_x, [1.0, -0.5, 0.3], decimal=10)
+
+    def test_profile_grouping(self):
+        np.random.seed(41)
+        z_source = 1.5
+        num_halos = 20
+        lens_model_list = ["SIS", "SHEAR"] + ["TNFW"] * num_halos
+        redshift_list = [0.5, 0.5] + list(np.random.choice([0.3, 0.5, 0.8], num_halos))
+        kwargs_lens = [
+            {"theta_E": 1.0, "center_x": 0, "center_y": 0},
+            {"gamma1": 0.05, "gamma2": -0.02},
+        ]
+        for i in range(num_halos):
+            kwargs_lens.append(
+                {
+                    "Rs": 0.1,
+                    "alpha_Rs": np.random.uniform(0.001, 0.01),
+                    "r_trunc": 0.3,
+                    "center_x": np.random.uniform(-2, 2),
+                    "center_y": np.random.uniform(-2, 2),
+                }
+            )
+        lens_model = MultiPlane(
+            z_source=z_source,
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+        )
+        lens_model_grouped = MultiPlane(
+            z_source=z_source,
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+            kwargs_profile_grouping={},
+        )
+        theta_x, theta_y = np.linspace(-1.5, 1.5, 10), np.linspace(1, -1, 10)
+        beta_x, beta_y = lens_model.ray_shooting(theta_x, theta_y, kwargs_lens)
+        beta_x_, beta_y_ = lens_model_grouped.ray_shooting(
+            theta_x, theta_y, kwargs_lens
+        )
+        npt.assert_almost_equal(beta_x_, beta_x, decimal=10)
+        npt.assert_almost_equal(beta_y_, beta_y, decimal=10)
+
+        lens_model_tree = MultiPlane(
+            z_source=z_source,
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+            kwargs_profile_grouping={"opening_angle": 0.3, "leaf_size": 2},
+        )
+        beta_x_, beta_y_ = lens_model_tree.ray_shooting(theta_x, theta_y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_, beta_x, decimal=5)
+        npt.assert_almost_equal(beta_y_, beta_y, decimal=5)
+
     def test_ray_shooting_partial_2(self):
         z_source = 1.5
         lens_model_list = ["SIS", "SIS", "SIS", "SIS"]
@@ -1,6 +1,7 @@
 __author__ = "dangilman"
 
 import copy
+import os
 
 import numpy.testing as npt
 from lenstronomy.LensModel.lens_model import LensModel
@@ -9,7 +10,9 @@ from lenstronomy.LensModel.Util.decouple_multi_plane_util import (
     setup_grids,
     coordinates_and_deflections,
     setup_raytracing_lensmodels,
+    setup_deflection_fields,
     decoupled_multiplane_class_setup,
+    BilinearGridInterpolator,
 )
 from copy import deepcopy
 import numpy as np
@@ -631,6 +634,162 @@ class TestMultiPlaneDecoupled(object):
             npt.assert_almost_equal(beta_x, beta_x_true)
             npt.assert_almost_equal(beta_y, beta_y_true)
 
+    def test_setup_deflection_fields(self, tmp_path):
+        grid_size = 0.05
+        grid_resolution = 0.002
+        filename = os.path.join(tmp_path, "deflection_fields.npy")
+        args = (
+            self.x_image,
+            self.y_image,
+            self.lens_model_true,
+            self.kwargs_lens_true,
+            self.index_lens_split,
+            grid_size,
+            grid_resolution,
+        )
+        # chunks crossing the grids of different images
+        deflection_fields = setup_deflection_fields(
+            *args, filename=filename, chunk_size=100
+        )
+        assert isinstance(deflection_fields, np.memmap)
+        for i in range(0, len(self.x_image)):
+            grid_x, grid_y, _, npix = setup_grids(
+                grid_size, grid_resolution, self.x_image[i], self.y_image[i]
+            )
+            fields = coordinates_and_deflections(
+                self.lens_model_fixed,
+                self.lens_model_free,
+                self.kwargs_lens_fixed,
+                self.kwargs_lens_free,
+                grid_x,
+                grid_y,
+                self.z_split,
+                self.z_source,
+                self.cosmo_bkg,
+            )
+            assert deflection_fields.shape == (len(self.x_image), 6, npix, npix)
+            for k in range(0, 6):
+                npt.assert_almost_equal(
+                    deflection_fields[i, k], fields[k].reshape(npix, npix)
+                )
+
+        deflection_fields_parallel = setup_deflection_fields(
+            *args, processes=2, chunk_size=500
+        )
+        npt.assert_almost_equal(deflection_fields_parallel, deflection_fields)
+
+        # lens models set up from the reloaded fields
+        multiplane_lens_model_list, _ = setup_raytracing_lensmodels(*args)
+        multiplane_lens_model_list_loaded, _ = setup_raytracing_lensmodels(
+            *args, deflection_fields=np.load(filename, mmap_mode="r")
+        )
+        x_grid, y_grid, _, _ = setup_grids(grid_size, 0.0025)
+        for i in range(0, len(self.x_image)):
+            beta_x, beta_y = multiplane_lens_model_list[i].ray_shooting(
+                x_grid + self.x_image[i],
+                y_grid + self.y_image[i],
+                self.kwargs_lens_free,
+            )
+            beta_x_loaded, beta_y_loaded = multiplane_lens_model_list_loaded[
+                i
+            ].ray_shooting(
+                x_grid + self.x_image[i],
+                y_grid + self.y_image[i],
+                self.kwargs_lens_free,
+            )
+            npt.assert_almost_equal(beta_x_loaded, beta_x, decimal=12)
+            npt.assert_almost_equal(beta_y_loaded, beta_y, decimal=12)
+
+        npt.assert_raises(
+            ValueError,
+            setup_raytracing_lensmodels,
+            *args[:-1],
+            grid_resolution=0.001,
+            deflection_fields=deflection_fields,
+        )
+
+    def test_bilinear_grid_interpolator(self):
+        from scipy.interpolate import RegularGridInterpolator
+
+        np.random.seed(42)
+        _, _, interp_points, npix = setup_grids(1.0, 0.05, 0.2, -0.1)
+        values = np.random.rand(npix, npix)
+        interp = BilinearGridInterpolator(interp_points[0], interp_points[1], values)
+        interp_scipy = RegularGridInterpolator(
+            interp_points, values.T, bounds_error=False, fill_value=None
+        )
+        # coordinates inside and outside of the grid
+        x = np.random.uniform(-0.5, 0.9, 1000)
+        y = np.random.uniform(-0.8, 0.6, 1000)
+        npt.assert_almost_equal(interp((x, y)), interp_scipy((x, y)), decimal=12)
+        npt.assert_almost_equal(interp((0.1, 0.2)), interp_scipy((0.1, 0.2)), 12)
+        npt.assert_almost_equal(
+            interp((interp_points[0][3], interp_points[1][5])), values[5, 3], 12
+        )
+        x_grid, y_grid = np.meshgrid(x[:10], y[:10])
+        assert interp((x_grid, y_grid)).shape == (10, 10)
+
+        interp = BilinearGridInterpolator(
+            interp_points[0], interp_points[1], values, fill_value=0.0
+        )
+        outside = (np.abs(x - 0.2) > 0.5) | (np.abs(y + 0.1) > 0.5)
+        npt.assert_almost_equal(interp((x, y))[outside], 0)
+        npt.assert_almost_equal(
+            interp((x, y))[~outside], interp_scipy((x[~outside], y[~outside])), 12
+        )
+
+        interp = BilinearGridInterpolator(
+            interp_points[0], interp_points[1], values, bounds_error=True
+        )
+        interp((0.2, -0.1))
+        npt.assert_raises(ValueError, interp, (x, y))
+
+        x_axis = np.sort(np.random.uniform(-0.3, 0.7, npix))
+        npt.assert_raises(
+            ValueError, BilinearGridInterpolator, x_axis, interp_points[1], values
+        )
+
+    def test_decoupled_multiplane_class_setup_non_uniform_grid(self):
+        from scipy.interpolate import RegularGridInterpolator
+
+        np.random.seed(42)
+        npix = 20
+        interp_points = (
+            np.sort(np.random.uniform(-1, 1, npix)),
+            np.sort(np.random.uniform(-1, 1, npix)),
+        )
+        fields = [np.random.normal(size=npix**2) for _ in range(6)]
+        kwargs_lens_model = decoupled_multiplane_class_setup(
+            self.lens_model_free,
+            *fields,
+            self.z_split,
+            coordinate_type="GRID",
+            interp_points=interp_points,
+        )
+        kwargs_multiplane_model = kwargs_lens_model["kwargs_multiplane_model"]
+        x = np.random.uniform(-1, 1, 100)
+        y = np.random.uniform(-1, 1, 100)
+        for key, field in zip(
+            [
+                "x0_interp",
+                "y0_interp",
+                "alpha_x_interp_foreground",
+                "alpha_y_interp_foreground",
+                "alpha_x_interp_background",
+                "alpha_y_interp_background",
+            ],
+            fields,
+        ):
+            interp_scipy = RegularGridInterpolator(
+                interp_points,
+                field.reshape(npix, npix).T,
+                bounds_error=False,
+                fill_value=None,
+            )
+            npt.assert_almost_equal(
+                kwargs_multiplane_model[key]((x, y)), interp_scipy((x, y)), decimal=12
+            )
+
     def test_change_cosmology(self):
         from astropy.cosmology import FlatwCDM
 
@@ -158,6 +158,43 @@ class TestEPLvsNIE(object):
         npt.assert_almost_equal(f_xy, 0)
         npt.assert_almost_equal(f_yx, 0)
 
+    def test_tol_and_broadcast(self):
+        from lenstronomy.LensModel.Profiles.epl import EPL
+
+        x = np.array([1.0, -0.5, 0.3])
+        y = np.array([0.2, 1.5, -0.7])
+        kwargs = {"theta_E": 1.2, "gamma": 2.1, "e1": 0.2, "e2": -0.1}
+        epl_low_precision = EPL(tol=1e-4)
+        npt.assert_almost_equal(
+            epl_low_precision.derivatives(x, y, **kwargs),
+            self.EPL.derivatives(x, y, **kwargs),
+            decimal=3,
+        )
+        npt.assert_almost_equal(
+            epl_low_precision.hessian(x, y, **kwargs),
+            self.EPL.hessian(x, y, **kwargs),
+            decimal=3,
+        )
+
+        # parameter arrays broadcast against the coordinates
+        theta_E = np.array([[1.0], [1.2]])
+        gamma = np.array([[1.8], [2.2]])
+        f_x, f_y = self.EPL.derivatives(x, y, theta_E, gamma, 0.2, -0.1)
+        f_xx, f_xy, f_yx, f_yy = self.EPL.hessian(x, y, theta_E, gamma, 0.2, -0.1)
+        assert f_x.shape == (2, 3)
+        for i in range(2):
+            f_x_i, f_y_i = self.EPL.derivatives(
+                x, y, theta_E[i, 0], gamma[i, 0], 0.2, -0.1
+            )
+            npt.assert_almost_equal(f_x[i], f_x_i, decimal=12)
+            npt.assert_almost_equal(f_y[i], f_y_i, decimal=12)
+            f_xx_i, f_xy_i, _, f_yy_i = self.EPL.hessian(
+                x, y, theta_E[i, 0], gamma[i, 0], 0.2, -0.1
+            )
+            npt.assert_almost_equal(f_xx[i], f_xx_i, decimal=12)
+            npt.assert_almost_equal(f_xy[i], f_xy_i, decimal=12)
+            npt.assert_almost_equal(f_yy[i], f_yy_i, decimal=12)
+
 
 class TestEPLvsPEMD(object):
     """Test EPL model vs PEMD with FASTELL This tests get only executed if fastell is
@@ -121,6 +121,81 @@ class TestLensEquationSolver(object):
         source_x, source_y = lensModel.ray_shooting(x_pos, y_pos, kwargs_lens)
         npt.assert_almost_equal(sourcePos_x, source_x, decimal=10)
 
+    def test_image_position_batch(self):
+        lens_model_list = ["EPL", "SHEAR"]
+        lensModel = LensModel(lens_model_list)
+        lensEquationSolver = LensEquationSolver(lensModel)
+        kwargs_lens = [
+            {
+                "theta_E": 1.0,
+                "gamma": 2.1,
+                "e1": 0.1,
+                "e2": -0.05,
+                "center_x": 0,
+                "center_y": 0,
+            },
+            {"gamma1": 0.03, "gamma2": 0.01},
+        ]
+        np.random.seed(42)
+        sourcePos_x = np.random.uniform(-0.3, 0.3, 20)
+        sourcePos_y = np.random.uniform(-0.3, 0.3, 20)
+        x_pos_list, y_pos_list = lensEquationSolver.image_position_lenstronomy_batch(
+            sourcePos_x,
+            sourcePos_y,
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=5,
+            precision_limit=10 ** (-10),
+        )
+        assert len(x_pos_list) == 20
+        for i in range(20):
+            x_pos, y_pos = lensEquationSolver.image_position_lenstronomy(
+                sourcePos_x[i],
+                sourcePos_y[i],
+                kwargs_lens,
+                min_distance=0.05,
+                search_window=5,
+                precision_limit=10 ** (-10),
+            )
+            npt.assert_almost_equal(x_pos_list[i], x_pos, decimal=8)
+            npt.assert_almost_equal(y_pos_list[i], y_pos, decimal=8)
+            source_x, source_y = lensModel.ray_shooting(
+                x_pos_list[i], y_pos_list[i], kwargs_lens
+            )
+            npt.assert_almost_equal(source_x, sourcePos_x[i], decimal=9)
+            npt.assert_almost_equal(source_y, sourcePos_y[i], decimal=9)
+
+        # a source far outside the caustics has a single image
+        x_pos_list, y_pos_list = lensEquationSolver.image_position_lenstronomy_batch(
+            [3.0, 0.05], [0, 0.02], kwargs_lens, magnification_limit=0.1
+        )
+        assert len(x_pos_list[0]) == 1
+        x_pos, y_pos = lensEquationSolver.image_position_lenstronomy(
+            0.05, 0.02, kwargs_lens, magnification_limit=0.1
+        )
+        npt.assert_almost_equal(x_pos_list[1], x_pos, decimal=8)
+        mag = lensModel.magnification(x_pos_list[1], y_pos_list[1], kwargs_lens)
+        assert np.all(np.abs(mag) >= 0.1)
+
+        # no sources
+        x_pos_list, y_pos_list = lensEquationSolver.image_position_lenstronomy_batch(
+            [], [], kwargs_lens
+        )
+        assert x_pos_list == [] and y_pos_list == []
+
+        # a source at the center of an isothermal lens has no image at the singular
+        # lens center
+        kwargs_lens[0]["gamma"] = 2
+        x_pos_list, y_pos_list = lensEquationSolver.image_position_lenstronomy_batch(
+            [0.0], [0.0], kwargs_lens
+        )
+        x_pos, y_pos = lensEquationSolver.image_position_lenstronomy(
+            0.0, 0.0, kwargs_lens
+        )
+        assert len(x_pos_list[0]) == len(x_pos) == 4
+        npt.assert_almost_equal(np.sort(x_pos_list[0]), np.sort(x_pos), decimal=8)
+        npt.assert_almost_equal(np.sort(y_pos_list[0]), np.sort(y_pos), decimal=8)
+
     def test_central_image(self):
         lens_model_list = ["SPEP", "SIS", "SHEAR"]
         kwargs_spep = {
@@ -1,6 +1,13 @@
-from lenstronomy.LensModel.Util.epl_util import brentq_nojit
+from lenstronomy.LensModel.Util.epl_util import (
+    brentq_nojit,
+    epl_num_terms,
+    epl_omega_series,
+    epl_major_axis_alpha,
+    epl_major_axis_alpha_hessian,
+)
 import numpy as np
 import numpy.testing as npt
+from scipy.special import hyp2f1
 
 
 def test_brentq_nojit():
@@ -12,3 +19,58 @@ def test_brentq_nojit():
     npt.assert_almost_equal(
         brentq_nojit(lambda x, args: np.cos(x), np.pi, np.pi / 2), np.pi / 2, decimal=10
     )
+
+
+def test_epl_num_terms():
+    assert epl_num_terms(1) == 1
+    assert epl_num_terms(0.5, tol=1e-4) < epl_num_terms(0.5, tol=1e-16)
+    assert epl_num_terms(0.3) > epl_num_terms(0.8)
+    assert epl_num_terms(np.array([0.3, 0.8])) == epl_num_terms(0.3)
+    assert epl_num_terms(0.001, niter_max=50) == 50
+
+
+def test_epl_omega_series():
+    phi = np.linspace(-np.pi, np.pi, 11)
+    t, q = 0.8, 0.4
+    omega_hyp2f1 = np.exp(1j * phi) * hyp2f1(
+        1, t / 2, 2 - t / 2, -(1 - q) / (1 + q) * np.exp(2j * phi)
+    )
+    for tol, decimal in [(1e-16, 14), (1e-6, 5)]:
+        omega = epl_omega_series(phi, t, q, epl_num_terms(q, tol=tol))
+        npt.assert_almost_equal(omega, omega_hyp2f1, decimal=decimal)
+
+
+def test_epl_major_axis_alpha_hessian():
+    x = np.array([0, 1.0, -0.3, 2.0])
+    y = np.array([0, 0.5, 0.7, -1.0])
+    b, t, q = 1.2, 1.1, 0.7
+    niter = epl_num_terms(q)
+    alpha_x, alpha_y = epl_major_axis_alpha(x, y, b, t, q, niter)
+    # the deflection vanishes at the center
+    assert alpha_x[0] == 0 and alpha_y[0] == 0
+    Z = q * x[1:] + 1j * y[1:]
+    R = np.abs(Z)
+    alpha = (
+        2
+        / (1 + q)
+        * (b / R) ** t
+        * Z
+        * hyp2f1(1, t / 2, 2 - t / 2, -(1 - q) / (1 + q) * Z / Z.conj())
+    )
+    npt.assert_almost_equal(alpha_x[1:], alpha.real, decimal=12)
+    npt.assert_almost_equal(alpha_y[1:], alpha.imag, decimal=12)
+
+    result = epl_major_axis_alpha_hessian(x, y, b, t, q, niter)
+    npt.assert_almost_equal(result[0], alpha_x, decimal=14)
+    npt.assert_almost_equal(result[1], alpha_y, decimal=14)
+    # the trace of the Hessian is twice the convergence
+    kappa = (2 - t) / 2 * (b / np.maximum(np.hypot(q * x, y), 1e-8)) ** t
+    npt.assert_almost_equal((result[2] + result[4]) / 2, kappa, decimal=10)
+
+    # parameters given as arrays of the size of the coordinates
+    ones = np.ones_like(x)
+    result_array = epl_major_axis_alpha_hessian(
+        x, y, b * ones, t * ones, q * ones, niter
+    )
+    for value, value_array in zip(result, result_array):
+        npt.assert_almost_equal(value_array, value, decimal=14)
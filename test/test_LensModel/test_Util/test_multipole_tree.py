@@ -0,0 +1,116 @@
+__author__ = "sibirrer"
+
+import numpy as np
+import numpy.testing as npt
+
+from lenstronomy.LensModel.Util.multipole_tree import MultipoleTree
+from lenstronomy.LensModel.Profiles.point_mass import PointMass
+
+
+class TestMultipoleTree(object):
+    def setup_method(self):
+        np.random.seed(42)
+        num = 300
+        self.center_x = np.random.uniform(-5, 5, num)
+        self.center_y = np.random.uniform(-5, 5, num)
+        self.mass = np.random.uniform(0.0001, 0.001, num)
+        self.point_mass = PointMass()
+        self.x = np.random.uniform(-1, 1, 50)
+        self.y = np.random.uniform(-1, 1, 50)
+
+    def _exact_function(self, function_name):
+        function = getattr(self.point_mass, function_name)
+
+        def _function(x, y, index):
+            return np.sum(
+                function(
+                    x[np.newaxis, :],
+                    y[np.newaxis, :],
+                    theta_E=np.sqrt(self.mass[index])[:, np.newaxis],
+                    center_x=self.center_x[index][:, np.newaxis],
+                    center_y=self.center_y[index][:, np.newaxis],
+                ),
+                axis=1,
+            )
+
+        return _function
+
+    def test_evaluate(self):
+        tree = MultipoleTree(
+            self.center_x, self.center_y, self.mass, leaf_size=4, order=4
+        )
+        assert tree.num_nodes > 1
+        for function_name in ["derivatives", "hessian"]:
+            exact_function = self._exact_function(function_name)
+            output_exact = exact_function(self.x, self.y, np.arange(len(self.mass)))
+            output, error = tree.evaluate(
+                function_name, self.x, self.y, exact_function, opening_angle=0.3
+            )
+            npt.assert_almost_equal(output, output_exact, decimal=4)
+            if function_name == "derivatives":
+                diff = np.hypot(*(output - output_exact))
+                assert np.all(diff <= error + 1e-12)
+                assert np.max(error) > 0
+
+        # opening angle of zero evaluates all deflectors exactly
+        exact_function = self._exact_function("derivatives")
+        output, error = tree.evaluate(
+            "derivatives", self.x, self.y, exact_function, opening_angle=0
+        )
+        npt.assert_almost_equal(
+            output, exact_function(self.x, self.y, np.arange(len(self.mass))), 12
+        )
+        npt.assert_almost_equal(error, 0, decimal=12)
+
+        # higher multipole orders are more accurate
+        _, error = tree.evaluate(
+            "derivatives", self.x, self.y, exact_function, opening_angle=0.5
+        )
+        tree_high = MultipoleTree(
+            self.center_x, self.center_y, self.mass, leaf_size=4, order=10
+        )
+        _, error_high = tree_high.evaluate(
+            "derivatives", self.x, self.y, exact_function, opening_angle=0.5
+        )
+        assert np.max(error_high) < np.max(error)
+
+    def test_local_expansion(self):
+        tree = MultipoleTree(
+            self.center_x, self.center_y, self.mass, leaf_size=4, order=6
+        )
+        radius = np.sqrt(2)
+        coeffs, index = tree.local_expansion(0, 0, radius, opening_angle=0.5)
+        assert 0 < len(index) < len(self.mass)
+        for function_name in ["derivatives", "hessian"]:
+            exact_function = self._exact_function(function_name)
+            output_exact = exact_function(self.x, self.y, np.arange(len(self.mass)))
+            output = tree.evaluate_local(
+                function_name, coeffs, 0, 0, self.x, self.y
+            ) + exact_function(self.x, self.y, index)
+            npt.assert_almost_equal(output, output_exact, decimal=5)
+
+        # disk far away from all deflectors
+        coeffs, index = tree.local_expansion(100, 0, radius, opening_angle=0.5)
+        assert len(index) == 0
+        x, y = self.x + 100, self.y
+        output = tree.evaluate_local("derivatives", coeffs, 100, 0, x, y)
+        output_exact = self._exact_function("derivatives")(
+            x, y, np.arange(len(self.mass))
+        )
+        npt.assert_almost_equal(output, output_exact, decimal=10)
+
+    def test_empty(self):
+        tree = MultipoleTree([], [], [])
+        assert tree.num_nodes == 0
+        coeffs, index = tree.local_expansion(0, 0, 1)
+        npt.assert_almost_equal(coeffs, 0)
+        assert len(index) == 0
+        output, error = tree.evaluate(
+            "hessian", self.x, self.y, self._exact_function("hessian")
+        )
+        assert output.shape == (4, len(self.x))
+        npt.assert_almost_equal(output, 0)
+
+    def test_coincident(self):
+        tree = MultipoleTree(np.ones(20), np.ones(20), self.mass[:20], leaf_size=2)
+        assert tree.num_nodes == 1
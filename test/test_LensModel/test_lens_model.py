@@ -278,6 +278,36 @@ class TestLensModel(object):
         # assert delta_x == 1 + 0.19470019576785122/(8*np.pi)
         # assert delta_y == 1 + 0.19470019576785122/(8*np.pi)
 
+    def test_batch(self):
+        x, y = np.array([1.0, 0.5, -0.3]), np.array([0.2, -1.0, 0.4])
+        kwargs_batch = [{"theta_E": [0.8, 1.0], "center_x": 0.1, "center_y": 0.0}]
+        for lens_model in [
+            LensModel(lens_model_list=["SIS"]),
+            LensModel(
+                lens_model_list=["SIS"],
+                multi_plane=True,
+                lens_redshift_list=[0.5],
+                z_source=1.5,
+            ),
+        ]:
+            beta_x, beta_y = lens_model.ray_shooting_batch(x, y, kwargs_batch)
+            f_x, f_y = lens_model.alpha_batch(x, y, kwargs_batch)
+            f_xx, f_xy, f_yx, f_yy = lens_model.hessian_batch(x, y, kwargs_batch)
+            assert beta_x.shape == (2, 3)
+            for j, theta_E in enumerate([0.8, 1.0]):
+                kwargs = [{"theta_E": theta_E, "center_x": 0.1, "center_y": 0.0}]
+                npt.assert_almost_equal(
+                    [beta_x[j], beta_y[j]], lens_model.ray_shooting(x, y, kwargs)
+                )
+                npt.assert_almost_equal(
+                    [f_x[j], f_y[j]], lens_model.alpha(x, y, kwargs)
+                )
+                npt.assert_almost_equal(
+                    [f_xx[j], f_xy[j], f_yx[j], f_yy[j]],
+                    lens_model.hessian(x, y, kwargs),
+                    decimal=5,
+                )
+
     def test_arrival_time(self):
         z_lens = 0.5
         z_source = 1.5
@@ -1,5 +1,6 @@
 __author__ = "sibirrer"
 
+import copy
 import numpy.testing as npt
 import numpy as np
 from lenstronomy.LensModel.lens_model_extensions import LensModelExtensions
@@ -10,6 +11,7 @@ from lenstronomy.Util.magnification_finite_util import (
     auto_raytracing_grid_size,
 )
 import lenstronomy.Util.param_util as param_util
+import lenstronomy.Util.util as util
 from lenstronomy.LightModel.light_model import LightModel
 from astropy.cosmology import FlatLambdaCDM
 
@@ -505,6 +507,105 @@ class TestLensModelExtensions(object):
         sb_true = source_model.surface_brightness(bx, by, kwargs_source)
         npt.assert_equal(True, flux_array[1] == sb_true)
 
+    def test_magnification_finite_adaptive_batch(self):
+        lens_model_list = ["EPL", "SHEAR", "TNFW"]
+        kwargs_lens = [
+            {
+                "theta_E": 1.0,
+                "gamma": 2.0,
+                "e1": 0.02,
+                "e2": -0.09,
+                "center_x": 0,
+                "center_y": 0,
+            },
+            {"gamma1": 0.01, "gamma2": 0.03},
+            {
+                "Rs": 0.02,
+                "alpha_Rs": 0.002,
+                "r_trunc": 0.05,
+                "center_x": 0.8,
+                "center_y": 0.6,
+            },
+        ]
+        kwargs_lens_2 = copy.deepcopy(kwargs_lens)
+        kwargs_lens_2[2]["center_x"] = -0.7
+
+        lensmodel = LensModel(lens_model_list)
+        extension = LensModelExtensions(lensmodel)
+        solver = LensEquationSolver(LensModel(lens_model_list[:2]))
+        source_x, source_y = 0.07, 0.03
+        x_image, y_image = solver.find_bright_image(source_x, source_y, kwargs_lens[:2])
+
+        source_fwhm_parsec = 40.0
+        source_model = LightModel(["GAUSSIAN"])
+        kwargs_source = [
+            {"amp": 1.0, "center_x": source_x, "center_y": source_y, "sigma": 0.0005}
+        ]
+        grid_size = auto_raytracing_grid_size(source_fwhm_parsec)
+        grid_resolution = auto_raytracing_grid_resolution(source_fwhm_parsec)
+
+        for kwargs_aperture in [
+            {},
+            {"axis_ratio": 0},
+            {"axis_ratio": 1},
+            {"use_largest_eigenvalue": False},
+            {"fixed_aperture_size": True},
+            {"step_size": 1000},
+        ]:
+            mag = extension.magnification_finite_adaptive(
+                x_image,
+                y_image,
+                kwargs_lens,
+                source_model,
+                kwargs_source,
+                grid_resolution,
+                grid_size,
+                **kwargs_aperture
+            )
+            mag_batch = extension.magnification_finite_adaptive_batch(
+                x_image,
+                y_image,
+                kwargs_lens,
+                source_model,
+                kwargs_source,
+                grid_resolution,
+                grid_size,
+                **kwargs_aperture
+            )
+            npt.assert_almost_equal(mag_batch / mag, 1, decimal=10)
+
+        # stack of lens model realizations
+        mag_2 = extension.magnification_finite_adaptive(
+            x_image,
+            y_image,
+            kwargs_lens_2,
+            source_model,
+            kwargs_source,
+            grid_resolution,
+            grid_size,
+        )
+        mag_batch = extension.magnification_finite_adaptive_batch(
+            x_image,
+            y_image,
+            [kwargs_lens, kwargs_lens_2],
+            source_model,
+            kwargs_source,
+            grid_resolution,
+            grid_size,
+        )
+        assert mag_batch.shape == (2, len(x_image))
+        npt.assert_almost_equal(mag_batch[1] / mag_2, 1, decimal=10)
+        mag_batch = extension.magnification_finite_adaptive_batch(
+            [x_image, x_image],
+            [y_image, y_image],
+            [kwargs_lens, kwargs_lens_2],
+            source_model,
+            kwargs_source,
+            grid_resolution,
+            grid_size,
+        )
+        npt.assert_almost_equal(mag_batch[1] / mag_2, 1, decimal=10)
+
     def test_zoom_source(self):
         lens_model_list = ["SIE", "SHEAR"]
         lensModel = LensModel(lens_model_list=lens_model_list)
@@ -564,3 +665,112 @@ class TestLensModelExtensions(object):
             index_vertices=0,
         )
         npt.assert_almost_equal(area, 0.08445866728739478, decimal=3)
+
+        caustics = lensModelExtensions.critical_curve_caustics_adaptive(
+            kwargs_lens, **kwargs_caustic_num
+        )
+        area_adaptive = lensModelExtensions.caustic_area(
+            kwargs_lens=kwargs_lens, index_vertices=0, caustics=caustics
+        )
+        npt.assert_almost_equal(area_adaptive, 0.08445866728739478, decimal=3)
+
+    def test_critical_curve_caustics_adaptive(self):
+        lens_model_list = ["NFW", "SHEAR", "SIS"]
+        lensModel = LensModel(lens_model_list)
+        lensModelExtensions = LensModelExtensions(lensModel)
+        kwargs_lens = [
+            {"Rs": 1.0, "alpha_Rs": 1.6, "center_x": 0, "center_y": 0},
+            {"gamma1": 0.05, "gamma2": 0},
+            {"theta_E": 0.05, "center_x": 1.05, "center_y": 0.9},
+        ]
+        kwargs_caustic_num = {
+            "compute_window": 5,
+            "grid_scale": 0.005,
+            "center_x": 0.1,
+            "center_y": -0.05,
+        }
+        (
+            ra_crit_list,
+            dec_crit_list,
+            ra_caustic_list,
+            dec_caustic_list,
+        ) = lensModelExtensions.critical_curve_caustics(
+            kwargs_lens, **kwargs_caustic_num
+        )
+        (
+            ra_crit_list_adaptive,
+            dec_crit_list_adaptive,
+            ra_caustic_list_adaptive,
+            dec_caustic_list_adaptive,
+        ) = lensModelExtensions.critical_curve_caustics_adaptive(
+            kwargs_lens, start_scale=0.02, **kwargs_caustic_num
+        )
+
+        def _areas(ra_list, dec_list):
+            # the tiling routine also returns tiny fragments at the singular SIS center
+            areas = np.array(
+                [
+                    util.area(np.dstack([ra, dec])[0])
+                    for ra, dec in zip(ra_list, dec_list)
+                ]
+            )
+            return np.sort(areas[np.abs(areas) > 1e-4])
+
+        npt.assert_almost_equal(
+            _areas(ra_crit_list_adaptive, dec_crit_list_adaptive),
+            _areas(ra_crit_list, dec_crit_list),
+            decimal=4,
+        )
+        npt.assert_almost_equal(
+            _areas(ra_caustic_list_adaptive, dec_caustic_list_adaptive),
+            _areas(ra_caustic_list, dec_caustic_list),
+            decimal=3,
+        )
+        for ra, dec, ra_caustic, dec_caustic in zip(
+            ra_crit_list_adaptive,
+            dec_crit_list_adaptive,
+            ra_caustic_list_adaptive,
+            dec_caustic_list_adaptive,
+        ):
+            # closed and ordered curves on the critical curve
+            npt.assert_almost_equal([ra[0], dec[0]], [ra[-1], dec[-1]], decimal=10)
+            assert np.max(np.hypot(np.diff(ra), np.diff(dec))) < 2 * 0.005
+            if len(ra) > 100:
+                # the loops around the singular SIS center are resolved by few cells
+                mag = lensModel.magnification(ra, dec, kwargs_lens)
+                assert np.min(np.abs(mag)) > 100
+            beta_x, beta_y = lensModel.ray_shooting(ra, dec, kwargs_lens)
+            npt.assert_almost_equal(ra_caustic, beta_x, decimal=10)
+
+        # tangential and radial critical curves are returned in the same order
+        lensModel = LensModel(["NIE", "SHEAR"])
+        lensModelExtensions = LensModelExtensions(lensModel)
+        kwargs_lens = [
+            {
+                "theta_E": 1,
+                "e1": 0.1,
+                "e2": 0.05,
+                "s_scale": 0.2,
+                "center_x": 0,
+                "center_y": 0,
+            },
+            {"gamma1": 0.03, "gamma2": 0.01},
+        ]
+        caustics = lensModelExtensions.critical_curve_caustics_adaptive(kwargs_lens)
+        assert len(caustics[0]) == 2
+        for index_vertices in [0, 1]:
+            area = lensModelExtensions.caustic_area(
+                kwargs_lens, index_vertices=index_vertices
+            )
+            area_adaptive = lensModelExtensions.caustic_area(
+                kwargs_lens, index_vertices=index_vertices, caustics=caustics
+            )
+            npt.assert_almost_equal(area_adaptive / area, 1, decimal=3)
+
+        # no critical curves
+        lensModel = LensModel(["SHEAR"])
+        lensModelExtensions = LensModelExtensions(lensModel)
+        output = lensModelExtensions.critical_curve_caustics_adaptive(
+            [{"gamma1": 0.01, "gamma2": 0}]
+        )
+        assert output == ([], [], [], [])
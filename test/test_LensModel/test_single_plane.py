@@ -121,6 +121,192 @@ class TestLensModel(object):
         npt.assert_almost_equal(alpha_x_scaled, alpha_x * alpha_scaling)
         npt.assert_almost_equal(alpha_y_scaled, alpha_y * alpha_scaling)
 
+    def test_batch(self):
+        lens_model = SinglePlane(["EPL", "SHEAR", "SIS"])
+        x, y = np.linspace(-1.5, 1.5, 10), np.linspace(1, -1, 10)
+        theta_E = np.array([0.9, 1.0, 1.1])
+        gamma = np.array([1.9, 2.0, 2.1])
+        epl_array = np.array(
+            [theta_E, gamma, [0.1, 0, -0.1], [0, 0.05, 0.1], [0, 0.1, 0], [0, 0, 0.1]]
+        ).T
+        kwargs_batch = [
+            epl_array,
+            {"gamma1": [0.01, 0.02, 0.03], "gamma2": -0.02},
+            {"theta_E": 0.1, "center_x": 1, "center_y": 0},
+        ]
+        f_x, f_y = lens_model.alpha_batch(x, y, kwargs_batch)
+        f_xx, f_xy, f_yx, f_yy = lens_model.hessian_batch(x, y, kwargs_batch)
+        beta_x, beta_y = lens_model.ray_shooting_batch(x, y, kwargs_batch)
+        assert f_x.shape == (3, 10)
+        for j in range(3):
+            kwargs = [
+                dict(zip(lens_model.param_name_list[0], epl_array[j])),
+                {"gamma1": [0.01, 0.02, 0.03][j], "gamma2": -0.02},
+                {"theta_E": 0.1, "center_x": 1, "center_y": 0},
+            ]
+            f_x_j, f_y_j = lens_model.alpha(x, y, kwargs)
+            npt.assert_almost_equal(f_x[j], f_x_j, decimal=10)
+            npt.assert_almost_equal(f_y[j], f_y_j, decimal=10)
+            beta_x_j, beta_y_j = lens_model.ray_shooting(x, y, kwargs)
+            npt.assert_almost_equal(beta_x[j], beta_x_j, decimal=10)
+            npt.assert_almost_equal(beta_y[j], beta_y_j, decimal=10)
+            hessian_j = lens_model.hessian(x, y, kwargs)
+            npt.assert_almost_equal(
+                [f_xx[j], f_xy[j], f_yx[j], f_yy[j]], hessian_j, decimal=10
+            )
+
+        f_x_0, _ = lens_model.alpha_batch(x, y, kwargs_batch, k=0)
+        f_x_1, _ = lens_model.alpha_batch(x, y, kwargs_batch, k=[1, 2])
+        npt.assert_almost_equal(f_x_0 + f_x_1, f_x, decimal=10)
+
+        with pytest.raises(ValueError):
+            lens_model.alpha_batch(x, y, kwargs_batch[:2])
+        with pytest.raises(ValueError):
+            lens_model.alpha_batch(x, y, [epl_array[:, :3]] + kwargs_batch[1:])
+        with pytest.raises(ValueError):
+            lens_model.alpha_batch(x, y, [epl_array[:2]] + kwargs_batch[1:])
+
+    def test_profile_grouping(self):
+        np.random.seed(42)
+        num_halos = 30
+        lens_model_list = ["SIE", "SHEAR"] + ["TNFW"] * num_halos + ["NFW"] * 3
+        kwargs_lens = [
+            {"theta_E": 1.0, "e1": 0.1, "e2": -0.05, "center_x": 0, "center_y": 0},
+            {"gamma1": 0.03, "gamma2": 0.01},
+        ]
+        for i in range(num_halos):
+            kwargs_lens.append(
+                {
+                    "Rs": np.random.uniform(0.05, 0.2),
+                    "alpha_Rs": np.random.uniform(0.001, 0.01),
+                    "r_trunc": np.random.uniform(0.1, 0.5),
+                    "center_x": np.random.uniform(-2, 2),
+                    "center_y": np.random.uniform(-2, 2),
+                }
+            )
+        for i in range(3):
+            kwargs_lens.append(
+                {"Rs": 0.3, "alpha_Rs": 0.02, "center_x": 0.5 * i, "center_y": -0.2}
+            )
+        x, y = np.meshgrid(np.linspace(-1.5, 1.5, 6), np.linspace(-1, 1, 4))
+        lens_model = SinglePlane(lens_model_list)
+        lens_model_grouped = SinglePlane(lens_model_list, kwargs_profile_grouping={})
+        assert lens_model_grouped.profile_grouping is True
+        assert lens_model.profile_grouping is False
+        f_x, f_y = lens_model.alpha(x, y, kwargs_lens)
+        f_x_grouped, f_y_grouped = lens_model_grouped.alpha(x, y, kwargs_lens)
+        assert f_x_grouped.shape == x.shape
+        npt.assert_almost_equal(f_x_grouped, f_x, decimal=10)
+        npt.assert_almost_equal(f_y_grouped, f_y, decimal=10)
+        hessian = lens_model.hessian(x, y, kwargs_lens)
+        hessian_grouped = lens_model_grouped.hessian(x, y, kwargs_lens)
+        npt.assert_almost_equal(hessian_grouped, hessian, decimal=10)
+
+        # scalar input and sub-sets of the models
+        f_x, f_y = lens_model.alpha(0.3, -0.2, kwargs_lens, k=[0, 2, 3])
+        f_x_grouped, f_y_grouped = lens_model_grouped.alpha(
+            0.3, -0.2, kwargs_lens, k=[0, 2, 3]
+        )
+        npt.assert_almost_equal(f_x_grouped, f_x, decimal=10)
+        npt.assert_almost_equal(f_y_grouped, f_y, decimal=10)
+
+        # models with different sets of keyword arguments are evaluated one by one
+        kwargs_mixed = kwargs_lens[:-1] + [{"Rs": 0.3, "alpha_Rs": 0.02}]
+        f_x, f_y = lens_model.alpha(x, y, kwargs_mixed)
+        f_x_grouped, f_y_grouped = lens_model_grouped.alpha(x, y, kwargs_mixed)
+        npt.assert_almost_equal(f_x_grouped, f_x, decimal=10)
+        npt.assert_almost_equal(f_y_grouped, f_y, decimal=10)
+
+        # small chunks give the same result
+        lens_model_chunk = SinglePlane(
+            lens_model_list, kwargs_profile_grouping={"max_chunk_size": 50}
+        )
+        f_x_chunk, f_y_chunk = lens_model_chunk.alpha(x, y, kwargs_lens)
+        f_x, f_y = lens_model.alpha(x, y, kwargs_lens)
+        npt.assert_almost_equal(f_x_chunk, f_x, decimal=10)
+        npt.assert_almost_equal(f_y_chunk, f_y, decimal=10)
+
+    def test_profile_grouping_truncation(self):
+        lens_model_list = ["TNFW", "TNFW"]
+        kwargs_lens = [
+            {
+                "Rs": 0.1,
+                "alpha_Rs": 0.01,
+                "r_trunc": 0.2,
+                "center_x": 30,
+                "center_y": 0,
+            },
+            {
+                "Rs": 0.1,
+                "alpha_Rs": 0.01,
+                "r_trunc": 0.2,
+                "center_x": 0.5,
+                "center_y": 0,
+            },
+        ]
+        x, y = np.linspace(-1, 1, 10), np.linspace(-1, 1, 10)
+        lens_model = SinglePlane(lens_model_list)
+        lens_model_grouped = SinglePlane(
+            lens_model_list, kwargs_profile_grouping={"truncation_factor": 20}
+        )
+        far = lens_model_grouped._far_from_coordinates(
+            x,
+            y,
+            {"center_x": np.array([30, 0.5]), "center_y": np.array([0, 0])},
+            radius=np.array([4, 4]),
+        )
+        npt.assert_equal(far, [True, False])
+        f_x, f_y = lens_model.alpha(x, y, kwargs_lens)
+        f_x_grouped, f_y_grouped = lens_model_grouped.alpha(x, y, kwargs_lens)
+        npt.assert_almost_equal(f_x_grouped / f_x, 1, decimal=4)
+        npt.assert_almost_equal(f_y_grouped, f_y, decimal=6)
+        hessian = lens_model.hessian(x, y, kwargs_lens)
+        hessian_grouped = lens_model_grouped.hessian(x, y, kwargs_lens)
+        npt.assert_almost_equal(hessian_grouped, hessian, decimal=6)
+
+    def test_profile_grouping_tree_code(self):
+        np.random.seed(7)
+        num_halos = 200
+        lens_model_list = ["SIS"] + ["TNFW"] * num_halos + ["POINT_MASS"] * 20
+        kwargs_lens = [{"theta_E": 1.0, "center_x": 0, "center_y": 0}]
+        for i in range(num_halos):
+            kwargs_lens.append(
+                {
+                    "Rs": 0.05,
+                    "alpha_Rs": np.random.uniform(0.001, 0.005),
+                    "r_trunc": 0.1,
+                    "center_x": np.random.uniform(-8, 8),
+                    "center_y": np.random.uniform(-8, 8),
+                }
+            )
+        for i in range(20):
+            kwargs_lens.append(
+                {
+                    "theta_E": 0.001,
+                    "center_x": np.random.uniform(-8, 8),
+                    "center_y": np.random.uniform(-8, 8),
+                }
+            )
+        x, y = np.meshgrid(np.linspace(-1.5, 1.5, 6), np.linspace(-1, 1, 4))
+        lens_model = SinglePlane(lens_model_list)
+        lens_model_tree = SinglePlane(
+            lens_model_list,
+            kwargs_profile_grouping={"opening_angle": 0.5, "leaf_size": 4},
+        )
+        f_x, f_y = lens_model.alpha(x, y, kwargs_lens)
+        f_x_tree, f_y_tree = lens_model_tree.alpha(x, y, kwargs_lens)
+        assert f_x_tree.shape == x.shape
+        npt.assert_almost_equal(f_x_tree, f_x, decimal=5)
+        npt.assert_almost_equal(f_y_tree, f_y, decimal=5)
+        hessian = lens_model.hessian(x, y, kwargs_lens)
+        hessian_tree = lens_model_tree.hessian(x, y, kwargs_lens)
+        npt.assert_almost_equal(hessian_tree, hessian, decimal=5)
+
+        error = lens_model_tree.alpha_error_estimate(x, y, kwargs_lens)
+        assert error.shape == x.shape
+        assert np.max(error) > 0
+        npt.assert_almost_equal(lens_model.alpha_error_estimate(x, y, kwargs_lens), 0)
+
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
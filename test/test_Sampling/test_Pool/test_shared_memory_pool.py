@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+from lenstronomy.Sampling.Pool.shared_memory_pool import (
+    SharedArrayStore,
+    SharedLogL,
+    SharedMemoryPool,
+    get_shared_memory_pool,
+    loads_shared,
+)
+
+
+class _ArrayLikelihood(object):
+    """Minimal likelihood holding a large data array."""
+
+    def __init__(self, data, scale=1.0):
+        self.data = data
+        self.kernel = np.ones(3)
+        self.scale = scale
+
+    def logL(self, args):
+        return -np.sum((self.data - args[0]) ** 2) * self.scale
+
+    def logL_batch(self, args_array):
+        return np.array([self.logL(args) for args in args_array])
+
+
+class TestSharedArrayStore(object):
+    def setup_method(self):
+        self.data = np.linspace(0, 1, 10000).reshape(100, 100)
+        self.store = SharedArrayStore()
+
+    def teardown_method(self):
+        self.store.close()
+
+    def test_dumps_loads(self):
+        likelihood = _ArrayLikelihood(self.data)
+        data = self.store.dumps(likelihood)
+        # the large array is not pickled with the skeleton, the small one is
+        assert len(data) < self.data.nbytes
+        assert self.store.num_blocks == 1
+        likelihood_shared, used = loads_shared(data)
+        assert len(used) == 1
+        npt.assert_equal(likelihood_shared.data, self.data)
+        npt.assert_equal(likelihood_shared.logL([0.5]), likelihood.logL([0.5]))
+        # shared arrays are read-only
+        with pytest.raises(ValueError):
+            likelihood_shared.data[0, 0] = 1
+
+        # a new object with the same data re-uses the block
+        data_2 = self.store.dumps(_ArrayLikelihood(np.copy(self.data), scale=2))
+        assert self.store.num_blocks == 1
+        likelihood_shared_2, used_2 = loads_shared(data_2)
+        assert used_2 == used
+        assert likelihood_shared_2.scale == 2
+
+        # blocks no longer referenced are released
+        self.store.dumps(_ArrayLikelihood(self.data + 1))
+        assert self.store.num_blocks == 1
+        # arrays of released blocks stay valid as long as they are referenced
+        npt.assert_equal(likelihood_shared.data, self.data)
+
+    def test_shared_logl(self):
+        likelihood = _ArrayLikelihood(self.data)
+        pool = SharedMemoryPool(processes=2)
+        try:
+            logl = pool.set_likelihood(likelihood)
+            assert isinstance(logl, SharedLogL)
+            args_list = [[0.1], [0.5], [0.9]]
+            npt.assert_almost_equal(
+                pool.map(logl, args_list), [likelihood.logL(a) for a in args_list]
+            )
+            # evaluation in the master process attaches the same memory
+            npt.assert_almost_equal(logl([0.1]), likelihood.logL([0.1]))
+
+            # the workers stay alive and receive the new likelihood
+            likelihood_2 = _ArrayLikelihood(self.data, scale=2)
+            logl_batch = pool.set_likelihood(likelihood_2, vectorize=True)
+            npt.assert_almost_equal(
+                logl_batch(np.array(args_list)),
+                [likelihood_2.logL(a) for a in args_list],
+            )
+        finally:
+            pool.terminate()
+
+    def test_get_shared_memory_pool(self):
+        pool = get_shared_memory_pool(processes=2)
+        assert get_shared_memory_pool(processes=2) is pool
+        pool.close()
+        pool_new = get_shared_memory_pool(processes=2)
+        assert pool_new is not pool
+        pool_new.terminate()
+
+
+if __name__ == "__main__":
+    pytest.main()
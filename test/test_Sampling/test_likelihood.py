@@ -13,6 +13,7 @@ from lenstronomy.Data.psf import PSF
 from lenstronomy.Data.kinematic_bin_2D import KinBin
 from lenstronomy.Sampling.Likelihoods import kinematic_NN_call
 import lenstronomy.Util.kernel_util as kernel_util
+from lenstronomy.Util.profiling import Profiler
 
 
 class TestLikelihood(object):
@@ -195,6 +196,163 @@ class TestLikelihood(object):
         num_data_evaluate = self.Likelihood.num_data
         npt.assert_almost_equal(logL / num_data_evaluate, -1 / 2.0, decimal=1)
 
+    def test_logL_batch(self):
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        args_array = np.array([args, np.array(args) * 1.01, args])
+        # third sample outside the bounds
+        args_array[2, 0] = self.Likelihood.param_limits[1][0] + 1
+        logL_batch = self.Likelihood.logL_batch(args_array)
+        assert len(logL_batch) == 3
+        npt.assert_almost_equal(logL_batch[0], self.Likelihood.logL(args_array[0]))
+        npt.assert_almost_equal(logL_batch[1], self.Likelihood.logL(args_array[1]))
+        assert logL_batch[2] == -(10**18)
+
+        kwargs_list = self.param_class.args2kwargs_batch(args_array[:2])
+        assert len(kwargs_list) == 2
+        kwargs_return = self.param_class.args2kwargs(args_array[1])
+        assert (
+            kwargs_list[1]["kwargs_lens"][0]["theta_E"]
+            == kwargs_return["kwargs_lens"][0]["theta_E"]
+        )
+
+    def test_log_likelihood_batch(self):
+        kwargs_model = {
+            "lens_model_list": ["EPL", "SHEAR"],
+            "lens_light_model_list": ["SERSIC"],
+            "source_light_model_list": ["SERSIC"],
+            "point_source_model_list": ["LENSED_POSITION"],
+        }
+        kwargs_lens = [
+            {
+                "theta_E": 1.0,
+                "gamma": 2.0,
+                "e1": 0.1,
+                "e2": -0.05,
+                "center_x": 0,
+                "center_y": 0,
+            },
+            {"gamma1": 0.03, "gamma2": 0.01, "ra_0": 0, "dec_0": 0},
+        ]
+        lens_model_class = class_creator.create_class_instances(**kwargs_model)[0]
+        from lenstronomy.LensModel.Solver.lens_equation_solver import (
+            LensEquationSolver,
+        )
+
+        x_image, y_image = LensEquationSolver(
+            lens_model_class
+        ).image_position_from_source(0.05, 0.02, kwargs_lens)
+        kwargs_ps = [
+            {"ra_image": x_image, "dec_image": y_image, "point_amp": np.ones(4)}
+        ]
+        kwargs_data = {
+            "multi_band_list": [
+                [self.kwargs_band, self.kwargs_psf, self.kwargs_numerics]
+            ],
+            "multi_band_type": "single-band",
+            "time_delays_measured": np.array([-5.0, -3.0, 2.0]),
+            "time_delays_uncertainties": np.ones(3),
+        }
+        for kwargs_constraints in [
+            {"num_point_source_list": [4], "Ddt_sampling": True},
+            {
+                "num_point_source_list": [4],
+                "Ddt_sampling": True,
+                "solver_type": "PROFILE_SHEAR",
+                "kwargs_lens_init": kwargs_lens,
+            },
+        ]:
+            param_class = Param(kwargs_model, **kwargs_constraints)
+            likelihood = Likelihood(
+                kwargs_data_joint=kwargs_data,
+                kwargs_model=kwargs_model,
+                param_class=param_class,
+                source_position_likelihood=True,
+                source_position_tolerance=0.01,
+                time_delay_likelihood=True,
+                image_likelihood=True,
+            )
+            args = param_class.kwargs2args(
+                kwargs_lens=kwargs_lens,
+                kwargs_source=self.kwargs_source,
+                kwargs_lens_light=self.kwargs_lens_light,
+                kwargs_ps=kwargs_ps,
+                kwargs_special={"D_dt": 3000},
+            )
+            np.random.seed(41)
+            args_array = args * (1 + 0.01 * np.random.randn(8, len(args)))
+            with Profiler() as profiler:
+                logL_batch = likelihood.logL_batch(args_array)
+            # the imaging coordinates are ray-traced for all samples at once
+            assert "Image2SourceMapping.ray_shooting" not in profiler.report()
+            logL = [likelihood.logL(args_i) for args_i in args_array]
+            npt.assert_allclose(logL_batch, logL, rtol=1e-10)
+            # the hard bound on the source position scatter is hit by some samples
+            assert np.min(logL) < -(10**3)
+
+            kwargs_list = param_class.args2kwargs_batch(args_array)
+            position_likelihood = likelihood._position_likelihood
+            logL_source_position = position_likelihood.source_position_logL_batch(
+                [kwargs["kwargs_lens"] for kwargs in kwargs_list],
+                [kwargs["kwargs_ps"] for kwargs in kwargs_list],
+            )
+            for kwargs, logL_i in zip(kwargs_list, logL_source_position):
+                npt.assert_allclose(
+                    logL_i,
+                    position_likelihood.source_position_likelihood(
+                        kwargs["kwargs_lens"],
+                        kwargs["kwargs_ps"],
+                        sigma=0.001,
+                        hard_bound_rms=0.01,
+                    ),
+                    rtol=1e-10,
+                    atol=1e-10,
+                )
+            logL_time_delay = likelihood.time_delay_likelihood.logL_batch(
+                [kwargs["kwargs_lens"] for kwargs in kwargs_list],
+                [kwargs["kwargs_ps"] for kwargs in kwargs_list],
+                [kwargs["kwargs_special"] for kwargs in kwargs_list],
+            )
+            for kwargs, logL_i in zip(kwargs_list, logL_time_delay):
+                npt.assert_allclose(
+                    logL_i,
+                    likelihood.time_delay_likelihood.logL(
+                        kwargs["kwargs_lens"],
+                        kwargs["kwargs_ps"],
+                        kwargs["kwargs_special"],
+                    ),
+                    rtol=1e-10,
+                    atol=1e-10,
+                )
+
+    def test_profiling(self):
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        assert self.Likelihood.profiler is None
+        likelihood = Likelihood(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            profiling=True,
+        )
+        logL = likelihood.logL(args)
+        logL_batch = likelihood.logL_batch(np.array([args, args]))
+        npt.assert_almost_equal(logL_batch, [logL, logL], decimal=8)
+        report = likelihood.profiler.report()
+        assert report["Likelihood.log_likelihood"]["calls"] == 3
+        assert report["ImageLinearFit.linear_response_matrix"]["calls"] == 3
+        assert "Image2SourceMapping.ray_shooting" in report
+
     def test_time_delay_likelihood(self):
         kwargs_likelihood = {
             "time_delay_likelihood": True,
@@ -2,6 +2,7 @@ __author__ = "sibirrer"
 
 import pytest
 import numpy as np
+import numpy.testing as npt
 import os
 import lenstronomy.Util.simulation_util as sim_util
 from lenstronomy.ImSim.image_model import ImageModel
@@ -12,7 +13,10 @@ from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.Sampling.sampler import Sampler, choose_pool
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
-from lenstronomy.Sampling.Pool.parallelization_util import sampler_logl_worker
+from lenstronomy.Sampling.Pool.parallelization_util import (
+    PoolBatchLogL,
+    sampler_logl_worker,
+)
 
 
 class _MiniLikelihood(object):
@@ -22,6 +26,10 @@ class _MiniLikelihood(object):
     def logL(args):
         return -np.sum(np.asarray(args) ** 2)
 
+    @staticmethod
+    def logL_batch(args_array):
+        return -np.sum(np.asarray(args_array) ** 2, axis=1)
+
 
 class TestSampler(object):
     """Test the fitting sequences."""
@@ -157,6 +165,19 @@ class TestSampler(object):
 
         assert len(result) == 16
 
+        result_vectorized, chain_vectorized = self.sampler.pso(
+            n_particles,
+            n_iterations,
+            lower_start=None,
+            upper_start=None,
+            threadCount=1,
+            init_pos=None,
+            mpi=False,
+            print_key="PSO",
+            vectorize=True,
+        )
+        assert len(result_vectorized) == 16
+
     def test_mcmc_emcee(self):
         n_walkers = 36
         n_run = 2
@@ -173,6 +194,14 @@ class TestSampler(object):
         assert len(samples) == n_walkers * n_run
         assert len(dist) == len(samples)
 
+        samples_vectorized, dist_vectorized = self.sampler.mcmc_emcee(
+            n_walkers, n_run, n_burn, mean_start, sigma_start, mpi=False, vectorize=True
+        )
+        assert len(samples_vectorized) == n_walkers * n_run
+        npt.assert_almost_equal(
+            dist_vectorized, self.Likelihood.logL_batch(samples_vectorized), decimal=6
+        )
+
         # test of backup file
         # 1) run a chain specifiying a backup file name
         backup_filename = "test_mcmc_emcee.h5"
@@ -334,5 +363,53 @@ def test_pool_and_logl_serial(monkeypatch):
     assert logl_function is sampler.chain.logL
 
 
+def test_pool_and_logl_vectorize(monkeypatch):
+    class _FakePool(object):
+        size = 3
+
+        @staticmethod
+        def map(func, iterable):
+            return [_MiniLikelihood.logL_batch(args) for args in iterable]
+
+    def _fake_choose_pool(**kwargs):
+        return _FakePool()
+
+    monkeypatch.setattr("lenstronomy.Sampling.sampler.choose_pool", _fake_choose_pool)
+
+    sampler = Sampler(likelihood_class=_MiniLikelihood())
+    pool, logl_function = sampler._pool_and_logl(
+        mpi=False, threadCount=1, vectorize=True
+    )
+    assert logl_function == sampler.chain.logL_batch
+
+    pool, logl_function = sampler._pool_and_logl(
+        mpi=False, threadCount=3, vectorize=True
+    )
+    assert isinstance(logl_function, PoolBatchLogL)
+    args_array = np.random.uniform(-1, 1, size=(7, 2))
+    npt.assert_almost_equal(
+        logl_function(args_array), _MiniLikelihood.logL_batch(args_array)
+    )
+
+
+def test_pool_and_logl_shared_memory(monkeypatch):
+    calls = []
+
+    class _FakePool(object):
+        def set_likelihood(self, likelihood_module, vectorize=False):
+            calls.append((likelihood_module, vectorize))
+            return "shared_logl"
+
+    monkeypatch.setattr(
+        "lenstronomy.Sampling.Pool.shared_memory_pool.get_shared_memory_pool",
+        lambda processes: _FakePool(),
+    )
+    sampler = Sampler(likelihood_class=_MiniLikelihood(), shared_memory_pool=True)
+    pool, logl_function = sampler._pool_and_logl(mpi=False, threadCount=2)
+    assert isinstance(pool, _FakePool)
+    assert logl_function == "shared_logl"
+    assert calls[0] == (sampler.chain, False)
+
+
 if __name__ == "__main__":
     pytest.main()
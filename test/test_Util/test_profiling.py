@@ -0,0 +1,88 @@
+import threading
+import time
+
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Util.profiling import Profiler, timed
+
+
+@timed("sleep")
+def _sleep(duration):
+    time.sleep(duration)
+    return duration
+
+
+@timed("nested")
+def _nested(duration):
+    return _sleep(duration)
+
+
+class TestProfiler(object):
+    def test_timed(self):
+        # no active profiler
+        assert _sleep(0) == 0
+
+        with Profiler() as profiler:
+            assert profiler.active is True
+            _sleep(0.01)
+            _nested(0.01)
+        assert profiler.active is False
+        _sleep(0.01)
+        report = profiler.report()
+        assert report["sleep"]["calls"] == 2
+        assert report["nested"]["calls"] == 1
+        assert report["sleep"]["time"] >= 0.02
+        npt.assert_almost_equal(
+            report["sleep"]["time_per_call"], report["sleep"]["time"] / 2
+        )
+        # timings are inclusive
+        assert report["nested"]["time"] <= report["sleep"]["time"]
+        assert list(report.keys())[0] == "sleep"
+
+        # nested profilers both record, timings accumulate over activations
+        with profiler:
+            with Profiler() as profiler_inner:
+                _sleep(0)
+        assert profiler.report()["sleep"]["calls"] == 3
+        assert profiler_inner.report()["sleep"]["calls"] == 1
+
+        assert "sleep" in profiler.summary()
+        profiler.reset()
+        assert profiler.report() == {}
+
+    def test_threads(self):
+        # calls of other threads are not recorded
+        with Profiler() as profiler:
+            thread = threading.Thread(target=_sleep, args=(0,))
+            thread.start()
+            thread.join()
+            _sleep(0)
+        assert profiler.report()["sleep"]["calls"] == 1
+
+        # profilers activated in different threads are independent
+        profiler_thread = Profiler()
+
+        def _run():
+            with profiler_thread:
+                _sleep(0)
+
+        with profiler:
+            thread = threading.Thread(target=_run)
+            thread.start()
+            thread.join()
+            assert profiler.active is True
+            assert profiler_thread.active is False
+        assert profiler.report()["sleep"]["calls"] == 1
+        assert profiler_thread.report()["sleep"]["calls"] == 1
+
+    def test_raise(self):
+        profiler = Profiler()
+        with pytest.raises(ValueError):
+            with profiler:
+                raise ValueError()
+        assert profiler.active is False
+
+
+if __name__ == "__main__":
+    pytest.main()
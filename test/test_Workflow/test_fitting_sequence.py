@@ -383,6 +383,47 @@ class TestFittingSequence(object):
         assert "psf_before" in psf_iteration_list[0]
         assert "psf_after" in psf_iteration_list[0]
 
+    def test_profiling_reports(self):
+        kwargs_likelihood = dict(self.kwargs_likelihood, profiling=True)
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            kwargs_likelihood,
+            self.kwargs_params,
+        )
+        fitting_list = [
+            ["PSO", {"sigma_scale": 1, "n_particles": 2, "n_iterations": 2}],
+            ["psf_iteration", {"num_iter": 1, "psf_iter_factor": 1}],
+            ["update_settings", {"kwargs_likelihood": {"profiling": False}}],
+            ["SIMPLEX", {"n_iterations": 2}],
+        ]
+        fittingSequence.fit_sequence(fitting_list)
+        reports = fittingSequence.profiling_reports
+        assert len(reports) == 3
+        assert reports[0]["sequence"] == 0
+        assert reports[0]["fitting_type"] == "PSO"
+        report = reports[0]["report"]
+        # 2 iterations of 2 particles and the evaluation of the initial state
+        assert report["Likelihood.log_likelihood"]["calls"] >= 4
+        for component in [
+            "ImageLinearFit.linear_response_matrix",
+            "Image2SourceMapping.ray_shooting",
+            "LightModel.functions_split",
+            "Numerics.re_size_convolve_batch",
+            "de_lens.get_param_WLS",
+            "LensEquationSolver.image_position_from_source",
+        ]:
+            assert report[component]["calls"] > 0
+        # timings are inclusive
+        assert (
+            report["ImageLinearFit.linear_response_matrix"]["time"]
+            <= report["Likelihood.log_likelihood"]["time"]
+        )
+        assert reports[1]["fitting_type"] == "psf_iteration"
+        assert "Numerics.re_size_convolve_batch" in reports[1]["report"]
+        assert reports[2]["fitting_type"] == "update_settings"
+
     def test_cobaya(self):
         np.random.seed(42)
 